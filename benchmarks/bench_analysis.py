@@ -0,0 +1,97 @@
+"""
+Benchmark do resumo do histórico de treinos.
+
+Compara o resumo por semana feito com laços em Python sobre
+`Workout.exercises[].sets[]` com o WorkoutAnalysisService, que agrupa com NumPy
+as colunas de um SetBatch, sobre um histórico sintético.
+
+Uso:
+    python -m benchmarks.bench_analysis --years 3
+"""
+
+import argparse
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, List
+
+from benchmarks.common import setup_django
+
+
+def best_of(run: Callable[[], Any], rounds: int) -> float:
+    """Retorna o melhor tempo, em segundos, entre várias execuções."""
+    best = float('inf')
+    for _ in range(rounds):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def loop_summary(workouts: List[Any], tz: Any) -> Dict[Any, Dict[str, float]]:
+    """Resumo por semana com laços aninhados sobre as entidades."""
+    weeks: Dict[Any, Dict[str, float]] = {}
+    for workout in workouts:
+        if workout.start_time is None:
+            continue
+        day = workout.start_time.astimezone(tz).date()
+        entry = weeks.setdefault(day - timedelta(days=day.weekday()), {
+            'sets': 0, 'reps': 0, 'volume': 0.0, 'duration': 0, 'rpe_sum': 0.0, 'rpe_count': 0
+        })
+        for exercise in workout.exercises:
+            for set_item in exercise.sets:
+                if not set_item.completed:
+                    continue
+                entry['sets'] += 1
+                entry['reps'] += set_item.reps or 0
+                entry['volume'] += (set_item.weight or 0.0) * (set_item.reps or 0)
+                entry['duration'] += set_item.duration or 0
+                if set_item.rpe is not None:
+                    entry['rpe_sum'] += set_item.rpe
+                    entry['rpe_count'] += 1
+    return weeks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--years', type=float, default=3, help="Anos de histórico sintético")
+    parser.add_argument('--rounds', type=int, default=10, help="Repetições de cada cenário (vale a melhor)")
+    options = parser.parse_args()
+    setup_django()
+
+    from django.utils import timezone
+
+    from hevyai.domain.entities.set_batch import SetBatch
+    from hevyai.domain.entities.workout import Workout
+    from hevyai.domain.services.workout_analysis_service import WorkoutAnalysisService
+    from hevyai.infrastructure.api.fake.dataset import FakeHevyDataset
+
+    tz = timezone.get_current_timezone()
+    dataset = FakeHevyDataset.synthetic(years=options.years)
+    workouts = [Workout.from_dict(data) for data in dataset.resources['workouts']]
+    batch = SetBatch.from_workouts(workouts)
+    service = WorkoutAnalysisService()
+
+    weeks = loop_summary(workouts, tz)
+    summary = service.summarize(batch, group_by='week', tz=tz)
+    if [str(week) for week in sorted(weeks)] != [group.key for group in summary.groups] or any(
+        weeks[week]['sets'] != group.sets or abs(weeks[week]['volume'] - group.volume) > 1e-6
+        for week, group in zip(sorted(weeks), summary.groups)
+    ):
+        raise SystemExit("Os dois resumos produziram resultados diferentes")
+
+    results = {
+        'laços por semana': best_of(lambda: loop_summary(workouts, tz), options.rounds),
+    }
+    for group_by in ('week', 'month', 'workout', 'exercise'):
+        results[f'NumPy por {group_by}'] = best_of(
+            lambda: service.summarize(batch, group_by=group_by, tz=tz), options.rounds
+        )
+
+    print(f"treinos={len(workouts)} séries={len(batch)} semanas={len(summary.groups)}\n")
+    print(f"{'cenário':<22} {'ms':>8}")
+    for name, seconds in results.items():
+        print(f"{name:<22} {seconds * 1000:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
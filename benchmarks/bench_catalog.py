@@ -0,0 +1,77 @@
+"""
+Benchmark do catálogo em memória de modelos de exercícios: carga, consultas por
+ID, filtros e busca textual.
+
+Uso:
+    python -m benchmarks.bench_catalog --custom-templates 500 --queries 20000
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmarks.common import Recorder, add_server_arguments, fake_server, report, setup_django
+
+SEARCH_QUERIES = ['bench', 'inclin db', 'supino', 'bech pres', 'curl', 'squ', 'row cable', 'custom exer 4']
+
+
+def bench_load(catalog: Any, rounds: int) -> Dict[str, Any]:
+    """Carga completa do catálogo a partir da API, uma operação por rodada."""
+    recorder = Recorder()
+    for _ in range(rounds):
+        recorder.run(catalog.refresh)
+    return recorder.summary()
+
+
+def bench_snapshot(catalog: Any, rounds: int) -> Dict[str, Any]:
+    """Carga do catálogo a partir da cópia em disco, uma operação por rodada."""
+    recorder = Recorder()
+    for _ in range(rounds):
+        recorder.run(catalog.load_snapshot)
+    return recorder.summary()
+
+
+def bench_calls(calls: List[Any], queries: int) -> Dict[str, Any]:
+    """Chamadas alternadas ao catálogo, em uma única thread."""
+    recorder = Recorder()
+    for i in range(queries):
+        recorder.run(calls[i % len(calls)])
+    return recorder.summary()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_server_arguments(parser)
+    parser.add_argument('--queries', type=int, default=10000, help="Consultas por cenário")
+    parser.add_argument('--rounds', type=int, default=5, help="Cargas completas do catálogo")
+    options = parser.parse_args()
+    setup_django()
+
+    from hevyai.infrastructure.catalog.exercise_template_catalog import ExerciseTemplateCatalog
+    from hevyai.infrastructure.repositories.repository_factory import get_exercise_template_source
+
+    with fake_server(options) as server, tempfile.TemporaryDirectory() as snapshot_dir:
+        snapshot_path = Path(snapshot_dir) / 'exercise_templates.json'
+        catalog = ExerciseTemplateCatalog(get_exercise_template_source, snapshot_path=snapshot_path)
+        ids = [t['id'] for t in server.dataset.resources['exercise_templates']]
+        groups = sorted({t['primary_muscle_group'] for t in server.dataset.resources['exercise_templates']})
+
+        results = {
+            'catalog.refresh': bench_load(catalog, options.rounds),
+            'catalog.load_snapshot': bench_snapshot(catalog, options.rounds),
+            'catalog.get': bench_calls([lambda i=i: catalog.get(i) for i in ids], options.queries),
+            'catalog.list(muscle_group)': bench_calls(
+                [lambda g=g: catalog.list(muscle_group=g) for g in groups], options.queries
+            ),
+            'catalog.search': bench_calls(
+                [lambda q=q: catalog.search(q) for q in SEARCH_QUERIES], options.queries
+            ),
+        }
+        report(results, options.json)
+        if not options.json:
+            print(f"\nmodelos={len(catalog)} respostas do servidor={server.get_stats()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark de vazão e latência de cauda do cliente, dos repositórios e das views
+contra o substituto local da API do Hevy.
+
+Uso:
+    python -m benchmarks.bench_client --threads 16 --requests 2000 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+from benchmarks.common import Recorder, add_server_arguments, fake_server, report, setup_django
+
+
+def bench_detail(client: Any, ids: List[str], threads: int, requests: int) -> Dict[str, Any]:
+    """GETs de detalhe de treinos feitos por várias threads com o cliente compartilhado."""
+    recorder = Recorder()
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(lambda i: recorder.run(lambda: client.get_workout(ids[i % len(ids)])), range(requests)))
+    return recorder.summary()
+
+
+def bench_list_pages(client: Any, page_count: int, threads: int, requests: int) -> Dict[str, Any]:
+    """GETs de páginas da listagem de treinos feitos por várias threads."""
+    recorder = Recorder()
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(lambda i: recorder.run(lambda: client.get_workouts(i % page_count + 1)), range(requests)))
+    return recorder.summary()
+
+
+def bench_full_history(repository: Any, prefetch: int, rounds: int) -> Dict[str, Any]:
+    """Leitura do histórico completo pelo repositório, uma operação por rodada."""
+    recorder = Recorder()
+    for _ in range(rounds):
+        recorder.run(lambda: sum(1 for _ in repository.iter_all(prefetch=prefetch)))
+    return recorder.summary()
+
+
+def bench_async_history(rounds: int) -> Dict[str, Any]:
+    """Leitura do histórico completo pelo cliente assíncrono, uma operação por rodada."""
+    from hevyai.infrastructure.api.clients.async_hevy_client import AsyncHevyApiClient
+
+    async def run() -> Dict[str, Any]:
+        recorder = Recorder()
+        async with AsyncHevyApiClient() as client:
+            for _ in range(rounds):
+                began = time.perf_counter()
+                try:
+                    await client.get_all_workouts()
+                except Exception as e:
+                    recorder.errors[type(e).__name__] = recorder.errors.get(type(e).__name__, 0) + 1
+                else:
+                    recorder.latencies.append(time.perf_counter() - began)
+        return recorder.summary()
+
+    return asyncio.run(run())
+
+
+def bench_view(threads: int, requests: int, page_count: int) -> Dict[str, Any]:
+    """Requisições à view de listagem de treinos, incluindo serialização."""
+    from rest_framework.test import APIRequestFactory, force_authenticate
+
+    from hevyai.presentation.rest.viewsets.workout_viewsets import WorkoutViewSet
+
+    class BenchmarkUser:
+        is_authenticated = True
+
+    view = WorkoutViewSet.as_view({'get': 'list'})
+    factory = APIRequestFactory()
+
+    def call(i: int) -> None:
+        request = factory.get('/api/workouts/', {'page': i % page_count + 1})
+        force_authenticate(request, user=BenchmarkUser())
+        response = view(request).render()
+        if response.status_code >= 400:
+            raise RuntimeError(f'HTTP {response.status_code}')
+
+    recorder = Recorder()
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(lambda i: recorder.run(lambda: call(i)), range(requests)))
+    return recorder.summary()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_server_arguments(parser)
+    parser.add_argument('--threads', type=int, default=16, help="Threads concorrentes")
+    parser.add_argument('--requests', type=int, default=1000, help="Requisições por cenário concorrente")
+    parser.add_argument('--rounds', type=int, default=3, help="Leituras do histórico completo")
+    options = parser.parse_args()
+    setup_django()
+
+    from hevyai.infrastructure.api.clients.client_registry import get_hevy_client
+    from hevyai.infrastructure.repositories.hevy_workout_repository import HevyWorkoutRepository
+
+    with fake_server(options) as server:
+        client = get_hevy_client()
+        ids = [w['id'] for w in server.dataset.resources['workouts']]
+        page_count = server.dataset.get_page('workouts', 1, 10)['page_count']
+        repository = HevyWorkoutRepository(client)
+
+        results = {
+            'client.get_workout': bench_detail(client, ids, options.threads, options.requests),
+            'client.get_workouts': bench_list_pages(client, page_count, options.threads, options.requests),
+            'repository.iter_all(prefetch=1)': bench_full_history(repository, 1, options.rounds),
+            'repository.iter_all(prefetch=8)': bench_full_history(repository, 8, options.rounds),
+            'async.get_all_workouts': bench_async_history(options.rounds),
+            'view.workouts.list': bench_view(options.threads, options.requests, page_count),
+        }
+        report(results, options.json)
+        if not options.json:
+            print(f"\ntreinos={len(ids)} páginas={page_count} respostas do servidor={server.get_stats()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""
+Benchmark de memória e tempo de construção das entidades de treinos ao mapear
+um histórico de vários anos.
+
+Compara as entidades atuais (dataclasses com __slots__ e datas opcionais) com
+a definição anterior (dataclasses com __dict__ e datetime.now() em cada
+instância) e com o SetBatch colunar.
+
+Uso:
+    python -m benchmarks.bench_entities --years 5 --workouts-per-week 5
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.common import setup_django
+
+
+@dataclass
+class LegacySet:
+    """Definição anterior de Set."""
+    id: str
+    reps: Optional[int] = None
+    weight: Optional[float] = None
+    duration: Optional[int] = None
+    distance: Optional[float] = None
+    rpe: Optional[float] = None
+    completed: bool = True
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass
+class LegacyExercise:
+    """Definição anterior de Exercise."""
+    id: str
+    exercise_template_id: str
+    name: str
+    notes: Optional[str] = None
+    sets: List[LegacySet] = field(default_factory=list)
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass
+class LegacyWorkout:
+    """Definição anterior de Workout."""
+    id: str
+    name: str
+    exercises: List[LegacyExercise] = field(default_factory=list)
+    notes: Optional[str] = None
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+
+
+def map_history(data: List[Dict[str, Any]], workout_cls: type, exercise_cls: type, set_cls: type) -> List[Any]:
+    """Mapeia os treinos da API para entidades, como os repositórios fazem."""
+    workouts = []
+    for workout_data in data:
+        exercises = []
+        for exercise_data in workout_data['exercises']:
+            sets = [
+                set_cls(
+                    id=set_data.get('id', ''),
+                    reps=set_data.get('reps'),
+                    weight=set_data.get('weight'),
+                    duration=set_data.get('duration'),
+                    distance=set_data.get('distance'),
+                    rpe=set_data.get('rpe'),
+                    completed=set_data.get('completed', True)
+                )
+                for set_data in exercise_data.get('sets', [])
+            ]
+            exercises.append(exercise_cls(
+                id=exercise_data.get('id', ''),
+                exercise_template_id=exercise_data.get('exercise_template_id', ''),
+                name=exercise_data.get('title', ''),
+                notes=exercise_data.get('notes'),
+                sets=sets
+            ))
+        workouts.append(workout_cls(
+            id=workout_data.get('id', ''),
+            name=workout_data.get('title', ''),
+            exercises=exercises,
+            notes=workout_data.get('description'),
+            start_time=workout_data.get('start_time'),
+            end_time=workout_data.get('end_time'),
+            created_at=workout_data.get('created_at'),
+            updated_at=workout_data.get('updated_at')
+        ))
+    return workouts
+
+
+def measure(build: Callable[[], Any], rounds: int) -> Dict[str, Any]:
+    """Mede o melhor tempo de construção e a memória retida pelo resultado."""
+    best = float('inf')
+    for _ in range(rounds):
+        gc.collect()
+        started = time.perf_counter()
+        result = build()
+        best = min(best, time.perf_counter() - started)
+        del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {'seconds': best, 'bytes': retained}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--years', type=float, default=5, help="Anos de histórico sintético")
+    parser.add_argument('--workouts-per-week', type=float, default=5, help="Treinos por semana")
+    parser.add_argument('--rounds', type=int, default=5, help="Repetições de cada cenário (vale a melhor)")
+    options = parser.parse_args()
+    setup_django()
+
+    from hevyai.domain.entities.set_batch import SetBatch
+    from hevyai.domain.entities.workout import Exercise, Set, Workout
+    from hevyai.infrastructure.api.fake.dataset import FakeHevyDataset
+
+    dataset = FakeHevyDataset.synthetic(years=options.years, workouts_per_week=options.workouts_per_week)
+    data = dataset.resources['workouts']
+    set_count = sum(len(e['sets']) for w in data for e in w['exercises'])
+    entities = map_history(data, Workout, Exercise, Set)
+
+    results = {
+        'dataclass (anterior)': measure(
+            lambda: map_history(data, LegacyWorkout, LegacyExercise, LegacySet), options.rounds
+        ),
+        'dataclass(slots=True)': measure(lambda: map_history(data, Workout, Exercise, Set), options.rounds),
+        'SetBatch.from_workouts': measure(lambda: SetBatch.from_workouts(entities), options.rounds),
+    }
+
+    print(f"treinos={len(data)} séries={set_count}\n")
+    print(f"{'cenário':<24} {'ms':>9} {'MiB':>9} {'bytes/série':>12}")
+    for name, result in results.items():
+        print(
+            f"{name:<24} {result['seconds'] * 1000:>9.1f} {result['bytes'] / 2 ** 20:>9.2f} "
+            f"{result['bytes'] / set_count:>12.1f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark do custo de CPU para responder à listagem de treinos a partir das entidades.
+
+Compara o caminho anterior (entidade -> dicionário com datas em texto ->
+WorkoutDTO.from_dict -> campos do DRF um a um) com o atual
+(WorkoutDTO.from_entity -> serializadores com representação direta das séries),
+sobre um histórico sintético de cerca de 10 mil séries.
+
+Uso:
+    python -m benchmarks.bench_mapping --years 1.5 --rounds 20
+"""
+
+import argparse
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.common import setup_django
+
+
+def legacy_workout_dtos(workouts: List[Any]) -> List[Any]:
+    """Conversão anterior dos casos de uso, via dicionário intermediário."""
+    from hevyai.application.dtos.workout_dto import WorkoutDTO
+
+    workout_dtos = []
+    for workout in workouts:
+        workout_dict = {
+            "id": workout.id,
+            "name": workout.name,
+            "notes": workout.notes,
+            "start_time": workout.start_time.isoformat() if workout.start_time else None,
+            "end_time": workout.end_time.isoformat() if workout.end_time else None,
+            "created_at": workout.created_at.isoformat() if workout.created_at else None,
+            "updated_at": workout.updated_at.isoformat() if workout.updated_at else None,
+            "exercises": []
+        }
+        for exercise in workout.exercises:
+            exercise_dict = {
+                "id": exercise.id,
+                "exercise_template_id": exercise.exercise_template_id,
+                "name": exercise.name,
+                "notes": exercise.notes,
+                "sets": []
+            }
+            for set_item in exercise.sets:
+                exercise_dict["sets"].append({
+                    "id": set_item.id,
+                    "reps": set_item.reps,
+                    "weight": set_item.weight,
+                    "duration": set_item.duration,
+                    "distance": set_item.distance,
+                    "rpe": set_item.rpe,
+                    "completed": set_item.completed
+                })
+            workout_dict["exercises"].append(exercise_dict)
+        workout_dtos.append(WorkoutDTO.from_dict(workout_dict))
+    return workout_dtos
+
+
+def legacy_serializer_class() -> type:
+    """Cria o WorkoutSerializer com a representação genérica do DRF em todos os níveis."""
+    from rest_framework import serializers
+
+    from hevyai.presentation.rest.serializers import workout_serializers
+
+    class LegacySetSerializer(workout_serializers.SetSerializer):
+        to_representation = serializers.Serializer.to_representation
+
+    class LegacyExerciseSerializer(workout_serializers.ExerciseSerializer):
+        sets = LegacySetSerializer(many=True)
+        to_representation = serializers.Serializer.to_representation
+
+    class LegacyWorkoutSerializer(workout_serializers.WorkoutSerializer):
+        exercises = LegacyExerciseSerializer(many=True)
+
+    return LegacyWorkoutSerializer
+
+
+def measure(respond: Callable[[], Any], rounds: int) -> Dict[str, float]:
+    """Mede o tempo de CPU de cada resposta."""
+    samples = []
+    for _ in range(rounds):
+        started = time.process_time()
+        respond()
+        samples.append(time.process_time() - started)
+    return {'median': statistics.median(samples), 'best': min(samples)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--years', type=float, default=1.5, help="Anos de histórico sintético")
+    parser.add_argument('--workouts-per-week', type=float, default=5, help="Treinos por semana")
+    parser.add_argument('--rounds', type=int, default=20, help="Respostas medidas por cenário")
+    options = parser.parse_args()
+    setup_django()
+
+    from hevyai.application.dtos.workout_dto import WorkoutDTO
+    from hevyai.domain.entities.workout import Workout
+    from hevyai.infrastructure.api.fake.dataset import FakeHevyDataset
+    from hevyai.presentation.rest.serializers.workout_serializers import WorkoutSerializer
+
+    dataset = FakeHevyDataset.synthetic(years=options.years, workouts_per_week=options.workouts_per_week)
+    workouts = [Workout.from_dict(data) for data in dataset.resources['workouts']]
+    set_count = sum(len(exercise.sets) for workout in workouts for exercise in workout.exercises)
+    legacy_serializer = legacy_serializer_class()
+
+    legacy = legacy_serializer(legacy_workout_dtos(workouts), many=True).data
+    current = WorkoutSerializer([WorkoutDTO.from_entity(w) for w in workouts], many=True).data
+    if legacy != current:
+        raise SystemExit("As duas conversões produziram respostas diferentes")
+
+    scenarios = {
+        'DTOs anterior': lambda: legacy_workout_dtos(workouts),
+        'DTOs from_entity': lambda: [WorkoutDTO.from_entity(w) for w in workouts],
+        'resposta anterior': lambda: legacy_serializer(legacy_workout_dtos(workouts), many=True).data,
+        'resposta atual': lambda: WorkoutSerializer([WorkoutDTO.from_entity(w) for w in workouts], many=True).data,
+    }
+    results = {name: measure(respond, options.rounds) for name, respond in scenarios.items()}
+
+    print(f"treinos={len(workouts)} séries={set_count}\n")
+    print(f"{'cenário':<20} {'mediana ms':>11} {'melhor ms':>10} {'µs/série':>9}")
+    for name, result in results.items():
+        print(
+            f"{name:<20} {result['median'] * 1000:>11.1f} {result['best'] * 1000:>10.1f} "
+            f"{result['median'] * 1e6 / set_count:>9.2f}"
+        )
+    saved = results['resposta anterior']['median'] - results['resposta atual']['median']
+    print(f"\nCPU economizada por resposta: {saved * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark da conversão das datas da API do Hevy.
+
+Compara o parse_datetime do Django (usado antes pela sincronização) com o
+parse_timestamp compartilhado, com e sem o cache de textos repetidos, sobre
+todas as datas dos treinos de um histórico sintético.
+
+Uso:
+    python -m benchmarks.bench_timestamps --years 3
+"""
+
+import argparse
+import time
+from datetime import timezone
+from typing import Any, Callable, List
+
+from benchmarks.common import setup_django
+
+DATE_FIELDS = ('start_time', 'end_time', 'created_at', 'updated_at')
+
+
+def best_of(run: Callable[[], Any], rounds: int) -> float:
+    """Retorna o melhor tempo, em segundos, entre várias execuções."""
+    best = float('inf')
+    for _ in range(rounds):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--years', type=float, default=3, help="Anos de histórico sintético")
+    parser.add_argument('--rounds', type=int, default=5, help="Repetições de cada cenário (vale a melhor)")
+    options = parser.parse_args()
+    setup_django()
+
+    from django.utils import timezone as dj_timezone
+    from django.utils.dateparse import parse_datetime
+
+    from hevyai.domain import timestamps
+    from hevyai.infrastructure.api.fake.dataset import FakeHevyDataset
+
+    dataset = FakeHevyDataset.synthetic(years=options.years)
+    # Como nas respostas da API: o formato com 'Z' e as datas de cada treino
+    values: List[str] = [
+        workout[name].replace('+00:00', 'Z')
+        for workout in dataset.resources['workouts']
+        for name in DATE_FIELDS
+        if workout.get(name)
+    ]
+
+    def django_parse() -> None:
+        for value in values:
+            parsed = parse_datetime(value)
+            if parsed is not None and dj_timezone.is_naive(parsed):
+                dj_timezone.make_aware(parsed, timezone.utc)
+
+    def shared_cold() -> None:
+        timestamps._parse_text.cache_clear()
+        for value in values:
+            timestamps.parse_timestamp(value)
+
+    def shared_warm() -> None:
+        for value in values:
+            timestamps.parse_timestamp(value)
+
+    shared_warm()
+    results = {
+        'django parse_datetime': best_of(django_parse, options.rounds),
+        'parse_timestamp (frio)': best_of(shared_cold, options.rounds),
+        'parse_timestamp (cache)': best_of(shared_warm, options.rounds),
+    }
+
+    print(f"datas={len(values)} distintas={len(set(values))}\n")
+    print(f"{'cenário':<26} {'ms':>8} {'ns/data':>9}")
+    for name, seconds in results.items():
+        print(f"{name:<26} {seconds * 1000:>8.2f} {seconds * 1e9 / len(values):>9.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+"""
+Utilitários compartilhados pelos benchmarks.
+
+Os benchmarks rodam a partir da raiz do projeto (`python -m benchmarks.<nome>`) e
+usam o substituto local da API do Hevy, sem acesso à rede.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List
+from urllib.request import urlopen
+
+
+def setup_django() -> None:
+    """
+    Configura o Django para os benchmarks.
+
+    O limitador de taxa do cliente é afrouxado por padrão para medir o cliente e
+    não a cota do Hevy; defina HEVY_API_RATE_LIMIT para reproduzir a cota real.
+    """
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hevyai.settings')
+    os.environ.setdefault('HEVY_API_KEY', 'benchmark')
+    os.environ.setdefault('HEVY_API_RATE_LIMIT', '100000')
+    os.environ.setdefault('HEVY_API_RATE_BURST', '100000')
+
+    import django
+    django.setup()
+
+
+def add_server_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Adiciona as opções do substituto da API a um parser de linha de comando.
+
+    Args:
+        parser: Parser do benchmark
+    """
+    parser.add_argument('--fixtures', help="Diretório de fixtures (padrão: histórico sintético)")
+    parser.add_argument('--years', type=float, default=3, help="Anos de histórico sintético")
+    parser.add_argument('--custom-templates', type=int, default=5, help="Modelos de exercícios personalizados sintéticos")
+    parser.add_argument('--latency-ms', type=float, default=20, help="Latência fixa por resposta")
+    parser.add_argument('--jitter-ms', type=float, default=10, help="Variação máxima somada à latência")
+    parser.add_argument('--throttle-rate', type=float, default=0, help="Fração de respostas 429")
+    parser.add_argument('--error-rate', type=float, default=0, help="Fração de respostas 503")
+    parser.add_argument('--seed', type=int, default=42, help="Semente dos dados e das falhas")
+    parser.add_argument('--in-process', action='store_true', help="Executa o servidor no mesmo processo")
+    parser.add_argument('--json', action='store_true', help="Imprime o resultado em JSON")
+
+
+class FakeServerHandle:
+    """Acesso ao substituto da API em execução, no mesmo processo ou em outro."""
+
+    def __init__(self, url: str, dataset: Any):
+        self.url = url
+        self.dataset = dataset
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Obtém as respostas enviadas pelo servidor, por status.
+
+        Returns:
+            Dicionário indexado pelo status HTTP (como texto)
+        """
+        from hevyai.infrastructure.api.fake.server import STATS_PATH
+
+        with urlopen(self.url + STATS_PATH) as response:
+            return json.load(response)
+
+
+def _serve(dataset: Any, faults: Any, conn: Any) -> None:
+    """Executa o substituto da API em um processo filho, informando a URL ao pai."""
+    from hevyai.infrastructure.api.fake.server import FakeHevyServer
+
+    server = FakeHevyServer(dataset, faults)
+    conn.send(server.url)
+    server.serve_forever()
+
+
+@contextmanager
+def fake_server(options: argparse.Namespace) -> Iterator[FakeServerHandle]:
+    """
+    Inicia o substituto da API conforme as opções e aponta HEVY_API_URL para ele.
+
+    Por padrão o servidor roda em um processo separado, para que o trabalho dele
+    não dispute o GIL com o código medido.
+
+    Args:
+        options: Opções adicionadas por `add_server_arguments`
+
+    Yields:
+        Acesso ao servidor em execução
+    """
+    from django.conf import settings
+
+    from hevyai.infrastructure.api.clients.client_registry import close_hevy_clients
+    from hevyai.infrastructure.api.fake.dataset import FakeHevyDataset
+    from hevyai.infrastructure.api.fake.server import FakeHevyServer, FaultProfile
+
+    if options.fixtures:
+        dataset = FakeHevyDataset.from_fixtures(options.fixtures)
+    else:
+        dataset = FakeHevyDataset.synthetic(
+            years=options.years, custom_templates=options.custom_templates, seed=options.seed
+        )
+    faults = FaultProfile(
+        latency_ms=options.latency_ms,
+        jitter_ms=options.jitter_ms,
+        throttle_rate=options.throttle_rate,
+        error_rate=options.error_rate,
+        retry_after=0.1,
+        seed=options.seed
+    )
+
+    server = process = None
+    if options.in_process:
+        server = FakeHevyServer(dataset, faults)
+        url = server.start()
+    else:
+        parent_conn, child_conn = multiprocessing.Pipe()
+        process = multiprocessing.get_context('fork').Process(
+            target=_serve, args=(dataset, faults, child_conn), daemon=True
+        )
+        process.start()
+        url = parent_conn.recv()
+
+    previous_url = settings.HEVY_API_URL
+    settings.HEVY_API_URL = url
+    try:
+        yield FakeServerHandle(url, dataset)
+    finally:
+        settings.HEVY_API_URL = previous_url
+        close_hevy_clients()
+        if server is not None:
+            server.stop()
+        if process is not None:
+            process.terminate()
+            process.join()
+
+
+class Recorder:
+    """
+    Registra a latência e os erros das operações de um cenário.
+
+    Operações que levantam exceção contam como erro e não entram nos percentis,
+    para que falhas injetadas não interrompam o cenário.
+    """
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.errors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def run(self, fn: Callable[[], Any]) -> Any:
+        """
+        Executa uma operação registrando sua latência ou seu erro.
+
+        Args:
+            fn: Operação
+
+        Returns:
+            O resultado da operação ou None se ela falhar
+        """
+        started = time.perf_counter()
+        try:
+            result = fn()
+        except Exception as e:
+            with self._lock:
+                name = type(e).__name__
+                self.errors[name] = self.errors.get(name, 0) + 1
+            return None
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.latencies.append(elapsed)
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Resume o cenário desde a criação do registrador.
+
+        Returns:
+            Dicionário com operações, erros, vazão (ops/s) e percentis em milissegundos
+        """
+        elapsed = time.perf_counter() - self._started
+        ordered = sorted(self.latencies)
+
+        def percentile(p: float) -> float:
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1000
+
+        return {
+            'ops': len(ordered),
+            'errors': sum(self.errors.values()),
+            'seconds': round(elapsed, 3),
+            'ops_per_sec': round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+            'mean_ms': round(statistics.fmean(ordered) * 1000, 2) if ordered else 0.0,
+            'p50_ms': round(percentile(50), 2),
+            'p95_ms': round(percentile(95), 2),
+            'p99_ms': round(percentile(99), 2),
+            'max_ms': round(ordered[-1] * 1000, 2) if ordered else 0.0,
+            'errors_by_type': dict(self.errors),
+        }
+
+
+def report(results: Dict[str, Dict[str, Any]], as_json: bool = False) -> None:
+    """
+    Imprime os resultados dos cenários.
+
+    Args:
+        results: Resultados indexados pelo nome do cenário
+        as_json: Se True, imprime em JSON em vez de tabela
+    """
+    if as_json:
+        print(json.dumps(results, indent=2))
+        return
+    columns = ['ops', 'errors', 'seconds', 'ops_per_sec', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms']
+    width = max(len(name) for name in results) if results else 10
+    print(f"{'cenário':<{width}}  " + '  '.join(f'{c:>11}' for c in columns))
+    for name, result in results.items():
+        print(f'{name:<{width}}  ' + '  '.join(f'{result.get(c, ""):>11}' for c in columns))
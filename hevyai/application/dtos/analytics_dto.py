@@ -0,0 +1,195 @@
+"""
+DTOs (Data Transfer Objects) para as análises do histórico de treinos.
+Estes objetos são usados para transferir dados entre as camadas de aplicação e apresentação.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import List, Optional
+
+from hevyai.domain.entities.training_load import TrainingLoadDay, TrainingLoadSeries
+from hevyai.domain.entities.training_summary import TrainingSummary, TrainingTotals
+from hevyai.domain.entities.workout_rollup import WorkoutRollup
+
+
+def _rounded(value: Optional[float], digits: int = 2) -> Optional[float]:
+    return None if value is None else round(value, digits)
+
+
+@dataclass
+class TrainingTotalsDTO:
+    """DTO para representar os totais de um treino, exercício ou período."""
+    key: str
+    name: Optional[str] = None
+    workouts: int = 0
+    sets: int = 0
+    reps: int = 0
+    volume: float = 0.0
+    tonnage: float = 0.0
+    duration: int = 0
+    distance: float = 0.0
+    average_intensity: Optional[float] = None
+    average_rpe: Optional[float] = None
+    first_performed: Optional[datetime] = None
+    last_performed: Optional[datetime] = None
+
+    @classmethod
+    def from_entity(cls, totals: TrainingTotals) -> 'TrainingTotalsDTO':
+        """
+        Cria um DTO a partir dos totais calculados pelo serviço de análise.
+
+        Args:
+            totals: Entidade TrainingTotals
+
+        Returns:
+            Uma instância de TrainingTotalsDTO, com os valores arredondados
+        """
+        return cls(
+            key=totals.key,
+            name=totals.name,
+            workouts=totals.workouts,
+            sets=totals.sets,
+            reps=totals.reps,
+            volume=round(totals.volume, 2),
+            tonnage=round(totals.tonnage, 3),
+            duration=totals.duration,
+            distance=round(totals.distance, 2),
+            average_intensity=_rounded(totals.average_intensity),
+            average_rpe=_rounded(totals.average_rpe),
+            first_performed=totals.first_performed,
+            last_performed=totals.last_performed
+        )
+
+
+@dataclass
+class TrainingSummaryDTO:
+    """DTO para representar o resumo do histórico de treinos em um período."""
+    group_by: str
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    totals: Optional[TrainingTotalsDTO] = None
+    groups: List[TrainingTotalsDTO] = field(default_factory=list)
+
+    @classmethod
+    def from_entity(cls, summary: TrainingSummary) -> 'TrainingSummaryDTO':
+        """
+        Cria um DTO a partir do resumo calculado pelo serviço de análise.
+
+        Args:
+            summary: Entidade TrainingSummary
+
+        Returns:
+            Uma instância de TrainingSummaryDTO
+        """
+        return cls(
+            group_by=summary.group_by,
+            start=summary.start,
+            end=summary.end,
+            totals=TrainingTotalsDTO.from_entity(summary.totals),
+            groups=[TrainingTotalsDTO.from_entity(group) for group in summary.groups]
+        )
+
+
+@dataclass
+class TrainingLoadDayDTO:
+    """DTO para representar a carga de treino de um dia e as médias aguda e crônica."""
+    day: date
+    load: float = 0.0
+    acute: float = 0.0
+    chronic: float = 0.0
+    ratio: Optional[float] = None
+
+    @classmethod
+    def from_entity(cls, item: TrainingLoadDay) -> 'TrainingLoadDayDTO':
+        """
+        Cria um DTO a partir de uma entidade TrainingLoadDay.
+
+        Args:
+            item: Entidade TrainingLoadDay
+
+        Returns:
+            Uma instância de TrainingLoadDayDTO, com os valores arredondados
+        """
+        return cls(
+            day=item.day,
+            load=round(item.load, 2),
+            acute=round(item.acute, 2),
+            chronic=round(item.chronic, 2),
+            ratio=_rounded(item.ratio, 3)
+        )
+
+
+@dataclass
+class TrainingLoadSeriesDTO:
+    """DTO para representar a série diária de carga de treino de um escopo."""
+    metric: str
+    scope: str
+    acute_days: int
+    chronic_days: int
+    start: date
+    end: date
+    scopes: List[str] = field(default_factory=list)
+    days: List[TrainingLoadDayDTO] = field(default_factory=list)
+
+    @classmethod
+    def from_entity(cls, series: TrainingLoadSeries, scopes: List[str]) -> 'TrainingLoadSeriesDTO':
+        """
+        Cria um DTO a partir de uma entidade TrainingLoadSeries.
+
+        Args:
+            series: Entidade TrainingLoadSeries
+            scopes: Escopos disponíveis na métrica da série
+
+        Returns:
+            Uma instância de TrainingLoadSeriesDTO
+        """
+        return cls(
+            metric=series.metric,
+            scope=series.scope,
+            acute_days=series.acute_days,
+            chronic_days=series.chronic_days,
+            start=series.start,
+            end=series.end,
+            scopes=list(scopes),
+            days=[TrainingLoadDayDTO.from_entity(item) for item in series.days]
+        )
+
+
+@dataclass
+class WorkoutRollupDTO:
+    """DTO para representar os totais dos treinos de um período."""
+    period_start: date
+    workouts: int = 0
+    sets: int = 0
+    volume: float = 0.0
+    duration: int = 0
+    distinct_exercises: int = 0
+
+    @classmethod
+    def from_entity(cls, rollup: WorkoutRollup) -> 'WorkoutRollupDTO':
+        """
+        Cria um DTO a partir de uma entidade WorkoutRollup.
+
+        Args:
+            rollup: Entidade WorkoutRollup
+
+        Returns:
+            Uma instância de WorkoutRollupDTO, com o volume arredondado
+        """
+        return cls(
+            period_start=rollup.period_start,
+            workouts=rollup.workouts,
+            sets=rollup.sets,
+            volume=round(rollup.volume, 2),
+            duration=rollup.duration,
+            distinct_exercises=rollup.distinct_exercises
+        )
+
+
+@dataclass
+class WorkoutRollupsDTO:
+    """DTO para representar os totais por período de um intervalo."""
+    period: str
+    start: Optional[date] = None
+    end: Optional[date] = None
+    rollups: List[WorkoutRollupDTO] = field(default_factory=list)
@@ -0,0 +1,74 @@
+"""
+DTOs (Data Transfer Objects) para a evolução de um modelo de exercício.
+Estes objetos são usados para transferir dados entre as camadas de aplicação e apresentação.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from hevyai.domain.entities.exercise_history import ExerciseHistory, HistoryPoint
+
+
+@dataclass
+class HistoryPointDTO:
+    """DTO para representar um ponto de uma série temporal de um modelo de exercício."""
+    performed_at: datetime
+    workout_id: str
+    value: float
+    reps: Optional[int] = None
+
+    @classmethod
+    def from_entity(cls, point: HistoryPoint) -> 'HistoryPointDTO':
+        """
+        Cria um DTO a partir de uma entidade HistoryPoint.
+
+        Args:
+            point: Entidade HistoryPoint
+
+        Returns:
+            Uma instância de HistoryPointDTO
+        """
+        return cls(
+            performed_at=point.performed_at,
+            workout_id=point.workout_id,
+            value=round(point.value, 2),
+            reps=point.reps
+        )
+
+
+@dataclass
+class ExerciseHistoryDTO:
+    """DTO para representar a evolução de um modelo de exercício em um período."""
+    exercise_template_id: str
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    points: int = 0
+    sessions: int = 0
+    downsampled: bool = False
+    top_set: List[HistoryPointDTO] = field(default_factory=list)
+    e1rm: List[HistoryPointDTO] = field(default_factory=list)
+    volume: List[HistoryPointDTO] = field(default_factory=list)
+
+    @classmethod
+    def from_entity(cls, history: ExerciseHistory) -> 'ExerciseHistoryDTO':
+        """
+        Cria um DTO a partir de uma entidade ExerciseHistory.
+
+        Args:
+            history: Entidade ExerciseHistory
+
+        Returns:
+            Uma instância de ExerciseHistoryDTO
+        """
+        return cls(
+            exercise_template_id=history.exercise_template_id,
+            start=history.start,
+            end=history.end,
+            points=history.max_points,
+            sessions=history.sessions,
+            downsampled=history.downsampled,
+            top_set=[HistoryPointDTO.from_entity(point) for point in history.top_set],
+            e1rm=[HistoryPointDTO.from_entity(point) for point in history.e1rm],
+            volume=[HistoryPointDTO.from_entity(point) for point in history.volume]
+        )
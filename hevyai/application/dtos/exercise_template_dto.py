@@ -7,6 +7,9 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
+from hevyai.domain.entities.exercise_template import ExerciseTemplate
+from hevyai.domain.timestamps import parse_timestamp
+
 
 @dataclass
 class MuscleGroupDTO:
@@ -26,6 +29,27 @@ class ExerciseTemplateDTO:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
+    @classmethod
+    def from_entity(cls, template: ExerciseTemplate) -> 'ExerciseTemplateDTO':
+        """
+        Cria uma instância de ExerciseTemplateDTO a partir da entidade de domínio.
+        
+        Args:
+            template: Entidade ExerciseTemplate
+            
+        Returns:
+            Uma nova instância de ExerciseTemplateDTO
+        """
+        return cls(
+            id=template.id,
+            name=template.name,
+            description=template.description,
+            is_custom=template.is_custom,
+            muscle_groups=[MuscleGroupDTO(id=mg.id, name=mg.name) for mg in template.muscle_groups],
+            created_at=template.created_at,
+            updated_at=template.updated_at
+        )
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ExerciseTemplateDTO':
         """
@@ -44,26 +68,12 @@ class ExerciseTemplateDTO:
                 name=mg_data.get('name', '')
             ))
                 
-        created_at = None
-        if data.get('created_at'):
-            try:
-                created_at = datetime.fromisoformat(data.get('created_at'))
-            except ValueError:
-                pass
-                
-        updated_at = None
-        if data.get('updated_at'):
-            try:
-                updated_at = datetime.fromisoformat(data.get('updated_at'))
-            except ValueError:
-                pass
-        
         return cls(
             id=data.get('id', ''),
             name=data.get('name', ''),
             description=data.get('description'),
             is_custom=data.get('is_custom', False),
             muscle_groups=muscle_group_dtos,
-            created_at=created_at,
-            updated_at=updated_at
+            created_at=parse_timestamp(data.get('created_at')),
+            updated_at=parse_timestamp(data.get('updated_at'))
         )
\ No newline at end of file
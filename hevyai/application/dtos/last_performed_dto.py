@@ -0,0 +1,88 @@
+"""
+DTOs (Data Transfer Objects) para os valores anteriores dos exercícios de uma rotina.
+Estes objetos são usados para transferir dados entre as camadas de aplicação e apresentação.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from hevyai.domain.entities.last_performed import LastPerformed, PreviousSet
+from hevyai.domain.entities.routine import RoutineExercise
+
+
+@dataclass
+class PreviousSetDTO:
+    """DTO para representar uma série da última execução de um exercício."""
+    weight: Optional[float] = None
+    reps: Optional[int] = None
+    duration: Optional[int] = None
+    distance: Optional[float] = None
+    rpe: Optional[float] = None
+
+    @classmethod
+    def from_entity(cls, previous: PreviousSet) -> 'PreviousSetDTO':
+        """
+        Cria um DTO a partir de uma entidade PreviousSet.
+
+        Args:
+            previous: Entidade PreviousSet
+
+        Returns:
+            Uma instância de PreviousSetDTO
+        """
+        return cls(
+            weight=previous.weight,
+            reps=previous.reps,
+            duration=previous.duration,
+            distance=previous.distance,
+            rpe=previous.rpe
+        )
+
+
+@dataclass
+class RoutineExercisePreviousDTO:
+    """DTO para representar os valores anteriores de um exercício da rotina."""
+    id: str
+    exercise_template_id: str
+    name: str
+    order: int
+    workout_id: Optional[str] = None
+    performed_at: Optional[datetime] = None
+    sets: List[PreviousSetDTO] = field(default_factory=list)
+
+    @classmethod
+    def from_entity(
+        cls,
+        exercise: RoutineExercise,
+        last_performed: Optional[LastPerformed]
+    ) -> 'RoutineExercisePreviousDTO':
+        """
+        Cria um DTO a partir de um exercício da rotina e da sua última execução.
+
+        Args:
+            exercise: Entidade RoutineExercise
+            last_performed: Última execução do modelo (None se nunca foi feito)
+
+        Returns:
+            Uma instância de RoutineExercisePreviousDTO
+        """
+        dto = cls(
+            id=exercise.id,
+            exercise_template_id=exercise.exercise_template_id,
+            name=exercise.name,
+            order=exercise.order
+        )
+        if last_performed is not None:
+            dto.workout_id = last_performed.workout_id
+            dto.performed_at = last_performed.performed_at
+            dto.sets = [PreviousSetDTO.from_entity(previous) for previous in last_performed.sets]
+        return dto
+
+
+@dataclass
+class RoutinePreviousValuesDTO:
+    """DTO para representar os valores anteriores de todos os exercícios de uma rotina."""
+    routine_id: str
+    routine_name: str
+    exercises: List[RoutineExercisePreviousDTO] = field(default_factory=list)
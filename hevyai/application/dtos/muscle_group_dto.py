@@ -0,0 +1,86 @@
+"""
+DTOs (Data Transfer Objects) para grupos musculares.
+Estes objetos são usados para transferir dados entre as camadas de aplicação e apresentação.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import List, Optional
+
+from hevyai.application.dtos.exercise_template_dto import MuscleGroupDTO
+from hevyai.domain.entities.training_summary import MuscleGroupWeeks
+
+
+@dataclass
+class MuscleGroupSummaryDTO:
+    """DTO para representar um grupo muscular e a quantidade de modelos de exercícios dele."""
+    id: str
+    name: str
+    template_count: int = 0
+
+
+@dataclass
+class MuscleGroupTemplateVolumeDTO:
+    """DTO para representar o volume de um modelo de exercício dentro de um grupo muscular."""
+    exercise_template_id: str
+    name: str
+    is_primary: bool = True
+    workouts: int = 0
+    sets: int = 0
+    reps: int = 0
+    volume: float = 0.0
+    duration: int = 0
+    distance: float = 0.0
+    last_performed: Optional[datetime] = None
+
+
+@dataclass
+class MuscleGroupVolumeDTO:
+    """DTO para representar o volume treinado de um grupo muscular em um período."""
+    muscle_group: str
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    workouts: int = 0
+    sets: int = 0
+    reps: int = 0
+    volume: float = 0.0
+    duration: int = 0
+    distance: float = 0.0
+    last_performed: Optional[datetime] = None
+    templates: List[MuscleGroupTemplateVolumeDTO] = field(default_factory=list)
+    recent_workout_ids: List[str] = field(default_factory=list)
+
+
+@dataclass
+class MuscleGroupWeeksDTO:
+    """DTO para representar as séries e o volume por semana e grupo muscular."""
+    secondary_weight: float
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    weeks: List[date] = field(default_factory=list)
+    muscle_groups: List[MuscleGroupDTO] = field(default_factory=list)
+    sets: List[List[float]] = field(default_factory=list)
+    volume: List[List[float]] = field(default_factory=list)
+    unassigned_sets: List[int] = field(default_factory=list)
+
+    @classmethod
+    def from_entity(cls, matrix: MuscleGroupWeeks) -> 'MuscleGroupWeeksDTO':
+        """
+        Cria um DTO a partir da matriz calculada pelo serviço de análise.
+
+        Args:
+            matrix: Entidade MuscleGroupWeeks
+
+        Returns:
+            Uma instância de MuscleGroupWeeksDTO, com os valores arredondados
+        """
+        return cls(
+            secondary_weight=matrix.secondary_weight,
+            start=matrix.start,
+            end=matrix.end,
+            weeks=matrix.weeks,
+            muscle_groups=[MuscleGroupDTO(id=mg.id, name=mg.name) for mg in matrix.muscle_groups],
+            sets=[[round(value, 2) for value in row] for row in matrix.sets],
+            volume=[[round(value, 2) for value in row] for row in matrix.volume],
+            unassigned_sets=matrix.unassigned_sets
+        )
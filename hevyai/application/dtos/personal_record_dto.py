@@ -0,0 +1,105 @@
+"""
+DTOs (Data Transfer Objects) para recordes pessoais.
+Estes objetos são usados para transferir dados entre as camadas de aplicação e apresentação.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from hevyai.domain.entities.personal_record import OneRepMaxPoint, PersonalRecords, RecordSet
+
+
+@dataclass
+class RecordSetDTO:
+    """DTO para representar a série que detém um recorde."""
+    value: float
+    weight: float
+    reps: int
+    workout_id: str
+    performed_at: Optional[datetime] = None
+
+    @classmethod
+    def from_entity(cls, record: Optional[RecordSet]) -> Optional['RecordSetDTO']:
+        """
+        Cria um DTO a partir de uma entidade RecordSet.
+
+        Args:
+            record: Entidade RecordSet (ou None, quando não há recorde)
+
+        Returns:
+            Uma instância de RecordSetDTO ou None
+        """
+        if record is None:
+            return None
+        return cls(
+            value=round(record.value, 2),
+            weight=record.weight,
+            reps=record.reps,
+            workout_id=record.workout_id,
+            performed_at=record.performed_at
+        )
+
+
+@dataclass
+class OneRepMaxPointDTO:
+    """DTO para representar o melhor 1RM estimado de um treino."""
+    workout_id: str
+    performed_at: Optional[datetime]
+    epley: float
+    brzycki: Optional[float] = None
+    is_record: bool = False
+
+    @classmethod
+    def from_entity(cls, point: OneRepMaxPoint) -> 'OneRepMaxPointDTO':
+        """
+        Cria um DTO a partir de uma entidade OneRepMaxPoint.
+
+        Args:
+            point: Entidade OneRepMaxPoint
+
+        Returns:
+            Uma instância de OneRepMaxPointDTO
+        """
+        return cls(
+            workout_id=point.workout_id,
+            performed_at=point.performed_at,
+            epley=round(point.epley, 2),
+            brzycki=None if point.brzycki is None else round(point.brzycki, 2),
+            is_record=point.is_record
+        )
+
+
+@dataclass
+class PersonalRecordsDTO:
+    """DTO para representar os recordes pessoais de um modelo de exercício."""
+    exercise_template_id: str
+    workouts: int = 0
+    best_weight: Optional[RecordSetDTO] = None
+    best_e1rm_epley: Optional[RecordSetDTO] = None
+    best_e1rm_brzycki: Optional[RecordSetDTO] = None
+    best_volume_set: Optional[RecordSetDTO] = None
+    rep_maxes: List[RecordSetDTO] = field(default_factory=list)
+    e1rm_history: List[OneRepMaxPointDTO] = field(default_factory=list)
+
+    @classmethod
+    def from_entity(cls, records: PersonalRecords) -> 'PersonalRecordsDTO':
+        """
+        Cria um DTO a partir de uma entidade PersonalRecords.
+
+        Args:
+            records: Entidade PersonalRecords
+
+        Returns:
+            Uma instância de PersonalRecordsDTO
+        """
+        return cls(
+            exercise_template_id=records.exercise_template_id,
+            workouts=records.workouts,
+            best_weight=RecordSetDTO.from_entity(records.best_weight),
+            best_e1rm_epley=RecordSetDTO.from_entity(records.best_e1rm_epley),
+            best_e1rm_brzycki=RecordSetDTO.from_entity(records.best_e1rm_brzycki),
+            best_volume_set=RecordSetDTO.from_entity(records.best_volume_set),
+            rep_maxes=[RecordSetDTO.from_entity(record) for record in records.rep_maxes],
+            e1rm_history=[OneRepMaxPointDTO.from_entity(point) for point in records.e1rm_history]
+        )
@@ -0,0 +1,152 @@
+"""
+DTOs (Data Transfer Objects) para a aderência dos treinos às rotinas.
+Estes objetos são usados para transferir dados entre as camadas de aplicação e apresentação.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from hevyai.domain.entities.routine_adherence import (
+    ExerciseAdherence,
+    RoutineAdherenceSummary,
+    WorkoutAdherence,
+)
+
+
+def _round(value: Optional[float], digits: int = 2) -> Optional[float]:
+    return None if value is None else round(value, digits)
+
+
+@dataclass
+class ExerciseAdherenceDTO:
+    """DTO para representar a comparação de um exercício planejado com o executado."""
+    exercise_template_id: str
+    name: str
+    planned_sets: int
+    performed_sets: int
+    missed_sets: int
+    extra_sets: int
+    skipped: bool
+    reps_delta: Optional[float] = None
+    weight_delta: Optional[float] = None
+
+    @classmethod
+    def from_entity(cls, exercise: ExerciseAdherence) -> 'ExerciseAdherenceDTO':
+        """
+        Cria um DTO a partir de uma entidade ExerciseAdherence.
+
+        Args:
+            exercise: Entidade ExerciseAdherence
+
+        Returns:
+            Uma instância de ExerciseAdherenceDTO
+        """
+        return cls(
+            exercise_template_id=exercise.exercise_template_id,
+            name=exercise.name,
+            planned_sets=exercise.planned_sets,
+            performed_sets=exercise.performed_sets,
+            missed_sets=exercise.missed_sets,
+            extra_sets=exercise.extra_sets,
+            skipped=exercise.skipped,
+            reps_delta=_round(exercise.reps_delta),
+            weight_delta=_round(exercise.weight_delta)
+        )
+
+
+@dataclass
+class WorkoutAdherenceDTO:
+    """DTO para representar a aderência de um treino à sua rotina."""
+    workout_id: str
+    workout_name: str
+    routine_id: str
+    routine_name: str
+    matched_by: str
+    similarity: float
+    score: float
+    start_time: Optional[datetime] = None
+    planned_exercises: int = 0
+    skipped_exercises: int = 0
+    extra_exercises: int = 0
+    planned_sets: int = 0
+    missed_sets: int = 0
+    extra_sets: int = 0
+    reps_delta: Optional[float] = None
+    weight_delta: Optional[float] = None
+    exercises: List[ExerciseAdherenceDTO] = field(default_factory=list)
+
+    @classmethod
+    def from_entity(cls, adherence: WorkoutAdherence, include_exercises: bool = True) -> 'WorkoutAdherenceDTO':
+        """
+        Cria um DTO a partir de uma entidade WorkoutAdherence.
+
+        Args:
+            adherence: Entidade WorkoutAdherence
+            include_exercises: Se o detalhe de cada exercício deve ser incluído
+
+        Returns:
+            Uma instância de WorkoutAdherenceDTO
+        """
+        return cls(
+            workout_id=adherence.workout_id,
+            workout_name=adherence.workout_name,
+            routine_id=adherence.routine_id,
+            routine_name=adherence.routine_name,
+            matched_by=adherence.matched_by,
+            similarity=round(adherence.similarity, 3),
+            score=round(adherence.score, 3),
+            start_time=adherence.start_time,
+            planned_exercises=adherence.planned_exercises,
+            skipped_exercises=adherence.skipped_exercises,
+            extra_exercises=adherence.extra_exercises,
+            planned_sets=adherence.planned_sets,
+            missed_sets=adherence.missed_sets,
+            extra_sets=adherence.extra_sets,
+            reps_delta=_round(adherence.reps_delta),
+            weight_delta=_round(adherence.weight_delta),
+            exercises=[ExerciseAdherenceDTO.from_entity(e) for e in adherence.exercises] if include_exercises else []
+        )
+
+
+@dataclass
+class RoutineAdherenceSummaryDTO:
+    """DTO para representar a aderência média dos treinos de uma rotina."""
+    routine_id: str
+    routine_name: str
+    workouts: int
+    average_score: float
+    skipped_exercises: int
+    missed_sets: int
+    last_performed: Optional[datetime] = None
+
+    @classmethod
+    def from_entity(cls, summary: RoutineAdherenceSummary) -> 'RoutineAdherenceSummaryDTO':
+        """
+        Cria um DTO a partir de uma entidade RoutineAdherenceSummary.
+
+        Args:
+            summary: Entidade RoutineAdherenceSummary
+
+        Returns:
+            Uma instância de RoutineAdherenceSummaryDTO
+        """
+        return cls(
+            routine_id=summary.routine_id,
+            routine_name=summary.routine_name,
+            workouts=summary.workouts,
+            average_score=round(summary.average_score, 3),
+            skipped_exercises=summary.skipped_exercises,
+            missed_sets=summary.missed_sets,
+            last_performed=summary.last_performed
+        )
+
+
+@dataclass
+class RoutineAdherenceReportDTO:
+    """DTO para representar a aderência às rotinas dos treinos de um período."""
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    unmatched_workouts: int = 0
+    routines: List[RoutineAdherenceSummaryDTO] = field(default_factory=list)
+    workouts: List[WorkoutAdherenceDTO] = field(default_factory=list)
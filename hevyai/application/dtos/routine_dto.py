@@ -7,6 +7,9 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
+from hevyai.domain.entities.routine import Routine, RoutineExercise, RoutineSet
+from hevyai.domain.timestamps import parse_timestamp
+
 
 @dataclass
 class RoutineSetDTO:
@@ -18,6 +21,26 @@ class RoutineSetDTO:
     distance: Optional[float] = None
     rest_seconds: Optional[int] = None
 
+    @classmethod
+    def from_entity(cls, set_item: RoutineSet) -> 'RoutineSetDTO':
+        """
+        Cria uma instância de RoutineSetDTO a partir da entidade de domínio.
+        
+        Args:
+            set_item: Entidade RoutineSet
+            
+        Returns:
+            Uma nova instância de RoutineSetDTO
+        """
+        return cls(
+            id=set_item.id,
+            reps=set_item.reps,
+            weight=set_item.weight,
+            duration=set_item.duration,
+            distance=set_item.distance,
+            rest_seconds=set_item.rest_seconds
+        )
+
 
 @dataclass
 class RoutineExerciseDTO:
@@ -29,6 +52,27 @@ class RoutineExerciseDTO:
     sets: List[RoutineSetDTO] = field(default_factory=list)
     order: int = 0
 
+    @classmethod
+    def from_entity(cls, exercise: RoutineExercise) -> 'RoutineExerciseDTO':
+        """
+        Cria uma instância de RoutineExerciseDTO a partir da entidade de domínio.
+        
+        Args:
+            exercise: Entidade RoutineExercise
+            
+        Returns:
+            Uma nova instância de RoutineExerciseDTO, com as séries já convertidas
+        """
+        set_from_entity = RoutineSetDTO.from_entity
+        return cls(
+            id=exercise.id,
+            exercise_template_id=exercise.exercise_template_id,
+            name=exercise.name,
+            notes=exercise.notes,
+            sets=[set_from_entity(set_item) for set_item in exercise.sets],
+            order=exercise.order
+        )
+
 
 @dataclass
 class RoutineDTO:
@@ -42,6 +86,29 @@ class RoutineDTO:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
+    @classmethod
+    def from_entity(cls, routine: Routine) -> 'RoutineDTO':
+        """
+        Cria uma instância de RoutineDTO a partir da entidade de domínio.
+        
+        Args:
+            routine: Entidade Routine
+            
+        Returns:
+            Uma nova instância de RoutineDTO
+        """
+        exercise_from_entity = RoutineExerciseDTO.from_entity
+        return cls(
+            id=routine.id,
+            name=routine.name,
+            exercises=[exercise_from_entity(exercise) for exercise in routine.exercises],
+            notes=routine.notes,
+            folder_id=routine.folder_id,
+            is_public=routine.is_public,
+            created_at=routine.created_at,
+            updated_at=routine.updated_at
+        )
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'RoutineDTO':
         """
@@ -75,20 +142,6 @@ class RoutineDTO:
                 order=exercise_data.get('order', 0)
             ))
                 
-        created_at = None
-        if data.get('created_at'):
-            try:
-                created_at = datetime.fromisoformat(data.get('created_at'))
-            except ValueError:
-                pass
-                
-        updated_at = None
-        if data.get('updated_at'):
-            try:
-                updated_at = datetime.fromisoformat(data.get('updated_at'))
-            except ValueError:
-                pass
-        
         return cls(
             id=data.get('id', ''),
             name=data.get('name', ''),
@@ -96,6 +149,6 @@ class RoutineDTO:
             notes=data.get('notes'),
             folder_id=data.get('folder_id'),
             is_public=data.get('is_public', False),
-            created_at=created_at,
-            updated_at=updated_at
+            created_at=parse_timestamp(data.get('created_at')),
+            updated_at=parse_timestamp(data.get('updated_at'))
         )
\ No newline at end of file
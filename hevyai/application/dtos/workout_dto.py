@@ -7,6 +7,9 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
+from hevyai.domain.entities.workout import Exercise, Set, Workout
+from hevyai.domain.timestamps import parse_timestamp
+
 
 @dataclass
 class SetDTO:
@@ -19,6 +22,27 @@ class SetDTO:
     rpe: Optional[float] = None
     completed: bool = True
 
+    @classmethod
+    def from_entity(cls, set_item: Set) -> 'SetDTO':
+        """
+        Cria uma instância de SetDTO a partir da entidade de domínio.
+        
+        Args:
+            set_item: Entidade Set
+            
+        Returns:
+            Uma nova instância de SetDTO
+        """
+        return cls(
+            id=set_item.id,
+            reps=set_item.reps,
+            weight=set_item.weight,
+            duration=set_item.duration,
+            distance=set_item.distance,
+            rpe=set_item.rpe,
+            completed=set_item.completed
+        )
+
 
 @dataclass
 class ExerciseDTO:
@@ -29,6 +53,26 @@ class ExerciseDTO:
     notes: Optional[str] = None
     sets: List[SetDTO] = field(default_factory=list)
 
+    @classmethod
+    def from_entity(cls, exercise: Exercise) -> 'ExerciseDTO':
+        """
+        Cria uma instância de ExerciseDTO a partir da entidade de domínio.
+        
+        Args:
+            exercise: Entidade Exercise
+            
+        Returns:
+            Uma nova instância de ExerciseDTO, com as séries já convertidas
+        """
+        set_from_entity = SetDTO.from_entity
+        return cls(
+            id=exercise.id,
+            exercise_template_id=exercise.exercise_template_id,
+            name=exercise.name,
+            notes=exercise.notes,
+            sets=[set_from_entity(set_item) for set_item in exercise.sets]
+        )
+
 
 @dataclass
 class WorkoutDTO:
@@ -37,11 +81,39 @@ class WorkoutDTO:
     name: str
     exercises: List[ExerciseDTO] = field(default_factory=list)
     notes: Optional[str] = None
+    routine_id: Optional[str] = None
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
+    @classmethod
+    def from_entity(cls, workout: Workout) -> 'WorkoutDTO':
+        """
+        Cria uma instância de WorkoutDTO a partir da entidade de domínio.
+        
+        Copia os campos diretamente, sem passar por um dicionário intermediário
+        nem converter as datas para texto e de volta.
+        
+        Args:
+            workout: Entidade Workout
+            
+        Returns:
+            Uma nova instância de WorkoutDTO
+        """
+        exercise_from_entity = ExerciseDTO.from_entity
+        return cls(
+            id=workout.id,
+            name=workout.name,
+            exercises=[exercise_from_entity(exercise) for exercise in workout.exercises],
+            notes=workout.notes,
+            routine_id=workout.routine_id,
+            start_time=workout.start_time,
+            end_time=workout.end_time,
+            created_at=workout.created_at,
+            updated_at=workout.updated_at
+        )
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'WorkoutDTO':
         """
@@ -75,41 +147,14 @@ class WorkoutDTO:
                 sets=set_dtos
             ))
         
-        start_time = None
-        if data.get('start_time'):
-            try:
-                start_time = datetime.fromisoformat(data.get('start_time'))
-            except ValueError:
-                pass
-                
-        end_time = None
-        if data.get('end_time'):
-            try:
-                end_time = datetime.fromisoformat(data.get('end_time'))
-            except ValueError:
-                pass
-                
-        created_at = None
-        if data.get('created_at'):
-            try:
-                created_at = datetime.fromisoformat(data.get('created_at'))
-            except ValueError:
-                pass
-                
-        updated_at = None
-        if data.get('updated_at'):
-            try:
-                updated_at = datetime.fromisoformat(data.get('updated_at'))
-            except ValueError:
-                pass
-        
         return cls(
             id=data.get('id', ''),
             name=data.get('name', ''),
             exercises=exercise_dtos,
             notes=data.get('notes'),
-            start_time=start_time,
-            end_time=end_time,
-            created_at=created_at,
-            updated_at=updated_at
+            routine_id=data.get('routine_id'),
+            start_time=parse_timestamp(data.get('start_time')),
+            end_time=parse_timestamp(data.get('end_time')),
+            created_at=parse_timestamp(data.get('created_at')),
+            updated_at=parse_timestamp(data.get('updated_at'))
         )
\ No newline at end of file
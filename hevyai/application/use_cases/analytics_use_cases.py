@@ -0,0 +1,151 @@
+"""
+Casos de uso relacionados às análises do histórico de treinos.
+Implementa os resumos de volume, tonelagem e intensidade sobre todas as séries,
+as séries de carga de treino aguda e crônica e os totais por período.
+"""
+
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Optional
+
+from hevyai.application.dtos.analytics_dto import (
+    TrainingLoadSeriesDTO,
+    TrainingSummaryDTO,
+    WorkoutRollupDTO,
+    WorkoutRollupsDTO,
+)
+from hevyai.domain.entities.workout_rollup import ROLLUP_PERIODS
+from hevyai.domain.repositories.set_history_repository import SetHistoryRepository
+from hevyai.domain.repositories.training_load_repository import TrainingLoadRepository
+from hevyai.domain.repositories.workout_rollup_repository import WorkoutRollupRepository
+from hevyai.domain.services.workout_analysis_service import WorkoutAnalysisService
+
+# Dias exibidos quando o intervalo não é informado
+DEFAULT_LOAD_WINDOW_DAYS = 90
+# Limite de dias de uma série de carga em uma consulta
+MAX_LOAD_WINDOW_DAYS = 3660
+
+
+class GetTrainingSummaryUseCase:
+    """Caso de uso para resumir o histórico de treinos por treino, exercício ou período."""
+
+    def __init__(self, set_history_repository: SetHistoryRepository, analysis_service: Optional[WorkoutAnalysisService] = None):
+        """
+        Inicializa o caso de uso com o histórico de séries e o serviço de análise.
+
+        Args:
+            set_history_repository: Repositório do histórico de séries
+            analysis_service: Serviço de análise de treinos (padrão: um novo WorkoutAnalysisService)
+        """
+        self.set_history_repository = set_history_repository
+        self.analysis_service = analysis_service or WorkoutAnalysisService()
+
+    def execute(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        group_by: str = 'week',
+        tz: tzinfo = timezone.utc
+    ) -> TrainingSummaryDTO:
+        """
+        Executa o caso de uso para resumir os treinos iniciados em um período.
+
+        Args:
+            start: Início do período, inclusivo (opcional)
+            end: Fim do período, exclusivo (opcional)
+            group_by: 'workout', 'exercise', 'day', 'week', 'month' ou 'year' (padrão: 'week')
+            tz: Fuso horário do calendário dos períodos (padrão: UTC)
+
+        Returns:
+            DTO com os totais do período e de cada grupo
+
+        Raises:
+            ValueError: Se o agrupamento não for um dos aceitos
+        """
+        batch = self.set_history_repository.get_set_batch()
+        summary = self.analysis_service.summarize(batch, start, end, group_by, tz)
+        return TrainingSummaryDTO.from_entity(summary)
+
+
+class GetTrainingLoadUseCase:
+    """Caso de uso para obter a carga de treino diária com as médias aguda e crônica."""
+
+    def __init__(self, training_load_repository: TrainingLoadRepository):
+        """
+        Inicializa o caso de uso com um repositório de carga de treino.
+
+        Args:
+            training_load_repository: Repositório de carga de treino
+        """
+        self.training_load_repository = training_load_repository
+
+    def execute(
+        self,
+        metric: str,
+        scope: str,
+        today: date,
+        start: Optional[date] = None,
+        end: Optional[date] = None
+    ) -> TrainingLoadSeriesDTO:
+        """
+        Executa o caso de uso para obter a série de carga de um escopo.
+
+        Args:
+            metric: 'volume' ou 'srpe'
+            scope: 'all' ou o ID de um grupo muscular
+            today: Dia atual, usado como fim padrão do intervalo
+            start: Primeiro dia, inclusivo (padrão: DEFAULT_LOAD_WINDOW_DAYS dias antes do fim)
+            end: Último dia, inclusivo (padrão: hoje)
+
+        Returns:
+            DTO com um item por dia do intervalo
+
+        Raises:
+            ValueError: Se o intervalo for invertido ou maior que MAX_LOAD_WINDOW_DAYS dias
+        """
+        end = end or today
+        start = start or end - timedelta(days=DEFAULT_LOAD_WINDOW_DAYS - 1)
+        if start > end:
+            raise ValueError("A data inicial deve ser anterior à data final")
+        if (end - start).days >= MAX_LOAD_WINDOW_DAYS:
+            raise ValueError(f"O período deve ter no máximo {MAX_LOAD_WINDOW_DAYS} dias")
+        series = self.training_load_repository.get_series(metric, scope, start, end)
+        scopes = self.training_load_repository.get_scopes(metric)
+        return TrainingLoadSeriesDTO.from_entity(series, scopes)
+
+
+class GetWorkoutRollupsUseCase:
+    """Caso de uso para obter os totais de treinos por dia, semana ou mês."""
+
+    def __init__(self, workout_rollup_repository: WorkoutRollupRepository):
+        """
+        Inicializa o caso de uso com um repositório de totais por período.
+
+        Args:
+            workout_rollup_repository: Repositório dos totais por período
+        """
+        self.workout_rollup_repository = workout_rollup_repository
+
+    def execute(self, period: str = 'week', start: Optional[date] = None, end: Optional[date] = None) -> WorkoutRollupsDTO:
+        """
+        Executa o caso de uso para obter os totais dos períodos de um intervalo.
+
+        Args:
+            period: 'day', 'week' ou 'month' (padrão: 'week')
+            start: Primeiro dia, inclusivo (opcional)
+            end: Último dia, inclusivo (opcional)
+
+        Returns:
+            DTO com os totais dos períodos com treinos, em ordem cronológica
+
+        Raises:
+            ValueError: Se o período não for um dos aceitos
+        """
+        if period not in ROLLUP_PERIODS:
+            raise ValueError(f"Período inválido: '{period}' (use {', '.join(ROLLUP_PERIODS)})")
+        rollups = self.workout_rollup_repository.get_rollups(period, start, end)
+        return WorkoutRollupsDTO(
+            period=period,
+            start=start,
+            end=end,
+            rollups=[WorkoutRollupDTO.from_entity(rollup) for rollup in rollups]
+        )
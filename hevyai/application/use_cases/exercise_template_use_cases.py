@@ -3,11 +3,16 @@ Casos de uso relacionados a modelos de exercícios.
 Implementa as operações de negócio envolvendo modelos de exercícios.
 """
 
+from datetime import datetime
 from typing import List, Optional
 
+from hevyai.application.dtos.exercise_history_dto import ExerciseHistoryDTO
 from hevyai.application.dtos.exercise_template_dto import ExerciseTemplateDTO
-from hevyai.domain.entities.exercise_template import ExerciseTemplate
+from hevyai.application.dtos.personal_record_dto import PersonalRecordsDTO
+from hevyai.domain.repositories.exercise_history_repository import ExerciseHistoryRepository
 from hevyai.domain.repositories.exercise_template_repository import ExerciseTemplateRepository
+from hevyai.domain.repositories.personal_record_repository import PersonalRecordRepository
+from hevyai.domain.services.exercise_history_service import ExerciseHistoryService
 
 
 class GetExerciseTemplatesUseCase:
@@ -22,43 +27,32 @@ class GetExerciseTemplatesUseCase:
         """
         self.template_repository = template_repository
     
-    def execute(self, page: int = 1, per_page: int = 10) -> List[ExerciseTemplateDTO]:
+    def execute(
+        self,
+        page: int = 1,
+        per_page: int = 10,
+        is_custom: Optional[bool] = None,
+        muscle_group: Optional[str] = None
+    ) -> List[ExerciseTemplateDTO]:
         """
         Executa o caso de uso para listar modelos de exercícios.
         
         Args:
             page: Número da página (padrão: 1)
             per_page: Quantidade de itens por página (padrão: 10)
+            is_custom: Se informado, apenas personalizados (True) ou padrão (False)
+            muscle_group: ID ou nome de um grupo muscular
             
         Returns:
             Lista de DTOs de modelos de exercícios
         """
-        templates = self.template_repository.get_all(page, per_page)
+        if is_custom is None and not muscle_group:
+            templates = self.template_repository.get_all(page, per_page)
+        else:
+            templates = self.template_repository.find(is_custom, muscle_group, page, per_page)
         
         # Converter entidades de domínio para DTOs
-        template_dtos = []
-        for template in templates:
-            # Converter para dict e usar o método from_dict do DTO
-            template_dict = {
-                "id": template.id,
-                "name": template.name,
-                "description": template.description,
-                "is_custom": template.is_custom,
-                "created_at": template.created_at.isoformat() if template.created_at else None,
-                "updated_at": template.updated_at.isoformat() if template.updated_at else None,
-                "muscle_groups": []
-            }
-            
-            for mg in template.muscle_groups:
-                mg_dict = {
-                    "id": mg.id,
-                    "name": mg.name
-                }
-                template_dict["muscle_groups"].append(mg_dict)
-            
-            template_dtos.append(ExerciseTemplateDTO.from_dict(template_dict))
-        
-        return template_dtos
+        return [ExerciseTemplateDTO.from_entity(template) for template in templates]
 
 
 class GetExerciseTemplateByIdUseCase:
@@ -89,21 +83,105 @@ class GetExerciseTemplateByIdUseCase:
             return None
         
         # Converter entidade de domínio para DTO
-        template_dict = {
-            "id": template.id,
-            "name": template.name,
-            "description": template.description,
-            "is_custom": template.is_custom,
-            "created_at": template.created_at.isoformat() if template.created_at else None,
-            "updated_at": template.updated_at.isoformat() if template.updated_at else None,
-            "muscle_groups": []
-        }
-        
-        for mg in template.muscle_groups:
-            mg_dict = {
-                "id": mg.id,
-                "name": mg.name
-            }
-            template_dict["muscle_groups"].append(mg_dict)
-        
-        return ExerciseTemplateDTO.from_dict(template_dict)
\ No newline at end of file
+        return ExerciseTemplateDTO.from_entity(template)
+
+
+class SearchExerciseTemplatesUseCase:
+    """Caso de uso para buscar modelos de exercícios por nome e descrição."""
+    
+    def __init__(self, template_repository: ExerciseTemplateRepository):
+        """
+        Inicializa o caso de uso com um repositório de modelos de exercícios.
+        
+        Args:
+            template_repository: Repositório de modelos de exercícios
+        """
+        self.template_repository = template_repository
+    
+    def execute(self, query: str, limit: int = 20) -> List[ExerciseTemplateDTO]:
+        """
+        Executa o caso de uso para buscar modelos de exercícios.
+        
+        Args:
+            query: Texto da busca
+            limit: Quantidade máxima de resultados (padrão: 20)
+            
+        Returns:
+            Lista de DTOs de modelos de exercícios, do mais relevante para o menos
+        """
+        templates = self.template_repository.search(query, limit)
+        
+        # Converter entidades de domínio para DTOs
+        return [ExerciseTemplateDTO.from_entity(template) for template in templates]
+
+
+class GetExerciseTemplateRecordsUseCase:
+    """Caso de uso para obter os recordes pessoais de um modelo de exercício."""
+    
+    def __init__(self, record_repository: PersonalRecordRepository):
+        """
+        Inicializa o caso de uso com um repositório de recordes pessoais.
+        
+        Args:
+            record_repository: Repositório de recordes pessoais
+        """
+        self.record_repository = record_repository
+    
+    def execute(self, template_id: str) -> PersonalRecordsDTO:
+        """
+        Executa o caso de uso para obter os recordes de um modelo de exercício.
+        
+        Args:
+            template_id: ID do modelo de exercício
+            
+        Returns:
+            DTO com os recordes e a evolução do 1RM estimado
+        """
+        records = self.record_repository.get_records(template_id)
+        
+        # Converter entidade de domínio para DTO
+        return PersonalRecordsDTO.from_entity(records)
+
+
+class GetExerciseTemplateHistoryUseCase:
+    """Caso de uso para obter a evolução de um modelo de exercício."""
+    
+    def __init__(
+        self,
+        history_repository: ExerciseHistoryRepository,
+        history_service: Optional[ExerciseHistoryService] = None
+    ):
+        """
+        Inicializa o caso de uso.
+        
+        Args:
+            history_repository: Repositório da evolução por modelo de exercício
+            history_service: Serviço da evolução (padrão: ExerciseHistoryService())
+        """
+        self.history_repository = history_repository
+        self.history_service = history_service or ExerciseHistoryService()
+    
+    def execute(
+        self,
+        template_id: str,
+        max_points: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> ExerciseHistoryDTO:
+        """
+        Executa o caso de uso para obter a evolução de um modelo de exercício.
+        
+        Args:
+            template_id: ID do modelo de exercício
+            max_points: Quantidade máxima de pontos por série
+            start: Início do período, inclusivo (opcional)
+            end: Fim do período, exclusivo (opcional)
+            
+        Returns:
+            DTO com as séries de série principal, 1RM estimado e volume
+        """
+        sessions = self.history_repository.get_sessions(template_id, start, end)
+        history = self.history_service.build_history(template_id, sessions, max_points, start, end)
+        
+        # Converter entidade de domínio para DTO
+        return ExerciseHistoryDTO.from_entity(history)
@@ -0,0 +1,238 @@
+"""
+Casos de uso relacionados a grupos musculares.
+Implementa as consultas de modelos de exercícios e de volume treinado por grupo muscular.
+"""
+
+from datetime import datetime, timezone, tzinfo
+from typing import Dict, List, Optional
+
+from hevyai.application.dtos.exercise_template_dto import ExerciseTemplateDTO
+from hevyai.application.dtos.muscle_group_dto import (
+    MuscleGroupSummaryDTO,
+    MuscleGroupTemplateVolumeDTO,
+    MuscleGroupVolumeDTO,
+    MuscleGroupWeeksDTO,
+)
+from hevyai.domain.entities.exercise_template import ExerciseTemplate
+from hevyai.domain.repositories.exercise_template_repository import ExerciseTemplateRepository
+from hevyai.domain.repositories.set_history_repository import SetHistoryRepository
+from hevyai.domain.repositories.template_usage_repository import TemplateUsageRepository
+from hevyai.domain.services.workout_analysis_service import WorkoutAnalysisService
+
+# Modelos de exercícios lidos por chamada ao reunir todos os modelos de um grupo
+TEMPLATE_PAGE_SIZE = 500
+# Treinos mais recentes listados no volume de um grupo muscular
+RECENT_WORKOUTS = 10
+
+
+def find_group_templates(template_repository: ExerciseTemplateRepository, muscle_group: str) -> List[ExerciseTemplate]:
+    """
+    Obtém todos os modelos de exercícios de um grupo muscular pelo filtro do repositório.
+
+    Args:
+        template_repository: Repositório de modelos de exercícios
+        muscle_group: ID ou nome do grupo muscular
+
+    Returns:
+        Lista de modelos de exercícios do grupo
+    """
+    templates: List[ExerciseTemplate] = []
+    page = 1
+    while True:
+        batch = template_repository.find(muscle_group=muscle_group, page=page, per_page=TEMPLATE_PAGE_SIZE)
+        templates.extend(batch)
+        if len(batch) < TEMPLATE_PAGE_SIZE:
+            return templates
+        page += 1
+
+
+def is_primary_group(template: ExerciseTemplate, muscle_group: str) -> bool:
+    """
+    Indica se o grupo muscular é o principal do modelo (o primeiro da lista).
+
+    Args:
+        template: Modelo de exercício
+        muscle_group: ID ou nome do grupo muscular
+
+    Returns:
+        True se o grupo for o primeiro grupo muscular do modelo
+    """
+    if not template.muscle_groups:
+        return False
+    first = template.muscle_groups[0]
+    return muscle_group.strip().lower() in (first.id.lower(), first.name.lower())
+
+
+class ListMuscleGroupsUseCase:
+    """Caso de uso para listar os grupos musculares dos modelos de exercícios."""
+
+    def __init__(self, template_repository: ExerciseTemplateRepository):
+        """
+        Inicializa o caso de uso com um repositório de modelos de exercícios.
+
+        Args:
+            template_repository: Repositório de modelos de exercícios
+        """
+        self.template_repository = template_repository
+
+    def execute(self) -> List[MuscleGroupSummaryDTO]:
+        """
+        Executa o caso de uso para listar os grupos musculares.
+
+        Returns:
+            Lista de DTOs de grupos musculares, ordenada pelo nome
+        """
+        groups: Dict[str, MuscleGroupSummaryDTO] = {}
+        for template in self.template_repository.iter_all():
+            for mg in template.muscle_groups:
+                key = (mg.id or mg.name).lower()
+                if key not in groups:
+                    groups[key] = MuscleGroupSummaryDTO(id=mg.id, name=mg.name)
+                groups[key].template_count += 1
+        return sorted(groups.values(), key=lambda group: group.name.lower())
+
+
+class GetMuscleGroupTemplatesUseCase:
+    """Caso de uso para listar os modelos de exercícios de um grupo muscular."""
+
+    def __init__(self, template_repository: ExerciseTemplateRepository):
+        """
+        Inicializa o caso de uso com um repositório de modelos de exercícios.
+
+        Args:
+            template_repository: Repositório de modelos de exercícios
+        """
+        self.template_repository = template_repository
+
+    def execute(self, muscle_group: str, page: int = 1, per_page: int = 10) -> List[ExerciseTemplateDTO]:
+        """
+        Executa o caso de uso para listar os modelos de exercícios de um grupo muscular.
+
+        Args:
+            muscle_group: ID ou nome do grupo muscular
+            page: Número da página (padrão: 1)
+            per_page: Quantidade de itens por página (padrão: 10)
+
+        Returns:
+            Lista de DTOs de modelos de exercícios
+        """
+        templates = self.template_repository.find(muscle_group=muscle_group, page=page, per_page=per_page)
+
+        # Converter entidades de domínio para DTOs
+        return [ExerciseTemplateDTO.from_entity(template) for template in templates]
+
+
+class GetMuscleGroupVolumeUseCase:
+    """Caso de uso para obter o volume treinado de um grupo muscular."""
+
+    def __init__(self, template_repository: ExerciseTemplateRepository, usage_repository: TemplateUsageRepository):
+        """
+        Inicializa o caso de uso com os repositórios necessários.
+
+        Args:
+            template_repository: Repositório de modelos de exercícios
+            usage_repository: Repositório de uso de modelos de exercícios
+        """
+        self.template_repository = template_repository
+        self.usage_repository = usage_repository
+
+    def execute(
+        self,
+        muscle_group: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> MuscleGroupVolumeDTO:
+        """
+        Executa o caso de uso para obter o volume treinado de um grupo muscular.
+
+        Os totais do grupo somam todos os modelos de exercícios em que ele aparece,
+        seja como grupo principal ou secundário; cada modelo indica o seu papel.
+
+        Args:
+            muscle_group: ID ou nome do grupo muscular
+            start: Início do período, inclusivo (opcional)
+            end: Fim do período, exclusivo (opcional)
+
+        Returns:
+            DTO com o volume do grupo e de cada modelo de exercício treinado
+        """
+        templates = {t.id: t for t in find_group_templates(self.template_repository, muscle_group)}
+        usage = self.usage_repository.get_usage(templates.keys(), start, end)
+        workouts = self.usage_repository.get_workouts(usage.keys(), start, end)
+
+        result = MuscleGroupVolumeDTO(muscle_group=muscle_group, start=start, end=end, workouts=len(workouts))
+        for template_id, item in usage.items():
+            template = templates[template_id]
+            result.templates.append(MuscleGroupTemplateVolumeDTO(
+                exercise_template_id=template_id,
+                name=template.name,
+                is_primary=is_primary_group(template, muscle_group),
+                workouts=item.workouts,
+                sets=item.sets,
+                reps=item.reps,
+                volume=round(item.volume, 2),
+                duration=item.duration,
+                distance=item.distance,
+                last_performed=item.last_performed
+            ))
+            result.sets += item.sets
+            result.reps += item.reps
+            result.volume += item.volume
+            result.duration += item.duration
+            result.distance += item.distance
+
+        result.volume = round(result.volume, 2)
+        result.templates.sort(key=lambda t: (-t.sets, t.name))
+        result.recent_workout_ids = [workout_id for workout_id, _ in workouts[:RECENT_WORKOUTS]]
+        if workouts:
+            result.last_performed = workouts[0][1]
+        return result
+
+
+class GetMuscleGroupWeeksUseCase:
+    """Caso de uso para obter as séries e o volume de todos os grupos musculares por semana."""
+
+    def __init__(
+        self,
+        template_repository: ExerciseTemplateRepository,
+        set_history_repository: SetHistoryRepository,
+        analysis_service: Optional[WorkoutAnalysisService] = None
+    ):
+        """
+        Inicializa o caso de uso com os repositórios necessários.
+
+        Args:
+            template_repository: Repositório de modelos de exercícios
+            set_history_repository: Repositório do histórico de séries
+            analysis_service: Serviço de análise de treinos (padrão: um novo WorkoutAnalysisService)
+        """
+        self.template_repository = template_repository
+        self.set_history_repository = set_history_repository
+        self.analysis_service = analysis_service or WorkoutAnalysisService()
+
+    def execute(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        tz: tzinfo = timezone.utc,
+        secondary_weight: float = 0.0
+    ) -> MuscleGroupWeeksDTO:
+        """
+        Executa o caso de uso para montar a matriz semanas × grupos musculares.
+
+        Os modelos de exercícios do histórico são obtidos de uma vez com
+        `get_many`, e não um a um.
+
+        Args:
+            start: Início do período, inclusivo (opcional)
+            end: Fim do período, exclusivo (opcional)
+            tz: Fuso horário do calendário das semanas (padrão: UTC)
+            secondary_weight: Peso das séries nos grupos musculares secundários (padrão: 0)
+
+        Returns:
+            DTO com as semanas, os grupos musculares e as matrizes de séries e volume
+        """
+        batch = self.set_history_repository.get_set_batch()
+        templates = self.template_repository.get_many(batch.template_ids)
+        matrix = self.analysis_service.muscle_group_weeks(batch, templates, start, end, tz, secondary_weight)
+        return MuscleGroupWeeksDTO.from_entity(matrix)
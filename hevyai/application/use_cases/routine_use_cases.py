@@ -3,11 +3,22 @@ Casos de uso relacionados a rotinas.
 Implementa as operações de negócio envolvendo rotinas.
 """
 
+from datetime import datetime
 from typing import List, Optional
 
+from hevyai.application.dtos.last_performed_dto import RoutineExercisePreviousDTO, RoutinePreviousValuesDTO
+from hevyai.application.dtos.routine_adherence_dto import (
+    RoutineAdherenceReportDTO,
+    RoutineAdherenceSummaryDTO,
+    WorkoutAdherenceDTO,
+)
 from hevyai.application.dtos.routine_dto import RoutineDTO
-from hevyai.domain.entities.routine import Routine
+from hevyai.domain.entities.routine_adherence import PerformedWorkout
+from hevyai.domain.repositories.last_performed_repository import LastPerformedRepository
+from hevyai.domain.repositories.performed_workout_repository import PerformedWorkoutRepository
 from hevyai.domain.repositories.routine_repository import RoutineRepository
+from hevyai.domain.repositories.workout_repository import WorkoutRepository
+from hevyai.domain.services.routine_adherence_service import RoutineAdherenceService, RoutineSignatureIndex
 
 
 class GetRoutinesUseCase:
@@ -36,48 +47,7 @@ class GetRoutinesUseCase:
         routines = self.routine_repository.get_all(page, per_page)
         
         # Converter entidades de domínio para DTOs
-        routine_dtos = []
-        for routine in routines:
-            # Aqui, idealmente, você teria um método específico para converter
-            # entidade para DTO. Para simplificar, estamos convertendo para dict
-            # e usando o método from_dict do DTO.
-            routine_dict = {
-                "id": routine.id,
-                "name": routine.name,
-                "notes": routine.notes,
-                "folder_id": routine.folder_id,
-                "is_public": routine.is_public,
-                "created_at": routine.created_at.isoformat() if routine.created_at else None,
-                "updated_at": routine.updated_at.isoformat() if routine.updated_at else None,
-                "exercises": []
-            }
-            
-            for exercise in routine.exercises:
-                exercise_dict = {
-                    "id": exercise.id,
-                    "exercise_template_id": exercise.exercise_template_id,
-                    "name": exercise.name,
-                    "notes": exercise.notes,
-                    "order": exercise.order,
-                    "sets": []
-                }
-                
-                for set_item in exercise.sets:
-                    set_dict = {
-                        "id": set_item.id,
-                        "reps": set_item.reps,
-                        "weight": set_item.weight,
-                        "duration": set_item.duration,
-                        "distance": set_item.distance,
-                        "rest_seconds": set_item.rest_seconds
-                    }
-                    exercise_dict["sets"].append(set_dict)
-                
-                routine_dict["exercises"].append(exercise_dict)
-            
-            routine_dtos.append(RoutineDTO.from_dict(routine_dict))
-        
-        return routine_dtos
+        return [RoutineDTO.from_entity(routine) for routine in routines]
 
 
 class GetRoutineByIdUseCase:
@@ -107,39 +77,150 @@ class GetRoutineByIdUseCase:
         if not routine:
             return None
         
-        # Converter entidade de domínio para DTO (simplificado)
-        routine_dict = {
-            "id": routine.id,
-            "name": routine.name,
-            "notes": routine.notes,
-            "folder_id": routine.folder_id,
-            "is_public": routine.is_public,
-            "created_at": routine.created_at.isoformat() if routine.created_at else None,
-            "updated_at": routine.updated_at.isoformat() if routine.updated_at else None,
-            "exercises": []
-        }
-        
-        for exercise in routine.exercises:
-            exercise_dict = {
-                "id": exercise.id,
-                "exercise_template_id": exercise.exercise_template_id,
-                "name": exercise.name,
-                "notes": exercise.notes,
-                "order": exercise.order,
-                "sets": []
-            }
-            
-            for set_item in exercise.sets:
-                set_dict = {
-                    "id": set_item.id,
-                    "reps": set_item.reps,
-                    "weight": set_item.weight,
-                    "duration": set_item.duration,
-                    "distance": set_item.distance,
-                    "rest_seconds": set_item.rest_seconds
-                }
-                exercise_dict["sets"].append(set_dict)
-            
-            routine_dict["exercises"].append(exercise_dict)
-        
-        return RoutineDTO.from_dict(routine_dict)
\ No newline at end of file
+        # Converter entidade de domínio para DTO
+        return RoutineDTO.from_entity(routine)
+
+
+class GetRoutineAdherenceUseCase:
+    """Caso de uso para medir a aderência dos treinos de um período às rotinas."""
+
+    def __init__(
+        self,
+        performed_workout_repository: PerformedWorkoutRepository,
+        routine_repository: RoutineRepository,
+        service: Optional[RoutineAdherenceService] = None
+    ):
+        """
+        Inicializa o caso de uso.
+
+        Args:
+            performed_workout_repository: Repositório dos treinos executados
+            routine_repository: Repositório de rotinas
+            service: Serviço de aderência (padrão: RoutineAdherenceService())
+        """
+        self.performed_workout_repository = performed_workout_repository
+        self.routine_repository = routine_repository
+        self.service = service or RoutineAdherenceService()
+
+    def execute(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        routine_id: Optional[str] = None
+    ) -> RoutineAdherenceReportDTO:
+        """
+        Executa o caso de uso para medir a aderência às rotinas.
+
+        Args:
+            start: Início do período, inclusivo (opcional)
+            end: Fim do período, exclusivo (opcional)
+            routine_id: Restringe o resultado aos treinos associados a esta rotina (opcional)
+
+        Returns:
+            DTO com o resumo por rotina e a aderência de cada treino, do mais
+            recente para o mais antigo (sem o detalhe por exercício)
+        """
+        workouts = self.performed_workout_repository.get_performed_workouts(start, end)
+        routines = list(self.routine_repository.iter_all())
+        adherences, unmatched = self.service.score_history(workouts, routines)
+        if routine_id:
+            adherences = [a for a in adherences if a.routine_id == routine_id]
+
+        return RoutineAdherenceReportDTO(
+            start=start,
+            end=end,
+            unmatched_workouts=unmatched,
+            routines=[RoutineAdherenceSummaryDTO.from_entity(s) for s in self.service.summarize(adherences)],
+            workouts=[WorkoutAdherenceDTO.from_entity(a, include_exercises=False) for a in reversed(adherences)]
+        )
+
+
+class GetWorkoutAdherenceUseCase:
+    """Caso de uso para comparar um treino com a rotina da qual ele veio."""
+
+    def __init__(
+        self,
+        workout_repository: WorkoutRepository,
+        routine_repository: RoutineRepository,
+        service: Optional[RoutineAdherenceService] = None
+    ):
+        """
+        Inicializa o caso de uso.
+
+        Args:
+            workout_repository: Repositório de treinos
+            routine_repository: Repositório de rotinas
+            service: Serviço de aderência (padrão: RoutineAdherenceService())
+        """
+        self.workout_repository = workout_repository
+        self.routine_repository = routine_repository
+        self.service = service or RoutineAdherenceService()
+
+    def execute(self, workout_id: str) -> Optional[WorkoutAdherenceDTO]:
+        """
+        Executa o caso de uso para comparar um treino com a sua rotina.
+
+        A rotina informada pelo treino é buscada diretamente; sem ela, o treino
+        é associado pela assinatura entre todas as rotinas.
+
+        Args:
+            workout_id: ID do treino
+
+        Returns:
+            DTO da aderência, com o detalhe por exercício, ou None se o treino
+            não existir ou não puder ser associado a uma rotina
+        """
+        workout = self.workout_repository.get_by_id(workout_id)
+        if not workout:
+            return None
+
+        performed = PerformedWorkout.from_workout(workout)
+        routine = self.routine_repository.get_by_id(workout.routine_id) if workout.routine_id else None
+        routines = [routine] if routine else self.routine_repository.iter_all()
+        match = RoutineSignatureIndex(routines).match(performed)
+        if match is None:
+            return None
+        return WorkoutAdherenceDTO.from_entity(self.service.score(performed, *match))
+
+
+class GetRoutinePreviousValuesUseCase:
+    """Caso de uso para obter os valores anteriores de todos os exercícios de uma rotina."""
+
+    def __init__(self, routine_repository: RoutineRepository, last_performed_repository: LastPerformedRepository):
+        """
+        Inicializa o caso de uso.
+
+        Args:
+            routine_repository: Repositório de rotinas
+            last_performed_repository: Repositório da última execução por modelo de exercício
+        """
+        self.routine_repository = routine_repository
+        self.last_performed_repository = last_performed_repository
+
+    def execute(self, routine_id: str) -> Optional[RoutinePreviousValuesDTO]:
+        """
+        Executa o caso de uso para obter os valores anteriores de uma rotina.
+
+        Args:
+            routine_id: ID da rotina
+
+        Returns:
+            DTO com as séries da última execução de cada exercício, na ordem da
+            rotina, ou None se a rotina não existir
+        """
+        routine = self.routine_repository.get_by_id(routine_id)
+        if not routine:
+            return None
+
+        exercises = sorted(routine.exercises, key=lambda e: e.order)
+        last_performed = self.last_performed_repository.get_last_performed(
+            {e.exercise_template_id for e in exercises if e.exercise_template_id}
+        )
+        return RoutinePreviousValuesDTO(
+            routine_id=routine.id,
+            routine_name=routine.name,
+            exercises=[
+                RoutineExercisePreviousDTO.from_entity(e, last_performed.get(e.exercise_template_id))
+                for e in exercises
+            ]
+        )
@@ -0,0 +1,68 @@
+"""
+Comando que executa o substituto local da API do Hevy.
+"""
+
+from django.core.management.base import BaseCommand
+
+from hevyai.infrastructure.api.fake.dataset import FakeHevyDataset
+from hevyai.infrastructure.api.fake.server import FakeHevyServer, FaultProfile
+
+
+class Command(BaseCommand):
+    help = (
+        "Executa um servidor local que imita os endpoints de leitura da API do Hevy, "
+        "servindo fixtures gravadas ou um histórico sintético, com latência e falhas injetadas."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1', help="Endereço de escuta")
+        parser.add_argument('--port', type=int, default=8765, help="Porta de escuta")
+        parser.add_argument('--api-key', help="Exige este valor no cabeçalho api-key")
+        parser.add_argument('--fixtures', help="Diretório de fixtures (ver record_hevy_fixtures)")
+        parser.add_argument('--years', type=float, default=3, help="Anos de histórico sintético")
+        parser.add_argument('--workouts-per-week', type=float, default=4, help="Treinos sintéticos por semana")
+        parser.add_argument('--seed', type=int, default=42, help="Semente dos dados e das falhas")
+        parser.add_argument('--save', help="Grava os dados servidos como fixtures neste diretório")
+        parser.add_argument('--latency-ms', type=float, default=0, help="Latência fixa por resposta")
+        parser.add_argument('--jitter-ms', type=float, default=0, help="Variação máxima somada à latência")
+        parser.add_argument('--throttle-rate', type=float, default=0, help="Fração de respostas 429")
+        parser.add_argument('--error-rate', type=float, default=0, help="Fração de respostas de erro")
+        parser.add_argument('--error-status', type=int, default=503, help="Status dos erros injetados")
+        parser.add_argument('--retry-after', type=float, default=1, help="Retry-After das respostas 429")
+        parser.add_argument('--rate-limit', type=float, default=0, help="Requisições por segundo antes de 429 (0 desativa)")
+        parser.add_argument('--rate-burst', type=float, default=10, help="Rajada aceita pelo limite de taxa")
+
+    def handle(self, *args, **options):
+        if options['fixtures']:
+            dataset = FakeHevyDataset.from_fixtures(options['fixtures'])
+        else:
+            dataset = FakeHevyDataset.synthetic(
+                years=options['years'],
+                workouts_per_week=options['workouts_per_week'],
+                seed=options['seed']
+            )
+        if options['save']:
+            dataset.save(options['save'])
+            self.stdout.write(f"Fixtures gravadas em {options['save']}")
+
+        faults = FaultProfile(
+            latency_ms=options['latency_ms'],
+            jitter_ms=options['jitter_ms'],
+            throttle_rate=options['throttle_rate'],
+            error_rate=options['error_rate'],
+            error_status=options['error_status'],
+            retry_after=options['retry_after'],
+            rate_limit=options['rate_limit'],
+            rate_burst=options['rate_burst'],
+            seed=options['seed']
+        )
+        server = FakeHevyServer(dataset, faults, host=options['host'], port=options['port'], api_key=options['api_key'])
+        counts = ', '.join(f"{name}={len(items)}" for name, items in dataset.resources.items())
+        self.stdout.write(self.style.SUCCESS(f"API do Hevy simulada em {server.url} ({counts})"))
+        self.stdout.write(f"Use HEVY_API_URL={server.url} para apontar a aplicação para ela. Ctrl+C encerra.")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.httpd.server_close()
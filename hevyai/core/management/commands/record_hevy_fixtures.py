@@ -0,0 +1,37 @@
+"""
+Comando que grava os dados da conta do Hevy como fixtures do substituto local da API.
+"""
+
+from django.core.management.base import BaseCommand
+
+from hevyai.infrastructure.api.clients.client_registry import get_hevy_client
+from hevyai.infrastructure.api.fake.dataset import FakeHevyDataset
+from hevyai.infrastructure.repositories.pagination import iter_page_items
+
+
+class Command(BaseCommand):
+    help = (
+        "Grava treinos, rotinas, modelos de exercícios, pastas de rotinas e exclusões "
+        "de treinos da API do Hevy como fixtures para o comando fake_hevy_server."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', help="Diretório de destino das fixtures")
+        parser.add_argument('--since', default='1970-01-01T00:00:00Z', help="Data inicial dos eventos de exclusão")
+
+    def handle(self, *args, **options):
+        client = get_hevy_client()
+        data = {
+            'workouts': list(iter_page_items(client.get_workouts, 'workouts')),
+            'routines': list(iter_page_items(client.get_routines, 'routines')),
+            'exercise_templates': list(iter_page_items(client.get_exercise_templates, 'exercise_templates')),
+            'routine_folders': list(iter_page_items(client.get_routine_folders, 'routine_folders')),
+        }
+        events = iter_page_items(lambda page: client.get_workout_events(options['since'], page), 'events')
+        deleted = [event for event in events if event.get('type') == 'deleted']
+
+        FakeHevyDataset(deleted_events=deleted, **data).save(options['output'])
+        counts = ', '.join(f"{name}={len(items)}" for name, items in data.items())
+        self.stdout.write(self.style.SUCCESS(
+            f"Fixtures gravadas em {options['output']} ({counts}, exclusões={len(deleted)})"
+        ))
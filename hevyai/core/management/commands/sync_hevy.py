@@ -0,0 +1,88 @@
+"""
+Comando que sincroniza a cópia local dos dados do Hevy.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from hevyai.core.models import HevySyncState
+from hevyai.infrastructure.sync.hevy_sync_service import RESOURCES, HevySyncService, SyncPhaseResult
+from hevyai.infrastructure.sync.workout_rollups import WorkoutRollupService
+
+
+class Command(BaseCommand):
+    help = (
+        "Sincroniza treinos, rotinas, modelos de exercícios e pastas de rotinas do Hevy "
+        "com a cópia local. Na primeira execução faz a carga completa; depois aplica "
+        "apenas os eventos de treinos desde o último cursor. Execuções interrompidas "
+        "são retomadas do último ponto de controle."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help="Refaz a carga completa também dos treinos")
+        parser.add_argument('--restart', action='store_true', help="Ignora pontos de controle de execuções interrompidas")
+        parser.add_argument('--resource', choices=RESOURCES, action='append', help="Sincroniza apenas este recurso (repetível)")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Itens gravados por lote")
+        parser.add_argument('--status', action='store_true', help="Mostra o estado da sincronização e sai")
+        parser.add_argument(
+            '--rebuild-rollups', action='store_true',
+            help="Recalcula os totais por período de todos os treinos da cópia local e sai"
+        )
+
+    def handle(self, *args, **options):
+        if options['status']:
+            self._print_status()
+            return
+        if options['rebuild_rollups']:
+            started = time.perf_counter()
+            rows = WorkoutRollupService().rebuild()
+            elapsed = time.perf_counter() - started
+            self.stdout.write(self.style.SUCCESS(f"Totais por período recalculados em {elapsed:.1f}s: {rows} linhas"))
+            return
+
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size deve ser positivo")
+        service = HevySyncService(batch_size=options['batch_size'])
+        started = time.perf_counter()
+        self.stdout.write(
+            f"{'fase':<28} {'páginas':>8} {'itens':>8} {'linhas':>9} {'removidos':>9} "
+            f"{'segundos':>9} {'itens/s':>9} {'linhas/s':>9}"
+        )
+
+        results = service.sync(
+            full=options['full'],
+            restart=options['restart'],
+            on_phase=self._print_phase,
+            resources=options['resource']
+        )
+
+        elapsed = time.perf_counter() - started
+        items = sum(r.items for r in results)
+        rows = sum(r.rows for r in results)
+        self.stdout.write(self.style.SUCCESS(
+            f"Sincronização concluída em {elapsed:.1f}s: {items} itens, {rows} linhas gravadas"
+        ))
+
+    def _print_phase(self, result: SyncPhaseResult) -> None:
+        line = (
+            f"{result.phase:<28} {result.pages:>8} {result.items:>8} {result.rows:>9} {result.removed:>9} "
+            f"{result.seconds:>9.2f} {result.items_per_second:>9.1f} {result.rows_per_second:>9.1f}"
+        )
+        if result.resumed_from_page:
+            line += f"  (retomada da página {result.resumed_from_page})"
+        self.stdout.write(line)
+
+    def _print_status(self) -> None:
+        states = {state.resource: state for state in HevySyncState.objects.all()}
+        for resource in RESOURCES:
+            state = states.get(resource)
+            if state is None:
+                self.stdout.write(f"{resource}: nunca sincronizado")
+                continue
+            line = f"{resource}: carga completa em {state.backfilled_at or '-'}"
+            if state.cursor:
+                line += f", cursor de eventos {state.cursor}"
+            if state.in_progress:
+                line += f", {state.run_kind} interrompido após a página {state.run_page}"
+            self.stdout.write(line)
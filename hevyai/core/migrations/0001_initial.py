@@ -0,0 +1,165 @@
+# Generated by Django 5.2.18 on 2026-10-17 13:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HevyDeletedWorkout',
+            fields=[
+                ('id', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('synced_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='HevyExerciseTemplate',
+            fields=[
+                ('id', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('exercise_type', models.CharField(blank=True, max_length=32, null=True)),
+                ('primary_muscle_group', models.CharField(blank=True, db_index=True, max_length=64, null=True)),
+                ('muscle_groups', models.JSONField(default=list)),
+                ('is_custom', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(blank=True, null=True)),
+                ('synced_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['title'],
+            },
+        ),
+        migrations.CreateModel(
+            name='HevyRoutine',
+            fields=[
+                ('id', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('folder_id', models.CharField(blank=True, db_index=True, max_length=64, null=True)),
+                ('is_public', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(blank=True, null=True)),
+                ('synced_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['title'],
+            },
+        ),
+        migrations.CreateModel(
+            name='HevyRoutineFolder',
+            fields=[
+                ('id', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('index', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(blank=True, null=True)),
+                ('synced_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['index'],
+            },
+        ),
+        migrations.CreateModel(
+            name='HevySyncState',
+            fields=[
+                ('resource', models.CharField(max_length=32, primary_key=True, serialize=False)),
+                ('cursor', models.CharField(blank=True, max_length=64, null=True)),
+                ('backfilled_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='HevyWorkout',
+            fields=[
+                ('id', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('title', models.CharField(blank=True, default='', max_length=255)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('routine_id', models.CharField(blank=True, db_index=True, max_length=64, null=True)),
+                ('start_time', models.DateTimeField(blank=True, db_index=True, null=True)),
+                ('end_time', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(blank=True, db_index=True, null=True)),
+                ('synced_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['-start_time'],
+            },
+        ),
+        migrations.CreateModel(
+            name='HevyRoutineExercise',
+            fields=[
+                ('id', models.CharField(max_length=96, primary_key=True, serialize=False)),
+                ('position', models.IntegerField()),
+                ('hevy_id', models.CharField(blank=True, default='', max_length=64)),
+                ('exercise_template_id', models.CharField(db_index=True, max_length=64)),
+                ('title', models.CharField(blank=True, default='', max_length=255)),
+                ('notes', models.TextField(blank=True, null=True)),
+                ('routine', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='exercises', to='core.hevyroutine')),
+            ],
+            options={
+                'ordering': ['routine_id', 'position'],
+            },
+        ),
+        migrations.CreateModel(
+            name='HevyRoutineSet',
+            fields=[
+                ('id', models.CharField(max_length=112, primary_key=True, serialize=False)),
+                ('position', models.IntegerField()),
+                ('hevy_id', models.CharField(blank=True, default='', max_length=64)),
+                ('set_type', models.CharField(blank=True, max_length=32, null=True)),
+                ('reps', models.IntegerField(blank=True, null=True)),
+                ('weight', models.FloatField(blank=True, null=True)),
+                ('duration', models.IntegerField(blank=True, null=True)),
+                ('distance', models.FloatField(blank=True, null=True)),
+                ('rest_seconds', models.IntegerField(blank=True, null=True)),
+                ('exercise', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sets', to='core.hevyroutineexercise')),
+            ],
+            options={
+                'ordering': ['exercise_id', 'position'],
+            },
+        ),
+        migrations.CreateModel(
+            name='HevyWorkoutExercise',
+            fields=[
+                ('id', models.CharField(max_length=96, primary_key=True, serialize=False)),
+                ('position', models.IntegerField()),
+                ('hevy_id', models.CharField(blank=True, default='', max_length=64)),
+                ('exercise_template_id', models.CharField(db_index=True, max_length=64)),
+                ('title', models.CharField(blank=True, default='', max_length=255)),
+                ('notes', models.TextField(blank=True, null=True)),
+                ('superset_id', models.IntegerField(blank=True, null=True)),
+                ('workout', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='exercises', to='core.hevyworkout')),
+            ],
+            options={
+                'ordering': ['workout_id', 'position'],
+            },
+        ),
+        migrations.CreateModel(
+            name='HevyWorkoutSet',
+            fields=[
+                ('id', models.CharField(max_length=112, primary_key=True, serialize=False)),
+                ('position', models.IntegerField()),
+                ('hevy_id', models.CharField(blank=True, default='', max_length=64)),
+                ('set_type', models.CharField(blank=True, max_length=32, null=True)),
+                ('reps', models.IntegerField(blank=True, null=True)),
+                ('weight', models.FloatField(blank=True, null=True)),
+                ('duration', models.IntegerField(blank=True, null=True)),
+                ('distance', models.FloatField(blank=True, null=True)),
+                ('rpe', models.FloatField(blank=True, null=True)),
+                ('completed', models.BooleanField(default=True)),
+                ('exercise', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sets', to='core.hevyworkoutexercise')),
+            ],
+            options={
+                'ordering': ['exercise_id', 'position'],
+            },
+        ),
+    ]
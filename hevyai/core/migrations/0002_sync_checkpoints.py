@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 13:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='hevysyncstate',
+            name='run_cursor',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='hevysyncstate',
+            name='run_kind',
+            field=models.CharField(blank=True, max_length=16, null=True),
+        ),
+        migrations.AddField(
+            model_name='hevysyncstate',
+            name='run_page',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='hevysyncstate',
+            name='run_started_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
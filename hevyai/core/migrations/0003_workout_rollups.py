@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 13:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_sync_checkpoints'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HevyWorkoutRollup',
+            fields=[
+                ('id', models.CharField(max_length=24, primary_key=True, serialize=False)),
+                ('period', models.CharField(max_length=8)),
+                ('period_start', models.DateField()),
+                ('workouts', models.IntegerField(default=0)),
+                ('sets', models.IntegerField(default=0)),
+                ('volume', models.FloatField(default=0.0)),
+                ('duration', models.IntegerField(default=0)),
+                ('distinct_exercises', models.IntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['period', 'period_start'],
+                'indexes': [models.Index(fields=['period', 'period_start'], name='core_hevywo_period_a43b80_idx')],
+            },
+        ),
+    ]
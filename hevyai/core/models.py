@@ -1,5 +1,187 @@
 from django.db import models
 
 # Modelos básicos para a aplicação core
-# Como estamos usando a API do Hevy como fonte de dados principal, 
-# não precisaremos de muitos modelos aqui.
\ No newline at end of file
+# A API do Hevy continua sendo a fonte de verdade; os modelos abaixo guardam uma
+# cópia local (espelho) dos dados da conta, mantida em dia pelo HevySyncService
+# a partir dos eventos de treinos, para que as leituras não dependam da API.
+
+
+class HevyExerciseTemplate(models.Model):
+    """Cópia local de um modelo de exercício do Hevy."""
+    id = models.CharField(primary_key=True, max_length=64)
+    title = models.CharField(max_length=255)
+    description = models.TextField(null=True, blank=True)
+    exercise_type = models.CharField(max_length=32, null=True, blank=True)
+    primary_muscle_group = models.CharField(max_length=64, null=True, blank=True, db_index=True)
+    muscle_groups = models.JSONField(default=list)
+    is_custom = models.BooleanField(default=False)
+    created_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(null=True, blank=True)
+    synced_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['title']
+
+
+class HevyRoutineFolder(models.Model):
+    """Cópia local de uma pasta de rotinas do Hevy."""
+    id = models.CharField(primary_key=True, max_length=64)
+    title = models.CharField(max_length=255)
+    index = models.IntegerField(default=0)
+    created_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(null=True, blank=True)
+    synced_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['index']
+
+
+class HevyRoutine(models.Model):
+    """Cópia local de uma rotina do Hevy."""
+    id = models.CharField(primary_key=True, max_length=64)
+    title = models.CharField(max_length=255)
+    description = models.TextField(null=True, blank=True)
+    # Sem restrição de chave estrangeira: a pasta pode ser sincronizada depois da rotina
+    folder_id = models.CharField(max_length=64, null=True, blank=True, db_index=True)
+    is_public = models.BooleanField(default=False)
+    created_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(null=True, blank=True)
+    synced_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['title']
+
+
+class HevyRoutineExercise(models.Model):
+    """Exercício de uma rotina; a chave é '<rotina>:<posição>'."""
+    id = models.CharField(primary_key=True, max_length=96)
+    routine = models.ForeignKey(HevyRoutine, on_delete=models.CASCADE, related_name='exercises')
+    position = models.IntegerField()
+    hevy_id = models.CharField(max_length=64, blank=True, default='')
+    exercise_template_id = models.CharField(max_length=64, db_index=True)
+    title = models.CharField(max_length=255, blank=True, default='')
+    notes = models.TextField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['routine_id', 'position']
+
+
+class HevyRoutineSet(models.Model):
+    """Série planejada de um exercício de rotina; a chave é '<exercício>:<posição>'."""
+    id = models.CharField(primary_key=True, max_length=112)
+    exercise = models.ForeignKey(HevyRoutineExercise, on_delete=models.CASCADE, related_name='sets')
+    position = models.IntegerField()
+    hevy_id = models.CharField(max_length=64, blank=True, default='')
+    set_type = models.CharField(max_length=32, null=True, blank=True)
+    reps = models.IntegerField(null=True, blank=True)
+    weight = models.FloatField(null=True, blank=True)
+    duration = models.IntegerField(null=True, blank=True)
+    distance = models.FloatField(null=True, blank=True)
+    rest_seconds = models.IntegerField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['exercise_id', 'position']
+
+
+class HevyWorkout(models.Model):
+    """Cópia local de um treino do Hevy."""
+    id = models.CharField(primary_key=True, max_length=64)
+    title = models.CharField(max_length=255, blank=True, default='')
+    description = models.TextField(null=True, blank=True)
+    routine_id = models.CharField(max_length=64, null=True, blank=True, db_index=True)
+    start_time = models.DateTimeField(null=True, blank=True, db_index=True)
+    end_time = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    synced_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-start_time']
+
+
+class HevyWorkoutExercise(models.Model):
+    """Exercício de um treino; a chave é '<treino>:<posição>'."""
+    id = models.CharField(primary_key=True, max_length=96)
+    workout = models.ForeignKey(HevyWorkout, on_delete=models.CASCADE, related_name='exercises')
+    position = models.IntegerField()
+    hevy_id = models.CharField(max_length=64, blank=True, default='')
+    exercise_template_id = models.CharField(max_length=64, db_index=True)
+    title = models.CharField(max_length=255, blank=True, default='')
+    notes = models.TextField(null=True, blank=True)
+    superset_id = models.IntegerField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['workout_id', 'position']
+
+
+class HevyWorkoutSet(models.Model):
+    """Série executada em um exercício de treino; a chave é '<exercício>:<posição>'."""
+    id = models.CharField(primary_key=True, max_length=112)
+    exercise = models.ForeignKey(HevyWorkoutExercise, on_delete=models.CASCADE, related_name='sets')
+    position = models.IntegerField()
+    hevy_id = models.CharField(max_length=64, blank=True, default='')
+    set_type = models.CharField(max_length=32, null=True, blank=True)
+    reps = models.IntegerField(null=True, blank=True)
+    weight = models.FloatField(null=True, blank=True)
+    duration = models.IntegerField(null=True, blank=True)
+    distance = models.FloatField(null=True, blank=True)
+    rpe = models.FloatField(null=True, blank=True)
+    completed = models.BooleanField(default=True)
+
+    class Meta:
+        ordering = ['exercise_id', 'position']
+
+
+class HevyDeletedWorkout(models.Model):
+    """Registro de um treino excluído no Hevy, recebido pelos eventos de treinos."""
+    id = models.CharField(primary_key=True, max_length=64)
+    deleted_at = models.DateTimeField(null=True, blank=True)
+    synced_at = models.DateTimeField(auto_now=True)
+
+
+class HevyWorkoutRollup(models.Model):
+    """
+    Totais dos treinos de um período (dia, semana ou mês, no fuso da aplicação).
+
+    Calculados a partir da cópia local e recalculados, pelo HevySyncService,
+    apenas nos períodos dos treinos gravados ou excluídos em cada lote. Períodos
+    sem treinos não têm linha. A chave é '<período>:<AAAA-MM-DD>'.
+    """
+    id = models.CharField(primary_key=True, max_length=24)
+    period = models.CharField(max_length=8)
+    period_start = models.DateField()
+    workouts = models.IntegerField(default=0)
+    sets = models.IntegerField(default=0)
+    volume = models.FloatField(default=0.0)
+    duration = models.IntegerField(default=0)
+    distinct_exercises = models.IntegerField(default=0)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['period', 'period_start']
+        indexes = [models.Index(fields=['period', 'period_start'])]
+
+
+class HevySyncState(models.Model):
+    """
+    Estado da sincronização de um recurso do Hevy.
+
+    `cursor` guarda a data ISO 8601 até a qual os eventos de treinos já foram
+    aplicados; `backfilled_at` indica quando a carga completa do recurso terminou.
+    Os campos `run_*` guardam o ponto de controle de uma execução em andamento
+    (carga completa ou leitura de eventos), para que ela possa ser retomada se
+    for interrompida.
+    """
+    resource = models.CharField(primary_key=True, max_length=32)
+    cursor = models.CharField(max_length=64, null=True, blank=True)
+    backfilled_at = models.DateTimeField(null=True, blank=True)
+    run_kind = models.CharField(max_length=16, null=True, blank=True)
+    run_started_at = models.DateTimeField(null=True, blank=True)
+    run_page = models.IntegerField(default=0)
+    run_cursor = models.CharField(max_length=64, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @property
+    def in_progress(self) -> bool:
+        """Indica se há uma execução interrompida a ser retomada."""
+        return self.run_kind is not None
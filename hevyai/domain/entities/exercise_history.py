@@ -0,0 +1,55 @@
+"""
+Entidades da evolução de um modelo de exercício ao longo dos treinos.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+
+@dataclass(slots=True)
+class ExerciseSession:
+    """
+    Resumo de um modelo de exercício em um treino.
+
+    Só contam as séries concluídas com peso e repetições. A série principal
+    (`top_weight`, `top_reps`) é a mais pesada, com mais repetições no empate;
+    `e1rm` é o maior 1RM estimado (Epley), ausente quando todas as séries
+    passam do limite de repetições das fórmulas.
+    """
+    workout_id: str
+    performed_at: datetime
+    top_weight: float
+    top_reps: int
+    volume: float
+    sets: int
+    e1rm: Optional[float] = None
+
+
+@dataclass(slots=True)
+class HistoryPoint:
+    """Ponto de uma série temporal de um modelo de exercício (um treino)."""
+    performed_at: datetime
+    workout_id: str
+    value: float
+    reps: Optional[int] = None
+
+
+@dataclass
+class ExerciseHistory:
+    """
+    Evolução de um modelo de exercício em um período.
+
+    `sessions` é a quantidade de treinos do modelo no período; quando ela passa
+    de `max_points`, cada série é reduzida a `max_points` pontos
+    (`downsampled`), mantendo o primeiro e o último treino.
+    """
+    exercise_template_id: str
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    max_points: int = 0
+    sessions: int = 0
+    downsampled: bool = False
+    top_set: List[HistoryPoint] = field(default_factory=list)
+    e1rm: List[HistoryPoint] = field(default_factory=list)
+    volume: List[HistoryPoint] = field(default_factory=list)
@@ -3,9 +3,11 @@ Entidades relacionadas a modelos de exercícios no domínio da aplicação.
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 
+from hevyai.domain.timestamps import parse_timestamp
+
 
 @dataclass
 class MuscleGroup:
@@ -27,8 +29,8 @@ class ExerciseTemplate:
     description: Optional[str] = None
     is_custom: bool = False
     muscle_groups: List[MuscleGroup] = field(default_factory=list)
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ExerciseTemplate':
@@ -54,6 +56,6 @@ class ExerciseTemplate:
             description=data.get('description'),
             is_custom=data.get('is_custom', False),
             muscle_groups=muscle_groups,
-            created_at=datetime.fromisoformat(data.get('created_at', datetime.now().isoformat())),
-            updated_at=datetime.fromisoformat(data.get('updated_at', datetime.now().isoformat()))
+            created_at=parse_timestamp(data.get('created_at')) or datetime.now(timezone.utc),
+            updated_at=parse_timestamp(data.get('updated_at')) or datetime.now(timezone.utc)
         )
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+Entidades dos valores da última vez em que cada modelo de exercício foi feito.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+
+@dataclass(slots=True)
+class PreviousSet:
+    """Valores de uma série concluída na última vez em que o exercício foi feito."""
+    weight: Optional[float] = None
+    reps: Optional[int] = None
+    duration: Optional[int] = None  # duração em segundos
+    distance: Optional[float] = None
+    rpe: Optional[float] = None
+
+
+@dataclass(slots=True)
+class LastPerformed:
+    """
+    Última vez em que um modelo de exercício foi feito.
+
+    `sets` traz as séries concluídas do modelo nesse treino, na ordem do treino,
+    para preencher os valores anteriores de cada série da rotina pela posição.
+    """
+    exercise_template_id: str
+    workout_id: str
+    performed_at: datetime
+    sets: List[PreviousSet] = field(default_factory=list)
@@ -0,0 +1,51 @@
+"""
+Entidades relacionadas aos recordes pessoais por modelo de exercício.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+
+@dataclass(slots=True)
+class RecordSet:
+    """
+    Representa a série que detém um recorde.
+
+    `value` é o valor do recorde: o peso, o 1RM estimado ou o volume da série
+    (peso × repetições), conforme o recorde.
+    """
+    value: float
+    weight: float
+    reps: int
+    workout_id: str
+    performed_at: Optional[datetime] = None
+
+
+@dataclass(slots=True)
+class OneRepMaxPoint:
+    """Melhor 1RM estimado de um modelo de exercício em um treino."""
+    workout_id: str
+    performed_at: Optional[datetime]
+    epley: float
+    brzycki: Optional[float] = None
+    is_record: bool = False  # superou todos os treinos anteriores
+
+
+@dataclass
+class PersonalRecords:
+    """
+    Representa os recordes pessoais de um modelo de exercício.
+
+    Só contam as séries concluídas com peso e repetições. Em `rep_maxes`, o
+    `value` de cada item é o peso e `reps` o máximo de repetições feitas com
+    ele, do maior para o menor peso.
+    """
+    exercise_template_id: str
+    workouts: int = 0
+    best_weight: Optional[RecordSet] = None
+    best_e1rm_epley: Optional[RecordSet] = None
+    best_e1rm_brzycki: Optional[RecordSet] = None
+    best_volume_set: Optional[RecordSet] = None
+    rep_maxes: List[RecordSet] = field(default_factory=list)
+    e1rm_history: List[OneRepMaxPoint] = field(default_factory=list)
@@ -3,11 +3,13 @@ Entidades relacionadas a rotinas no domínio da aplicação.
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 
+from hevyai.domain.timestamps import parse_timestamp
 
-@dataclass
+
+@dataclass(slots=True)
 class RoutineSet:
     """Representa um conjunto de exercícios em uma rotina."""
     id: str
@@ -16,8 +18,8 @@ class RoutineSet:
     duration: Optional[int] = None  # duração em segundos
     distance: Optional[float] = None
     rest_seconds: Optional[int] = None
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'RoutineSet':
@@ -37,12 +39,12 @@ class RoutineSet:
             duration=data.get('duration'),
             distance=data.get('distance'),
             rest_seconds=data.get('rest_seconds'),
-            created_at=datetime.fromisoformat(data.get('created_at', datetime.now().isoformat())),
-            updated_at=datetime.fromisoformat(data.get('updated_at', datetime.now().isoformat()))
+            created_at=parse_timestamp(data.get('created_at')),
+            updated_at=parse_timestamp(data.get('updated_at'))
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RoutineExercise:
     """Representa um exercício em uma rotina."""
     id: str
@@ -51,8 +53,8 @@ class RoutineExercise:
     notes: Optional[str] = None
     sets: List[RoutineSet] = field(default_factory=list)
     order: int = 0
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'RoutineExercise':
@@ -73,8 +75,8 @@ class RoutineExercise:
             notes=data.get('notes'),
             sets=sets,
             order=data.get('order', 0),
-            created_at=datetime.fromisoformat(data.get('created_at', datetime.now().isoformat())),
-            updated_at=datetime.fromisoformat(data.get('updated_at', datetime.now().isoformat()))
+            created_at=parse_timestamp(data.get('created_at')),
+            updated_at=parse_timestamp(data.get('updated_at'))
         )
 
 
@@ -87,8 +89,8 @@ class Routine:
     notes: Optional[str] = None
     folder_id: Optional[str] = None
     is_public: bool = False
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Routine':
@@ -110,6 +112,6 @@ class Routine:
             notes=data.get('notes'),
             folder_id=data.get('folder_id'),
             is_public=data.get('is_public', False),
-            created_at=datetime.fromisoformat(data.get('created_at', datetime.now().isoformat())),
-            updated_at=datetime.fromisoformat(data.get('updated_at', datetime.now().isoformat()))
+            created_at=parse_timestamp(data.get('created_at')) or datetime.now(timezone.utc),
+            updated_at=parse_timestamp(data.get('updated_at')) or datetime.now(timezone.utc)
         )
\ No newline at end of file
@@ -0,0 +1,113 @@
+"""
+Entidades da aderência dos treinos às rotinas planejadas.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from hevyai.domain.entities.workout import Workout
+
+
+@dataclass(slots=True)
+class PerformedExercise:
+    """Exercício executado em um treino, só com o necessário para compará-lo ao plano."""
+    exercise_template_id: str
+    name: str
+    # (repetições, peso) das séries concluídas, na ordem do treino
+    sets: List[Tuple[Optional[int], Optional[float]]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class PerformedWorkout:
+    """Treino executado, na forma compacta usada pela análise de aderência."""
+    workout_id: str
+    name: str
+    routine_id: Optional[str] = None
+    start_time: Optional[datetime] = None
+    exercises: List[PerformedExercise] = field(default_factory=list)
+
+    @classmethod
+    def from_workout(cls, workout: Workout) -> 'PerformedWorkout':
+        """
+        Cria um PerformedWorkout a partir de um treino.
+
+        Args:
+            workout: Entidade Workout
+
+        Returns:
+            O treino com as séries concluídas de cada exercício
+        """
+        return cls(
+            workout_id=workout.id,
+            name=workout.name,
+            routine_id=workout.routine_id,
+            start_time=workout.start_time,
+            exercises=[
+                PerformedExercise(
+                    exercise_template_id=exercise.exercise_template_id,
+                    name=exercise.name,
+                    sets=[(s.reps, s.weight) for s in exercise.sets if s.completed]
+                )
+                for exercise in workout.exercises
+            ]
+        )
+
+
+@dataclass(slots=True)
+class ExerciseAdherence:
+    """
+    Comparação de um exercício planejado com o executado.
+
+    `reps_delta` e `weight_delta` são as médias de (executado − alvo) nas séries
+    com alvo, pareadas pela posição; ficam ausentes quando não há séries pareadas.
+    """
+    exercise_template_id: str
+    name: str
+    planned_sets: int = 0
+    performed_sets: int = 0
+    missed_sets: int = 0
+    extra_sets: int = 0
+    skipped: bool = False
+    reps_delta: Optional[float] = None
+    weight_delta: Optional[float] = None
+
+
+@dataclass
+class WorkoutAdherence:
+    """
+    Aderência de um treino à rotina associada a ele.
+
+    `matched_by` indica como a rotina foi encontrada ('routine_id' quando o
+    treino informa a rotina, 'signature' quando pela semelhança dos modelos de
+    exercícios). `score` é a fração das séries planejadas que foram feitas.
+    """
+    workout_id: str
+    workout_name: str
+    routine_id: str
+    routine_name: str
+    matched_by: str
+    similarity: float
+    start_time: Optional[datetime] = None
+    planned_exercises: int = 0
+    skipped_exercises: int = 0
+    extra_exercises: int = 0
+    planned_sets: int = 0
+    missed_sets: int = 0
+    extra_sets: int = 0
+    reps_delta: Optional[float] = None
+    weight_delta: Optional[float] = None
+    score: float = 1.0
+    exercises: List[ExerciseAdherence] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class RoutineAdherenceSummary:
+    """Aderência média dos treinos associados a uma rotina."""
+    routine_id: str
+    routine_name: str
+    workouts: int = 0
+    average_score: float = 0.0
+    skipped_exercises: int = 0
+    missed_sets: int = 0
+    last_performed: Optional[datetime] = None
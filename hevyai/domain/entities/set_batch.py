@@ -0,0 +1,207 @@
+"""
+Representação colunar das séries de treinos, para processamento em lote.
+"""
+
+import math
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import compress
+from typing import AbstractSet, Dict, Iterable, List, Optional
+
+from hevyai.domain.entities.workout import Set, Workout
+
+# Valor usado nas colunas numéricas quando o dado não foi informado
+MISSING = math.nan
+
+
+@dataclass(slots=True)
+class SetBatch:
+    """
+    Guarda as séries de vários treinos em colunas de arrays tipados.
+
+    Cada posição i das colunas por série descreve uma série; `workout_index[i]` e
+    `template_index[i]` apontam para as listas `workout_ids` e `template_ids`, e
+    `workout_start[j]` e `workout_end[j]` guardam o início e o fim (timestamps
+    Unix) do treino j e `template_names[k]` o nome do exercício k no primeiro
+    treino em que ele aparece. Valores ausentes são NaN nas colunas de ponto
+    flutuante. As colunas suportam o protocolo de buffer, então
+    `numpy.frombuffer(batch.weight)` as usa sem cópia.
+
+    Uma série ocupa cerca de 50 bytes, contra algumas centenas como objeto Set.
+    """
+    workout_ids: List[str] = field(default_factory=list)
+    workout_start: array = field(default_factory=lambda: array('d'))
+    workout_end: array = field(default_factory=lambda: array('d'))
+    template_ids: List[str] = field(default_factory=list)
+    template_names: List[str] = field(default_factory=list)
+    workout_index: array = field(default_factory=lambda: array('I'))
+    template_index: array = field(default_factory=lambda: array('I'))
+    reps: array = field(default_factory=lambda: array('d'))
+    weight: array = field(default_factory=lambda: array('d'))
+    duration: array = field(default_factory=lambda: array('d'))
+    distance: array = field(default_factory=lambda: array('d'))
+    rpe: array = field(default_factory=lambda: array('d'))
+    completed: array = field(default_factory=lambda: array('B'))
+    _template_codes: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_workouts(cls, workouts: Iterable[Workout]) -> 'SetBatch':
+        """
+        Cria um lote com todas as séries de uma coleção de treinos.
+
+        Args:
+            workouts: Treinos (por exemplo, o resultado de `iter_all`)
+
+        Returns:
+            Um novo SetBatch
+        """
+        batch = cls()
+        for workout in workouts:
+            batch.append_workout(workout)
+        return batch
+
+    def append_workout(self, workout: Workout) -> None:
+        """
+        Acrescenta as séries de um treino ao lote.
+
+        Args:
+            workout: Treino a acrescentar
+        """
+        workout_code = len(self.workout_ids)
+        self.workout_ids.append(workout.id)
+        start = workout.start_time
+        self.workout_start.append(start.timestamp() if isinstance(start, datetime) else MISSING)
+        end = workout.end_time
+        self.workout_end.append(end.timestamp() if isinstance(end, datetime) else MISSING)
+
+        codes = self._template_codes
+        for exercise in workout.exercises:
+            template_code = codes.get(exercise.exercise_template_id)
+            if template_code is None:
+                template_code = codes[exercise.exercise_template_id] = len(self.template_ids)
+                self.template_ids.append(exercise.exercise_template_id)
+                self.template_names.append(exercise.name)
+            for set_item in exercise.sets:
+                self.workout_index.append(workout_code)
+                self.template_index.append(template_code)
+                self.reps.append(MISSING if set_item.reps is None else set_item.reps)
+                self.weight.append(MISSING if set_item.weight is None else set_item.weight)
+                self.duration.append(MISSING if set_item.duration is None else set_item.duration)
+                self.distance.append(MISSING if set_item.distance is None else set_item.distance)
+                self.rpe.append(MISSING if set_item.rpe is None else set_item.rpe)
+                self.completed.append(1 if set_item.completed else 0)
+
+    def copy(self) -> 'SetBatch':
+        """
+        Cria uma cópia independente do lote.
+
+        Returns:
+            Um novo SetBatch com as mesmas séries
+        """
+        return SetBatch(
+            workout_ids=list(self.workout_ids),
+            workout_start=self.workout_start[:],
+            workout_end=self.workout_end[:],
+            template_ids=list(self.template_ids),
+            template_names=list(self.template_names),
+            workout_index=self.workout_index[:],
+            template_index=self.template_index[:],
+            reps=self.reps[:],
+            weight=self.weight[:],
+            duration=self.duration[:],
+            distance=self.distance[:],
+            rpe=self.rpe[:],
+            completed=self.completed[:],
+            _template_codes=dict(self._template_codes)
+        )
+
+    def without_workouts(self, workout_codes: AbstractSet[int]) -> 'SetBatch':
+        """
+        Cria um lote sem as séries de alguns treinos.
+
+        Os treinos restantes são renumerados na ordem original; os códigos dos
+        modelos de exercícios são mantidos.
+
+        Args:
+            workout_codes: Posições, em `workout_ids`, dos treinos a remover
+
+        Returns:
+            Um novo SetBatch
+        """
+        keep_workout = [code not in workout_codes for code in range(len(self.workout_ids))]
+        renumbered: List[int] = []
+        next_code = 0
+        for kept in keep_workout:
+            renumbered.append(next_code)
+            next_code += kept
+        keep_set = [keep_workout[code] for code in self.workout_index]
+
+        def rows(column: array) -> array:
+            return array(column.typecode, compress(column, keep_set))
+
+        return SetBatch(
+            workout_ids=list(compress(self.workout_ids, keep_workout)),
+            workout_start=array('d', compress(self.workout_start, keep_workout)),
+            workout_end=array('d', compress(self.workout_end, keep_workout)),
+            template_ids=list(self.template_ids),
+            template_names=list(self.template_names),
+            workout_index=array('I', [renumbered[code] for code in compress(self.workout_index, keep_set)]),
+            template_index=rows(self.template_index),
+            reps=rows(self.reps),
+            weight=rows(self.weight),
+            duration=rows(self.duration),
+            distance=rows(self.distance),
+            rpe=rows(self.rpe),
+            completed=rows(self.completed),
+            _template_codes=dict(self._template_codes)
+        )
+
+    def __len__(self) -> int:
+        return len(self.reps)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes ocupados pelas colunas numéricas (sem as listas de IDs)."""
+        columns = (
+            self.workout_start, self.workout_end, self.workout_index, self.template_index,
+            self.reps, self.weight, self.duration, self.distance, self.rpe, self.completed
+        )
+        return sum(column.itemsize * len(column) for column in columns)
+
+    def template_code(self, exercise_template_id: str) -> Optional[int]:
+        """
+        Obtém o código de um modelo de exercício nas colunas `template_index`.
+
+        Args:
+            exercise_template_id: ID do modelo de exercício
+
+        Returns:
+            O código ou None se o modelo não aparece no lote
+        """
+        return self._template_codes.get(exercise_template_id)
+
+    def get_set(self, position: int) -> Set:
+        """
+        Reconstrói a série de uma posição como entidade Set (sem o ID original).
+
+        Args:
+            position: Posição da série no lote
+
+        Returns:
+            Entidade Set
+        """
+        def value(column: array) -> Optional[float]:
+            item = column[position]
+            return None if math.isnan(item) else item
+
+        reps, duration = value(self.reps), value(self.duration)
+        return Set(
+            id='',
+            reps=None if reps is None else int(reps),
+            weight=value(self.weight),
+            duration=None if duration is None else int(duration),
+            distance=value(self.distance),
+            rpe=value(self.rpe),
+            completed=bool(self.completed[position])
+        )
@@ -0,0 +1,24 @@
+"""
+Entidades relacionadas ao uso de modelos de exercícios nos treinos.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class TemplateUsage:
+    """
+    Representa o quanto um modelo de exercício foi treinado em um período.
+    
+    O volume é a soma de peso × repetições das séries concluídas.
+    """
+    exercise_template_id: str
+    workouts: int = 0
+    sets: int = 0
+    reps: int = 0
+    volume: float = 0.0
+    duration: int = 0  # duração em segundos
+    distance: float = 0.0
+    last_performed: Optional[datetime] = None
@@ -0,0 +1,33 @@
+"""
+Entidades da carga de treino diária e das médias aguda e crônica.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import List, Optional
+
+
+@dataclass(slots=True)
+class TrainingLoadDay:
+    """
+    Carga de treino de um dia e as médias móveis exponenciais até ele.
+
+    `ratio` é a razão aguda:crônica (ACWR), ausente enquanto a carga crônica é zero.
+    """
+    day: date
+    load: float = 0.0
+    acute: float = 0.0
+    chronic: float = 0.0
+    ratio: Optional[float] = None
+
+
+@dataclass
+class TrainingLoadSeries:
+    """Série diária da carga de treino de um escopo (todos os treinos ou um grupo muscular)."""
+    metric: str
+    scope: str
+    acute_days: int
+    chronic_days: int
+    start: date
+    end: date
+    days: List[TrainingLoadDay] = field(default_factory=list)
@@ -0,0 +1,65 @@
+"""
+Entidades dos resumos de treino calculados sobre o histórico de séries.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import List, Optional
+
+from hevyai.domain.entities.exercise_template import MuscleGroup
+
+
+@dataclass(slots=True)
+class TrainingTotals:
+    """
+    Totais das séries concluídas de um grupo (treino, exercício ou período).
+
+    O volume é a soma de peso × repetições; a tonelagem é o mesmo volume em
+    toneladas. A intensidade média é o peso médio por repetição das séries com
+    peso, e a RPE média considera apenas as séries em que ela foi informada. A
+    duração soma, uma vez por treino, o tempo entre o início e o fim dos treinos
+    do grupo (no agrupamento por exercício, dos treinos em que ele aparece).
+    """
+    key: str
+    name: Optional[str] = None
+    workouts: int = 0
+    sets: int = 0
+    reps: int = 0
+    volume: float = 0.0
+    tonnage: float = 0.0
+    duration: int = 0  # duração dos treinos em segundos
+    distance: float = 0.0
+    average_intensity: Optional[float] = None
+    average_rpe: Optional[float] = None
+    first_performed: Optional[datetime] = None
+    last_performed: Optional[datetime] = None
+
+
+@dataclass
+class TrainingSummary:
+    """Resumo do histórico de treinos em um período, agrupado por treino, exercício ou período."""
+    group_by: str
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    totals: TrainingTotals = field(default_factory=lambda: TrainingTotals(key='total'))
+    groups: List[TrainingTotals] = field(default_factory=list)
+
+
+@dataclass
+class MuscleGroupWeeks:
+    """
+    Séries e volume das séries concluídas por semana e grupo muscular.
+
+    `sets[i][j]` e `volume[i][j]` são os totais da semana `weeks[i]` (a
+    segunda-feira que a inicia) no grupo `muscle_groups[j]`. As semanas vão da
+    primeira à última com treinos, sem lacunas. Uma série conta 1 para o grupo
+    muscular principal do seu modelo e `secondary_weight` para cada um dos demais.
+    """
+    secondary_weight: float
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    weeks: List[date] = field(default_factory=list)
+    muscle_groups: List[MuscleGroup] = field(default_factory=list)
+    sets: List[List[float]] = field(default_factory=list)
+    volume: List[List[float]] = field(default_factory=list)
+    unassigned_sets: List[int] = field(default_factory=list)
@@ -6,8 +6,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
+from hevyai.domain.timestamps import parse_timestamp
 
-@dataclass
+
+@dataclass(slots=True)
 class Set:
     """Representa um conjunto de exercícios em um treino."""
     id: str
@@ -17,8 +19,8 @@ class Set:
     distance: Optional[float] = None
     rpe: Optional[float] = None  # Rating of Perceived Exertion
     completed: bool = True
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Set':
@@ -39,12 +41,12 @@ class Set:
             distance=data.get('distance'),
             rpe=data.get('rpe'),
             completed=data.get('completed', True),
-            created_at=datetime.fromisoformat(data.get('created_at', datetime.now().isoformat())),
-            updated_at=datetime.fromisoformat(data.get('updated_at', datetime.now().isoformat()))
+            created_at=parse_timestamp(data.get('created_at')),
+            updated_at=parse_timestamp(data.get('updated_at'))
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Exercise:
     """Representa um exercício em um treino."""
     id: str
@@ -52,8 +54,8 @@ class Exercise:
     name: str
     notes: Optional[str] = None
     sets: List[Set] = field(default_factory=list)
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Exercise':
@@ -73,22 +75,23 @@ class Exercise:
             name=data.get('name', ''),
             notes=data.get('notes'),
             sets=sets,
-            created_at=datetime.fromisoformat(data.get('created_at', datetime.now().isoformat())),
-            updated_at=datetime.fromisoformat(data.get('updated_at', datetime.now().isoformat()))
+            created_at=parse_timestamp(data.get('created_at')),
+            updated_at=parse_timestamp(data.get('updated_at'))
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Workout:
     """Representa um treino completo."""
     id: str
     name: str
     exercises: List[Exercise] = field(default_factory=list)
     notes: Optional[str] = None
+    routine_id: Optional[str] = None  # rotina da qual o treino foi iniciado
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Workout':
@@ -103,27 +106,27 @@ class Workout:
         """
         exercises = [Exercise.from_dict(exercise_data) for exercise_data in data.get('exercises', [])]
         
-        start_time = None
-        if data.get('start_time'):
-            try:
-                start_time = datetime.fromisoformat(data.get('start_time'))
-            except ValueError:
-                pass
-                
-        end_time = None
-        if data.get('end_time'):
-            try:
-                end_time = datetime.fromisoformat(data.get('end_time'))
-            except ValueError:
-                pass
-                
         return cls(
             id=data.get('id', ''),
             name=data.get('name', ''),
             exercises=exercises,
             notes=data.get('notes'),
-            start_time=start_time,
-            end_time=end_time,
-            created_at=datetime.fromisoformat(data.get('created_at', datetime.now().isoformat())),
-            updated_at=datetime.fromisoformat(data.get('updated_at', datetime.now().isoformat()))
-        )
\ No newline at end of file
+            routine_id=data.get('routine_id'),
+            start_time=parse_timestamp(data.get('start_time')),
+            end_time=parse_timestamp(data.get('end_time')),
+            created_at=parse_timestamp(data.get('created_at')),
+            updated_at=parse_timestamp(data.get('updated_at'))
+        )
+
+
+@dataclass
+class WorkoutChanges:
+    """
+    Representa as alterações em treinos desde um cursor.
+    
+    Cada treino aparece no máximo uma vez, na sua versão mais recente: em
+    `updated` se foi criado ou alterado, ou em `deleted_ids` se foi excluído.
+    """
+    updated: List[Workout] = field(default_factory=list)
+    deleted_ids: List[str] = field(default_factory=list)
+    cursor: Optional[str] = None  # data ISO 8601 a usar na próxima consulta
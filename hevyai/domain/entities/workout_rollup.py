@@ -0,0 +1,62 @@
+"""
+Entidade dos totais de treinos por período (dia, semana ou mês).
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+# Períodos com totais materializados
+ROLLUP_PERIODS = ('day', 'week', 'month')
+
+
+@dataclass(slots=True)
+class WorkoutRollup:
+    """
+    Totais dos treinos iniciados em um período.
+
+    `sets` e `volume` (peso × repetições) contam só as séries concluídas;
+    `duration` é a soma das durações dos treinos, em segundos.
+    """
+    period: str
+    period_start: date
+    workouts: int = 0
+    sets: int = 0
+    volume: float = 0.0
+    duration: int = 0
+    distinct_exercises: int = 0
+
+
+def period_start(day: date, period: str) -> date:
+    """
+    Obtém o primeiro dia do período que contém um dia; as semanas começam na segunda.
+
+    Args:
+        day: Dia
+        period: 'day', 'week' ou 'month'
+
+    Returns:
+        O primeiro dia do período
+    """
+    if period == 'week':
+        return day - timedelta(days=day.weekday())
+    if period == 'month':
+        return day.replace(day=1)
+    return day
+
+
+def next_period_start(start: date, period: str) -> date:
+    """
+    Obtém o primeiro dia do período seguinte.
+
+    Args:
+        start: Primeiro dia de um período
+        period: 'day', 'week' ou 'month'
+
+    Returns:
+        O primeiro dia do período seguinte
+    """
+    if period == 'week':
+        return start + timedelta(days=7)
+    if period == 'month':
+        return date(start.year + start.month // 12, start.month % 12 + 1, 1)
+    return start + timedelta(days=1)
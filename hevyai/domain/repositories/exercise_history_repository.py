@@ -0,0 +1,39 @@
+"""
+Interface do repositório da evolução por modelo de exercício.
+Define o contrato para consultar as sessões de um modelo de exercício em um período.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from hevyai.domain.entities.exercise_history import ExerciseSession
+
+
+class ExerciseHistoryRepository(ABC):
+    """
+    Interface para o repositório da evolução por modelo de exercício.
+
+    As sessões de cada modelo são mantidas ordenadas pelo início do treino, de
+    modo que um período é consultado sem percorrer os treinos.
+    """
+
+    @abstractmethod
+    def get_sessions(
+        self,
+        exercise_template_id: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[ExerciseSession]:
+        """
+        Obtém as sessões de um modelo de exercício em um período.
+
+        Args:
+            exercise_template_id: ID do modelo de exercício
+            start: Início do período, inclusivo (opcional)
+            end: Fim do período, exclusivo (opcional)
+
+        Returns:
+            As sessões, da mais antiga para a mais recente
+        """
+        pass
@@ -4,7 +4,8 @@ Define o contrato para acesso e persistência de modelos de exercícios.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
 
 from hevyai.domain.entities.exercise_template import ExerciseTemplate
 
@@ -32,6 +33,100 @@ class ExerciseTemplateRepository(ABC):
         """
         pass
     
+    def iter_all(self, prefetch: Optional[int] = None) -> Iterator[ExerciseTemplate]:
+        """
+        Percorre todos os modelos de exercícios, página por página, sem carregá-los de uma vez.
+        
+        A implementação padrão busca as páginas em sequência até encontrar uma
+        página vazia. Implementações concretas podem buscar páginas antecipadamente.
+        
+        Args:
+            prefetch: Quantidade de páginas a buscar antecipadamente (None usa o padrão
+                      da implementação; 0 busca uma página de cada vez)
+            
+        Yields:
+            Cada modelo de exercício encontrado
+        """
+        page = 1
+        while True:
+            items = self.get_all(page)
+            if not items:
+                return
+            yield from items
+            page += 1
+    
+    def find(
+        self,
+        is_custom: Optional[bool] = None,
+        muscle_group: Optional[str] = None,
+        page: int = 1,
+        per_page: int = 10
+    ) -> List[ExerciseTemplate]:
+        """
+        Obtém uma lista paginada de modelos de exercícios filtrada.
+        
+        A implementação padrão percorre todos os modelos com `iter_all` e filtra em
+        memória. Implementações concretas podem usar índices próprios.
+        
+        Args:
+            is_custom: Se informado, apenas personalizados (True) ou padrão (False)
+            muscle_group: ID ou nome de um grupo muscular (sem diferenciar maiúsculas)
+            page: Número da página (padrão: 1)
+            per_page: Quantidade de itens por página (padrão: 10)
+            
+        Returns:
+            Uma lista de modelos de exercícios
+        """
+        group = muscle_group.strip().lower() if muscle_group else None
+        matches = [
+            template for template in self.iter_all()
+            if (is_custom is None or template.is_custom == is_custom)
+            and (group is None or any(
+                group in (mg.id.lower(), mg.name.lower()) for mg in template.muscle_groups
+            ))
+        ]
+        start = (page - 1) * per_page
+        return matches[start:start + per_page]
+    
+    def search(self, query: str, limit: int = 20) -> List[ExerciseTemplate]:
+        """
+        Busca modelos de exercícios pelo nome ou pela descrição.
+        
+        A implementação padrão percorre todos os modelos com `iter_all` e mantém os
+        que contêm todas as palavras da consulta. Implementações concretas podem
+        usar um índice de busca, com correspondências parciais e ordenação por relevância.
+        
+        Args:
+            query: Texto da busca
+            limit: Quantidade máxima de resultados (padrão: 20)
+            
+        Returns:
+            Uma lista de modelos de exercícios
+        """
+        words = query.lower().split()
+        if not words:
+            return []
+        matches = []
+        for template in self.iter_all():
+            text = f"{template.name} {template.description or ''}".lower()
+            if all(word in text for word in words):
+                matches.append(template)
+                if len(matches) >= limit:
+                    break
+        return matches
+    
+    def get_high_water_mark(self) -> Optional[datetime]:
+        """
+        Obtém a data da alteração mais recente entre os modelos de exercícios.
+        
+        Usada por caches para saber se precisam ser atualizados. A implementação
+        padrão retorna None, indicando que a origem não informa essa data.
+        
+        Returns:
+            A data da alteração mais recente ou None se não for conhecida
+        """
+        return None
+    
     @abstractmethod
     def get_by_id(self, template_id: str) -> Optional[ExerciseTemplate]:
         """
@@ -45,6 +140,27 @@ class ExerciseTemplateRepository(ABC):
         """
         pass
     
+    def get_many(self, template_ids: List[str]) -> Dict[str, ExerciseTemplate]:
+        """
+        Obtém vários modelos de exercícios pelos seus IDs.
+        
+        A implementação padrão chama `get_by_id` para cada ID. Implementações
+        concretas podem obter todos de uma vez (catálogo em memória ou uma única
+        consulta à cópia local).
+        
+        Args:
+            template_ids: IDs dos modelos de exercícios
+            
+        Returns:
+            Dicionário com os modelos encontrados, pelo ID; os não encontrados ficam de fora
+        """
+        templates = {}
+        for template_id in dict.fromkeys(template_ids):
+            template = self.get_by_id(template_id)
+            if template is not None:
+                templates[template_id] = template
+        return templates
+    
     @abstractmethod
     def save(self, template: ExerciseTemplate) -> ExerciseTemplate:
         """
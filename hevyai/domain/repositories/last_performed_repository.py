@@ -0,0 +1,32 @@
+"""
+Interface do repositório da última execução de cada modelo de exercício.
+Define o contrato para consultar os valores anteriores de vários modelos de uma vez.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable
+
+from hevyai.domain.entities.last_performed import LastPerformed
+
+
+class LastPerformedRepository(ABC):
+    """
+    Interface para o repositório da última execução de cada modelo de exercício.
+
+    Responde, pelo ID do modelo, com as séries da vez mais recente em que ele foi
+    feito, sem percorrer as páginas de treinos atrás de cada modelo.
+    """
+
+    @abstractmethod
+    def get_last_performed(self, template_ids: Iterable[str]) -> Dict[str, LastPerformed]:
+        """
+        Obtém a última execução de cada modelo de exercício.
+
+        Args:
+            template_ids: IDs dos modelos de exercícios
+
+        Returns:
+            Dicionário indexado pelo ID do modelo, apenas com os modelos que já
+            tiveram alguma série concluída
+        """
+        pass
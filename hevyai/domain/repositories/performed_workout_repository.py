@@ -0,0 +1,36 @@
+"""
+Interface do repositório de treinos executados, na forma usada pela análise de aderência.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from hevyai.domain.entities.routine_adherence import PerformedWorkout
+
+
+class PerformedWorkoutRepository(ABC):
+    """
+    Interface para o repositório de treinos executados.
+
+    Entrega o histórico com apenas a rotina, os modelos de exercícios e as séries
+    concluídas de cada treino, para comparar o histórico inteiro com as rotinas.
+    """
+
+    @abstractmethod
+    def get_performed_workouts(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[PerformedWorkout]:
+        """
+        Obtém os treinos iniciados em um período.
+
+        Args:
+            start: Início do período, inclusivo (opcional)
+            end: Fim do período, exclusivo (opcional)
+
+        Returns:
+            Os treinos, do mais antigo para o mais recente
+        """
+        pass
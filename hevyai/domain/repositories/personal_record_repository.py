@@ -0,0 +1,31 @@
+"""
+Interface do repositório de recordes pessoais.
+Define o contrato para consultar os recordes de cada modelo de exercício.
+"""
+
+from abc import ABC, abstractmethod
+
+from hevyai.domain.entities.personal_record import PersonalRecords
+
+
+class PersonalRecordRepository(ABC):
+    """
+    Interface para o repositório de recordes pessoais.
+
+    Os recordes são mantidos a partir do histórico de treinos e consultados
+    pelo ID do modelo de exercício, sem percorrer o histórico.
+    """
+
+    @abstractmethod
+    def get_records(self, exercise_template_id: str) -> PersonalRecords:
+        """
+        Obtém os recordes pessoais de um modelo de exercício.
+
+        Args:
+            exercise_template_id: ID do modelo de exercício
+
+        Returns:
+            Os recordes do modelo; sem séries com peso e repetições, os recordes
+            vêm vazios
+        """
+        pass
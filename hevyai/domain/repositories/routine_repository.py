@@ -4,7 +4,7 @@ Define o contrato para acesso e persistência de rotinas.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from hevyai.domain.entities.routine import Routine
 
@@ -32,6 +32,28 @@ class RoutineRepository(ABC):
         """
         pass
     
+    def iter_all(self, prefetch: Optional[int] = None) -> Iterator[Routine]:
+        """
+        Percorre todos os rotinas, página por página, sem carregá-los de uma vez.
+        
+        A implementação padrão busca as páginas em sequência até encontrar uma
+        página vazia. Implementações concretas podem buscar páginas antecipadamente.
+        
+        Args:
+            prefetch: Quantidade de páginas a buscar antecipadamente (None usa o padrão
+                      da implementação; 0 busca uma página de cada vez)
+            
+        Yields:
+            Cada rotina encontrada
+        """
+        page = 1
+        while True:
+            items = self.get_all(page)
+            if not items:
+                return
+            yield from items
+            page += 1
+    
     @abstractmethod
     def get_by_id(self, routine_id: str) -> Optional[Routine]:
         """
@@ -0,0 +1,30 @@
+"""
+Interface do repositório do histórico de séries.
+Define o contrato para obter todas as séries dos treinos em formato colunar.
+"""
+
+from abc import ABC, abstractmethod
+
+from hevyai.domain.entities.set_batch import SetBatch
+
+
+class SetHistoryRepository(ABC):
+    """
+    Interface para o repositório do histórico de séries.
+
+    Entrega as séries de todos os treinos em um SetBatch, para que análises sobre
+    o histórico inteiro sejam feitas em lote, sem percorrer as entidades.
+    """
+
+    @abstractmethod
+    def get_set_batch(self) -> SetBatch:
+        """
+        Obtém as séries de todos os treinos.
+
+        O lote retornado não é mais alterado pelo repositório e pode ser lido sem
+        bloqueios; alterações posteriores do histórico aparecem em um novo lote.
+
+        Returns:
+            SetBatch com as séries de todos os treinos
+        """
+        pass
@@ -0,0 +1,60 @@
+"""
+Interface do repositório de uso de modelos de exercícios.
+Define o contrato para consultar quanto cada modelo de exercício foi treinado.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from hevyai.domain.entities.template_usage import TemplateUsage
+
+
+class TemplateUsageRepository(ABC):
+    """
+    Interface para o repositório de uso de modelos de exercícios.
+    
+    As consultas partem dos IDs dos modelos de exercícios, de modo que perguntas
+    como "o que treinei de posterior de coxa" são respondidas a partir dos
+    modelos desse grupo muscular, sem percorrer o histórico de treinos.
+    """
+    
+    @abstractmethod
+    def get_usage(
+        self,
+        template_ids: Iterable[str],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Dict[str, TemplateUsage]:
+        """
+        Obtém o uso de cada modelo de exercício em um período.
+        
+        Args:
+            template_ids: IDs dos modelos de exercícios
+            start: Início do período, inclusivo (opcional)
+            end: Fim do período, exclusivo (opcional)
+            
+        Returns:
+            Dicionário indexado pelo ID do modelo, apenas com os modelos treinados no período
+        """
+        pass
+    
+    @abstractmethod
+    def get_workouts(
+        self,
+        template_ids: Iterable[str],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[Tuple[str, Optional[datetime]]]:
+        """
+        Obtém os treinos em que algum dos modelos de exercícios foi feito.
+        
+        Args:
+            template_ids: IDs dos modelos de exercícios
+            start: Início do período, inclusivo (opcional)
+            end: Fim do período, exclusivo (opcional)
+            
+        Returns:
+            Lista de tuplas (ID do treino, início do treino), do mais recente para o mais antigo
+        """
+        pass
@@ -0,0 +1,48 @@
+"""
+Interface do repositório de carga de treino.
+Define o contrato para consultar as séries diárias de carga aguda e crônica.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List
+
+from hevyai.domain.entities.training_load import TrainingLoadSeries
+
+
+class TrainingLoadRepository(ABC):
+    """
+    Interface para o repositório de carga de treino.
+
+    As séries são mantidas a partir do histórico de treinos, por métrica
+    ('volume' ou 'srpe') e escopo ('all' ou o ID de um grupo muscular).
+    """
+
+    @abstractmethod
+    def get_scopes(self, metric: str) -> List[str]:
+        """
+        Lista os escopos com carga registrada em uma métrica.
+
+        Args:
+            metric: 'volume' ou 'srpe'
+
+        Returns:
+            Escopos em ordem alfabética
+        """
+        pass
+
+    @abstractmethod
+    def get_series(self, metric: str, scope: str, start: date, end: date) -> TrainingLoadSeries:
+        """
+        Obtém a série diária de carga de um escopo em um intervalo de dias.
+
+        Args:
+            metric: 'volume' ou 'srpe'
+            scope: 'all' ou o ID de um grupo muscular
+            start: Primeiro dia, inclusivo
+            end: Último dia, inclusivo
+
+        Returns:
+            A série com um item por dia do intervalo; escopos sem treinos vêm com carga zero
+        """
+        pass
@@ -4,9 +4,9 @@ Define o contrato para acesso e persistência de treinos.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
-from hevyai.domain.entities.workout import Workout
+from hevyai.domain.entities.workout import Workout, WorkoutChanges
 
 
 class WorkoutRepository(ABC):
@@ -32,6 +32,28 @@ class WorkoutRepository(ABC):
         """
         pass
     
+    def iter_all(self, prefetch: Optional[int] = None) -> Iterator[Workout]:
+        """
+        Percorre todos os treinos, página por página, sem carregá-los de uma vez.
+        
+        A implementação padrão busca as páginas em sequência até encontrar uma
+        página vazia. Implementações concretas podem buscar páginas antecipadamente.
+        
+        Args:
+            prefetch: Quantidade de páginas a buscar antecipadamente (None usa o padrão
+                      da implementação; 0 busca uma página de cada vez)
+            
+        Yields:
+            Cada treino encontrado
+        """
+        page = 1
+        while True:
+            items = self.get_all(page)
+            if not items:
+                return
+            yield from items
+            page += 1
+    
     @abstractmethod
     def get_by_id(self, workout_id: str) -> Optional[Workout]:
         """
@@ -55,6 +77,23 @@ class WorkoutRepository(ABC):
         """
         pass
     
+    def get_changes_since(self, since: str) -> WorkoutChanges:
+        """
+        Obtém os treinos criados, alterados ou excluídos desde uma data.
+        
+        Usado para manter índices em memória em dia sem reler todo o histórico.
+        
+        Args:
+            since: Data ISO 8601 (normalmente o cursor da consulta anterior)
+            
+        Returns:
+            As alterações e o cursor para a próxima consulta
+            
+        Raises:
+            NotImplementedError: Se a implementação não fornecer alterações incrementais
+        """
+        raise NotImplementedError("Este repositório não fornece alterações incrementais")
+    
     @abstractmethod
     def save(self, workout: Workout) -> Workout:
         """
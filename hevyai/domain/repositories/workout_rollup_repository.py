@@ -0,0 +1,34 @@
+"""
+Interface do repositório dos totais de treinos por período.
+Define o contrato para ler os totais diários, semanais e mensais já calculados.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional
+
+from hevyai.domain.entities.workout_rollup import WorkoutRollup
+
+
+class WorkoutRollupRepository(ABC):
+    """
+    Interface para o repositório dos totais de treinos por período.
+
+    Os totais são mantidos a cada alteração do histórico, de modo que a leitura
+    de um intervalo não agrega as séries dos treinos.
+    """
+
+    @abstractmethod
+    def get_rollups(self, period: str, start: Optional[date] = None, end: Optional[date] = None) -> List[WorkoutRollup]:
+        """
+        Obtém os totais dos períodos que se sobrepõem a um intervalo de dias.
+
+        Args:
+            period: 'day', 'week' ou 'month'
+            start: Primeiro dia, inclusivo (opcional)
+            end: Último dia, inclusivo (opcional)
+
+        Returns:
+            Os totais em ordem cronológica; períodos sem treinos não aparecem
+        """
+        pass
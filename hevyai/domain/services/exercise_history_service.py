@@ -0,0 +1,172 @@
+"""
+Serviço da evolução de um modelo de exercício ao longo dos treinos.
+
+Resume cada modelo de exercício de um treino em uma sessão (série principal,
+1RM estimado e volume) e monta, a partir das sessões de um período, as séries
+temporais do modelo. Períodos longos são reduzidos no servidor pelo algoritmo
+Largest-Triangle-Three-Buckets (LTTB), que preserva picos e vales da curva.
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+from hevyai.domain.entities.exercise_history import ExerciseHistory, ExerciseSession, HistoryPoint
+from hevyai.domain.entities.workout import Workout
+from hevyai.domain.services.personal_record_service import MAX_E1RM_REPS, epley_one_rep_max
+from hevyai.domain.timestamps import parse_timestamp
+
+# O LTTB mantém o primeiro e o último ponto e ao menos um por balde
+MIN_POINTS = 3
+
+
+def largest_triangle_three_buckets(xs: Sequence[float], ys: Sequence[float], threshold: int) -> List[int]:
+    """
+    Escolhe os pontos de uma série pelo algoritmo Largest-Triangle-Three-Buckets.
+
+    O primeiro e o último ponto são mantidos; os demais são divididos em
+    `threshold - 2` baldes e, de cada balde, fica o ponto que forma o maior
+    triângulo com o ponto escolhido no balde anterior e a média do seguinte.
+
+    Args:
+        xs: Abscissas, em ordem crescente
+        ys: Ordenadas
+        threshold: Quantidade de pontos desejada
+
+    Returns:
+        Posições dos pontos escolhidos, em ordem crescente; todas as posições
+        quando a série já cabe no limite ou o limite é menor que MIN_POINTS
+    """
+    size = len(xs)
+    if threshold >= size or threshold < MIN_POINTS:
+        return list(range(size))
+
+    every = (size - 2) / (threshold - 2)
+    selected = [0]
+    previous = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        next_start = end
+        next_end = min(int((bucket + 2) * every) + 1, size)
+        count = next_end - next_start
+        average_x = sum(xs[next_start:next_end]) / count
+        average_y = sum(ys[next_start:next_end]) / count
+
+        anchor_x, anchor_y = xs[previous], ys[previous]
+        best, best_area = start, -1.0
+        for position in range(start, end):
+            area = abs(
+                (anchor_x - average_x) * (ys[position] - anchor_y)
+                - (anchor_x - xs[position]) * (average_y - anchor_y)
+            )
+            if area > best_area:
+                best, best_area = position, area
+        selected.append(best)
+        previous = best
+    selected.append(size - 1)
+    return selected
+
+
+class ExerciseHistoryService:
+    """Serviço de domínio para a evolução de cada modelo de exercício."""
+
+    def summarize_workout(self, workout: Workout) -> Dict[str, ExerciseSession]:
+        """
+        Resume cada modelo de exercício de um treino.
+
+        Args:
+            workout: Treino
+
+        Returns:
+            Dicionário indexado pelo ID do modelo de exercício, apenas com os
+            modelos que tiveram séries concluídas com peso e repetições; vazio
+            se o treino não tiver data de início
+        """
+        performed_at = parse_timestamp(workout.start_time)
+        sessions: Dict[str, ExerciseSession] = {}
+        if performed_at is None:
+            return sessions
+
+        for exercise in workout.exercises:
+            if not exercise.exercise_template_id:
+                continue
+            for set_item in exercise.sets:
+                weight, reps = set_item.weight, set_item.reps
+                if not set_item.completed or not weight or not reps or weight <= 0 or reps <= 0:
+                    continue
+                session = sessions.get(exercise.exercise_template_id)
+                if session is None:
+                    session = sessions[exercise.exercise_template_id] = ExerciseSession(
+                        workout.id, performed_at, weight, reps, 0.0, 0
+                    )
+                elif (weight, reps) > (session.top_weight, session.top_reps):
+                    session.top_weight, session.top_reps = weight, reps
+                session.volume += weight * reps
+                session.sets += 1
+                if reps <= MAX_E1RM_REPS:
+                    e1rm = epley_one_rep_max(weight, reps)
+                    if session.e1rm is None or e1rm > session.e1rm:
+                        session.e1rm = e1rm
+        return sessions
+
+    def build_history(
+        self,
+        exercise_template_id: str,
+        sessions: List[ExerciseSession],
+        max_points: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> ExerciseHistory:
+        """
+        Monta as séries de série principal, 1RM estimado e volume de um modelo.
+
+        Args:
+            exercise_template_id: ID do modelo de exercício
+            sessions: Sessões do modelo no período, da mais antiga para a mais recente
+            max_points: Quantidade máxima de pontos por série (ao menos MIN_POINTS)
+            start: Início do período consultado (opcional)
+            end: Fim do período consultado (opcional)
+
+        Returns:
+            Entidade ExerciseHistory
+        """
+        history = ExerciseHistory(
+            exercise_template_id=exercise_template_id,
+            start=start,
+            end=end,
+            max_points=max_points,
+            sessions=len(sessions),
+            downsampled=len(sessions) > max_points
+        )
+        history.top_set = self._series(
+            sessions, max_points, lambda s: s.top_weight, lambda s: s.top_reps
+        )
+        history.e1rm = self._series(
+            [s for s in sessions if s.e1rm is not None], max_points, lambda s: s.e1rm
+        )
+        history.volume = self._series(sessions, max_points, lambda s: s.volume)
+        return history
+
+    def _series(
+        self,
+        sessions: List[ExerciseSession],
+        max_points: int,
+        value: Callable[[ExerciseSession], float],
+        reps: Optional[Callable[[ExerciseSession], int]] = None
+    ) -> List[HistoryPoint]:
+        """Reduz uma série a max_points pontos e a converte em HistoryPoint."""
+        ys = [value(session) for session in sessions]
+        if len(sessions) > max_points:
+            xs = [session.performed_at.timestamp() for session in sessions]
+            positions = largest_triangle_three_buckets(xs, ys, max_points)
+        else:
+            positions = range(len(sessions))
+        return [
+            HistoryPoint(
+                performed_at=sessions[position].performed_at,
+                workout_id=sessions[position].workout_id,
+                value=ys[position],
+                reps=reps(sessions[position]) if reps else None
+            )
+            for position in positions
+        ]
@@ -0,0 +1,217 @@
+"""
+Serviço de recordes pessoais.
+
+Define as fórmulas de 1RM estimado (Epley e Brzycki), a comparação entre
+séries candidatas a recorde e o resumo dos recordes de cada modelo de
+exercício em um único treino, a partir do qual os recordes do histórico são
+mantidos incrementalmente.
+"""
+
+import math
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from hevyai.domain.entities.personal_record import OneRepMaxPoint, PersonalRecords, RecordSet
+from hevyai.domain.entities.workout import Workout
+from hevyai.domain.timestamps import parse_timestamp
+
+# Acima dessa quantidade de repetições as fórmulas de 1RM deixam de ser
+# confiáveis, e a série não entra nos recordes de 1RM estimado
+MAX_E1RM_REPS = 12
+
+# Recordes de valor único, com o nome do campo em PersonalRecords
+BEST_WEIGHT = 'best_weight'
+BEST_E1RM_EPLEY = 'best_e1rm_epley'
+BEST_E1RM_BRZYCKI = 'best_e1rm_brzycki'
+BEST_VOLUME_SET = 'best_volume_set'
+RECORD_FIELDS = (BEST_WEIGHT, BEST_E1RM_EPLEY, BEST_E1RM_BRZYCKI, BEST_VOLUME_SET)
+
+
+def epley_one_rep_max(weight: float, reps: int) -> float:
+    """
+    Estima o 1RM pela fórmula de Epley: peso × (1 + repetições / 30).
+
+    Args:
+        weight: Peso da série
+        reps: Repetições da série (ao menos 1)
+
+    Returns:
+        1RM estimado; com uma repetição, o próprio peso
+    """
+    return weight if reps == 1 else weight * (1 + reps / 30)
+
+
+def brzycki_one_rep_max(weight: float, reps: int) -> float:
+    """
+    Estima o 1RM pela fórmula de Brzycki: peso × 36 / (37 − repetições).
+
+    Args:
+        weight: Peso da série
+        reps: Repetições da série (de 1 a MAX_E1RM_REPS)
+
+    Returns:
+        1RM estimado; com uma repetição, o próprio peso
+    """
+    return weight if reps == 1 else weight * 36 / (37 - reps)
+
+
+def is_better(candidate: RecordSet, current: Optional[RecordSet]) -> bool:
+    """
+    Indica se uma série supera o recorde atual.
+
+    Vence o maior valor; no empate, a série com mais repetições e, persistindo o
+    empate, a feita antes (quem atingiu a marca primeiro).
+
+    Args:
+        candidate: Série candidata
+        current: Recorde atual (None se ainda não há recorde)
+
+    Returns:
+        True se a candidata deve assumir o recorde
+    """
+    if current is None:
+        return True
+    if candidate.value != current.value:
+        return candidate.value > current.value
+    return _rank(candidate) > _rank(current)
+
+
+def _rank(record: RecordSet) -> Tuple[float, int, float]:
+    performed_at = record.performed_at
+    return record.value, record.reps, -performed_at.timestamp() if performed_at else -math.inf
+
+
+@dataclass(slots=True)
+class WorkoutRecords:
+    """
+    Melhores séries de um modelo de exercício em um treino.
+
+    `bests` é indexado pelos campos de RECORD_FIELDS e `rep_maxes` pelo peso.
+    """
+    workout_id: str
+    performed_at: Optional[datetime]
+    bests: Dict[str, RecordSet] = field(default_factory=dict)
+    rep_maxes: Dict[float, RecordSet] = field(default_factory=dict)
+
+    def offer(self, field_name: str, record: RecordSet) -> None:
+        """Guarda a série se ela superar o melhor valor do treino para o recorde."""
+        if is_better(record, self.bests.get(field_name)):
+            self.bests[field_name] = record
+
+
+class PersonalRecordService:
+    """
+    Serviço de domínio para os recordes pessoais por modelo de exercício.
+
+    Os recordes do histórico são o melhor entre os resumos de cada treino
+    (`summarize_workout`), de modo que incluir um treino custa o número de
+    séries dele e remover um treino exige revisar apenas os resumos dos
+    modelos de exercícios em que ele detinha algum recorde.
+    """
+
+    def summarize_workout(self, workout: Workout) -> Dict[str, WorkoutRecords]:
+        """
+        Resume as melhores séries de cada modelo de exercício de um treino.
+
+        Args:
+            workout: Treino
+
+        Returns:
+            Dicionário indexado pelo ID do modelo de exercício, apenas com os
+            modelos que tiveram séries concluídas com peso e repetições
+        """
+        performed_at = parse_timestamp(workout.start_time)
+        summaries: Dict[str, WorkoutRecords] = {}
+        for exercise in workout.exercises:
+            if not exercise.exercise_template_id:
+                continue
+            for set_item in exercise.sets:
+                weight, reps = set_item.weight, set_item.reps
+                if not set_item.completed or not weight or not reps or weight <= 0 or reps <= 0:
+                    continue
+                summary = summaries.get(exercise.exercise_template_id)
+                if summary is None:
+                    summary = summaries[exercise.exercise_template_id] = WorkoutRecords(workout.id, performed_at)
+
+                # O recorde de peso e o máximo de repetições por peso usam a mesma série
+                heaviest = RecordSet(weight, weight, reps, workout.id, performed_at)
+                summary.offer(BEST_WEIGHT, heaviest)
+                if is_better(heaviest, summary.rep_maxes.get(weight)):
+                    summary.rep_maxes[weight] = heaviest
+                summary.offer(BEST_VOLUME_SET, RecordSet(weight * reps, weight, reps, workout.id, performed_at))
+                if reps <= MAX_E1RM_REPS:
+                    summary.offer(BEST_E1RM_EPLEY, RecordSet(
+                        epley_one_rep_max(weight, reps), weight, reps, workout.id, performed_at
+                    ))
+                    summary.offer(BEST_E1RM_BRZYCKI, RecordSet(
+                        brzycki_one_rep_max(weight, reps), weight, reps, workout.id, performed_at
+                    ))
+        return summaries
+
+    def merge_workout(
+        self,
+        bests: Dict[str, RecordSet],
+        rep_maxes: Dict[float, RecordSet],
+        summary: WorkoutRecords
+    ) -> None:
+        """
+        Atualiza os recordes de um modelo de exercício com o resumo de um treino.
+
+        Args:
+            bests: Recordes de valor único, alterados no lugar
+            rep_maxes: Máximo de repetições por peso, alterado no lugar
+            summary: Resumo do treino para o modelo
+        """
+        for field_name, record in summary.bests.items():
+            if is_better(record, bests.get(field_name)):
+                bests[field_name] = record
+        for weight, record in summary.rep_maxes.items():
+            if is_better(record, rep_maxes.get(weight)):
+                rep_maxes[weight] = record
+
+    def build_records(
+        self,
+        exercise_template_id: str,
+        bests: Dict[str, RecordSet],
+        rep_maxes: Dict[float, RecordSet],
+        workouts: List[WorkoutRecords]
+    ) -> PersonalRecords:
+        """
+        Monta os recordes de um modelo de exercício, com a evolução do 1RM estimado.
+
+        Args:
+            exercise_template_id: ID do modelo de exercício
+            bests: Recordes de valor único, indexados pelos campos de RECORD_FIELDS
+            rep_maxes: Máximo de repetições por peso
+            workouts: Resumos dos treinos do modelo
+
+        Returns:
+            Entidade PersonalRecords
+        """
+        records = PersonalRecords(exercise_template_id=exercise_template_id, workouts=len(workouts))
+        for field_name in RECORD_FIELDS:
+            setattr(records, field_name, bests.get(field_name))
+        records.rep_maxes = sorted(rep_maxes.values(), key=lambda item: item.value, reverse=True)
+
+        history: List[OneRepMaxPoint] = []
+        dated = sorted(
+            (summary for summary in workouts if summary.performed_at is not None),
+            key=lambda summary: summary.performed_at
+        )
+        best_so_far = 0.0
+        for summary in dated:
+            epley = summary.bests.get(BEST_E1RM_EPLEY)
+            if epley is None:
+                continue
+            brzycki = summary.bests.get(BEST_E1RM_BRZYCKI)
+            history.append(OneRepMaxPoint(
+                workout_id=summary.workout_id,
+                performed_at=summary.performed_at,
+                epley=epley.value,
+                brzycki=brzycki.value if brzycki else None,
+                is_record=epley.value > best_so_far
+            ))
+            best_so_far = max(best_so_far, epley.value)
+        records.e1rm_history = history
+        return records
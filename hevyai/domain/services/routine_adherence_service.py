@@ -0,0 +1,247 @@
+"""
+Serviço de aderência dos treinos às rotinas.
+
+Associa cada treino à rotina da qual ele veio e compara o planejado (exercícios
+e séries da rotina, com as repetições e o peso alvo) com o executado. Treinos
+sem `routine_id` (ou com uma rotina que não existe mais) são associados pela
+assinatura da rotina, o conjunto dos seus modelos de exercícios, consultada em
+um índice invertido modelo -> rotinas: o custo de associar um treino depende
+só dos seus modelos, e não da quantidade de rotinas.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from hevyai.domain.entities.routine import Routine
+from hevyai.domain.entities.routine_adherence import (
+    ExerciseAdherence,
+    PerformedWorkout,
+    RoutineAdherenceSummary,
+    WorkoutAdherence,
+)
+
+MATCHED_BY_ROUTINE_ID = 'routine_id'
+MATCHED_BY_SIGNATURE = 'signature'
+# Semelhança de Jaccard mínima entre os modelos do treino e os da rotina
+MIN_SIMILARITY = 0.5
+
+
+class RoutineSignatureIndex:
+    """
+    Índice das assinaturas (conjuntos de modelos de exercícios) das rotinas.
+
+    Guarda as rotinas pelo ID, as assinaturas exatas e, para cada modelo de
+    exercício, as rotinas em que ele aparece.
+    """
+
+    def __init__(self, routines: Iterable[Routine], min_similarity: float = MIN_SIMILARITY):
+        """
+        Monta o índice.
+
+        Args:
+            routines: Rotinas a indexar
+            min_similarity: Semelhança mínima para associar um treino por assinatura
+        """
+        self.min_similarity = min_similarity
+        self.routines: Dict[str, Routine] = {}
+        self._signatures: Dict[str, FrozenSet[str]] = {}
+        self._exact: Dict[FrozenSet[str], str] = {}
+        self._postings: Dict[str, List[str]] = defaultdict(list)
+        for routine in routines:
+            signature = frozenset(e.exercise_template_id for e in routine.exercises if e.exercise_template_id)
+            self.routines[routine.id] = routine
+            self._signatures[routine.id] = signature
+            self._exact.setdefault(signature, routine.id)
+            for template_id in signature:
+                self._postings[template_id].append(routine.id)
+
+    def match(self, workout: PerformedWorkout) -> Optional[Tuple[Routine, str, float]]:
+        """
+        Encontra a rotina de um treino.
+
+        Args:
+            workout: Treino executado
+
+        Returns:
+            Tupla (rotina, forma da associação, semelhança) ou None se nenhuma
+            rotina for informada pelo treino nem semelhante o bastante
+        """
+        signature = frozenset(e.exercise_template_id for e in workout.exercises if e.exercise_template_id)
+        routine = self.routines.get(workout.routine_id) if workout.routine_id else None
+        if routine is not None:
+            return routine, MATCHED_BY_ROUTINE_ID, _jaccard(signature, self._signatures[routine.id])
+        if not signature:
+            return None
+
+        exact = self._exact.get(signature)
+        if exact is not None:
+            return self.routines[exact], MATCHED_BY_SIGNATURE, 1.0
+
+        shared: Dict[str, int] = defaultdict(int)
+        for template_id in signature:
+            for routine_id in self._postings.get(template_id, ()):
+                shared[routine_id] += 1
+        best_id, best = None, 0.0
+        for routine_id, count in shared.items():
+            similarity = count / (len(signature) + len(self._signatures[routine_id]) - count)
+            if similarity > best:
+                best_id, best = routine_id, similarity
+        if best_id is None or best < self.min_similarity:
+            return None
+        return self.routines[best_id], MATCHED_BY_SIGNATURE, best
+
+
+class RoutineAdherenceService:
+    """
+    Serviço de domínio que compara treinos executados com as rotinas planejadas.
+
+    Os exercícios da rotina são pareados, na ordem, com os exercícios do treino
+    do mesmo modelo; exercícios planejados sem par foram pulados e os do treino
+    sem par são extras. As séries concluídas são pareadas com as planejadas pela
+    posição. Só as séries concluídas contam como feitas.
+    """
+
+    def score(self, workout: PerformedWorkout, routine: Routine, matched_by: str, similarity: float) -> WorkoutAdherence:
+        """
+        Compara um treino com uma rotina.
+
+        Args:
+            workout: Treino executado
+            routine: Rotina planejada
+            matched_by: Forma como a rotina foi associada ao treino
+            similarity: Semelhança entre os modelos do treino e os da rotina
+
+        Returns:
+            A aderência do treino, com o detalhe de cada exercício
+        """
+        result = WorkoutAdherence(
+            workout_id=workout.workout_id,
+            workout_name=workout.name,
+            routine_id=routine.id,
+            routine_name=routine.name,
+            matched_by=matched_by,
+            similarity=similarity,
+            start_time=workout.start_time
+        )
+        available: Dict[str, List[int]] = defaultdict(list)
+        for position, exercise in enumerate(workout.exercises):
+            available[exercise.exercise_template_id].append(position)
+        for positions in available.values():
+            positions.reverse()
+
+        reps_deltas: List[float] = []
+        weight_deltas: List[float] = []
+        matched = 0
+        for planned in sorted(routine.exercises, key=lambda e: e.order):
+            item = ExerciseAdherence(
+                exercise_template_id=planned.exercise_template_id,
+                name=planned.name,
+                planned_sets=len(planned.sets)
+            )
+            positions = available.get(planned.exercise_template_id)
+            if positions:
+                performed = workout.exercises[positions.pop()]
+                matched += 1
+                item.performed_sets = len(performed.sets)
+                exercise_reps: List[float] = []
+                exercise_weights: List[float] = []
+                for target, (reps, weight) in zip(planned.sets, performed.sets):
+                    if target.reps is not None and reps is not None:
+                        exercise_reps.append(reps - target.reps)
+                    if target.weight is not None and weight is not None:
+                        exercise_weights.append(weight - target.weight)
+                item.reps_delta = _mean(exercise_reps)
+                item.weight_delta = _mean(exercise_weights)
+                reps_deltas.extend(exercise_reps)
+                weight_deltas.extend(exercise_weights)
+            else:
+                item.skipped = True
+                result.skipped_exercises += 1
+            item.missed_sets = max(item.planned_sets - item.performed_sets, 0)
+            item.extra_sets = max(item.performed_sets - item.planned_sets, 0)
+
+            result.planned_sets += item.planned_sets
+            result.missed_sets += item.missed_sets
+            result.extra_sets += item.extra_sets
+            result.exercises.append(item)
+
+        result.planned_exercises = len(result.exercises)
+        result.extra_exercises = len(workout.exercises) - matched
+        result.reps_delta = _mean(reps_deltas)
+        result.weight_delta = _mean(weight_deltas)
+        if result.planned_sets:
+            result.score = (result.planned_sets - result.missed_sets) / result.planned_sets
+        return result
+
+    def score_history(
+        self,
+        workouts: Iterable[PerformedWorkout],
+        routines: Iterable[Routine],
+        min_similarity: float = MIN_SIMILARITY
+    ) -> Tuple[List[WorkoutAdherence], int]:
+        """
+        Associa e compara cada treino de um histórico com a sua rotina.
+
+        Args:
+            workouts: Treinos executados
+            routines: Rotinas planejadas
+            min_similarity: Semelhança mínima para associar um treino por assinatura
+
+        Returns:
+            Tupla (aderência dos treinos associados a uma rotina, quantidade de
+            treinos sem rotina)
+        """
+        index = RoutineSignatureIndex(routines, min_similarity)
+        results: List[WorkoutAdherence] = []
+        unmatched = 0
+        for workout in workouts:
+            match = index.match(workout)
+            if match is None:
+                unmatched += 1
+                continue
+            results.append(self.score(workout, *match))
+        return results, unmatched
+
+    def summarize(self, adherences: Iterable[WorkoutAdherence]) -> List[RoutineAdherenceSummary]:
+        """
+        Resume a aderência por rotina.
+
+        Args:
+            adherences: Aderência de cada treino
+
+        Returns:
+            Um resumo por rotina, da mais treinada para a menos treinada
+        """
+        summaries: Dict[str, RoutineAdherenceSummary] = {}
+        scores: Dict[str, float] = defaultdict(float)
+        for adherence in adherences:
+            summary = summaries.get(adherence.routine_id)
+            if summary is None:
+                summary = summaries[adherence.routine_id] = RoutineAdherenceSummary(
+                    routine_id=adherence.routine_id,
+                    routine_name=adherence.routine_name
+                )
+            summary.workouts += 1
+            summary.skipped_exercises += adherence.skipped_exercises
+            summary.missed_sets += adherence.missed_sets
+            scores[adherence.routine_id] += adherence.score
+            if adherence.start_time is not None and _is_later(adherence.start_time, summary.last_performed):
+                summary.last_performed = adherence.start_time
+
+        for routine_id, summary in summaries.items():
+            summary.average_score = scores[routine_id] / summary.workouts
+        return sorted(summaries.values(), key=lambda s: (-s.workouts, s.routine_name))
+
+
+def _jaccard(first: FrozenSet[str], second: FrozenSet[str]) -> float:
+    union = len(first | second)
+    return len(first & second) / union if union else 1.0
+
+
+def _mean(values: List[float]) -> Optional[float]:
+    return sum(values) / len(values) if values else None
+
+
+def _is_later(value: datetime, other: Optional[datetime]) -> bool:
+    return other is None or value > other
@@ -0,0 +1,275 @@
+"""
+Serviço de carga de treino.
+
+Calcula a carga de cada treino (volume ou RPE da sessão × duração) e mantém
+séries diárias com as médias móveis exponenciais aguda (7 dias) e crônica
+(28 dias), de onde sai a razão aguda:crônica (ACWR). As médias usam o fator
+2 / (N + 1) e partem de zero antes do primeiro dia com carga.
+
+As séries guardam a carga de cada dia e recalculam as médias só a partir do
+dia mais antigo alterado desde a última leitura: um treino novo recalcula
+poucos dias, e a carga inicial do histórico inteiro é calculada em uma única
+passada vetorizada.
+"""
+
+from datetime import date, timezone, tzinfo
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from hevyai.domain.entities.training_load import TrainingLoadDay
+from hevyai.domain.entities.workout import Workout
+from hevyai.domain.timestamps import parse_timestamp
+
+ACUTE_DAYS = 7
+CHRONIC_DAYS = 28
+
+# Cargas disponíveis: volume (peso × repetições) ou RPE da sessão × minutos
+METRIC_VOLUME = 'volume'
+METRIC_SESSION_RPE = 'srpe'
+METRICS = (METRIC_VOLUME, METRIC_SESSION_RPE)
+
+# Escopo com todos os treinos; os demais escopos são IDs de grupos musculares
+SCOPE_ALL = 'all'
+
+# Dias calculados de uma vez na média exponencial vetorizada; blocos curtos
+# mantêm os fatores (1 - alfa) ** -k dentro da precisão do ponto flutuante
+EWMA_BLOCK_DAYS = 64
+
+
+def ewma_alpha(days: int) -> float:
+    """
+    Obtém o fator de suavização da média móvel exponencial de N dias.
+
+    Args:
+        days: Quantidade de dias da média
+
+    Returns:
+        2 / (N + 1)
+    """
+    return 2 / (days + 1)
+
+
+def exponential_average(values: np.ndarray, alpha: float, initial: float = 0.0) -> np.ndarray:
+    """
+    Calcula a média móvel exponencial de uma série diária, de forma vetorizada.
+
+    Equivale a `media = alpha * valor + (1 - alpha) * media_anterior` dia a dia,
+    calculado em blocos de EWMA_BLOCK_DAYS com somas acumuladas.
+
+    Args:
+        values: Valores diários
+        alpha: Fator de suavização
+        initial: Média do dia anterior ao primeiro valor
+
+    Returns:
+        Média de cada dia
+    """
+    decay = 1.0 - alpha
+    result = np.empty(len(values))
+    previous = initial
+    for block_start in range(0, len(values), EWMA_BLOCK_DAYS):
+        block = values[block_start:block_start + EWMA_BLOCK_DAYS]
+        steps = np.arange(len(block))
+        growth = decay ** steps
+        # media[k] = decay^(k+1) * anterior + alpha * soma_{j<=k} decay^(k-j) * valor[j]
+        averaged = decay * growth * previous + alpha * growth * np.cumsum(block / growth)
+        result[block_start:block_start + len(block)] = averaged
+        previous = averaged[-1]
+    return result
+
+
+class DailyLoadSeries:
+    """
+    Série diária de carga de treino com as médias aguda e crônica.
+
+    `add` só acumula a carga do dia e anota o dia mais antigo alterado; as
+    médias são recalculadas na leitura seguinte, daquele dia em diante.
+    """
+
+    def __init__(self, acute_days: int = ACUTE_DAYS, chronic_days: int = CHRONIC_DAYS):
+        """
+        Inicializa uma série vazia.
+
+        Args:
+            acute_days: Dias da média aguda (padrão: 7)
+            chronic_days: Dias da média crônica (padrão: 28)
+        """
+        self.acute_days = acute_days
+        self.chronic_days = chronic_days
+        self._acute_alpha = ewma_alpha(acute_days)
+        self._chronic_alpha = ewma_alpha(chronic_days)
+        # Dia (ordinal) -> carga
+        self._loads: Dict[int, float] = {}
+        self._first_day: Optional[int] = None
+        self._last_day: Optional[int] = None
+        self._dirty_from: Optional[int] = None
+        # Colunas calculadas, a partir do dia `_origin`
+        self._origin: Optional[int] = None
+        self._daily = np.zeros(0)
+        self._acute = np.zeros(0)
+        self._chronic = np.zeros(0)
+
+    def add(self, day: date, amount: float) -> None:
+        """
+        Soma (ou, com valor negativo, subtrai) carga a um dia.
+
+        Args:
+            day: Dia da carga
+            amount: Carga a somar
+        """
+        ordinal = day.toordinal()
+        self._loads[ordinal] = self._loads.get(ordinal, 0.0) + amount
+        if self._first_day is None or ordinal < self._first_day:
+            self._first_day = ordinal
+        if self._last_day is None or ordinal > self._last_day:
+            self._last_day = ordinal
+        if self._dirty_from is None or ordinal < self._dirty_from:
+            self._dirty_from = ordinal
+
+    def window(self, start: date, end: date) -> List[TrainingLoadDay]:
+        """
+        Obtém os dias de um intervalo, com a carga e as médias de cada um.
+
+        Custa o número de dias do intervalo (mais o recálculo pendente, se houver).
+        Depois do último dia com carga, as médias apenas decaem.
+
+        Args:
+            start: Primeiro dia, inclusivo
+            end: Último dia, inclusivo
+
+        Returns:
+            Lista com um item por dia
+        """
+        self._refresh()
+        first = start.toordinal()
+        count = end.toordinal() - first + 1
+        if count <= 0:
+            return []
+
+        loads = np.zeros(count)
+        acute = np.zeros(count)
+        chronic = np.zeros(count)
+        if self._origin is not None:
+            size = len(self._daily)
+            positions = np.arange(first - self._origin, first - self._origin + count)
+            inside = (positions >= 0) & (positions < size)
+            loads[inside] = self._daily[positions[inside]]
+            acute[inside] = self._acute[positions[inside]]
+            chronic[inside] = self._chronic[positions[inside]]
+            after = positions >= size
+            if after.any():
+                elapsed = positions[after] - (size - 1)
+                acute[after] = self._acute[-1] * (1.0 - self._acute_alpha) ** elapsed
+                chronic[after] = self._chronic[-1] * (1.0 - self._chronic_alpha) ** elapsed
+
+        ratios = np.divide(acute, chronic, out=np.full(count, np.nan), where=chronic > 0)
+        return [
+            TrainingLoadDay(
+                day=date.fromordinal(first + position),
+                load=load,
+                acute=acute_value,
+                chronic=chronic_value,
+                ratio=None if ratio != ratio else ratio
+            )
+            for position, (load, acute_value, chronic_value, ratio) in enumerate(
+                zip(loads.tolist(), acute.tolist(), chronic.tolist(), ratios.tolist())
+            )
+        ]
+
+    def _refresh(self) -> None:
+        """Recalcula as médias a partir do dia mais antigo alterado."""
+        if self._dirty_from is None:
+            return
+        size = self._last_day - self._first_day + 1
+
+        if self._origin != self._first_day:
+            # Primeira leitura ou carga anterior ao início da série: uma passada completa
+            self._origin = self._first_day
+            start = 0
+            days = np.fromiter(self._loads.keys(), dtype=np.int64, count=len(self._loads))
+            self._daily = np.zeros(size)
+            self._daily[days - self._origin] = np.fromiter(self._loads.values(), dtype=float, count=len(self._loads))
+            self._acute = np.zeros(size)
+            self._chronic = np.zeros(size)
+        else:
+            start = self._dirty_from - self._origin
+            grown = size - len(self._daily)
+            if grown > 0:
+                self._daily = np.concatenate([self._daily, np.zeros(grown)])
+                self._acute = np.concatenate([self._acute, np.zeros(grown)])
+                self._chronic = np.concatenate([self._chronic, np.zeros(grown)])
+            self._daily[start:] = [self._loads.get(self._origin + position, 0.0) for position in range(start, size)]
+
+        previous_acute = self._acute[start - 1] if start else 0.0
+        previous_chronic = self._chronic[start - 1] if start else 0.0
+        self._acute[start:] = exponential_average(self._daily[start:], self._acute_alpha, previous_acute)
+        self._chronic[start:] = exponential_average(self._daily[start:], self._chronic_alpha, previous_chronic)
+        self._dirty_from = None
+
+
+class TrainingLoadService:
+    """
+    Serviço de domínio que calcula a carga de treino de cada treino.
+
+    O volume é a soma de peso × repetições das séries concluídas. A carga por
+    RPE da sessão é a RPE média das séries concluídas × a duração do treino em
+    minutos; em um grupo muscular, ela é dividida pela fração das séries
+    concluídas do treino feitas para o grupo. Cada exercício conta para o grupo
+    muscular principal (o primeiro) do seu modelo.
+    """
+
+    def workout_loads(
+        self,
+        workout: Workout,
+        primary_muscle_group: Callable[[str], Optional[str]],
+        tz: tzinfo = timezone.utc
+    ) -> Optional[Tuple[date, Dict[Tuple[str, str], float]]]:
+        """
+        Calcula as cargas de um treino por métrica e escopo.
+
+        Args:
+            workout: Treino
+            primary_muscle_group: Função que obtém o grupo muscular principal
+                                  de um modelo de exercício (ou None)
+            tz: Fuso horário que define o dia do treino (padrão: UTC)
+
+        Returns:
+            Tupla (dia do treino, {(métrica, escopo): carga}) ou None se o treino
+            não tiver data de início
+        """
+        start_time = parse_timestamp(workout.start_time)
+        if start_time is None:
+            return None
+
+        volume: Dict[str, float] = {SCOPE_ALL: 0.0}
+        sets: Dict[str, int] = {SCOPE_ALL: 0}
+        rpe_sum = 0.0
+        rpe_count = 0
+        for exercise in workout.exercises:
+            group = primary_muscle_group(exercise.exercise_template_id) if exercise.exercise_template_id else None
+            for set_item in exercise.sets:
+                if not set_item.completed:
+                    continue
+                lifted = (set_item.weight or 0.0) * (set_item.reps or 0)
+                volume[SCOPE_ALL] += lifted
+                sets[SCOPE_ALL] += 1
+                if group:
+                    volume[group] = volume.get(group, 0.0) + lifted
+                    sets[group] = sets.get(group, 0) + 1
+                if set_item.rpe is not None:
+                    rpe_sum += set_item.rpe
+                    rpe_count += 1
+
+        loads: Dict[Tuple[str, str], float] = {}
+        for scope, value in volume.items():
+            if value:
+                loads[(METRIC_VOLUME, scope)] = value
+
+        end_time = parse_timestamp(workout.end_time)
+        if rpe_count and end_time is not None and end_time > start_time:
+            session_load = rpe_sum / rpe_count * (end_time - start_time).total_seconds() / 60
+            for scope, count in sets.items():
+                if count:
+                    loads[(METRIC_SESSION_RPE, scope)] = session_load * count / sets[SCOPE_ALL]
+        return start_time.astimezone(tz).date(), loads
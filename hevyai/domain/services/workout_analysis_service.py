@@ -0,0 +1,335 @@
+"""
+Serviço de análise de treinos.
+
+Calcula volume, tonelagem, quantidade de séries, duração, intensidade e RPE do
+histórico de treinos com NumPy, sobre as colunas de um SetBatch: cada resumo é
+um conjunto de somas agrupadas (`numpy.bincount`) sobre todas as séries de uma
+vez, sem laços em Python por treino, exercício e série.
+"""
+
+import math
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from hevyai.domain.entities.exercise_template import ExerciseTemplate, MuscleGroup
+from hevyai.domain.entities.set_batch import SetBatch
+from hevyai.domain.entities.training_summary import MuscleGroupWeeks, TrainingSummary, TrainingTotals
+
+# Agrupamentos aceitos por `summarize`
+GROUP_BY_WORKOUT = 'workout'
+GROUP_BY_EXERCISE = 'exercise'
+PERIOD_GROUPS = ('day', 'week', 'month', 'year')
+GROUP_BY_OPTIONS = (GROUP_BY_WORKOUT, GROUP_BY_EXERCISE) + PERIOD_GROUPS
+
+SECONDS_PER_DAY = 86400
+# Intervalo em que o deslocamento do fuso horário é verificado de uma vez; as
+# mudanças de horário de verão ficam meses distantes umas das outras
+OFFSET_BUCKET_SECONDS = 7 * SECONDS_PER_DAY
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_DAY = date(1970, 1, 1)
+
+
+class WorkoutAnalysisService:
+    """
+    Serviço de domínio que resume o histórico de séries por treino, exercício ou
+    período, e por semana e grupo muscular.
+
+    Só entram nos totais as séries concluídas. Os períodos (dia, semana iniciada
+    na segunda-feira, mês e ano) seguem o calendário do fuso horário informado.
+    """
+
+    def summarize(
+        self,
+        batch: SetBatch,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        group_by: str = 'week',
+        tz: tzinfo = timezone.utc
+    ) -> TrainingSummary:
+        """
+        Resume as séries dos treinos iniciados em um período.
+
+        Args:
+            batch: Séries de todos os treinos
+            start: Início do período, inclusivo (opcional)
+            end: Fim do período, exclusivo (opcional)
+            group_by: 'workout', 'exercise', 'day', 'week', 'month' ou 'year' (padrão: 'week')
+            tz: Fuso horário do calendário dos períodos (padrão: UTC)
+
+        Returns:
+            Resumo com os totais do período e de cada grupo
+
+        Raises:
+            ValueError: Se o agrupamento não for um dos aceitos
+        """
+        if group_by not in GROUP_BY_OPTIONS:
+            raise ValueError(f"Agrupamento inválido: '{group_by}' (use {', '.join(GROUP_BY_OPTIONS)})")
+
+        summary = TrainingSummary(group_by=group_by, start=start, end=end)
+        workout_start = _column(batch.workout_start)
+        workout_index = _column(batch.workout_index).astype(np.intp)
+        set_start = workout_start[workout_index]
+        # Duração de cada treino (fim - início); NaN sem uma das datas ou com o fim antes do início
+        workout_duration = _column(batch.workout_end) - workout_start
+        workout_duration[~(workout_duration >= 0)] = np.nan
+
+        selected = _column(batch.completed).astype(bool)
+        if start is not None:
+            selected &= set_start >= start.timestamp()
+        if end is not None:
+            selected &= set_start < end.timestamp()
+
+        keys: Optional[np.ndarray] = None
+        if group_by == GROUP_BY_WORKOUT:
+            codes = workout_index
+        elif group_by == GROUP_BY_EXERCISE:
+            codes = _column(batch.template_index).astype(np.intp)
+        else:
+            # Treinos sem data de início ficam fora dos períodos
+            selected &= ~np.isnan(set_start)
+            period_keys = _period_keys(workout_start, group_by, tz)
+            keys, codes = np.unique(period_keys[workout_index[selected]], return_inverse=True)
+
+        if keys is None:
+            keys, codes = np.unique(codes[selected], return_inverse=True)
+        columns = {
+            name: _column(getattr(batch, name))[selected]
+            for name in ('reps', 'weight', 'distance', 'rpe')
+        }
+        columns['workout_index'] = workout_index[selected]
+        columns['workout_duration'] = workout_duration[workout_index[selected]]
+        columns['start'] = set_start[selected]
+        group_count = len(keys)
+
+        totals = _aggregate(np.zeros(len(columns['start']), dtype=np.intp), 1, columns, per_workout=True)
+        summary.totals = _build_totals(totals, 0, 'total', None, tz)
+        if not group_count:
+            return summary
+
+        groups = _aggregate(codes.reshape(-1), group_count, columns, per_workout=group_by != GROUP_BY_EXERCISE)
+        for position, key in enumerate(keys.tolist()):
+            if group_by == GROUP_BY_WORKOUT:
+                group_key, name = batch.workout_ids[key], None
+            elif group_by == GROUP_BY_EXERCISE:
+                group_key, name = batch.template_ids[key], batch.template_names[key]
+            else:
+                group_key, name = str(np.datetime64(key, 'D')), None
+            summary.groups.append(_build_totals(groups, position, group_key, name, tz))
+
+        # Os períodos já saem em ordem cronológica de np.unique
+        if group_by == GROUP_BY_EXERCISE:
+            summary.groups.sort(key=lambda group: (-group.sets, group.name or ''))
+        elif group_by == GROUP_BY_WORKOUT:
+            summary.groups.sort(key=lambda group: (group.first_performed is None, group.first_performed or _EPOCH))
+        return summary
+
+    def muscle_group_weeks(
+        self,
+        batch: SetBatch,
+        templates: Dict[str, ExerciseTemplate],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        tz: tzinfo = timezone.utc,
+        secondary_weight: float = 0.0
+    ) -> MuscleGroupWeeks:
+        """
+        Calcula a matriz semanas × grupos musculares de séries e volume.
+
+        Cada modelo de exercício vira uma linha de pesos por grupo muscular (1 no
+        principal, `secondary_weight` nos demais). As séries são somadas por
+        semana e modelo com `numpy.bincount`, e a matriz semanas × modelos é
+        multiplicada pela matriz modelos × grupos.
+
+        Args:
+            batch: Séries de todos os treinos
+            templates: Modelos de exercícios do histórico, pelo ID
+            start: Início do período, inclusivo (opcional)
+            end: Fim do período, exclusivo (opcional)
+            tz: Fuso horário do calendário das semanas (padrão: UTC)
+            secondary_weight: Peso das séries nos grupos musculares secundários (padrão: 0)
+
+        Returns:
+            A matriz de séries e volume por semana e grupo muscular
+        """
+        result = MuscleGroupWeeks(secondary_weight=secondary_weight, start=start, end=end)
+        template_count = len(batch.template_ids)
+
+        columns: Dict[str, int] = {}
+        rows, cols, weights = [], [], []
+        for position, template_id in enumerate(batch.template_ids):
+            template = templates.get(template_id)
+            for rank, group in enumerate(template.muscle_groups if template else []):
+                weight = 1.0 if rank == 0 else secondary_weight
+                key = (group.id or group.name).lower()
+                if weight <= 0 or not key:
+                    continue
+                if key not in columns:
+                    columns[key] = len(result.muscle_groups)
+                    result.muscle_groups.append(MuscleGroup(id=key, name=group.name or key))
+                rows.append(position)
+                cols.append(columns[key])
+                weights.append(weight)
+        group_weights = np.zeros((template_count, len(result.muscle_groups)))
+        # Um grupo repetido no mesmo modelo fica com o maior peso
+        np.maximum.at(group_weights, (np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)), weights)
+
+        workout_start = _column(batch.workout_start)
+        workout_index = _column(batch.workout_index).astype(np.intp)
+        set_start = workout_start[workout_index]
+        selected = _column(batch.completed).astype(bool) & ~np.isnan(set_start)
+        if start is not None:
+            selected &= set_start >= start.timestamp()
+        if end is not None:
+            selected &= set_start < end.timestamp()
+        if not selected.any():
+            return result
+
+        week_days = _period_keys(workout_start, 'week', tz)[workout_index[selected]]
+        first_week = int(week_days.min())
+        week_count = (int(week_days.max()) - first_week) // 7 + 1
+        cells = (week_days - first_week) // 7 * template_count + _column(batch.template_index)[selected]
+        lifted = _column(batch.reps)[selected] * _column(batch.weight)[selected]
+        size = week_count * template_count
+        template_sets = np.bincount(cells, minlength=size).reshape(week_count, template_count)
+        template_volume = np.bincount(cells, weights=np.nan_to_num(lifted), minlength=size).reshape(week_count, template_count)
+
+        assigned = group_weights.any(axis=1)
+        result.weeks = [_EPOCH_DAY + timedelta(days=first_week + 7 * week) for week in range(week_count)]
+        result.sets = (template_sets @ group_weights).tolist()
+        result.volume = (template_volume @ group_weights).tolist()
+        result.unassigned_sets = template_sets[:, ~assigned].sum(axis=1).tolist()
+        return result
+
+
+def _column(values) -> np.ndarray:
+    """Vista NumPy, sem cópia, de uma coluna do SetBatch."""
+    return np.frombuffer(values, dtype=values.typecode)
+
+
+def _aggregate(
+    codes: np.ndarray,
+    group_count: int,
+    columns: Dict[str, np.ndarray],
+    per_workout: bool
+) -> Dict[str, List[float]]:
+    """
+    Soma as colunas das séries por grupo; `codes[i]` é o grupo da série i.
+
+    Os treinos de cada grupo (e a duração deles) são contados pela primeira
+    série de cada par (grupo, treino). Com `per_workout`, todas as séries de um
+    treino estão no mesmo grupo, e essa série é a primeira de cada treino (as
+    séries de um treino são contíguas no SetBatch).
+    """
+    reps = columns['reps']
+    lifted = reps * columns['weight']
+    has_load = ~np.isnan(lifted)
+    has_rpe = ~np.isnan(columns['rpe'])
+
+    def total(weights: np.ndarray) -> np.ndarray:
+        return np.bincount(codes, weights=weights, minlength=group_count)
+
+    workout_index = columns['workout_index']
+    if per_workout:
+        first_rows = np.ones(len(codes), dtype=bool)
+        first_rows[1:] = workout_index[1:] != workout_index[:-1]
+    else:
+        # Primeira série de cada par (grupo, treino) distinto
+        stride = int(workout_index.max(initial=0)) + 1
+        _, first_positions = np.unique(codes.astype(np.int64) * stride + workout_index, return_index=True)
+        first_rows = np.zeros(len(codes), dtype=bool)
+        first_rows[first_positions] = True
+    workouts = np.bincount(codes[first_rows], minlength=group_count)
+    first = np.full(group_count, np.nan)
+    last = np.full(group_count, np.nan)
+    np.fmin.at(first, codes, columns['start'])
+    np.fmax.at(last, codes, columns['start'])
+
+    results = {
+        'workouts': workouts,
+        'sets': np.bincount(codes, minlength=group_count),
+        'reps': total(np.nan_to_num(reps)),
+        'volume': total(np.where(has_load, lifted, 0.0)),
+        'loaded_reps': total(np.where(has_load, reps, 0.0)),
+        'duration': total(np.where(first_rows, np.nan_to_num(columns['workout_duration']), 0.0)),
+        'distance': total(np.nan_to_num(columns['distance'])),
+        'rpe_sum': total(np.where(has_rpe, columns['rpe'], 0.0)),
+        'rpe_count': np.bincount(codes, weights=has_rpe, minlength=group_count),
+        'first': first,
+        'last': last,
+    }
+    # Listas Python: os resultados são lidos grupo a grupo ao montar as entidades
+    return {name: values.tolist() for name, values in results.items()}
+
+
+def _build_totals(
+    groups: Dict[str, List[float]],
+    position: int,
+    key: str,
+    name: Optional[str],
+    tz: tzinfo
+) -> TrainingTotals:
+    """Converte a posição de um grupo nos resultados agregados em TrainingTotals."""
+    volume = groups['volume'][position]
+    loaded_reps = groups['loaded_reps'][position]
+    rpe_count = groups['rpe_count'][position]
+    first = groups['first'][position]
+    last = groups['last'][position]
+    return TrainingTotals(
+        key=key,
+        name=name,
+        workouts=groups['workouts'][position],
+        sets=groups['sets'][position],
+        reps=int(round(groups['reps'][position])),
+        volume=volume,
+        tonnage=volume / 1000,
+        duration=int(round(groups['duration'][position])),
+        distance=groups['distance'][position],
+        average_intensity=volume / loaded_reps if loaded_reps else None,
+        average_rpe=groups['rpe_sum'][position] / rpe_count if rpe_count else None,
+        first_performed=None if math.isnan(first) else datetime.fromtimestamp(first, tz),
+        last_performed=None if math.isnan(last) else datetime.fromtimestamp(last, tz)
+    )
+
+
+def _period_keys(starts: np.ndarray, group_by: str, tz: tzinfo) -> np.ndarray:
+    """
+    Calcula o período de cada treino como o dia local (dias desde 1970-01-01)
+    em que o período começa; treinos sem início recebem 0 e devem ser filtrados.
+    """
+    days = np.zeros(len(starts), dtype=np.int64)
+    known = ~np.isnan(starts)
+    days[known] = _local_days(starts[known], tz)
+
+    if group_by == 'week':
+        # 1970-01-01 foi uma quinta-feira; as semanas começam na segunda
+        return days - (days + 3) % 7
+    if group_by in ('month', 'year'):
+        unit = 'M' if group_by == 'month' else 'Y'
+        return days.astype('datetime64[D]').astype(f'datetime64[{unit}]').astype('datetime64[D]').astype(np.int64)
+    return days
+
+
+def _local_days(starts: np.ndarray, tz: tzinfo) -> np.ndarray:
+    """
+    Converte instantes (timestamps Unix) em dias do calendário local.
+
+    O deslocamento do fuso é calculado no início e no fim de cada intervalo de
+    OFFSET_BUCKET_SECONDS que contém algum instante; apenas os instantes de
+    intervalos em que o deslocamento muda (horário de verão) são convertidos um a um.
+    """
+    buckets, inverse = np.unique(np.floor(starts / OFFSET_BUCKET_SECONDS), return_inverse=True)
+    inverse = inverse.reshape(-1)
+    bucket_starts = (buckets * OFFSET_BUCKET_SECONDS).tolist()
+    offsets = np.array([_utc_offset(moment, tz) for moment in bucket_starts])
+    offsets_at_end = np.array([_utc_offset(moment + OFFSET_BUCKET_SECONDS - 1, tz) for moment in bucket_starts])
+
+    local = starts + offsets[inverse]
+    for position in np.flatnonzero((offsets != offsets_at_end)[inverse]).tolist():
+        local[position] = starts[position] + _utc_offset(float(starts[position]), tz)
+    return np.floor(local / SECONDS_PER_DAY).astype(np.int64)
+
+
+def _utc_offset(moment: float, tz: tzinfo) -> float:
+    return datetime.fromtimestamp(moment, tz).utcoffset().total_seconds()
@@ -0,0 +1,89 @@
+"""
+Conversão das datas ISO 8601 recebidas da API do Hevy.
+
+As entidades, os repositórios, a sincronização e os índices convertem datas por
+aqui, uma única vez, ao receber os dados. O resultado é sempre um datetime com
+fuso horário (UTC quando o texto não informa fuso), de modo que datas vindas da
+API, da cópia local e do decodificador tipado podem ser comparadas e ordenadas
+entre si.
+"""
+
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Optional
+
+# A partir do Python 3.11 o fromisoformat aceita o sufixo 'Z' e frações com
+# qualquer quantidade de dígitos
+_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Textos distintos lembrados; os mesmos created_at / updated_at se repetem em
+# todas as séries e exercícios de um treino e entre as páginas da API
+CACHE_SIZE = 4096
+
+# Forma geral aceita quando o formato fixo do Hevy não se aplica: frações com
+# qualquer quantidade de dígitos, espaço no lugar do 'T' e fuso opcional
+_ISO_DATETIME = re.compile(
+    r'(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})[T ]'
+    r'(?P<hour>\d{1,2}):(?P<minute>\d{1,2})(?::(?P<second>\d{1,2})(?:[.,](?P<fraction>\d+))?)?'
+    r'\s*(?P<tz>Z|[+-]\d{2}(?::?\d{2})?)?$'
+)
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """
+    Converte uma data da API em datetime com fuso horário.
+
+    Args:
+        value: Texto ISO 8601 (ex.: '2024-01-01T10:00:00Z'), datetime ou None
+
+    Returns:
+        A data com fuso horário (UTC se não houver fuso), ou None se o valor for
+        ausente ou inválido
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+    if not isinstance(value, str):
+        return None
+    return _parse_text(value)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_text(value: str) -> Optional[datetime]:
+    # Caminho rápido: o formato do Hevy ('...T10:00:00Z', '...T10:00:00.123Z' ou
+    # '+00:00') é lido pelo fromisoformat, em C; antes do 3.11 o 'Z' é trocado
+    text = value if _ACCEPTS_Z or not value.endswith('Z') else value[:-1] + '+00:00'
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        parsed = _parse_general(value)
+        if parsed is None:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _parse_general(value: str) -> Optional[datetime]:
+    match = _ISO_DATETIME.match(value.strip())
+    if match is None:
+        return None
+    parts = match.groupdict()
+    tz = parts.pop('tz')
+    fraction = parts.pop('fraction')
+    try:
+        parsed = datetime(
+            **{key: int(number) for key, number in parts.items() if number is not None},
+            microsecond=int(fraction[:6].ljust(6, '0')) if fraction else 0
+        )
+    except ValueError:
+        return None
+    if tz and tz != 'Z':
+        sign = -1 if tz[0] == '-' else 1
+        digits = tz[1:].replace(':', '')
+        offset = timedelta(hours=int(digits[:2]), minutes=int(digits[2:] or 0))
+        return parsed.replace(tzinfo=timezone(sign * offset))
+    return parsed.replace(tzinfo=timezone.utc)
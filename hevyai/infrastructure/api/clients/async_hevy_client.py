@@ -0,0 +1,433 @@
+"""
+Cliente assíncrono para a API do Hevy.
+Espelha a interface do HevyApiClient, mas permite buscar várias páginas em paralelo.
+"""
+
+import asyncio
+from typing import Dict, Any, Optional, List, Callable, Awaitable
+
+import httpx
+from django.conf import settings
+
+from hevyai.infrastructure.api.clients.request_scheduler import (
+    RETRYABLE_STATUSES,
+    get_request_scheduler
+)
+from hevyai.infrastructure.api.clients.single_flight import AsyncSingleFlight
+
+
+class AsyncHevyApiClient:
+    """
+    Cliente assíncrono para a API do Hevy.
+
+    A API do Hevy limita o tamanho da página a 10 itens. Este cliente busca a
+    primeira página para descobrir o total de páginas e então dispara as demais
+    em paralelo, respeitando um limite configurável de requisições simultâneas.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_url: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        """
+        Inicializa o cliente assíncrono da API do Hevy.
+
+        Args:
+            api_key: Chave da API do Hevy (opcional, padrão: settings.HEVY_API_KEY)
+            api_url: URL da API do Hevy (opcional, padrão: settings.HEVY_API_URL)
+            max_concurrency: Máximo de requisições simultâneas
+                             (opcional, padrão: settings.HEVY_API_MAX_CONCURRENCY)
+        """
+        self.api_key = api_key or settings.HEVY_API_KEY
+        self.api_url = api_url or settings.HEVY_API_URL
+        self.max_concurrency = max_concurrency or settings.HEVY_API_MAX_CONCURRENCY
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.client = httpx.AsyncClient(
+            base_url=self.api_url,
+            headers={
+                'api-key': self.api_key,
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
+            },
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency
+            ),
+            timeout=httpx.Timeout(settings.HEVY_API_READ_TIMEOUT, connect=settings.HEVY_API_CONNECT_TIMEOUT)
+        )
+        self.scheduler = get_request_scheduler(self.api_key)
+        self._inflight = AsyncSingleFlight()
+
+    async def __aenter__(self) -> 'AsyncHevyApiClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Fecha as conexões abertas pelo cliente."""
+        await self.client.aclose()
+
+    async def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        """
+        Executa uma requisição, coalescendo GETs idênticos e simultâneos.
+
+        GETs com o mesmo caminho e parâmetros aguardados ao mesmo tempo compartilham
+        uma única requisição e o mesmo corpo decodificado, que não deve ser alterado.
+
+        Args:
+            method: Método HTTP
+            path: Caminho relativo à URL da API
+            **kwargs: Argumentos repassados ao httpx
+
+        Returns:
+            Corpo da resposta decodificado
+        """
+        if method != 'GET':
+            return await self._send(method, path, **kwargs)
+        key = (method, path, tuple(sorted((kwargs.get('params') or {}).items())))
+        return await self._inflight.do(key, lambda: self._send(method, path, **kwargs))
+
+    async def _send(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        """
+        Envia uma requisição respeitando o limite de concorrência e de taxa.
+
+        O limitador de taxa e a política de novas tentativas são os mesmos do
+        HevyApiClient e são compartilhados com ele quando a chave de API é a mesma.
+
+        Args:
+            method: Método HTTP
+            path: Caminho relativo à URL da API
+            **kwargs: Argumentos repassados ao httpx
+
+        Returns:
+            Corpo da resposta decodificado
+        """
+        attempt = 0
+        while True:
+            delay = self.scheduler.acquire()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            try:
+                async with self._semaphore:
+                    response = await self.client.request(method, path, **kwargs)
+            except httpx.TransportError:
+                if not self.scheduler.can_retry(method, attempt):
+                    if attempt > 0:
+                        self.scheduler.record_exhausted()
+                    raise
+                await asyncio.sleep(self.scheduler.retry_delay(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code in RETRYABLE_STATUSES:
+                if self.scheduler.can_retry(method, attempt):
+                    await asyncio.sleep(self.scheduler.retry_delay(
+                        attempt, response.status_code, response.headers.get('Retry-After')
+                    ))
+                    attempt += 1
+                    continue
+                if attempt > 0:
+                    self.scheduler.record_exhausted()
+
+            response.raise_for_status()
+            return response.json()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtém as estatísticas do cliente.
+
+        Returns:
+            Dicionário com as estatísticas do agendador de requisições e da
+            coalescência de requisições
+        """
+        return {
+            'scheduler': self.scheduler.get_stats(),
+            'coalescing': self._inflight.get_stats()
+        }
+
+    async def fetch_all_pages(
+        self,
+        fetch_page: Callable[[int], Awaitable[Dict[str, Any]]],
+        items_key: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Busca todas as páginas de um endpoint paginado.
+
+        A primeira página é buscada sozinha para obter o `page_count`; as
+        restantes são buscadas em paralelo e concatenadas na ordem original.
+
+        Args:
+            fetch_page: Função que busca uma página pelo número
+            items_key: Chave da lista de itens na resposta (ex.: 'workouts')
+
+        Returns:
+            Lista com os itens de todas as páginas
+        """
+        first_page = await fetch_page(1)
+        items = list(first_page.get(items_key, []))
+        page_count = first_page.get('page_count', 1) or 1
+
+        if page_count > 1:
+            pages = await asyncio.gather(
+                *(fetch_page(page) for page in range(2, page_count + 1))
+            )
+            for page_data in pages:
+                items.extend(page_data.get(items_key, []))
+
+        return items
+
+    async def get_workouts(self, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
+        """
+        Obtém uma lista paginada de treinos.
+
+        Args:
+            page: Número da página (padrão: 1)
+            page_size: Quantidade de itens por página (padrão: 10, máximo permitido pela API: 10)
+
+        Returns:
+            Dicionário com a resposta da API contendo página atual, total de páginas e treinos
+        """
+        return await self._request(
+            'GET', '/v1/workouts',
+            params={"page": page, "pageSize": min(page_size, 10)}
+        )
+
+    async def get_all_workouts(self) -> List[Dict[str, Any]]:
+        """
+        Obtém todos os treinos da conta, buscando as páginas em paralelo.
+
+        Returns:
+            Lista com os dados de todos os treinos
+        """
+        return await self.fetch_all_pages(self.get_workouts, 'workouts')
+
+    async def get_workout(self, workout_id: str) -> Dict[str, Any]:
+        """
+        Obtém os detalhes de um treino específico.
+
+        Args:
+            workout_id: ID do treino
+
+        Returns:
+            Dicionário com a resposta da API contendo detalhes completos do treino
+        """
+        return await self._request('GET', f"/v1/workouts/{workout_id}")
+
+    async def get_workout_count(self) -> int:
+        """
+        Obtém o número total de treinos na conta.
+
+        Returns:
+            Número total de treinos
+        """
+        response = await self._request('GET', '/v1/workouts/count')
+        return response.get("count", 0)
+
+    async def create_workout(self, workout_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Cria um novo treino.
+
+        Args:
+            workout_data: Dados do treino a ser criado
+
+        Returns:
+            Dicionário com a resposta da API contendo o treino criado
+        """
+        return await self._request('POST', '/v1/workouts', json=workout_data)
+
+    async def update_workout(self, workout_id: str, workout_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Atualiza um treino existente.
+
+        Args:
+            workout_id: ID do treino a ser atualizado
+            workout_data: Novos dados do treino
+
+        Returns:
+            Dicionário com a resposta da API contendo o treino atualizado
+        """
+        return await self._request('PUT', f"/v1/workouts/{workout_id}", json=workout_data)
+
+    async def get_workout_events(self, since_date: str, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
+        """
+        Obtém eventos de treinos (atualizações ou exclusões) desde uma data específica.
+
+        Args:
+            since_date: Data ISO 8601 a partir da qual buscar eventos
+            page: Número da página (padrão: 1)
+            page_size: Quantidade de itens por página (padrão: 10)
+
+        Returns:
+            Dicionário com a resposta da API contendo eventos de treinos
+        """
+        return await self._request(
+            'GET', '/v1/workouts/events',
+            params={"since_date": since_date, "page": page, "pageSize": min(page_size, 10)}
+        )
+
+    async def get_all_workout_events(self, since_date: str) -> List[Dict[str, Any]]:
+        """
+        Obtém todos os eventos de treinos desde uma data, buscando as páginas em paralelo.
+
+        Args:
+            since_date: Data ISO 8601 a partir da qual buscar eventos
+
+        Returns:
+            Lista com todos os eventos de treinos
+        """
+        return await self.fetch_all_pages(
+            lambda page: self.get_workout_events(since_date, page),
+            'events'
+        )
+
+    async def get_routines(self, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
+        """
+        Obtém uma lista paginada de rotinas.
+
+        Args:
+            page: Número da página (padrão: 1)
+            page_size: Quantidade de itens por página (padrão: 10)
+
+        Returns:
+            Dicionário com a resposta da API contendo rotinas
+        """
+        return await self._request(
+            'GET', '/v1/routines',
+            params={"page": page, "pageSize": min(page_size, 10)}
+        )
+
+    async def get_all_routines(self) -> List[Dict[str, Any]]:
+        """
+        Obtém todas as rotinas da conta, buscando as páginas em paralelo.
+
+        Returns:
+            Lista com os dados de todas as rotinas
+        """
+        return await self.fetch_all_pages(self.get_routines, 'routines')
+
+    async def get_routine(self, routine_id: str) -> Dict[str, Any]:
+        """
+        Obtém os detalhes de uma rotina específica.
+
+        Args:
+            routine_id: ID da rotina
+
+        Returns:
+            Dicionário com a resposta da API contendo detalhes da rotina
+        """
+        return await self._request('GET', f"/v1/routines/{routine_id}")
+
+    async def create_routine(self, routine_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Cria uma nova rotina.
+
+        Args:
+            routine_data: Dados da rotina a ser criada
+
+        Returns:
+            Dicionário com a resposta da API contendo a rotina criada
+        """
+        return await self._request('POST', '/v1/routines', json=routine_data)
+
+    async def update_routine(self, routine_id: str, routine_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Atualiza uma rotina existente.
+
+        Args:
+            routine_id: ID da rotina a ser atualizada
+            routine_data: Novos dados da rotina
+
+        Returns:
+            Dicionário com a resposta da API contendo a rotina atualizada
+        """
+        return await self._request('PUT', f"/v1/routines/{routine_id}", json=routine_data)
+
+    async def get_exercise_templates(self, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
+        """
+        Obtém uma lista paginada de modelos de exercícios.
+
+        Args:
+            page: Número da página (padrão: 1)
+            page_size: Quantidade de itens por página (padrão: 10)
+
+        Returns:
+            Dicionário com a resposta da API contendo modelos de exercícios
+        """
+        return await self._request(
+            'GET', '/v1/exercise_templates',
+            params={"page": page, "pageSize": min(page_size, 10)}
+        )
+
+    async def get_all_exercise_templates(self) -> List[Dict[str, Any]]:
+        """
+        Obtém todos os modelos de exercícios, buscando as páginas em paralelo.
+
+        Returns:
+            Lista com os dados de todos os modelos de exercícios
+        """
+        return await self.fetch_all_pages(self.get_exercise_templates, 'exercise_templates')
+
+    async def get_exercise_template(self, template_id: str) -> Dict[str, Any]:
+        """
+        Obtém os detalhes de um modelo de exercício específico.
+
+        Args:
+            template_id: ID do modelo de exercício
+
+        Returns:
+            Dicionário com a resposta da API contendo detalhes do modelo de exercício
+        """
+        return await self._request('GET', f"/v1/exercise_templates/{template_id}")
+
+    async def get_routine_folders(self, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
+        """
+        Obtém uma lista paginada de pastas de rotinas.
+
+        Args:
+            page: Número da página (padrão: 1)
+            page_size: Quantidade de itens por página (padrão: 10)
+
+        Returns:
+            Dicionário com a resposta da API contendo pastas de rotinas
+        """
+        return await self._request(
+            'GET', '/v1/routine_folders',
+            params={"page": page, "pageSize": min(page_size, 10)}
+        )
+
+    async def get_all_routine_folders(self) -> List[Dict[str, Any]]:
+        """
+        Obtém todas as pastas de rotinas, buscando as páginas em paralelo.
+
+        Returns:
+            Lista com os dados de todas as pastas de rotinas
+        """
+        return await self.fetch_all_pages(self.get_routine_folders, 'routine_folders')
+
+    async def get_routine_folder(self, folder_id: str) -> Dict[str, Any]:
+        """
+        Obtém os detalhes de uma pasta de rotinas específica.
+
+        Args:
+            folder_id: ID da pasta de rotinas
+
+        Returns:
+            Dicionário com a resposta da API contendo detalhes da pasta de rotinas
+        """
+        return await self._request('GET', f"/v1/routine_folders/{folder_id}")
+
+    async def create_routine_folder(self, folder_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Cria uma nova pasta de rotinas.
+
+        Args:
+            folder_data: Dados da pasta a ser criada
+
+        Returns:
+            Dicionário com a resposta da API contendo a pasta criada
+        """
+        return await self._request('POST', '/v1/routine_folders', json=folder_data)
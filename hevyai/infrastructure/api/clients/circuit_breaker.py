@@ -0,0 +1,161 @@
+"""
+Circuit breakers por endpoint da API do Hevy.
+Evitam que threads fiquem bloqueadas em chamadas a um endpoint que está falhando.
+"""
+
+import threading
+import time
+from typing import Any, Dict
+
+from hevyai.infrastructure.api.clients.exceptions import CircuitOpenError
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker de um endpoint, seguro para uso entre threads.
+
+    Depois de `failure_threshold` falhas consecutivas o circuito abre e as chamadas
+    falham imediatamente. Passados `reset_timeout` segundos, uma única chamada de
+    teste é liberada (meio aberto): se der certo o circuito fecha, se falhar volta
+    a abrir.
+    """
+
+    def __init__(self, endpoint: str, failure_threshold: int, reset_timeout: float):
+        """
+        Inicializa o circuit breaker.
+
+        Args:
+            endpoint: Nome do endpoint protegido (ex.: '/v1/workouts/{id}')
+            failure_threshold: Falhas consecutivas necessárias para abrir o circuito
+            reset_timeout: Tempo em segundos até liberar uma chamada de teste
+        """
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._transitions: Dict[str, int] = {}
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def _transition(self, state: str) -> None:
+        key = f"{self._state}->{state}"
+        self._transitions[key] = self._transitions.get(key, 0) + 1
+        self._state = state
+
+    def before_call(self) -> None:
+        """
+        Verifica se uma chamada pode ser feita.
+
+        Raises:
+            CircuitOpenError: Se o circuito estiver aberto ou já houver uma chamada de teste
+        """
+        with self._lock:
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    self._rejected += 1
+                    raise CircuitOpenError(f"Circuito aberto para {self.endpoint}", self.endpoint)
+                self._transition(HALF_OPEN)
+                self._probe_in_flight = False
+
+            if self._state == HALF_OPEN:
+                if self._probe_in_flight:
+                    self._rejected += 1
+                    raise CircuitOpenError(f"Circuito em teste para {self.endpoint}", self.endpoint)
+                self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        """Registra uma chamada bem-sucedida."""
+        with self._lock:
+            self._failures = 0
+            self._probe_in_flight = False
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        """Registra uma chamada que falhou por indisponibilidade do endpoint."""
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._transition(OPEN)
+                self._opened_at = time.monotonic()
+
+    def release_probe(self) -> None:
+        """
+        Libera a chamada de teste sem contar falha nem sucesso.
+
+        Usado quando a chamada é interrompida por um erro que não diz nada sobre o
+        endpoint (ex.: erro local ou interrupção), para que o circuito meio aberto
+        possa liberar uma nova chamada de teste.
+        """
+        with self._lock:
+            self._probe_in_flight = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtém o estado e as métricas do circuito.
+
+        Returns:
+            Dicionário com estado, falhas consecutivas, chamadas rejeitadas e transições
+        """
+        with self._lock:
+            return {
+                'state': self._state,
+                'consecutive_failures': self._failures,
+                'rejected': self._rejected,
+                'transitions': dict(self._transitions),
+            }
+
+
+class CircuitBreakerRegistry:
+    """Mantém um circuit breaker para cada endpoint de um cliente."""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        """
+        Inicializa o registro.
+
+        Args:
+            failure_threshold: Falhas consecutivas necessárias para abrir um circuito
+            reset_timeout: Tempo em segundos até liberar uma chamada de teste
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        """
+        Obtém o circuit breaker de um endpoint, criando-o se necessário.
+
+        Args:
+            endpoint: Nome do endpoint
+
+        Returns:
+            O circuit breaker do endpoint
+        """
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(endpoint, self.failure_threshold, self.reset_timeout)
+                self._breakers[endpoint] = breaker
+            return breaker
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Obtém as métricas de todos os circuitos.
+
+        Returns:
+            Dicionário indexado pelo nome do endpoint
+        """
+        with self._lock:
+            breakers = list(self._breakers.items())
+        return {endpoint: breaker.get_stats() for endpoint, breaker in breakers}
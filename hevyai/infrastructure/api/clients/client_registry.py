@@ -0,0 +1,73 @@
+"""
+Registro de clientes da API do Hevy.
+Mantém um único cliente, com seu pool de conexões, por chave de API e URL em cada processo.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+
+from hevyai.infrastructure.api.clients.hevy_client import HevyApiClient
+from hevyai.infrastructure.api.clients.request_scheduler import mask_api_key
+
+_clients: Dict[Tuple[str, str], HevyApiClient] = {}
+_clients_lock = threading.Lock()
+_owner_pid = os.getpid()
+
+
+def get_hevy_client(api_key: Optional[str] = None, api_url: Optional[str] = None) -> HevyApiClient:
+    """
+    Obtém o cliente compartilhado da API do Hevy para uma chave de API e URL.
+
+    O DRF cria uma instância de viewset por requisição; usar este registro evita
+    abrir uma nova conexão TCP+TLS com a API do Hevy a cada chamada. O registro é
+    recriado automaticamente em processos filhos (por exemplo, workers do gunicorn
+    criados com fork), já que conexões não devem ser compartilhadas entre processos.
+
+    Args:
+        api_key: Chave da API do Hevy (opcional, padrão: settings.HEVY_API_KEY)
+        api_url: URL da API do Hevy (opcional, padrão: settings.HEVY_API_URL)
+
+    Returns:
+        O cliente compartilhado
+    """
+    global _owner_pid
+
+    key = (api_key or settings.HEVY_API_KEY or '', api_url or settings.HEVY_API_URL)
+    with _clients_lock:
+        if _owner_pid != os.getpid():
+            # Processo filho: descarta os clientes herdados sem fechar as conexões do pai
+            _clients.clear()
+            _owner_pid = os.getpid()
+
+        client = _clients.get(key)
+        if client is None:
+            client = HevyApiClient(api_key=key[0] or None, api_url=key[1])
+            _clients[key] = client
+        return client
+
+
+def close_hevy_clients() -> None:
+    """Fecha e remove todos os clientes registrados neste processo."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+def get_all_client_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Obtém as estatísticas de todos os clientes registrados neste processo.
+
+    Returns:
+        Dicionário indexado por "<chave mascarada>@<url>"
+    """
+    with _clients_lock:
+        clients = list(_clients.items())
+    return {
+        f"{mask_api_key(api_key)}@{api_url}": client.get_stats()
+        for (api_key, api_url), client in clients
+    }
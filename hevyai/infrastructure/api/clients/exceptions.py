@@ -0,0 +1,25 @@
+"""
+Exceções levantadas pelos clientes da API do Hevy.
+"""
+
+from typing import Any, Optional
+
+
+class HevyApiUnavailableError(Exception):
+    """
+    A API do Hevy está indisponível (falha de conexão, timeout, 5xx/429 persistente
+    ou circuito aberto).
+
+    Quando o cliente tem uma versão anterior bem-sucedida da mesma resposta, ela é
+    anexada em `stale_data`, para que os repositórios possam servi-la marcada como
+    desatualizada.
+    """
+
+    def __init__(self, message: str, endpoint: str, stale_data: Optional[Any] = None):
+        super().__init__(message)
+        self.endpoint = endpoint
+        self.stale_data = stale_data
+
+
+class CircuitOpenError(HevyApiUnavailableError):
+    """O circuito do endpoint está aberto e a requisição não foi enviada."""
@@ -3,32 +3,360 @@ Cliente para a API do Hevy.
 Responsável por fazer requisições para a API externa do Hevy.
 """
 
+import re
+import time
+from http.cookiejar import DefaultCookiePolicy
+
 import requests
+from requests.adapters import HTTPAdapter
 from django.conf import settings
 from typing import Dict, Any, Optional, List
 
+from hevyai.infrastructure.api.clients.circuit_breaker import CircuitBreakerRegistry
+from hevyai.infrastructure.api.clients.exceptions import HevyApiUnavailableError
+from hevyai.infrastructure.api.clients.response_cache import CachedResponse, ResponseCache
+from hevyai.infrastructure.api.clients.single_flight import SingleFlight
+from hevyai.infrastructure.api.clients.typed_decoding import EntityPageDecoder
+from hevyai.infrastructure.api.clients.request_scheduler import (
+    RETRYABLE_STATUSES,
+    get_request_scheduler
+)
+
+# Identifica o segmento de ID em caminhos como /v1/workouts/<id>
+_ID_SEGMENT = re.compile(r'^(/v1/[a-z_]+)/(?!count$|events$)[^/]+$')
+
+
+def endpoint_name(path: str) -> str:
+    """
+    Obtém o nome do endpoint de um caminho, substituindo IDs por um marcador.
+    
+    Args:
+        path: Caminho relativo à URL da API (ex.: '/v1/workouts/abc')
+        
+    Returns:
+        O nome do endpoint (ex.: '/v1/workouts/{id}')
+    """
+    return _ID_SEGMENT.sub(r'\1/{id}', path)
+
+
+def build_session(api_key: Optional[str], pool_size: Optional[int] = None) -> requests.Session:
+    """
+    Cria uma sessão HTTP configurada para a API do Hevy.
+    
+    A sessão mantém um pool de conexões keep-alive de tamanho fixo, sem novas
+    tentativas no nível do urllib3 (elas são feitas pelo agendador de requisições)
+    e sem armazenar cookies, para poder ser compartilhada entre threads.
+    
+    Args:
+        api_key: Chave da API do Hevy
+        pool_size: Máximo de conexões mantidas abertas por host
+                   (padrão: settings.HEVY_API_POOL_SIZE)
+        
+    Returns:
+        A sessão configurada
+    """
+    pool_size = pool_size or settings.HEVY_API_POOL_SIZE
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_size,
+        pool_block=settings.HEVY_API_POOL_BLOCK,
+        max_retries=0
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    # A API do Hevy não depende de cookies; ignorá-los evita escrita concorrente no cookie jar
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    session.headers.update({
+        'api-key': api_key,
+        'Content-Type': 'application/json',
+        'Accept': 'application/json',
+        'Connection': 'keep-alive'
+    })
+    return session
+
 
 class HevyApiClient:
-    """Cliente para a API do Hevy."""
+    """
+    Cliente para a API do Hevy.
+    
+    Uma instância pode ser compartilhada entre threads. Em código de aplicação,
+    prefira obter o cliente por `get_hevy_client`, que mantém um único cliente
+    (e um único pool de conexões) por chave de API em cada processo.
+    """
 
-    def __init__(self, api_key: Optional[str] = None, api_url: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_url: Optional[str] = None,
+        session: Optional[requests.Session] = None
+    ):
         """
         Inicializa o cliente da API do Hevy.
         
         Args:
             api_key: Chave da API do Hevy (opcional, padrão: settings.HEVY_API_KEY)
             api_url: URL da API do Hevy (opcional, padrão: settings.HEVY_API_URL)
+            session: Sessão HTTP a ser usada (opcional). Se não for fornecida,
+                     uma nova sessão com pool de conexões será criada.
         """
         self.api_key = api_key or settings.HEVY_API_KEY
         self.api_url = api_url or settings.HEVY_API_URL
-        self.session = requests.Session()
-        self.session.headers.update({
-            'api-key': self.api_key,
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        })
+        self.session = session or build_session(self.api_key)
+        self.scheduler = get_request_scheduler(self.api_key)
+        self.cache = ResponseCache(
+            max_entries=settings.HEVY_API_CACHE_MAX_ENTRIES,
+            ttl=settings.HEVY_API_CACHE_TTL
+        )
+        self._inflight = SingleFlight()
+        self.timeout = (settings.HEVY_API_CONNECT_TIMEOUT, settings.HEVY_API_READ_TIMEOUT)
+        self.breakers = CircuitBreakerRegistry(
+            failure_threshold=settings.HEVY_API_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=settings.HEVY_API_CIRCUIT_RESET_TIMEOUT
+        )
+        # Última resposta bem-sucedida de cada GET, servida quando a API está indisponível
+        self.last_known_good = ResponseCache(
+            max_entries=settings.HEVY_API_STALE_MAX_ENTRIES,
+            ttl=0
+        )
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """
+        Executa uma requisição protegida pelo circuit breaker do endpoint.
+        
+        Toda requisição tem prazos explícitos de conexão e leitura. Falhas de
+        conexão, timeouts e respostas 429/5xx que persistem após as novas tentativas
+        contam como falha do endpoint; ao atingir o limite de falhas o circuito abre
+        e as próximas chamadas falham imediatamente, sem ocupar a thread.
+        
+        Args:
+            method: Método HTTP
+            path: Caminho relativo à URL da API
+            **kwargs: Argumentos repassados ao requests
+            
+        Returns:
+            A resposta bem-sucedida da API
+            
+        Raises:
+            CircuitOpenError: Se o circuito do endpoint estiver aberto
+            HevyApiUnavailableError: Se a API estiver inacessível ou falhando
+            requests.HTTPError: Se a API responder com um erro do cliente (4xx)
+        """
+        endpoint = endpoint_name(path)
+        breaker = self.breakers.get(endpoint)
+        breaker.before_call()
+        kwargs.setdefault('timeout', self.timeout)
+
+        try:
+            response = self._send(method, path, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            breaker.record_failure()
+            raise HevyApiUnavailableError(f"Falha ao acessar {endpoint}: {e}", endpoint) from e
+        except requests.RequestException:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            # Erros que não vêm do endpoint não contam como falha, mas precisam
+            # liberar a chamada de teste do circuito meio aberto
+            breaker.release_probe()
+            raise
+
+        if response.status_code in RETRYABLE_STATUSES:
+            breaker.record_failure()
+            raise HevyApiUnavailableError(
+                f"A API do Hevy respondeu {response.status_code} para {endpoint}", endpoint
+            )
 
-    def get_workouts(self, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
+        breaker.record_success()
+        response.raise_for_status()
+        return response
+
+    def _send(self, method: str, path: str, **kwargs) -> requests.Response:
+        """
+        Envia uma requisição respeitando o limite de taxa da chave de API.
+        
+        Requisições idempotentes (GET) que falham com 429, 5xx ou erro de conexão
+        são repetidas com backoff exponencial com jitter, respeitando o cabeçalho
+        Retry-After. Requisições de escrita nunca são repetidas.
+        
+        Args:
+            method: Método HTTP
+            path: Caminho relativo à URL da API
+            **kwargs: Argumentos repassados ao requests
+            
+        Returns:
+            A última resposta recebida, que pode ser um erro transitório se as
+            tentativas se esgotarem
+        """
+        attempt = 0
+        while True:
+            delay = self.scheduler.acquire()
+            if delay > 0:
+                time.sleep(delay)
+
+            try:
+                response = self.session.request(method, f"{self.api_url}{path}", **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if not self.scheduler.can_retry(method, attempt):
+                    if attempt > 0:
+                        self.scheduler.record_exhausted()
+                    raise
+                time.sleep(self.scheduler.retry_delay(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code in RETRYABLE_STATUSES:
+                if self.scheduler.can_retry(method, attempt):
+                    time.sleep(self.scheduler.retry_delay(
+                        attempt, response.status_code, response.headers.get('Retry-After')
+                    ))
+                    attempt += 1
+                    continue
+                if attempt > 0:
+                    self.scheduler.record_exhausted()
+
+            return response
+
+    def _get_json(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        decoder: Optional[EntityPageDecoder] = None
+    ) -> Any:
+        """
+        Executa um GET e decodifica a resposta, coalescendo chamadas idênticas.
+        
+        Se outras threads do processo pedirem o mesmo caminho com os mesmos
+        parâmetros enquanto a requisição está em andamento, elas aguardam e recebem
+        o mesmo resultado decodificado em vez de fazer uma nova requisição. Se a API
+        estiver indisponível, a última resposta bem-sucedida é anexada à exceção.
+        
+        Args:
+            path: Caminho relativo à URL da API
+            params: Parâmetros de consulta (opcional)
+            decoder: Decodificador tipado que recebe os bytes da resposta (opcional;
+                     sem ele, a resposta é decodificada com json)
+            
+        Returns:
+            Corpo da resposta decodificado (compartilhado; não deve ser alterado)
+        """
+        key = ('GET', path, tuple(sorted((params or {}).items())), decoder is not None)
+
+        def fetch() -> Any:
+            try:
+                response = self._request('GET', path, params=params)
+            except HevyApiUnavailableError as e:
+                entry = self.last_known_good.get(key)
+                e.stale_data = entry.body if entry is not None else None
+                raise
+            body = decoder.decode(response.content) if decoder is not None else response.json()
+            self.last_known_good.put(key, CachedResponse(body=body))
+            return body
+
+        return self._inflight.do(key, fetch)
+
+    def _get_cached(self, path: str) -> Dict[str, Any]:
+        """
+        Obtém um recurso individual pelo cache, coalescendo chamadas idênticas.
+        
+        Args:
+            path: Caminho do recurso relativo à URL da API
+            
+        Returns:
+            Corpo da resposta decodificado (compartilhado; não deve ser alterado)
+        """
+        return self._inflight.do(('CACHED', path), lambda: self._fetch_cached(path))
+
+    def _fetch_cached(self, path: str) -> Dict[str, Any]:
+        """
+        Obtém um recurso individual usando o cache de respostas.
+        
+        Se a resposta armazenada tiver validadores (ETag / Last-Modified), ela é
+        revalidada com uma requisição condicional e um 304 reaproveita o corpo já
+        decodificado. Sem validadores, a resposta é servida localmente enquanto
+        estiver dentro do TTL ou enquanto as listagens confirmarem o mesmo
+        `updated_at`.
+        
+        Args:
+            path: Caminho do recurso relativo à URL da API
+            
+        Returns:
+            Corpo da resposta decodificado (compartilhado; não deve ser alterado)
+        """
+        entry = self.cache.get(path)
+        headers = {}
+        if entry is not None:
+            if entry.has_validators:
+                headers = entry.conditional_headers()
+            elif self.cache.is_fresh(entry):
+                self.cache.record('hits')
+                return entry.body
+
+        try:
+            response = self._request('GET', path, headers=headers)
+        except HevyApiUnavailableError as e:
+            e.stale_data = entry.body if entry is not None else None
+            raise
+        if response.status_code == 304 and entry is not None:
+            self.cache.record('revalidated')
+            self.cache.touch(path)
+            return entry.body
+
+        self.cache.record('misses')
+        body = response.json()
+        self.cache.put(path, CachedResponse(
+            body=body,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+            updated_at=body.get('updated_at') if isinstance(body, dict) else None
+        ))
+        return body
+
+    def _observe_items(self, resource_path: str, items: List[Any]) -> None:
+        """
+        Repassa ao cache os itens de uma listagem, para comparação por `updated_at`.
+        
+        Args:
+            resource_path: Caminho base do recurso (ex.: '/v1/workouts')
+            items: Itens retornados pela listagem (dicionários ou, com o
+                   decodificador tipado, entidades)
+        """
+        for item in items:
+            if isinstance(item, dict):
+                if item.get('id'):
+                    self.cache.observe(f"{resource_path}/{item['id']}", item)
+            elif item.id:
+                self.cache.confirm(f"{resource_path}/{item.id}", item.updated_at)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtém as estatísticas do cliente.
+        
+        As estatísticas do agendador (limitador de taxa e novas tentativas) são
+        compartilhadas por todos os clientes do processo que usam a mesma chave de
+        API; as do cache, da coalescência e dos circuitos são deste cliente.
+        
+        Returns:
+            Dicionário com as estatísticas do agendador de requisições, do cache,
+            da coalescência de requisições e dos circuit breakers
+        """
+        return {
+            'scheduler': self.scheduler.get_stats(),
+            'cache': self.cache.get_stats(),
+            'coalescing': self._inflight.get_stats(),
+            'circuits': self.breakers.get_stats()
+        }
+
+    def close(self) -> None:
+        """Fecha as conexões do pool do cliente."""
+        self.session.close()
+
+    def get_workouts(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        decoder: Optional[EntityPageDecoder] = None
+    ) -> Dict[str, Any]:
         """
         Obtém uma lista paginada de treinos.
         
@@ -36,15 +364,18 @@ class HevyApiClient:
             page: Número da página (padrão: 1)
             page_size: Quantidade de itens por página (padrão: 10, máximo permitido pela API: 10)
             
+            decoder: Decodificador tipado das entidades (opcional; ver typed_decoding)
+            
         Returns:
             Dicionário com a resposta da API contendo página atual, total de páginas e treinos
         """
-        response = self.session.get(
-            f"{self.api_url}/v1/workouts",
-            params={"page": page, "pageSize": min(page_size, 10)}
+        data = self._get_json(
+            "/v1/workouts",
+            params={"page": page, "pageSize": min(page_size, 10)},
+            decoder=decoder
         )
-        response.raise_for_status()
-        return response.json()
+        self._observe_items("/v1/workouts", data.get('workouts', []))
+        return data
 
     def get_workout(self, workout_id: str) -> Dict[str, Any]:
         """
@@ -56,9 +387,7 @@ class HevyApiClient:
         Returns:
             Dicionário com a resposta da API contendo detalhes completos do treino
         """
-        response = self.session.get(f"{self.api_url}/v1/workouts/{workout_id}")
-        response.raise_for_status()
-        return response.json()
+        return self._get_cached(f"/v1/workouts/{workout_id}")
 
     def get_workout_count(self) -> int:
         """
@@ -67,9 +396,7 @@ class HevyApiClient:
         Returns:
             Número total de treinos
         """
-        response = self.session.get(f"{self.api_url}/v1/workouts/count")
-        response.raise_for_status()
-        return response.json().get("count", 0)
+        return self._get_json("/v1/workouts/count").get("count", 0)
     
     def create_workout(self, workout_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -81,11 +408,10 @@ class HevyApiClient:
         Returns:
             Dicionário com a resposta da API contendo o treino criado
         """
-        response = self.session.post(
-            f"{self.api_url}/v1/workouts",
+        response = self._request(
+            'POST', "/v1/workouts",
             json=workout_data
         )
-        response.raise_for_status()
         return response.json()
     
     def update_workout(self, workout_id: str, workout_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -99,11 +425,11 @@ class HevyApiClient:
         Returns:
             Dicionário com a resposta da API contendo o treino atualizado
         """
-        response = self.session.put(
-            f"{self.api_url}/v1/workouts/{workout_id}",
+        response = self._request(
+            'PUT', f"/v1/workouts/{workout_id}",
             json=workout_data
         )
-        response.raise_for_status()
+        self.cache.invalidate(f"/v1/workouts/{workout_id}")
         return response.json()
 
     def get_workout_events(self, since_date: str, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
@@ -118,14 +444,23 @@ class HevyApiClient:
         Returns:
             Dicionário com a resposta da API contendo eventos de treinos
         """
-        response = self.session.get(
-            f"{self.api_url}/v1/workouts/events",
+        data = self._get_json(
+            "/v1/workouts/events",
             params={"since_date": since_date, "page": page, "pageSize": min(page_size, 10)}
         )
-        response.raise_for_status()
-        return response.json()
+        for event in data.get('events', []):
+            if event.get('type') == 'deleted' and event.get('id'):
+                self.cache.invalidate(f"/v1/workouts/{event['id']}")
+            elif event.get('workout'):
+                self._observe_items("/v1/workouts", [event['workout']])
+        return data
 
-    def get_routines(self, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
+    def get_routines(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        decoder: Optional[EntityPageDecoder] = None
+    ) -> Dict[str, Any]:
         """
         Obtém uma lista paginada de rotinas.
         
@@ -133,15 +468,18 @@ class HevyApiClient:
             page: Número da página (padrão: 1)
             page_size: Quantidade de itens por página (padrão: 10)
             
+            decoder: Decodificador tipado das entidades (opcional; ver typed_decoding)
+            
         Returns:
             Dicionário com a resposta da API contendo rotinas
         """
-        response = self.session.get(
-            f"{self.api_url}/v1/routines",
-            params={"page": page, "pageSize": min(page_size, 10)}
+        data = self._get_json(
+            "/v1/routines",
+            params={"page": page, "pageSize": min(page_size, 10)},
+            decoder=decoder
         )
-        response.raise_for_status()
-        return response.json()
+        self._observe_items("/v1/routines", data.get('routines', []))
+        return data
 
     def get_routine(self, routine_id: str) -> Dict[str, Any]:
         """
@@ -153,9 +491,7 @@ class HevyApiClient:
         Returns:
             Dicionário com a resposta da API contendo detalhes da rotina
         """
-        response = self.session.get(f"{self.api_url}/v1/routines/{routine_id}")
-        response.raise_for_status()
-        return response.json()
+        return self._get_cached(f"/v1/routines/{routine_id}")
     
     def create_routine(self, routine_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -167,11 +503,10 @@ class HevyApiClient:
         Returns:
             Dicionário com a resposta da API contendo a rotina criada
         """
-        response = self.session.post(
-            f"{self.api_url}/v1/routines",
+        response = self._request(
+            'POST', "/v1/routines",
             json=routine_data
         )
-        response.raise_for_status()
         return response.json()
     
     def update_routine(self, routine_id: str, routine_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -185,14 +520,19 @@ class HevyApiClient:
         Returns:
             Dicionário com a resposta da API contendo a rotina atualizada
         """
-        response = self.session.put(
-            f"{self.api_url}/v1/routines/{routine_id}",
+        response = self._request(
+            'PUT', f"/v1/routines/{routine_id}",
             json=routine_data
         )
-        response.raise_for_status()
+        self.cache.invalidate(f"/v1/routines/{routine_id}")
         return response.json()
 
-    def get_exercise_templates(self, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
+    def get_exercise_templates(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        decoder: Optional[EntityPageDecoder] = None
+    ) -> Dict[str, Any]:
         """
         Obtém uma lista paginada de modelos de exercícios.
         
@@ -200,15 +540,18 @@ class HevyApiClient:
             page: Número da página (padrão: 1)
             page_size: Quantidade de itens por página (padrão: 10)
             
+            decoder: Decodificador tipado das entidades (opcional; ver typed_decoding)
+            
         Returns:
             Dicionário com a resposta da API contendo modelos de exercícios
         """
-        response = self.session.get(
-            f"{self.api_url}/v1/exercise_templates",
-            params={"page": page, "pageSize": min(page_size, 10)}
+        data = self._get_json(
+            "/v1/exercise_templates",
+            params={"page": page, "pageSize": min(page_size, 10)},
+            decoder=decoder
         )
-        response.raise_for_status()
-        return response.json()
+        self._observe_items("/v1/exercise_templates", data.get('exercise_templates', []))
+        return data
 
     def get_exercise_template(self, template_id: str) -> Dict[str, Any]:
         """
@@ -220,9 +563,7 @@ class HevyApiClient:
         Returns:
             Dicionário com a resposta da API contendo detalhes do modelo de exercício
         """
-        response = self.session.get(f"{self.api_url}/v1/exercise_templates/{template_id}")
-        response.raise_for_status()
-        return response.json()
+        return self._get_cached(f"/v1/exercise_templates/{template_id}")
     
     def get_routine_folders(self, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
         """
@@ -235,12 +576,12 @@ class HevyApiClient:
         Returns:
             Dicionário com a resposta da API contendo pastas de rotinas
         """
-        response = self.session.get(
-            f"{self.api_url}/v1/routine_folders",
+        data = self._get_json(
+            "/v1/routine_folders",
             params={"page": page, "pageSize": min(page_size, 10)}
         )
-        response.raise_for_status()
-        return response.json()
+        self._observe_items("/v1/routine_folders", data.get('routine_folders', []))
+        return data
     
     def get_routine_folder(self, folder_id: str) -> Dict[str, Any]:
         """
@@ -252,9 +593,7 @@ class HevyApiClient:
         Returns:
             Dicionário com a resposta da API contendo detalhes da pasta de rotinas
         """
-        response = self.session.get(f"{self.api_url}/v1/routine_folders/{folder_id}")
-        response.raise_for_status()
-        return response.json()
+        return self._get_cached(f"/v1/routine_folders/{folder_id}")
     
     def create_routine_folder(self, folder_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -266,9 +605,8 @@ class HevyApiClient:
         Returns:
             Dicionário com a resposta da API contendo a pasta criada
         """
-        response = self.session.post(
-            f"{self.api_url}/v1/routine_folders",
+        response = self._request(
+            'POST', "/v1/routine_folders",
             json=folder_data
         )
-        response.raise_for_status()
         return response.json()
\ No newline at end of file
@@ -0,0 +1,295 @@
+"""
+Agendador de requisições para a API do Hevy.
+Controla a taxa de requisições por chave de API e decide quando e quanto esperar
+antes de repetir uma requisição que falhou.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional
+
+from django.conf import settings
+
+# Status HTTP considerados transitórios e que podem ser repetidos
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Métodos HTTP idempotentes, os únicos que podem ser repetidos com segurança
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+
+class TokenBucket:
+    """
+    Limitador de taxa do tipo token bucket, seguro para uso entre threads.
+
+    Os tokens são repostos continuamente à taxa `rate` por segundo até o limite
+    `capacity`. Cada requisição reserva um token; se não houver token disponível,
+    a reserva é feita "a descoberto" e o chamador recebe quanto tempo deve esperar.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Inicializa o limitador.
+
+        Args:
+            rate: Tokens repostos por segundo
+            capacity: Quantidade máxima de tokens acumulados (rajada)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reserva um token.
+
+        Returns:
+            Tempo em segundos que o chamador deve esperar antes de enviar a requisição
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def drain(self, seconds: float) -> None:
+        """
+        Esvazia o balde para que nenhuma requisição seja liberada pelos próximos segundos.
+
+        Usado quando a API responde 429, para que todas as threads respeitem a pausa.
+
+        Args:
+            seconds: Tempo em segundos durante o qual nenhum token estará disponível
+        """
+        with self._lock:
+            # Após a pausa, a próxima reserva encontra exatamente um token
+            self._tokens = min(self._tokens, 1 - seconds * self.rate)
+            self._updated_at = time.monotonic()
+
+    @property
+    def available_tokens(self) -> float:
+        """Quantidade aproximada de tokens disponíveis no momento."""
+        with self._lock:
+            elapsed = time.monotonic() - self._updated_at
+            return min(self.capacity, self._tokens + elapsed * self.rate)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Interpreta o cabeçalho Retry-After.
+
+    Args:
+        value: Valor do cabeçalho, em segundos ou como data HTTP
+
+    Returns:
+        Tempo de espera em segundos ou None se o valor for ausente ou inválido
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RequestScheduler:
+    """
+    Agenda as requisições feitas com uma chave de API do Hevy.
+
+    Combina o limitador de taxa compartilhado com a política de novas tentativas
+    (backoff exponencial com jitter, respeitando Retry-After) e mantém estatísticas
+    que ajudam a dimensionar os workers em relação à cota do Hevy.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        max_retries: int,
+        backoff_base: float,
+        backoff_max: float
+    ):
+        """
+        Inicializa o agendador.
+
+        Args:
+            rate: Requisições por segundo permitidas
+            burst: Tamanho máximo de rajada
+            max_retries: Número máximo de novas tentativas por requisição
+            backoff_base: Espera base, em segundos, do backoff exponencial
+            backoff_max: Espera máxima, em segundos, entre tentativas
+        """
+        self.bucket = TokenBucket(rate, burst)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._lock = threading.Lock()
+        self._stats = {
+            'requests': 0,
+            'throttled': 0,
+            'throttle_wait_seconds': 0.0,
+            'retries': 0,
+            'retry_wait_seconds': 0.0,
+            'retries_by_status': {},
+            'exhausted': 0,
+        }
+
+    def acquire(self) -> float:
+        """
+        Reserva a vez de uma requisição no limitador de taxa.
+
+        Returns:
+            Tempo em segundos que o chamador deve esperar antes de enviar a requisição
+        """
+        delay = self.bucket.reserve()
+        with self._lock:
+            self._stats['requests'] += 1
+            if delay > 0:
+                self._stats['throttled'] += 1
+                self._stats['throttle_wait_seconds'] += delay
+        return delay
+
+    def can_retry(self, method: str, attempt: int) -> bool:
+        """
+        Indica se uma requisição que falhou pode ser repetida.
+
+        Args:
+            method: Método HTTP da requisição
+            attempt: Número de tentativas já realizadas (a primeira é 0)
+
+        Returns:
+            True se a requisição é idempotente e ainda há tentativas disponíveis
+        """
+        return method.upper() in IDEMPOTENT_METHODS and attempt < self.max_retries
+
+    def retry_delay(self, attempt: int, status: Optional[int] = None, retry_after: Optional[str] = None) -> float:
+        """
+        Calcula a espera antes da próxima tentativa e registra a nova tentativa.
+
+        Usa o valor de Retry-After quando presente; caso contrário aplica backoff
+        exponencial com jitter completo. Em respostas 429 a pausa é aplicada ao
+        limitador compartilhado, de modo que todas as threads a respeitam e a
+        própria reserva do próximo token já aguarda o tempo necessário.
+
+        Args:
+            attempt: Número de tentativas já realizadas (a primeira é 0)
+            status: Status HTTP da resposta que falhou (None para erros de conexão)
+            retry_after: Valor do cabeçalho Retry-After, se houver
+
+        Returns:
+            Tempo de espera em segundos antes de reservar o próximo token
+        """
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        else:
+            delay = min(delay, self.backoff_max)
+
+        key = str(status) if status is not None else 'connection_error'
+        with self._lock:
+            self._stats['retries'] += 1
+            self._stats['retry_wait_seconds'] += delay
+            self._stats['retries_by_status'][key] = self._stats['retries_by_status'].get(key, 0) + 1
+
+        if status == 429:
+            self.bucket.drain(delay)
+            return 0.0
+        return delay
+
+    def record_exhausted(self) -> None:
+        """Registra uma requisição que falhou após esgotar as tentativas."""
+        with self._lock:
+            self._stats['exhausted'] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtém as estatísticas do limitador e das novas tentativas.
+
+        Returns:
+            Dicionário com a configuração e os contadores acumulados
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['retries_by_status'] = dict(self._stats['retries_by_status'])
+        stats.update({
+            'rate': self.bucket.rate,
+            'burst': self.bucket.capacity,
+            'available_tokens': round(self.bucket.available_tokens, 3),
+            'max_retries': self.max_retries,
+        })
+        return stats
+
+
+_schedulers: Dict[str, RequestScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_request_scheduler(api_key: Optional[str]) -> RequestScheduler:
+    """
+    Obtém o agendador compartilhado de uma chave de API.
+
+    Todos os clientes do processo que usam a mesma chave compartilham o mesmo
+    limitador de taxa e as mesmas estatísticas.
+
+    Args:
+        api_key: Chave da API do Hevy
+
+    Returns:
+        O agendador associado à chave
+    """
+    key = api_key or ''
+    with _schedulers_lock:
+        scheduler = _schedulers.get(key)
+        if scheduler is None:
+            scheduler = RequestScheduler(
+                rate=settings.HEVY_API_RATE_LIMIT,
+                burst=settings.HEVY_API_RATE_BURST,
+                max_retries=settings.HEVY_API_MAX_RETRIES,
+                backoff_base=settings.HEVY_API_BACKOFF_BASE,
+                backoff_max=settings.HEVY_API_BACKOFF_MAX
+            )
+            _schedulers[key] = scheduler
+        return scheduler
+
+
+def get_all_scheduler_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Obtém as estatísticas de todos os agendadores do processo.
+
+    As chaves de API são mascaradas para não expô-las.
+
+    Returns:
+        Dicionário indexado pela chave de API mascarada
+    """
+    with _schedulers_lock:
+        schedulers = list(_schedulers.items())
+    return {mask_api_key(key): scheduler.get_stats() for key, scheduler in schedulers}
+
+
+def mask_api_key(api_key: Optional[str]) -> str:
+    """
+    Mascara uma chave de API, mantendo apenas os últimos caracteres.
+
+    Args:
+        api_key: Chave da API do Hevy
+
+    Returns:
+        A chave mascarada
+    """
+    if not api_key:
+        return '<sem chave>'
+    return f"...{api_key[-4:]}"
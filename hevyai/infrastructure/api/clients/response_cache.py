@@ -0,0 +1,199 @@
+"""
+Cache de respostas da API do Hevy.
+Guarda corpos já decodificados junto com seus validadores (ETag / Last-Modified)
+para que consultas repetidas custem um 304 ou um acerto local.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from hevyai.domain.timestamps import parse_timestamp
+
+
+@dataclass
+class CachedResponse:
+    """Representa uma resposta armazenada no cache."""
+    body: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    updated_at: Optional[str] = None
+    stored_at: float = 0.0
+
+    @property
+    def has_validators(self) -> bool:
+        """Indica se a resposta pode ser revalidada com uma requisição condicional."""
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        Monta os cabeçalhos de uma requisição condicional para esta resposta.
+
+        Returns:
+            Dicionário com If-None-Match e/ou If-Modified-Since
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Cache LRU de respostas, seguro para uso entre threads.
+
+    Os corpos armazenados são compartilhados entre os chamadores e devem ser
+    tratados como somente leitura.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        """
+        Inicializa o cache.
+
+        Args:
+            max_entries: Quantidade máxima de respostas armazenadas
+            ttl: Tempo em segundos durante o qual uma resposta sem validadores é
+                 considerada atual
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: 'OrderedDict[str, CachedResponse]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'invalidations': 0}
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Obtém uma resposta do cache.
+
+        Args:
+            key: Chave da resposta (caminho do recurso)
+
+        Returns:
+            A resposta armazenada ou None se não existir
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        """
+        Armazena uma resposta, descartando a menos usada se o cache estiver cheio.
+
+        Args:
+            key: Chave da resposta (caminho do recurso)
+            entry: Resposta a ser armazenada
+        """
+        entry.stored_at = time.monotonic()
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """
+        Indica se uma resposta ainda está dentro do TTL.
+
+        Args:
+            entry: Resposta armazenada
+
+        Returns:
+            True se a resposta pode ser servida sem consultar a API
+        """
+        return time.monotonic() - entry.stored_at < self.ttl
+
+    def touch(self, key: str) -> None:
+        """
+        Renova o TTL de uma resposta confirmada como atual.
+
+        Args:
+            key: Chave da resposta
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.stored_at = time.monotonic()
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove uma resposta do cache.
+
+        Args:
+            key: Chave da resposta
+        """
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._stats['invalidations'] += 1
+
+    def observe(self, key: str, body: Dict[str, Any]) -> None:
+        """
+        Compara um item recebido por outro endpoint (listagem ou eventos) com o cache.
+
+        Se o `updated_at` do item for igual ao da resposta armazenada, o TTL dela é
+        renovado; se for diferente (ou não houver resposta), o item passa a ser a
+        versão em cache do recurso.
+
+        Args:
+            key: Chave do recurso correspondente ao item
+            body: Dados do item
+        """
+        updated_at = body.get('updated_at')
+        if not updated_at:
+            return
+        entry = self.get(key)
+        if entry is not None and entry.updated_at == updated_at:
+            self.touch(key)
+        else:
+            self.put(key, CachedResponse(body=body, updated_at=updated_at))
+
+    def confirm(self, key: str, updated_at: Optional[datetime]) -> None:
+        """
+        Compara a data de atualização de um item já convertido em entidade com o cache.
+
+        Equivale a `observe` para listagens decodificadas em entidades, que não
+        servem como corpo de resposta: se a data coincidir com a da resposta
+        armazenada, o TTL dela é renovado; se for diferente, ela é descartada.
+
+        Args:
+            key: Chave do recurso correspondente ao item
+            updated_at: Data de atualização do item
+        """
+        if updated_at is None:
+            return
+        entry = self.get(key)
+        if entry is None:
+            return
+        if parse_timestamp(entry.updated_at) == parse_timestamp(updated_at):
+            self.touch(key)
+        else:
+            self.invalidate(key)
+
+    def record(self, outcome: str) -> None:
+        """
+        Registra o resultado de uma consulta ao cache.
+
+        Args:
+            outcome: 'hits', 'revalidated' ou 'misses'
+        """
+        with self._lock:
+            self._stats[outcome] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtém as estatísticas do cache.
+
+        Returns:
+            Dicionário com os contadores e o tamanho atual do cache
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+        stats.update({'max_entries': self.max_entries, 'ttl': self.ttl})
+        return stats
@@ -0,0 +1,129 @@
+"""
+Coalescência de requisições idênticas e simultâneas ("single-flight").
+Quando várias chamadas pedem o mesmo recurso ao mesmo tempo, apenas uma vai até a
+API do Hevy e todas recebem o mesmo resultado decodificado.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """Representa uma chamada em andamento compartilhada entre threads."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesce chamadas idênticas feitas ao mesmo tempo por várias threads.
+
+    A primeira thread a pedir uma chave executa a função; as demais esperam e
+    recebem o mesmo resultado (ou a mesma exceção). Resultados não são guardados
+    depois que a chamada termina.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._stats = {'executed': 0, 'shared': 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Executa `fn` ou aguarda a execução em andamento para a mesma chave.
+
+        Args:
+            key: Chave que identifica a chamada (ex.: método, caminho e parâmetros)
+            fn: Função que realiza a chamada
+
+        Returns:
+            O resultado de `fn`, compartilhado entre todos os chamadores da chave
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._stats['shared'] += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._stats['executed'] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Obtém as estatísticas de coalescência.
+
+        Returns:
+            Dicionário com as chamadas executadas e as que reaproveitaram outra chamada
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['in_flight'] = len(self._calls)
+        return stats
+
+
+class AsyncSingleFlight:
+    """
+    Coalesce corrotinas idênticas aguardadas ao mesmo tempo no mesmo event loop.
+
+    A chamada compartilhada roda em uma task própria, de modo que o cancelamento
+    de um dos chamadores não cancela a requisição para os demais.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._stats = {'executed': 0, 'shared': 0}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Executa `fn` ou aguarda a execução em andamento para a mesma chave.
+
+        Args:
+            key: Chave que identifica a chamada
+            fn: Função que cria a corrotina da chamada
+
+        Returns:
+            O resultado da corrotina, compartilhado entre todos os chamadores da chave
+        """
+        task = self._tasks.get(key)
+        if task is not None:
+            self._stats['shared'] += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            self._stats['executed'] += 1
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return await asyncio.shield(task)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Obtém as estatísticas de coalescência.
+
+        Returns:
+            Dicionário com as chamadas executadas e as que reaproveitaram outra chamada
+        """
+        stats = dict(self._stats)
+        stats['in_flight'] = len(self._tasks)
+        return stats
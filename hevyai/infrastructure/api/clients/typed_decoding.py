@@ -0,0 +1,261 @@
+"""
+Decodificação tipada das listagens da API do Hevy.
+
+Com o msgspec instalado (dependência opcional), as páginas de treinos, rotinas e
+modelos de exercícios são decodificadas a partir dos bytes da resposta em structs
+compiladas do esquema abaixo, já com as datas convertidas em datetime, e as
+structs viram entidades sem dicionários intermediários nem chamadas a `dict.get`.
+As diferenças de nome entre a API e as entidades (title -> name,
+description -> notes, index -> order) são declaradas uma única vez, nos campos
+das structs.
+
+Sem o msgspec, com HEVY_API_TYPED_DECODING desativado ou quando uma resposta
+não segue o esquema, os repositórios usam o caminho com json e dicionários.
+"""
+
+import json
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from django.conf import settings
+
+from hevyai.domain.entities.exercise_template import ExerciseTemplate, MuscleGroup
+from hevyai.domain.entities.routine import Routine, RoutineExercise, RoutineSet
+from hevyai.domain.entities.workout import Exercise, Set, Workout
+from hevyai.domain.timestamps import parse_timestamp
+
+try:
+    import msgspec
+except ImportError:  # dependência opcional
+    msgspec = None
+
+
+if msgspec is not None:
+
+    class _ApiSet(msgspec.Struct):
+        id: Optional[str] = ''
+        reps: Optional[int] = None
+        weight: Optional[float] = None
+        duration: Optional[int] = None
+        distance: Optional[float] = None
+        rpe: Optional[float] = None
+        completed: Optional[bool] = True
+
+    class _ApiExercise(msgspec.Struct):
+        id: Optional[str] = ''
+        exercise_template_id: Optional[str] = ''
+        name: Optional[str] = msgspec.field(default='', name='title')
+        notes: Optional[str] = None
+        sets: List[_ApiSet] = []
+
+    class _ApiWorkout(msgspec.Struct):
+        id: Optional[str] = ''
+        name: Optional[str] = msgspec.field(default='', name='title')
+        notes: Optional[str] = msgspec.field(default=None, name='description')
+        routine_id: Optional[str] = None
+        exercises: List[_ApiExercise] = []
+        start_time: Optional[datetime] = None
+        end_time: Optional[datetime] = None
+        created_at: Optional[datetime] = None
+        updated_at: Optional[datetime] = None
+
+    class _ApiWorkoutPage(msgspec.Struct):
+        page: int = 1
+        page_count: int = 1
+        workouts: List[_ApiWorkout] = []
+
+    class _ApiRoutineSet(msgspec.Struct):
+        id: Optional[str] = ''
+        reps: Optional[int] = None
+        weight: Optional[float] = None
+        duration: Optional[int] = None
+        distance: Optional[float] = None
+        rest_seconds: Optional[int] = None
+
+    class _ApiRoutineExercise(msgspec.Struct):
+        id: Optional[str] = ''
+        exercise_template_id: Optional[str] = ''
+        name: Optional[str] = msgspec.field(default='', name='title')
+        notes: Optional[str] = None
+        sets: List[_ApiRoutineSet] = []
+        order: Optional[int] = msgspec.field(default=0, name='index')
+
+    class _ApiRoutine(msgspec.Struct):
+        id: Optional[str] = ''
+        name: Optional[str] = msgspec.field(default='', name='title')
+        notes: Optional[str] = msgspec.field(default=None, name='description')
+        exercises: List[_ApiRoutineExercise] = []
+        folder_id: Any = None
+        is_public: Optional[bool] = False
+        created_at: Optional[datetime] = None
+        updated_at: Optional[datetime] = None
+
+    class _ApiRoutinePage(msgspec.Struct):
+        page: int = 1
+        page_count: int = 1
+        routines: List[_ApiRoutine] = []
+
+    class _ApiMuscleGroup(msgspec.Struct):
+        id: Optional[str] = ''
+        name: Optional[str] = ''
+
+    class _ApiExerciseTemplate(msgspec.Struct):
+        id: Optional[str] = ''
+        name: Optional[str] = ''
+        description: Optional[str] = None
+        is_custom: Optional[bool] = False
+        muscle_groups: List[_ApiMuscleGroup] = []
+        created_at: Optional[datetime] = None
+        updated_at: Optional[datetime] = None
+
+    class _ApiExerciseTemplatePage(msgspec.Struct):
+        page: int = 1
+        page_count: int = 1
+        exercise_templates: List[_ApiExerciseTemplate] = []
+
+
+def _build_workout(item: Any) -> Workout:
+    return Workout(
+        id=item.id,
+        name=item.name,
+        exercises=[
+            Exercise(
+                id=exercise.id,
+                exercise_template_id=exercise.exercise_template_id,
+                name=exercise.name,
+                notes=exercise.notes,
+                # Argumentos posicionais (na ordem dos campos de Set): as séries são
+                # a maior parte de uma página e assim são criadas bem mais rápido
+                sets=[
+                    Set(s.id, s.reps, s.weight, s.duration, s.distance, s.rpe, s.completed)
+                    for s in exercise.sets
+                ]
+            )
+            for exercise in item.exercises
+        ],
+        notes=item.notes,
+        routine_id=item.routine_id,
+        start_time=item.start_time,
+        end_time=item.end_time,
+        created_at=item.created_at,
+        updated_at=item.updated_at
+    )
+
+
+def _build_routine(item: Any) -> Routine:
+    return Routine(
+        id=item.id,
+        name=item.name,
+        exercises=[
+            RoutineExercise(
+                id=exercise.id,
+                exercise_template_id=exercise.exercise_template_id,
+                name=exercise.name,
+                notes=exercise.notes,
+                sets=[
+                    RoutineSet(s.id, s.reps, s.weight, s.duration, s.distance, s.rest_seconds)
+                    for s in exercise.sets
+                ],
+                order=exercise.order
+            )
+            for exercise in item.exercises
+        ],
+        notes=item.notes,
+        folder_id=item.folder_id,
+        is_public=item.is_public,
+        created_at=item.created_at,
+        updated_at=item.updated_at
+    )
+
+
+def _build_exercise_template(item: Any) -> ExerciseTemplate:
+    return ExerciseTemplate(
+        id=item.id,
+        name=item.name,
+        description=item.description,
+        is_custom=item.is_custom,
+        muscle_groups=[MuscleGroup(id=mg.id, name=mg.name) for mg in item.muscle_groups],
+        created_at=parse_timestamp(item.created_at),
+        updated_at=parse_timestamp(item.updated_at)
+    )
+
+
+class EntityPageDecoder:
+    """
+    Decodifica uma página de uma listagem da API do Hevy direto em entidades.
+
+    O resultado tem o mesmo formato da resposta decodificada com json
+    (`page`, `page_count` e a lista de itens), mas os itens já são entidades.
+    """
+
+    def __init__(self, items_key: str, page_type: type, build_item: Callable[[Any], Any]):
+        """
+        Inicializa o decodificador de uma listagem.
+
+        Args:
+            items_key: Chave da lista de itens na resposta (ex.: 'workouts')
+            page_type: Struct do msgspec que descreve a página
+            build_item: Função que converte a struct de um item na entidade
+        """
+        self.items_key = items_key
+        self._decoder = msgspec.json.Decoder(page_type)
+        self._build_item = build_item
+
+    def decode(self, raw: bytes) -> Dict[str, Any]:
+        """
+        Decodifica o corpo de uma resposta.
+
+        Se a resposta não seguir o esquema (por exemplo, um tipo inesperado em
+        algum campo), ela é decodificada com json e os itens ficam como
+        dicionários, para o repositório convertê-los pelo caminho comum.
+
+        Args:
+            raw: Corpo da resposta em bytes
+
+        Returns:
+            Dicionário com `page`, `page_count` e a lista de itens
+        """
+        try:
+            page = self._decoder.decode(raw)
+        except msgspec.ValidationError as e:
+            print(f"Resposta de {self.items_key} fora do esquema tipado, decodificando com json: {e}")
+            return json.loads(raw)
+
+        build_item = self._build_item
+        return {
+            'page': page.page,
+            'page_count': page.page_count,
+            self.items_key: [build_item(item) for item in getattr(page, self.items_key)],
+        }
+
+
+_decoders: Dict[str, EntityPageDecoder] = {}
+_decoders_lock = threading.Lock()
+
+
+def get_page_decoder(items_key: str) -> Optional[EntityPageDecoder]:
+    """
+    Obtém o decodificador tipado de uma listagem, se a decodificação tipada estiver ativa.
+
+    Args:
+        items_key: 'workouts', 'routines' ou 'exercise_templates'
+
+    Returns:
+        O decodificador (compartilhado pelo processo) ou None se o msgspec não
+        estiver instalado ou se settings.HEVY_API_TYPED_DECODING estiver desativado
+    """
+    if msgspec is None or not settings.HEVY_API_TYPED_DECODING:
+        return None
+
+    with _decoders_lock:
+        decoder = _decoders.get(items_key)
+        if decoder is None:
+            page_types = {
+                'workouts': (_ApiWorkoutPage, _build_workout),
+                'routines': (_ApiRoutinePage, _build_routine),
+                'exercise_templates': (_ApiExerciseTemplatePage, _build_exercise_template),
+            }
+            page_type, build_item = page_types[items_key]
+            decoder = _decoders[items_key] = EntityPageDecoder(items_key, page_type, build_item)
+        return decoder
@@ -0,0 +1,488 @@
+"""
+Dados servidos pelo substituto local da API do Hevy.
+Podem vir de fixtures gravadas da API real ou de um histórico sintético gerado
+de forma determinística.
+"""
+
+import json
+import os
+import random
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+# Recursos paginados servidos pelo substituto, com o nome do arquivo de fixture
+RESOURCES = ('workouts', 'routines', 'exercise_templates', 'routine_folders')
+
+# Catálogo usado pelo gerador sintético: (nome, grupo muscular principal, secundários)
+TEMPLATE_CATALOG = [
+    ('Bench Press (Barbell)', 'chest', ['triceps', 'shoulders']),
+    ('Incline Bench Press (Dumbbell)', 'chest', ['triceps', 'shoulders']),
+    ('Chest Fly (Cable)', 'chest', []),
+    ('Push Up', 'chest', ['triceps']),
+    ('Overhead Press (Barbell)', 'shoulders', ['triceps']),
+    ('Lateral Raise (Dumbbell)', 'shoulders', []),
+    ('Face Pull (Cable)', 'shoulders', ['upper_back']),
+    ('Triceps Pushdown (Cable)', 'triceps', []),
+    ('Skullcrusher (Barbell)', 'triceps', []),
+    ('Bicep Curl (Dumbbell)', 'biceps', ['forearms']),
+    ('Hammer Curl (Dumbbell)', 'biceps', ['forearms']),
+    ('Pull Up', 'lats', ['biceps', 'upper_back']),
+    ('Lat Pulldown (Cable)', 'lats', ['biceps']),
+    ('Bent Over Row (Barbell)', 'upper_back', ['lats', 'biceps']),
+    ('Seated Cable Row', 'upper_back', ['lats', 'biceps']),
+    ('Deadlift (Barbell)', 'lower_back', ['glutes', 'hamstrings']),
+    ('Romanian Deadlift (Barbell)', 'hamstrings', ['glutes', 'lower_back']),
+    ('Squat (Barbell)', 'quadriceps', ['glutes', 'hamstrings']),
+    ('Leg Press', 'quadriceps', ['glutes']),
+    ('Bulgarian Split Squat', 'quadriceps', ['glutes']),
+    ('Leg Extension (Machine)', 'quadriceps', []),
+    ('Lying Leg Curl (Machine)', 'hamstrings', []),
+    ('Hip Thrust (Barbell)', 'glutes', ['hamstrings']),
+    ('Standing Calf Raise', 'calves', []),
+    ('Plank', 'abdominals', []),
+    ('Cable Crunch', 'abdominals', []),
+    ('Running', 'cardio', []),
+    ('Rowing Machine', 'cardio', ['upper_back']),
+]
+
+# Divisões de treino usadas para gerar as rotinas sintéticas
+ROUTINE_SPLITS = [
+    ('Push', ['chest', 'shoulders', 'triceps']),
+    ('Pull', ['lats', 'upper_back', 'biceps']),
+    ('Legs', ['quadriceps', 'hamstrings', 'glutes', 'calves']),
+    ('Upper', ['chest', 'lats', 'upper_back', 'shoulders']),
+    ('Lower', ['quadriceps', 'hamstrings', 'glutes', 'lower_back']),
+    ('Full Body', ['chest', 'upper_back', 'quadriceps', 'abdominals']),
+    ('Conditioning', ['cardio', 'abdominals']),
+]
+
+# Exercícios medidos por duração/distância em vez de carga e repetições
+DURATION_GROUPS = frozenset({'cardio'})
+BODYWEIGHT_TEMPLATES = frozenset({'Push Up', 'Pull Up', 'Plank'})
+
+
+def format_timestamp(value: datetime) -> str:
+    """
+    Formata uma data no mesmo formato ISO 8601 usado pela API do Hevy.
+
+    Args:
+        value: Data com fuso horário
+
+    Returns:
+        A data formatada (ex.: '2024-01-01T10:00:00+00:00')
+    """
+    return value.astimezone(timezone.utc).isoformat(timespec='seconds')
+
+
+class FakeHevyDataset:
+    """
+    Conjunto de dados servido pelo substituto local da API do Hevy.
+
+    Guarda os recursos no formato de resposta da API e os eventos de exclusão de
+    treinos. Treinos são mantidos do mais recente para o mais antigo, como na API.
+    O conjunto pode ser alterado enquanto o servidor está no ar (`upsert_workout`,
+    `delete_workout`), o que gera os eventos correspondentes em `/v1/workouts/events`.
+    """
+
+    def __init__(
+        self,
+        workouts: Optional[List[Dict[str, Any]]] = None,
+        routines: Optional[List[Dict[str, Any]]] = None,
+        exercise_templates: Optional[List[Dict[str, Any]]] = None,
+        routine_folders: Optional[List[Dict[str, Any]]] = None,
+        deleted_events: Optional[List[Dict[str, Any]]] = None
+    ):
+        """
+        Inicializa o conjunto de dados.
+
+        Args:
+            workouts: Treinos no formato da API
+            routines: Rotinas no formato da API
+            exercise_templates: Modelos de exercícios no formato da API
+            routine_folders: Pastas de rotinas no formato da API
+            deleted_events: Eventos de exclusão de treinos ({'type': 'deleted', 'id', 'deleted_at'})
+        """
+        self._lock = threading.Lock()
+        self.resources: Dict[str, List[Dict[str, Any]]] = {
+            'workouts': sorted(workouts or [], key=lambda w: w.get('start_time') or '', reverse=True),
+            'routines': list(routines or []),
+            'exercise_templates': list(exercise_templates or []),
+            'routine_folders': list(routine_folders or []),
+        }
+        self.deleted_events: List[Dict[str, Any]] = list(deleted_events or [])
+        self._index = {
+            name: {str(item.get('id')): item for item in items}
+            for name, items in self.resources.items()
+        }
+
+    def get_page(self, resource: str, page: int, page_size: int) -> Dict[str, Any]:
+        """
+        Obtém uma página de um recurso no formato da API.
+
+        Args:
+            resource: Nome do recurso (ex.: 'workouts')
+            page: Número da página, a partir de 1
+            page_size: Quantidade de itens por página
+
+        Returns:
+            Dicionário com page, page_count e os itens da página
+        """
+        with self._lock:
+            items = self.resources[resource]
+            page_count = max(1, -(-len(items) // page_size))
+            start = (page - 1) * page_size
+            return {'page': page, 'page_count': page_count, resource: items[start:start + page_size]}
+
+    def get_item(self, resource: str, item_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtém um item de um recurso pelo seu ID.
+
+        Args:
+            resource: Nome do recurso
+            item_id: ID do item
+
+        Returns:
+            O item ou None se não existir
+        """
+        with self._lock:
+            return self._index[resource].get(item_id)
+
+    def count(self, resource: str) -> int:
+        """
+        Obtém a quantidade de itens de um recurso.
+
+        Args:
+            resource: Nome do recurso
+
+        Returns:
+            Número de itens
+        """
+        with self._lock:
+            return len(self.resources[resource])
+
+    def get_events_page(self, since: str, page: int, page_size: int) -> Dict[str, Any]:
+        """
+        Obtém uma página dos eventos de treinos ocorridos desde uma data.
+
+        Os eventos são ordenados do mais recente para o mais antigo. Treinos
+        atualizados geram eventos 'updated' com o treino completo; exclusões geram
+        eventos 'deleted' com o ID e a data da exclusão.
+
+        Args:
+            since: Data ISO 8601 a partir da qual buscar eventos
+            page: Número da página, a partir de 1
+            page_size: Quantidade de itens por página
+
+        Returns:
+            Dicionário com page, page_count e os eventos da página
+        """
+        since_key = _timestamp_key(since)
+        with self._lock:
+            events = [
+                (workout['updated_at'], {'type': 'updated', 'workout': workout})
+                for workout in self.resources['workouts']
+                if _timestamp_key(workout.get('updated_at')) > since_key
+            ]
+            events.extend(
+                (event['deleted_at'], event)
+                for event in self.deleted_events
+                if _timestamp_key(event.get('deleted_at')) > since_key
+            )
+        events.sort(key=lambda item: _timestamp_key(item[0]), reverse=True)
+        page_count = max(1, -(-len(events) // page_size))
+        start = (page - 1) * page_size
+        return {
+            'page': page,
+            'page_count': page_count,
+            'events': [event for _, event in events[start:start + page_size]],
+        }
+
+    def upsert_workout(self, workout: Dict[str, Any]) -> None:
+        """
+        Insere ou substitui um treino, como se tivesse sido salvo no aplicativo.
+
+        Args:
+            workout: Treino no formato da API; `updated_at` é preenchido se ausente
+        """
+        workout.setdefault('updated_at', format_timestamp(datetime.now(timezone.utc)))
+        with self._lock:
+            workouts = [w for w in self.resources['workouts'] if w['id'] != workout['id']]
+            workouts.append(workout)
+            workouts.sort(key=lambda w: w.get('start_time') or '', reverse=True)
+            self.resources['workouts'] = workouts
+            self._index['workouts'][workout['id']] = workout
+
+    def delete_workout(self, workout_id: str) -> bool:
+        """
+        Exclui um treino e registra o evento de exclusão.
+
+        Args:
+            workout_id: ID do treino
+
+        Returns:
+            True se o treino existia
+        """
+        with self._lock:
+            if self._index['workouts'].pop(workout_id, None) is None:
+                return False
+            self.resources['workouts'] = [w for w in self.resources['workouts'] if w['id'] != workout_id]
+            self.deleted_events.append({
+                'type': 'deleted',
+                'id': workout_id,
+                'deleted_at': format_timestamp(datetime.now(timezone.utc)),
+            })
+            return True
+
+    @classmethod
+    def from_fixtures(cls, directory: str) -> 'FakeHevyDataset':
+        """
+        Carrega um conjunto de dados gravado com `record_hevy_fixtures` ou `save`.
+
+        Cada recurso fica em um arquivo JSON com a lista de itens (ex.: workouts.json).
+        Arquivos ausentes são tratados como listas vazias.
+
+        Args:
+            directory: Diretório das fixtures
+
+        Returns:
+            O conjunto de dados carregado
+        """
+        data = {}
+        for name in RESOURCES + ('workout_events',):
+            path = os.path.join(directory, f'{name}.json')
+            if os.path.exists(path):
+                with open(path, encoding='utf-8') as fp:
+                    data[name] = json.load(fp)
+            else:
+                data[name] = []
+        return cls(
+            workouts=data['workouts'],
+            routines=data['routines'],
+            exercise_templates=data['exercise_templates'],
+            routine_folders=data['routine_folders'],
+            deleted_events=[e for e in data['workout_events'] if e.get('type') == 'deleted'],
+        )
+
+    def save(self, directory: str) -> None:
+        """
+        Grava o conjunto de dados como fixtures em um diretório.
+
+        Args:
+            directory: Diretório de destino (criado se não existir)
+        """
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            files = dict(self.resources)
+            files['workout_events'] = list(self.deleted_events)
+        for name, items in files.items():
+            with open(os.path.join(directory, f'{name}.json'), 'w', encoding='utf-8') as fp:
+                json.dump(items, fp, ensure_ascii=False)
+
+    @classmethod
+    def synthetic(
+        cls,
+        years: float = 3,
+        workouts_per_week: float = 4,
+        custom_templates: int = 5,
+        deleted_ratio: float = 0.01,
+        seed: int = 42,
+        end: Optional[datetime] = None
+    ) -> 'FakeHevyDataset':
+        """
+        Gera um histórico sintético e determinístico de vários anos.
+
+        Os treinos seguem rotinas de divisões comuns, com progressão de carga ao
+        longo do tempo, e uma fração deles aparece como excluída nos eventos.
+
+        Args:
+            years: Anos de histórico
+            workouts_per_week: Média de treinos por semana
+            custom_templates: Quantidade de modelos de exercícios personalizados
+            deleted_ratio: Fração de treinos gerados como excluídos
+            seed: Semente do gerador, para resultados reprodutíveis
+            end: Data do último treino (padrão: agora)
+
+        Returns:
+            O conjunto de dados gerado
+        """
+        rng = random.Random(seed)
+        end = end or datetime.now(timezone.utc).replace(microsecond=0)
+        start = end - timedelta(days=365 * years)
+
+        def new_id() -> str:
+            return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+        created = format_timestamp(start - timedelta(days=30))
+        templates = []
+        for index, (name, primary, secondary) in enumerate(TEMPLATE_CATALOG):
+            templates.append(_template(f'{index:08X}', name, primary, secondary, False, created))
+        for index in range(custom_templates):
+            primary = ROUTINE_SPLITS[index % len(ROUTINE_SPLITS)][1][0]
+            templates.append(_template(new_id(), f'Custom Exercise {index + 1}', primary, [], True, created))
+
+        templates_by_id = {t['id']: t for t in templates}
+        by_group: Dict[str, List[Dict[str, Any]]] = {}
+        for template in templates:
+            by_group.setdefault(template['primary_muscle_group'], []).append(template)
+
+        folders = [
+            {'id': index + 1, 'index': index, 'title': title, 'created_at': created, 'updated_at': created}
+            for index, title in enumerate(['Hipertrofia', 'Força', 'Condicionamento'])
+        ]
+
+        routines = []
+        for index, (title, groups) in enumerate(ROUTINE_SPLITS):
+            exercises = []
+            for group in groups:
+                for template in rng.sample(by_group[group], min(2, len(by_group[group]))):
+                    exercises.append({
+                        'id': new_id(),
+                        'index': len(exercises),
+                        'title': template['title'],
+                        'exercise_template_id': template['id'],
+                        'notes': None,
+                        'sets': [
+                            {'id': new_id(), 'index': i, 'type': 'normal', 'reps': 8 + 2 * (i % 2),
+                             'weight': None, 'duration': None, 'distance': None, 'rest_seconds': 90}
+                            for i in range(3)
+                        ],
+                    })
+            routines.append({
+                'id': new_id(),
+                'title': title,
+                'description': None,
+                'folder_id': folders[index % len(folders)]['id'],
+                'is_public': False,
+                'exercises': exercises,
+                'created_at': created,
+                'updated_at': created,
+            })
+
+        # Carga inicial de cada modelo, que progride ao longo do histórico
+        base_weight = {t['id']: rng.choice([10, 20, 30, 40, 60, 80]) for t in templates}
+        total_days = (end - start).days or 1
+        workouts = []
+        deleted = []
+        day = start
+        while day < end:
+            if rng.random() < workouts_per_week / 7:
+                routine = rng.choice(routines)
+                started = day.replace(hour=rng.randint(6, 20), minute=rng.choice([0, 15, 30, 45]), second=0)
+                progress = 1 + 0.5 * (day - start).days / total_days
+                exercises = []
+                elapsed = 0
+                for index, planned in enumerate(routine['exercises']):
+                    template = templates_by_id[planned['exercise_template_id']]
+                    sets = []
+                    for set_index in range(rng.randint(3, 5)):
+                        sets.append(_synthetic_set(rng, new_id(), set_index, template, base_weight[template['id']] * progress))
+                        elapsed += 150
+                    exercises.append({
+                        'id': new_id(),
+                        'index': index,
+                        'title': template['title'],
+                        'exercise_template_id': template['id'],
+                        'notes': None,
+                        'superset_id': None,
+                        'sets': sets,
+                    })
+                finished = started + timedelta(seconds=elapsed + rng.randint(300, 900))
+                updated = finished + timedelta(minutes=rng.randint(1, 30))
+                workout = {
+                    'id': new_id(),
+                    'title': routine['title'],
+                    'description': None,
+                    'routine_id': routine['id'],
+                    'start_time': format_timestamp(started),
+                    'end_time': format_timestamp(finished),
+                    'created_at': format_timestamp(finished),
+                    'updated_at': format_timestamp(updated),
+                    'exercises': exercises,
+                }
+                if rng.random() < deleted_ratio:
+                    deleted.append({
+                        'type': 'deleted',
+                        'id': workout['id'],
+                        'deleted_at': format_timestamp(updated + timedelta(days=rng.randint(0, 3))),
+                    })
+                else:
+                    workouts.append(workout)
+            day += timedelta(days=1)
+
+        return cls(
+            workouts=workouts,
+            routines=routines,
+            exercise_templates=templates,
+            routine_folders=folders,
+            deleted_events=deleted,
+        )
+
+
+def _template(
+    template_id: str,
+    title: str,
+    primary: str,
+    secondary: List[str],
+    is_custom: bool,
+    created: str
+) -> Dict[str, Any]:
+    """Monta um modelo de exercício sintético com os campos da API e os lidos pelo repositório."""
+    return {
+        'id': template_id,
+        'title': title,
+        'name': title,
+        'type': 'duration' if primary in DURATION_GROUPS else 'weight_reps',
+        'primary_muscle_group': primary,
+        'secondary_muscle_groups': secondary,
+        'muscle_groups': [{'id': group, 'name': group} for group in [primary] + secondary],
+        'is_custom': is_custom,
+        'description': None,
+        'created_at': created,
+        'updated_at': created,
+    }
+
+
+def _synthetic_set(
+    rng: random.Random,
+    set_id: str,
+    index: int,
+    template: Dict[str, Any],
+    weight: float
+) -> Dict[str, Any]:
+    """Gera uma série sintética coerente com o tipo do modelo de exercício."""
+    data = {
+        'id': set_id,
+        'index': index,
+        'type': 'warmup' if index == 0 and rng.random() < 0.3 else 'normal',
+        'reps': None,
+        'weight': None,
+        'duration': None,
+        'distance': None,
+        'rpe': None,
+        'completed': True,
+    }
+    if template['type'] == 'duration':
+        data['duration'] = rng.randint(600, 2400)
+        data['distance'] = round(data['duration'] * rng.uniform(2.2, 3.2), 1)
+    elif template['title'] in BODYWEIGHT_TEMPLATES:
+        data['reps'] = rng.randint(8, 20)
+    else:
+        data['reps'] = rng.randint(5, 12)
+        data['weight'] = round(weight * rng.uniform(0.9, 1.05) / 2.5) * 2.5
+        data['rpe'] = rng.choice([None, 7, 7.5, 8, 8.5, 9])
+    return data
+
+
+def _timestamp_key(value: Optional[str]) -> datetime:
+    """Converte um timestamp ISO 8601 em uma data comparável (datas inválidas ficam no início)."""
+    if not value:
+        return datetime.min.replace(tzinfo=timezone.utc)
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return datetime.min.replace(tzinfo=timezone.utc)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
@@ -0,0 +1,284 @@
+"""
+Servidor HTTP local que imita os endpoints de leitura da API do Hevy.
+Permite executar o `HevyApiClient`, os repositórios e as views sem acesso à API
+real, com latência, respostas 429 e erros injetados de forma reprodutível.
+"""
+
+import hashlib
+import json
+import random
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from hevyai.infrastructure.api.fake.dataset import RESOURCES, FakeHevyDataset
+
+# Tamanho máximo de página aceito pela API do Hevy
+MAX_PAGE_SIZE = 10
+
+# Caminho que expõe as estatísticas do servidor (fora do espaço /v1 da API)
+STATS_PATH = '/_fake/stats'
+
+
+@dataclass
+class FaultProfile:
+    """
+    Falhas e atrasos injetados pelo servidor.
+
+    Attributes:
+        latency_ms: Latência fixa adicionada a cada resposta
+        jitter_ms: Variação máxima (uniforme) somada à latência
+        throttle_rate: Fração das requisições respondidas com 429
+        error_rate: Fração das requisições respondidas com `error_status`
+        error_status: Status usado nos erros injetados
+        retry_after: Valor do cabeçalho Retry-After nas respostas 429
+        rate_limit: Requisições por segundo aceitas antes de responder 429 (0 desativa)
+        rate_burst: Rajada aceita pelo limite de taxa
+        seed: Semente do gerador usado nas injeções
+    """
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    throttle_rate: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    retry_after: Optional[float] = 1.0
+    rate_limit: float = 0.0
+    rate_burst: float = 10.0
+    seed: int = 0
+
+
+class FakeHevyServer:
+    """
+    Substituto local da API do Hevy.
+
+    Serve `/v1/workouts`, `/v1/workouts/count`, `/v1/workouts/events`,
+    `/v1/routines`, `/v1/exercise_templates`, `/v1/routine_folders` e os detalhes
+    de cada recurso, com a mesma paginação de 10 itens da API. Respostas de
+    detalhe trazem ETag e respondem 304 a requisições condicionais. As respostas
+    enviadas por status ficam disponíveis em `/_fake/stats`.
+    """
+
+    def __init__(
+        self,
+        dataset: FakeHevyDataset,
+        faults: Optional[FaultProfile] = None,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        api_key: Optional[str] = None
+    ):
+        """
+        Inicializa o servidor (sem iniciá-lo).
+
+        Args:
+            dataset: Dados servidos
+            faults: Falhas e atrasos injetados (padrão: nenhum)
+            host: Endereço de escuta
+            port: Porta de escuta (0 escolhe uma porta livre)
+            api_key: Se informada, requisições sem este cabeçalho `api-key` recebem 401
+        """
+        self.dataset = dataset
+        self.faults = faults or FaultProfile()
+        self.api_key = api_key
+        self._rng = random.Random(self.faults.seed)
+        self._rng_lock = threading.Lock()
+        self._limit_lock = threading.Lock()
+        self._tokens = self.faults.rate_burst
+        self._tokens_at = time.monotonic()
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, int] = {}
+        self._thread: Optional[threading.Thread] = None
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        """URL base do servidor, a ser usada como HEVY_API_URL."""
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> str:
+        """
+        Inicia o servidor em uma thread em segundo plano.
+
+        Returns:
+            A URL base do servidor
+        """
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='fake-hevy-api', daemon=True)
+        self._thread.start()
+        return self.url
+
+    def serve_forever(self) -> None:
+        """Atende requisições na thread atual até `stop` ser chamado."""
+        self.httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Encerra o servidor e libera a porta."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'FakeHevyServer':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Obtém a quantidade de respostas enviadas por status.
+
+        Returns:
+            Dicionário indexado pelo status HTTP (como texto)
+        """
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _record(self, status: int) -> None:
+        with self._stats_lock:
+            self._stats[str(status)] = self._stats.get(str(status), 0) + 1
+
+    def _inject(self) -> Tuple[float, Optional[int]]:
+        """
+        Sorteia a latência e a falha de uma requisição.
+
+        Returns:
+            Tupla (atraso em segundos, status da falha injetada ou None)
+        """
+        faults = self.faults
+        with self._rng_lock:
+            delay = faults.latency_ms + (self._rng.uniform(0, faults.jitter_ms) if faults.jitter_ms else 0.0)
+            roll = self._rng.random()
+        if faults.rate_limit and not self._admit():
+            return delay / 1000, 429
+        if roll < faults.throttle_rate:
+            return delay / 1000, 429
+        if roll < faults.throttle_rate + faults.error_rate:
+            return delay / 1000, faults.error_status
+        return delay / 1000, None
+
+    def _admit(self) -> bool:
+        """
+        Aplica o limite de taxa configurado; requisições recusadas não consomem a cota.
+
+        Returns:
+            True se a requisição está dentro do limite
+        """
+        with self._limit_lock:
+            now = time.monotonic()
+            self._tokens = min(self.faults.rate_burst, self._tokens + (now - self._tokens_at) * self.faults.rate_limit)
+            self._tokens_at = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def handle(self, method: str, target: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], Optional[Any]]:
+        """
+        Resolve uma requisição.
+
+        Args:
+            method: Método HTTP
+            target: Caminho com a query string
+            headers: Cabeçalhos da requisição (nomes em minúsculas)
+
+        Returns:
+            Tupla (status, cabeçalhos da resposta, corpo a ser serializado em JSON)
+        """
+        if target == STATS_PATH:
+            return 200, {}, self.get_stats()
+        if self.api_key is not None and headers.get('api-key') != self.api_key:
+            return 401, {}, {'error': 'Unauthorized'}
+
+        delay, fault = self._inject()
+        if delay:
+            time.sleep(delay)
+        if fault == 429:
+            extra = {'Retry-After': str(self.faults.retry_after)} if self.faults.retry_after is not None else {}
+            return 429, extra, {'error': 'Too Many Requests'}
+        if fault is not None:
+            return fault, {}, {'error': 'Injected failure'}
+
+        if method != 'GET':
+            return 405, {}, {'error': 'Method not allowed'}
+
+        url = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split('/') if part]
+        if len(parts) < 2 or parts[0] != 'v1' or parts[1] not in RESOURCES:
+            return 404, {}, {'error': 'Not found'}
+        resource = parts[1]
+
+        if len(parts) == 2 or (resource == 'workouts' and parts[2:] == ['events']):
+            try:
+                page = int(query.get('page', 1))
+                page_size = int(query.get('pageSize', 5))
+            except ValueError:
+                return 400, {}, {'error': 'Invalid page or pageSize'}
+            if page < 1 or not 1 <= page_size <= MAX_PAGE_SIZE:
+                return 400, {}, {'error': f'pageSize must be between 1 and {MAX_PAGE_SIZE}'}
+            if len(parts) == 3:
+                # A API documenta `since`; o cliente envia `since_date`
+                since = query.get('since') or query.get('since_date') or '1970-01-01T00:00:00Z'
+                return 200, {}, self.dataset.get_events_page(since, page, page_size)
+            return 200, {}, self.dataset.get_page(resource, page, page_size)
+
+        if resource == 'workouts' and parts[2:] == ['count']:
+            count = self.dataset.count('workouts')
+            return 200, {}, {'workout_count': count, 'count': count}
+
+        if len(parts) == 3:
+            item = self.dataset.get_item(resource, parts[2])
+            if item is None:
+                return 404, {}, {'error': 'Not found'}
+            etag = '"%s"' % hashlib.md5(f"{item.get('id')}:{item.get('updated_at')}".encode()).hexdigest()
+            if headers.get('if-none-match') == etag:
+                return 304, {'ETag': etag}, None
+            return 200, {'ETag': etag}, item
+
+        return 404, {}, {'error': 'Not found'}
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # HTTP/1.1 mantém as conexões abertas, como a API real atrás do balanceador
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self) -> None:
+                super().setup()
+                # Cabeçalhos e corpo são escritos separadamente; sem TCP_NODELAY o
+                # algoritmo de Nagle somaria dezenas de milissegundos a cada resposta
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def _dispatch(self) -> None:
+                length = int(self.headers.get('Content-Length') or 0)
+                if length:
+                    self.rfile.read(length)
+                headers = {key.lower(): value for key, value in self.headers.items()}
+                status, extra, body = server.handle(self.command, self.path, headers)
+                payload = b'' if body is None else json.dumps(body).encode()
+                self.send_response(status)
+                if body is not None:
+                    self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(payload)))
+                for key, value in extra.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                if payload:
+                    self.wfile.write(payload)
+                if self.path != STATS_PATH:
+                    server._record(status)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        return Handler
@@ -0,0 +1,417 @@
+"""
+Catálogo em memória dos modelos de exercícios do Hevy.
+
+O catálogo tem poucas centenas de itens que quase nunca mudam, então é carregado
+inteiro uma vez por processo (com as páginas buscadas em paralelo) e servido a
+partir de dicionários. Uma cópia é gravada em disco para que um processo novo não
+precise percorrer a API de novo, e a atualização acontece em segundo plano quando
+o TTL vence ou quando a origem indica alterações mais novas que as do catálogo.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+from hevyai.domain.entities.exercise_template import ExerciseTemplate, MuscleGroup
+from hevyai.domain.repositories.exercise_template_repository import ExerciseTemplateRepository
+from hevyai.domain.timestamps import parse_timestamp
+from hevyai.infrastructure.catalog.search_index import TemplateSearchIndex
+
+SNAPSHOT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CatalogState:
+    """Conteúdo imutável do catálogo; é trocado por inteiro a cada atualização."""
+    templates: Dict[str, ExerciseTemplate] = field(default_factory=dict)
+    # IDs ordenados por nome, usados na listagem
+    ordered_ids: Tuple[str, ...] = ()
+    custom_ids: Tuple[str, ...] = ()
+    builtin_ids: Tuple[str, ...] = ()
+    # Grupo muscular (ID ou nome, em minúsculas) -> IDs ordenados por nome
+    muscle_group_ids: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+    loaded_at: float = 0.0
+    high_water_mark: Optional[datetime] = None
+
+
+class ExerciseTemplateCatalog:
+    """
+    Catálogo em memória dos modelos de exercícios.
+
+    As leituras usam sempre o estado atual, sem bloqueios; a atualização monta um
+    novo CatalogState e o substitui de uma vez. Apenas a primeira carga de um
+    processo sem cópia em disco bloqueia a requisição.
+    """
+
+    def __init__(
+        self,
+        source_factory: Callable[[], ExerciseTemplateRepository],
+        snapshot_path: Optional[Path] = None,
+        ttl: Optional[float] = None,
+        check_interval: Optional[float] = None,
+        prefetch: Optional[int] = None
+    ):
+        """
+        Inicializa o catálogo, ainda vazio.
+
+        Args:
+            source_factory: Função que cria o repositório de onde o catálogo é carregado
+            snapshot_path: Arquivo da cópia em disco (opcional; sem ele nada é gravado)
+            ttl: Segundos até o catálogo ser atualizado (padrão: settings.HEVY_TEMPLATE_CATALOG_TTL)
+            check_interval: Segundos entre as consultas à marca de atualização da origem
+                            (padrão: settings.HEVY_TEMPLATE_CATALOG_CHECK_INTERVAL)
+            prefetch: Páginas buscadas em paralelo na carga (padrão: settings.HEVY_API_MAX_CONCURRENCY)
+        """
+        self.source_factory = source_factory
+        self.snapshot_path = snapshot_path
+        self.ttl = settings.HEVY_TEMPLATE_CATALOG_TTL if ttl is None else ttl
+        self.check_interval = (
+            settings.HEVY_TEMPLATE_CATALOG_CHECK_INTERVAL if check_interval is None else check_interval
+        )
+        self.prefetch = settings.HEVY_API_MAX_CONCURRENCY if prefetch is None else prefetch
+
+        self._state: Optional[CatalogState] = None
+        self.search_index = TemplateSearchIndex()
+        self._load_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._last_check = 0.0
+        self._refreshes = 0
+        self._last_error: Optional[str] = None
+
+    def get(self, template_id: str) -> Optional[ExerciseTemplate]:
+        """
+        Obtém um modelo de exercício pelo ID.
+
+        Args:
+            template_id: ID do modelo de exercício
+
+        Returns:
+            O modelo de exercício ou None se não estiver no catálogo
+        """
+        return self._current().templates.get(template_id)
+
+    def get_many(self, template_ids: List[str]) -> Dict[str, ExerciseTemplate]:
+        """
+        Obtém vários modelos de exercícios pelos IDs, da mesma versão do catálogo.
+
+        Args:
+            template_ids: IDs dos modelos de exercícios
+
+        Returns:
+            Dicionário com os modelos do catálogo, pelo ID
+        """
+        templates = self._current().templates
+        return {template_id: templates[template_id] for template_id in template_ids if template_id in templates}
+
+    def list(self, is_custom: Optional[bool] = None, muscle_group: Optional[str] = None) -> List[ExerciseTemplate]:
+        """
+        Lista os modelos de exercícios ordenados por nome, com filtros opcionais.
+
+        Args:
+            is_custom: Se informado, mantém apenas os personalizados (True) ou os padrão (False)
+            muscle_group: ID ou nome de um grupo muscular (sem diferenciar maiúsculas)
+
+        Returns:
+            Lista de modelos de exercícios
+        """
+        state = self._current()
+        if muscle_group:
+            ids = state.muscle_group_ids.get(muscle_group.strip().lower(), ())
+            if is_custom is not None:
+                ids = [i for i in ids if state.templates[i].is_custom == is_custom]
+        elif is_custom is None:
+            ids = state.ordered_ids
+        else:
+            ids = state.custom_ids if is_custom else state.builtin_ids
+        return [state.templates[i] for i in ids]
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[ExerciseTemplate, float]]:
+        """
+        Busca modelos de exercícios por nome e descrição no índice de busca do catálogo.
+
+        Args:
+            query: Texto digitado pelo usuário (palavras parciais, sem acentos, abreviações)
+            limit: Quantidade máxima de resultados
+
+        Returns:
+            Lista de tuplas (modelo de exercício, pontuação), da mais relevante para a menos
+        """
+        templates = self._current().templates
+        return [
+            (templates[result.template_id], result.score)
+            for result in self.search_index.search(query, limit)
+            if result.template_id in templates
+        ]
+
+    def __len__(self) -> int:
+        return len(self._current().templates)
+
+    @property
+    def high_water_mark(self) -> Optional[datetime]:
+        """Data da alteração mais recente entre os modelos de exercícios do catálogo."""
+        return self._current().high_water_mark
+
+    def refresh(self) -> int:
+        """
+        Recarrega o catálogo da origem de forma síncrona e grava a cópia em disco.
+
+        Se a origem só conseguir responder com dados desatualizados (API indisponível),
+        o catálogo atual é mantido.
+
+        Returns:
+            Quantidade de modelos de exercícios no catálogo
+        """
+        with self._refresh_lock:
+            source = self.source_factory()
+            templates = list(source.iter_all(prefetch=self.prefetch))
+            if getattr(source, 'is_stale', False) and self._state is not None:
+                return len(self._state.templates)
+
+            self._set_state(self._build_state(templates, time.time()))
+            self._last_check = time.monotonic()
+            self._refreshes += 1
+            self._last_error = None
+            self.save_snapshot()
+            return len(self._state.templates)
+
+    def refresh_in_background(self) -> bool:
+        """
+        Inicia uma atualização em uma thread de segundo plano, se não houver outra em andamento.
+
+        Returns:
+            True se uma nova atualização foi iniciada
+        """
+        with self._thread_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return False
+            self._refresh_thread = threading.Thread(
+                target=self._background_refresh,
+                name='hevy-template-catalog',
+                daemon=True
+            )
+            self._refresh_thread.start()
+            return True
+
+    def load_snapshot(self) -> bool:
+        """
+        Carrega o catálogo a partir da cópia em disco.
+
+        Returns:
+            True se a cópia existia e foi carregada
+        """
+        if self.snapshot_path is None or not self.snapshot_path.exists():
+            return False
+        try:
+            with open(self.snapshot_path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Erro ao ler a cópia do catálogo de exercícios: {e}")
+            return False
+        if data.get('version') != SNAPSHOT_VERSION:
+            return False
+
+        templates = [_template_from_dict(item) for item in data.get('templates', [])]
+        self._set_state(self._build_state(templates, data.get('saved_at', 0.0)))
+        return True
+
+    def save_snapshot(self) -> None:
+        """Grava o catálogo atual em disco, substituindo a cópia anterior de forma atômica."""
+        if self.snapshot_path is None or self._state is None:
+            return
+        state = self._state
+        data = {
+            'version': SNAPSHOT_VERSION,
+            'saved_at': state.loaded_at,
+            'templates': [_template_to_dict(state.templates[i]) for i in state.ordered_ids],
+        }
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.snapshot_path.with_name(f"{self.snapshot_path.name}.{os.getpid()}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, self.snapshot_path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtém informações sobre o estado do catálogo.
+
+        Returns:
+            Dicionário com quantidade de itens, idade, marca de atualização e atualizações feitas
+        """
+        state = self._state
+        return {
+            'templates': len(state.templates) if state else 0,
+            'age_seconds': round(time.time() - state.loaded_at, 1) if state else None,
+            'high_water_mark': state.high_water_mark.isoformat() if state and state.high_water_mark else None,
+            'refreshes': self._refreshes,
+            'refreshing': self._refresh_thread is not None and self._refresh_thread.is_alive(),
+            'last_error': self._last_error,
+        }
+
+    def _set_state(self, state: CatalogState) -> None:
+        """Publica um novo estado e atualiza o índice de busca apenas com o que mudou."""
+        self.search_index.sync(state.templates.values())
+        self._state = state
+
+    def _current(self) -> CatalogState:
+        """
+        Obtém o estado atual, carregando o catálogo na primeira chamada e
+        agendando a atualização em segundo plano quando necessário.
+        """
+        state = self._state
+        if state is None:
+            with self._load_lock:
+                if self._state is None and not self.load_snapshot():
+                    self.refresh()
+            state = self._state
+        if self._needs_refresh(state):
+            self.refresh_in_background()
+        return state
+
+    def _needs_refresh(self, state: CatalogState) -> bool:
+        """
+        Indica se a verificação em segundo plano deve ser iniciada, olhando apenas
+        o estado local: ela acontece no máximo uma vez a cada `check_interval`
+        segundos (inclusive as novas tentativas após falhas). A consulta à origem
+        fica com a thread de segundo plano, sem atrasar a requisição.
+        """
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return False
+        self._last_check = now
+        return True
+
+    def _is_outdated(self, state: CatalogState) -> bool:
+        """
+        Indica se o catálogo deve ser recarregado: o TTL venceu ou a origem tem
+        alterações mais novas que a marca de atualização do catálogo.
+        """
+        if time.time() - state.loaded_at >= self.ttl:
+            return True
+        source_mark = self.source_factory().get_high_water_mark()
+        return source_mark is not None and (state.high_water_mark is None or source_mark > state.high_water_mark)
+
+    def _background_refresh(self) -> None:
+        try:
+            if self._is_outdated(self._state):
+                self.refresh()
+        except Exception as e:
+            # Mantém o catálogo atual; a próxima leitura após o intervalo tenta de novo
+            self._last_error = str(e)
+            self._last_check = time.monotonic()
+            print(f"Erro ao atualizar o catálogo de exercícios: {e}")
+
+    @staticmethod
+    def _build_state(templates: List[ExerciseTemplate], loaded_at: float) -> CatalogState:
+        """
+        Monta os índices do catálogo a partir da lista de modelos de exercícios.
+
+        Args:
+            templates: Modelos de exercícios carregados
+            loaded_at: Momento da carga (timestamp Unix)
+
+        Returns:
+            Novo estado do catálogo
+        """
+        # As entidades podem ser as mesmas dos caches do cliente: são apenas lidas aqui
+        by_id: Dict[str, ExerciseTemplate] = {template.id: template for template in templates}
+
+        ordered = sorted(by_id.values(), key=lambda t: ((t.name or '').casefold(), t.id))
+        muscle_groups: Dict[str, List[str]] = {}
+        for template in ordered:
+            keys = set()
+            for group in template.muscle_groups:
+                keys.update(k.strip().lower() for k in (group.id, group.name) if k)
+            for key in keys:
+                muscle_groups.setdefault(key, []).append(template.id)
+
+        updated = [t.updated_at for t in ordered if t.updated_at is not None]
+        return CatalogState(
+            templates=by_id,
+            ordered_ids=tuple(t.id for t in ordered),
+            custom_ids=tuple(t.id for t in ordered if t.is_custom),
+            builtin_ids=tuple(t.id for t in ordered if not t.is_custom),
+            muscle_group_ids={key: tuple(ids) for key, ids in muscle_groups.items()},
+            loaded_at=loaded_at,
+            high_water_mark=max(updated) if updated else None
+        )
+
+
+def _template_to_dict(template: ExerciseTemplate) -> Dict[str, Any]:
+    return {
+        'id': template.id,
+        'name': template.name,
+        'description': template.description,
+        'is_custom': template.is_custom,
+        'muscle_groups': [{'id': mg.id, 'name': mg.name} for mg in template.muscle_groups],
+        'created_at': template.created_at.isoformat() if template.created_at else None,
+        'updated_at': template.updated_at.isoformat() if template.updated_at else None,
+    }
+
+
+def _template_from_dict(data: Dict[str, Any]) -> ExerciseTemplate:
+    return ExerciseTemplate(
+        id=data['id'],
+        name=data.get('name', ''),
+        description=data.get('description'),
+        is_custom=data.get('is_custom', False),
+        muscle_groups=[MuscleGroup(id=mg.get('id', ''), name=mg.get('name', '')) for mg in data.get('muscle_groups', [])],
+        created_at=parse_timestamp(data.get('created_at')),
+        updated_at=parse_timestamp(data.get('updated_at'))
+    )
+
+
+_catalogs: Dict[Tuple[str, ...], ExerciseTemplateCatalog] = {}
+_catalogs_lock = threading.Lock()
+_owner_pid = os.getpid()
+
+
+def get_exercise_template_catalog(
+    key: Tuple[str, ...],
+    source_factory: Callable[[], ExerciseTemplateRepository]
+) -> ExerciseTemplateCatalog:
+    """
+    Obtém o catálogo compartilhado do processo para uma origem de dados.
+
+    Cada conta (chave de API, URL e origem) tem o seu catálogo e a sua cópia em
+    disco, já que os exercícios personalizados são da conta. Assim como o registro
+    de clientes, o registro é recriado em processos filhos criados com fork.
+
+    Args:
+        key: Identificação da origem (ex.: chave de API, URL e origem de dados)
+        source_factory: Função que cria o repositório de onde o catálogo é carregado
+
+    Returns:
+        O catálogo compartilhado
+    """
+    global _owner_pid
+
+    with _catalogs_lock:
+        if _owner_pid != os.getpid():
+            _catalogs.clear()
+            _owner_pid = os.getpid()
+
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            snapshot_path = None
+            if settings.HEVY_TEMPLATE_CATALOG_DIR:
+                digest = hashlib.sha1('\0'.join(key).encode('utf-8')).hexdigest()[:12]
+                snapshot_path = Path(settings.HEVY_TEMPLATE_CATALOG_DIR) / f"exercise_templates-{digest}.json"
+            catalog = ExerciseTemplateCatalog(source_factory, snapshot_path=snapshot_path)
+            _catalogs[key] = catalog
+        return catalog
+
+
+def clear_exercise_template_catalogs() -> None:
+    """Descarta os catálogos deste processo (as cópias em disco são mantidas)."""
+    with _catalogs_lock:
+        _catalogs.clear()
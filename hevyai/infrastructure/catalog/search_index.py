@@ -0,0 +1,292 @@
+"""
+Índice de busca textual dos modelos de exercícios.
+
+Combina uma árvore de prefixos (trie) das palavras indexadas, para buscas
+incrementais como "inclin" -> "incline", com um índice de trigramas do
+vocabulário, que tolera erros de digitação ("bech" -> "bench"). Nomes e
+descrições são normalizados sem acentos e em minúsculas, e algumas abreviações e
+termos em português comuns na academia são traduzidos para o vocabulário do Hevy.
+"""
+
+import re
+import threading
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from hevyai.domain.entities.exercise_template import ExerciseTemplate
+
+# Termos da consulta expandidos para as palavras usadas nos nomes do Hevy
+QUERY_ALIASES: Dict[str, Tuple[str, ...]] = {
+    'db': ('dumbbell',),
+    'dbs': ('dumbbell',),
+    'halter': ('dumbbell',),
+    'halteres': ('dumbbell',),
+    'bb': ('barbell',),
+    'kb': ('kettlebell',),
+    'ohp': ('overhead', 'press'),
+    'rdl': ('romanian', 'deadlift'),
+    'supino': ('bench', 'press'),
+    'agachamento': ('squat',),
+    'terra': ('deadlift',),
+    'remada': ('row',),
+    'rosca': ('curl',),
+    'martelo': ('hammer',),
+    'puxada': ('pulldown',),
+    'desenvolvimento': ('overhead', 'press'),
+    'elevacao': ('raise',),
+    'inclinado': ('incline',),
+    'declinado': ('decline',),
+    'panturrilha': ('calf',),
+    'abdominal': ('crunch',),
+    'flexao': ('push', 'up'),
+    'cabo': ('cable',),
+    'polia': ('cable',),
+    'maquina': ('machine',),
+}
+
+# Pesos por campo e tipo de correspondência
+NAME_EXACT, NAME_PREFIX, NAME_FUZZY = 3.0, 2.0, 1.2
+DESCRIPTION_EXACT, DESCRIPTION_PREFIX, DESCRIPTION_FUZZY = 1.0, 0.6, 0.3
+# Similaridade mínima de trigramas para uma correspondência aproximada
+MIN_SIMILARITY = 0.45
+
+_NON_WORD = re.compile(r'[^a-z0-9]+')
+
+
+def normalize(text: Optional[str]) -> List[str]:
+    """
+    Separa um texto em palavras sem acentos e em minúsculas.
+
+    Args:
+        text: Texto a normalizar
+
+    Returns:
+        Lista de palavras
+    """
+    if not text:
+        return []
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    ascii_text = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return [word for word in _NON_WORD.split(ascii_text) if word]
+
+
+def trigrams(word: str) -> Set[str]:
+    """Trigramas de uma palavra, com marcadores de início e fim."""
+    padded = f'  {word} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass
+class SearchResult:
+    """Modelo de exercício encontrado e a sua pontuação."""
+    template_id: str
+    score: float
+
+
+class _TrieNode:
+    __slots__ = ('children', 'words')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        # Palavras do vocabulário que passam por este nó
+        self.words: Set[str] = set()
+
+
+class TemplateSearchIndex:
+    """
+    Índice de busca incremental sobre nome e descrição dos modelos de exercícios.
+
+    `sync` compara os modelos recebidos com os já indexados e só reindexa os que
+    foram incluídos, alterados ou removidos. As listas de postagem ficam por
+    palavra do vocabulário; a trie e o índice de trigramas apontam para palavras,
+    o que mantém as buscas proporcionais ao tamanho do vocabulário e não ao
+    número de modelos.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # ID -> (nome, descrição) indexados, para detectar alterações
+        self._documents: Dict[str, Tuple[str, str]] = {}
+        # ID -> (primeira palavra do nome, tamanho do nome, nome), para desempates
+        self._sort_keys: Dict[str, Tuple[str, int, str]] = {}
+        # Palavra -> {ID: campo}, onde campo é 'name' ou 'description'
+        self._postings: Dict[str, Dict[str, str]] = {}
+        self._trie = _TrieNode()
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._trigram_counts: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def sync(self, templates: Iterable[ExerciseTemplate]) -> Dict[str, int]:
+        """
+        Atualiza o índice para refletir exatamente o conjunto de modelos informado.
+
+        Args:
+            templates: Todos os modelos de exercícios atuais
+
+        Returns:
+            Quantidade de modelos incluídos, alterados e removidos
+        """
+        current = {t.id: (t.name or '', t.description or '') for t in templates}
+        with self._lock:
+            removed = [i for i in self._documents if i not in current]
+            changed = [i for i, doc in current.items() if i in self._documents and self._documents[i] != doc]
+            added = [i for i in current if i not in self._documents]
+            for template_id in removed + changed:
+                self._remove(template_id)
+            for template_id in changed + added:
+                self._add(template_id, *current[template_id])
+        return {'added': len(added), 'changed': len(changed), 'removed': len(removed)}
+
+    def search(self, query: str, limit: int = 20) -> List[SearchResult]:
+        """
+        Busca modelos de exercícios cujo nome ou descrição corresponda a todas as palavras da consulta.
+
+        Cada palavra pode corresponder exatamente, como prefixo ou de forma
+        aproximada (trigramas); correspondências no nome valem mais que na
+        descrição. Empates são desfeitos por nomes que começam com a consulta e
+        pelos nomes mais curtos.
+
+        Args:
+            query: Texto digitado pelo usuário
+            limit: Quantidade máxima de resultados
+
+        Returns:
+            Resultados ordenados pela pontuação
+        """
+        terms = self._expand(normalize(query))
+        if not terms:
+            return []
+
+        with self._lock:
+            scores: Optional[Dict[str, float]] = None
+            for term in terms:
+                term_scores = self._score_term(term)
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {i: s + term_scores[i] for i, s in scores.items() if i in term_scores}
+                if not scores:
+                    return []
+
+            first = terms[0]
+            sort_keys = self._sort_keys
+            ranked = sorted(
+                scores.items(),
+                key=lambda item: (
+                    -item[1],
+                    not sort_keys[item[0]][0].startswith(first),
+                    sort_keys[item[0]][1],
+                    sort_keys[item[0]][2]
+                )
+            )
+        return [SearchResult(template_id, round(score, 3)) for template_id, score in ranked[:limit]]
+
+    def _expand(self, words: List[str]) -> List[str]:
+        terms: List[str] = []
+        for word in words:
+            for term in QUERY_ALIASES.get(word, (word,)):
+                if term not in terms:
+                    terms.append(term)
+        return terms
+
+    def _score_term(self, term: str) -> Dict[str, float]:
+        """Melhor pontuação de cada modelo para uma palavra da consulta."""
+        scores: Dict[str, float] = {}
+
+        def offer(word: str, name_weight: float, description_weight: float) -> None:
+            for template_id, field_name in self._postings.get(word, {}).items():
+                score = name_weight if field_name == 'name' else description_weight
+                if score > scores.get(template_id, 0.0):
+                    scores[template_id] = score
+
+        offer(term, NAME_EXACT, DESCRIPTION_EXACT)
+
+        node = self._trie
+        for char in term:
+            node = node.children.get(char)
+            if node is None:
+                break
+        else:
+            for word in node.words:
+                if word != term:
+                    offer(word, NAME_PREFIX, DESCRIPTION_PREFIX)
+
+        if len(term) >= 3:
+            for word, similarity in self._similar_words(term):
+                offer(word, NAME_FUZZY * similarity, DESCRIPTION_FUZZY * similarity)
+        return scores
+
+    def _similar_words(self, term: str) -> List[Tuple[str, float]]:
+        """Palavras do vocabulário com similaridade de trigramas (Dice) acima do mínimo."""
+        term_trigrams = trigrams(term)
+        shared: Dict[str, int] = {}
+        for trigram in term_trigrams:
+            for word in self._trigrams.get(trigram, ()):
+                shared[word] = shared.get(word, 0) + 1
+
+        similar = []
+        for word, count in shared.items():
+            similarity = 2 * count / (len(term_trigrams) + self._trigram_counts[word])
+            if similarity >= MIN_SIMILARITY and word != term:
+                similar.append((word, similarity))
+        return similar
+
+    def _add(self, template_id: str, name: str, description: str) -> None:
+        self._documents[template_id] = (name, description)
+        name_words = normalize(name)
+        self._sort_keys[template_id] = (name_words[0] if name_words else '', len(name), name)
+        fields: Dict[str, str] = {}
+        for word in normalize(description):
+            fields[word] = 'description'
+        for word in name_words:
+            fields[word] = 'name'
+        for word, field_name in fields.items():
+            postings = self._postings.get(word)
+            if postings is None:
+                postings = self._postings[word] = {}
+                self._add_word(word)
+            postings[template_id] = field_name
+
+    def _remove(self, template_id: str) -> None:
+        name, description = self._documents.pop(template_id)
+        del self._sort_keys[template_id]
+        for word in set(normalize(name)) | set(normalize(description)):
+            postings = self._postings.get(word)
+            if postings is None:
+                continue
+            postings.pop(template_id, None)
+            if not postings:
+                del self._postings[word]
+                self._remove_word(word)
+
+    def _add_word(self, word: str) -> None:
+        node = self._trie
+        node.words.add(word)
+        for char in word:
+            node = node.children.setdefault(char, _TrieNode())
+            node.words.add(word)
+        word_trigrams = trigrams(word)
+        self._trigram_counts[word] = len(word_trigrams)
+        for trigram in word_trigrams:
+            self._trigrams.setdefault(trigram, set()).add(word)
+
+    def _remove_word(self, word: str) -> None:
+        node = self._trie
+        node.words.discard(word)
+        for char in word:
+            child = node.children[char]
+            child.words.discard(word)
+            if not child.words:
+                del node.children[char]
+                break
+            node = child
+        del self._trigram_counts[word]
+        for trigram in trigrams(word):
+            words = self._trigrams.get(trigram)
+            if words is not None:
+                words.discard(word)
+                if not words:
+                    del self._trigrams[trigram]
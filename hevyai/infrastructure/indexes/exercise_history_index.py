@@ -0,0 +1,100 @@
+"""
+Índice das sessões de cada modelo de exercício, ordenadas pelo início do treino.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from hevyai.domain.entities.exercise_history import ExerciseSession
+from hevyai.domain.entities.workout import Workout
+from hevyai.domain.repositories.exercise_history_repository import ExerciseHistoryRepository
+from hevyai.domain.services.exercise_history_service import ExerciseHistoryService
+from hevyai.infrastructure.indexes.workout_index_hub import WorkoutIndex
+
+# Chave de ordenação de uma sessão: (início do treino em segundos, ID do treino)
+_Key = Tuple[float, str]
+
+
+@dataclass
+class _TemplateSessions:
+    """Sessões de um modelo de exercício, em listas paralelas ordenadas pela chave."""
+    keys: List[_Key] = field(default_factory=list)
+    sessions: List[ExerciseSession] = field(default_factory=list)
+
+
+class ExerciseHistoryIndex(WorkoutIndex, ExerciseHistoryRepository):
+    """
+    Mantém, por modelo de exercício, as sessões ordenadas pelo início do treino.
+
+    Incluir ou remover um treino posiciona cada sessão dele por busca binária;
+    consultar um período localiza as bordas também por busca binária, sem
+    percorrer as sessões fora dele. Treinos sem data de início não entram.
+    """
+
+    def __init__(self, history_service: Optional[ExerciseHistoryService] = None):
+        super().__init__()
+        self.history_service = history_service or ExerciseHistoryService()
+        self._templates: Dict[str, _TemplateSessions] = {}
+        # ID do treino -> (ID do modelo, chave) das sessões dele, para desfazer a contribuição
+        self._workout_keys: Dict[str, Tuple[Tuple[str, _Key], ...]] = {}
+
+    def clear(self) -> None:
+        with self.lock:
+            self._templates = {}
+            self._workout_keys = {}
+
+    def add_workout(self, workout: Workout) -> None:
+        sessions = self.history_service.summarize_workout(workout)
+
+        with self.lock:
+            entries = []
+            for template_id, session in sessions.items():
+                key = (session.performed_at.timestamp(), workout.id)
+                state = self._templates.get(template_id)
+                if state is None:
+                    state = self._templates[template_id] = _TemplateSessions()
+                position = bisect_left(state.keys, key)
+                state.keys.insert(position, key)
+                state.sessions.insert(position, session)
+                entries.append((template_id, key))
+            self._workout_keys[workout.id] = tuple(entries)
+
+    def remove_workout(self, workout_id: str) -> None:
+        with self.lock:
+            for template_id, key in self._workout_keys.pop(workout_id, ()):
+                state = self._templates.get(template_id)
+                if state is None:
+                    continue
+                position = bisect_left(state.keys, key)
+                if position < len(state.keys) and state.keys[position] == key:
+                    del state.keys[position]
+                    del state.sessions[position]
+                if not state.keys:
+                    del self._templates[template_id]
+
+    def get_sessions(
+        self,
+        exercise_template_id: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[ExerciseSession]:
+        """
+        Obtém as sessões de um modelo de exercício em um período.
+
+        Args:
+            exercise_template_id: ID do modelo de exercício
+            start: Início do período, inclusivo (opcional)
+            end: Fim do período, exclusivo (opcional)
+
+        Returns:
+            As sessões, da mais antiga para a mais recente
+        """
+        with self.lock:
+            state = self._templates.get(exercise_template_id)
+            if state is None:
+                return []
+            first = bisect_left(state.keys, (start.timestamp(), '')) if start else 0
+            last = bisect_left(state.keys, (end.timestamp(), '')) if end else len(state.keys)
+            return state.sessions[first:last]
@@ -0,0 +1,126 @@
+"""
+Criação dos índices de treinos compartilhados pelo processo.
+"""
+
+from typing import List
+
+from django.conf import settings
+from django.utils import timezone
+
+from hevyai.domain.repositories.exercise_history_repository import ExerciseHistoryRepository
+from hevyai.domain.repositories.last_performed_repository import LastPerformedRepository
+from hevyai.domain.repositories.performed_workout_repository import PerformedWorkoutRepository
+from hevyai.domain.repositories.personal_record_repository import PersonalRecordRepository
+from hevyai.domain.repositories.set_history_repository import SetHistoryRepository
+from hevyai.domain.repositories.template_usage_repository import TemplateUsageRepository
+from hevyai.domain.repositories.training_load_repository import TrainingLoadRepository
+from hevyai.infrastructure.indexes.exercise_history_index import ExerciseHistoryIndex
+from hevyai.infrastructure.indexes.last_performed_index import LastPerformedIndex
+from hevyai.infrastructure.indexes.performed_workout_index import PerformedWorkoutIndex
+from hevyai.infrastructure.indexes.personal_record_index import PersonalRecordIndex
+from hevyai.infrastructure.indexes.set_history_index import SetHistoryIndex
+from hevyai.infrastructure.indexes.template_muscle_groups import TemplateMuscleGroups
+from hevyai.infrastructure.indexes.template_usage_index import TemplateUsageIndex
+from hevyai.infrastructure.indexes.training_load_index import TrainingLoadIndex
+from hevyai.infrastructure.indexes.workout_index_hub import WorkoutIndex, WorkoutIndexHub, get_shared_workout_index_hub
+from hevyai.infrastructure.repositories.repository_factory import get_exercise_template_repository, get_workout_repository
+
+
+def build_workout_indexes() -> List[WorkoutIndex]:
+    """
+    Cria os índices mantidos pelo hub de treinos.
+
+    Returns:
+        Lista de índices vazios
+    """
+    muscle_groups = TemplateMuscleGroups(get_exercise_template_repository)
+    return [
+        TemplateUsageIndex(),
+        SetHistoryIndex(),
+        PersonalRecordIndex(),
+        TrainingLoadIndex(muscle_groups.primary, timezone.get_default_timezone()),
+        PerformedWorkoutIndex(),
+        ExerciseHistoryIndex(),
+        LastPerformedIndex(),
+    ]
+
+
+def get_workout_index_hub() -> WorkoutIndexHub:
+    """
+    Obtém o hub de índices de treinos da origem de dados configurada.
+
+    Returns:
+        O hub compartilhado do processo
+    """
+    key = (settings.HEVY_API_KEY or '', settings.HEVY_API_URL, settings.HEVY_DATA_SOURCE)
+    return get_shared_workout_index_hub(key, get_workout_repository, build_workout_indexes)
+
+
+def get_template_usage_repository() -> TemplateUsageRepository:
+    """
+    Obtém o índice de uso de modelos de exercícios, em dia com a origem.
+
+    Returns:
+        O repositório de uso de modelos de exercícios
+    """
+    return get_workout_index_hub().get_index(TemplateUsageIndex)
+
+
+def get_set_history_repository() -> SetHistoryRepository:
+    """
+    Obtém o índice colunar das séries dos treinos, em dia com a origem.
+
+    Returns:
+        O repositório do histórico de séries
+    """
+    return get_workout_index_hub().get_index(SetHistoryIndex)
+
+
+def get_personal_record_repository() -> PersonalRecordRepository:
+    """
+    Obtém o índice de recordes pessoais por modelo de exercício, em dia com a origem.
+
+    Returns:
+        O repositório de recordes pessoais
+    """
+    return get_workout_index_hub().get_index(PersonalRecordIndex)
+
+
+def get_training_load_repository() -> TrainingLoadRepository:
+    """
+    Obtém o índice de carga de treino, em dia com a origem.
+
+    Returns:
+        O repositório de carga de treino
+    """
+    return get_workout_index_hub().get_index(TrainingLoadIndex)
+
+
+def get_performed_workout_repository() -> PerformedWorkoutRepository:
+    """
+    Obtém o índice dos treinos executados usado pela análise de aderência, em dia com a origem.
+
+    Returns:
+        O repositório de treinos executados
+    """
+    return get_workout_index_hub().get_index(PerformedWorkoutIndex)
+
+
+def get_exercise_history_repository() -> ExerciseHistoryRepository:
+    """
+    Obtém o índice das sessões por modelo de exercício, em dia com a origem.
+
+    Returns:
+        O repositório da evolução por modelo de exercício
+    """
+    return get_workout_index_hub().get_index(ExerciseHistoryIndex)
+
+
+def get_last_performed_repository() -> LastPerformedRepository:
+    """
+    Obtém o índice da última execução de cada modelo de exercício, em dia com a origem.
+
+    Returns:
+        O repositório da última execução por modelo de exercício
+    """
+    return get_workout_index_hub().get_index(LastPerformedIndex)
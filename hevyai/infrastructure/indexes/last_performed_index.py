@@ -0,0 +1,110 @@
+"""
+Índice da última execução de cada modelo de exercício.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+
+from hevyai.domain.entities.last_performed import LastPerformed, PreviousSet
+from hevyai.domain.entities.workout import Workout
+from hevyai.domain.repositories.last_performed_repository import LastPerformedRepository
+from hevyai.domain.timestamps import parse_timestamp
+from hevyai.infrastructure.indexes.workout_index_hub import WorkoutIndex
+
+# Chave de ordenação de uma execução: (início do treino em segundos, ID do treino)
+_Key = Tuple[float, str]
+
+
+@dataclass
+class _TemplateExecutions:
+    """Execuções de um modelo de exercício, em listas paralelas ordenadas pela chave."""
+    keys: List[_Key] = field(default_factory=list)
+    executions: List[LastPerformed] = field(default_factory=list)
+
+
+class LastPerformedIndex(WorkoutIndex, LastPerformedRepository):
+    """
+    Mantém, por modelo de exercício, as execuções ordenadas pelo início do treino.
+
+    A última execução é o fim da lista, então a consulta custa uma leitura por
+    modelo. As execuções anteriores continuam guardadas para que, ao excluir ou
+    editar o treino mais recente, a execução anterior assuma sem reler o
+    histórico. Treinos sem data de início não entram.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._templates: Dict[str, _TemplateExecutions] = {}
+        # ID do treino -> (ID do modelo, chave) das execuções dele, para desfazer a contribuição
+        self._workout_keys: Dict[str, Tuple[Tuple[str, _Key], ...]] = {}
+
+    def clear(self) -> None:
+        with self.lock:
+            self._templates = {}
+            self._workout_keys = {}
+
+    def add_workout(self, workout: Workout) -> None:
+        performed_at = parse_timestamp(workout.start_time)
+        if performed_at is None:
+            return
+
+        executions: Dict[str, LastPerformed] = {}
+        for exercise in workout.exercises:
+            if not exercise.exercise_template_id:
+                continue
+            sets = [
+                PreviousSet(s.weight, s.reps, s.duration, s.distance, s.rpe)
+                for s in exercise.sets if s.completed
+            ]
+            if not sets:
+                continue
+            execution = executions.get(exercise.exercise_template_id)
+            if execution is None:
+                executions[exercise.exercise_template_id] = LastPerformed(
+                    exercise.exercise_template_id, workout.id, performed_at, sets
+                )
+            else:
+                execution.sets.extend(sets)
+
+        key = (performed_at.timestamp(), workout.id)
+        with self.lock:
+            for template_id, execution in executions.items():
+                state = self._templates.get(template_id)
+                if state is None:
+                    state = self._templates[template_id] = _TemplateExecutions()
+                position = bisect_left(state.keys, key)
+                state.keys.insert(position, key)
+                state.executions.insert(position, execution)
+            self._workout_keys[workout.id] = tuple((template_id, key) for template_id in executions)
+
+    def remove_workout(self, workout_id: str) -> None:
+        with self.lock:
+            for template_id, key in self._workout_keys.pop(workout_id, ()):
+                state = self._templates.get(template_id)
+                if state is None:
+                    continue
+                position = bisect_left(state.keys, key)
+                if position < len(state.keys) and state.keys[position] == key:
+                    del state.keys[position]
+                    del state.executions[position]
+                if not state.keys:
+                    del self._templates[template_id]
+
+    def get_last_performed(self, template_ids: Iterable[str]) -> Dict[str, LastPerformed]:
+        """
+        Obtém a última execução de cada modelo de exercício.
+
+        Args:
+            template_ids: IDs dos modelos de exercícios
+
+        Returns:
+            Dicionário indexado pelo ID do modelo, apenas com os modelos que já
+            tiveram alguma série concluída
+        """
+        with self.lock:
+            return {
+                template_id: self._templates[template_id].executions[-1]
+                for template_id in template_ids
+                if template_id in self._templates
+            }
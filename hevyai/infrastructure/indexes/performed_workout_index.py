@@ -0,0 +1,71 @@
+"""
+Índice dos treinos executados, na forma compacta usada pela análise de aderência.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from hevyai.domain.entities.routine_adherence import PerformedWorkout
+from hevyai.domain.entities.workout import Workout
+from hevyai.domain.repositories.performed_workout_repository import PerformedWorkoutRepository
+from hevyai.infrastructure.indexes.workout_index_hub import WorkoutIndex
+
+
+class PerformedWorkoutIndex(WorkoutIndex, PerformedWorkoutRepository):
+    """
+    Mantém um PerformedWorkout por treino, com a lista ordenada pelo início
+    refeita apenas na primeira leitura depois de uma alteração.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._workouts: Dict[str, PerformedWorkout] = {}
+        self._ordered: Optional[List[PerformedWorkout]] = None
+
+    def clear(self) -> None:
+        with self.lock:
+            self._workouts = {}
+            self._ordered = None
+
+    def add_workout(self, workout: Workout) -> None:
+        performed = PerformedWorkout.from_workout(workout)
+        with self.lock:
+            self._workouts[workout.id] = performed
+            self._ordered = None
+
+    def remove_workout(self, workout_id: str) -> None:
+        with self.lock:
+            if self._workouts.pop(workout_id, None) is not None:
+                self._ordered = None
+
+    def get_performed_workouts(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[PerformedWorkout]:
+        """
+        Obtém os treinos iniciados em um período.
+
+        Args:
+            start: Início do período, inclusivo (opcional)
+            end: Fim do período, exclusivo (opcional)
+
+        Returns:
+            Os treinos, do mais antigo para o mais recente; sem período, os
+            treinos sem data de início também são incluídos, no fim
+        """
+        with self.lock:
+            if self._ordered is None:
+                self._ordered = sorted(
+                    self._workouts.values(),
+                    key=lambda w: (w.start_time is None, w.start_time.timestamp() if w.start_time else 0.0)
+                )
+            ordered = self._ordered
+        if start is None and end is None:
+            return list(ordered)
+        return [
+            workout for workout in ordered
+            if workout.start_time is not None
+            and (start is None or workout.start_time >= start)
+            and (end is None or workout.start_time < end)
+        ]
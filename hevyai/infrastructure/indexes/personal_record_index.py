@@ -0,0 +1,95 @@
+"""
+Índice incremental dos recordes pessoais por modelo de exercício.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from hevyai.domain.entities.personal_record import PersonalRecords, RecordSet
+from hevyai.domain.entities.workout import Workout
+from hevyai.domain.repositories.personal_record_repository import PersonalRecordRepository
+from hevyai.domain.services.personal_record_service import PersonalRecordService, WorkoutRecords
+from hevyai.infrastructure.indexes.workout_index_hub import WorkoutIndex
+
+
+@dataclass
+class _TemplateRecords:
+    """Estado de um modelo de exercício: recordes atuais e resumos por treino."""
+    bests: Dict[str, RecordSet] = field(default_factory=dict)
+    rep_maxes: Dict[float, RecordSet] = field(default_factory=dict)
+    # ID do treino -> melhores séries do modelo naquele treino
+    workouts: Dict[str, WorkoutRecords] = field(default_factory=dict)
+
+    def holds_record(self, workout_id: str) -> bool:
+        """Indica se algum recorde atual pertence ao treino."""
+        return any(record.workout_id == workout_id for record in self.bests.values()) or any(
+            record.workout_id == workout_id for record in self.rep_maxes.values()
+        )
+
+
+class PersonalRecordIndex(WorkoutIndex, PersonalRecordRepository):
+    """
+    Mantém os recordes pessoais de cada modelo de exercício.
+
+    Incluir um treino custa o número de séries dele: o resumo do treino é
+    comparado com os recordes atuais. Ao remover um treino (exclusão ou edição,
+    que o hub aplica como remoção seguida de inclusão), os recordes de um modelo
+    só são recalculados, a partir dos resumos dos treinos restantes desse
+    modelo, se o treino removido detinha algum deles.
+    """
+
+    def __init__(self, record_service: Optional[PersonalRecordService] = None):
+        super().__init__()
+        self.record_service = record_service or PersonalRecordService()
+        self._templates: Dict[str, _TemplateRecords] = {}
+        # ID do treino -> IDs dos modelos com resumo nele, para desfazer a contribuição
+        self._workout_templates: Dict[str, Tuple[str, ...]] = {}
+
+    def clear(self) -> None:
+        with self.lock:
+            self._templates = {}
+            self._workout_templates = {}
+
+    def add_workout(self, workout: Workout) -> None:
+        summaries = self.record_service.summarize_workout(workout)
+
+        with self.lock:
+            for template_id, summary in summaries.items():
+                state = self._templates.get(template_id)
+                if state is None:
+                    state = self._templates[template_id] = _TemplateRecords()
+                state.workouts[workout.id] = summary
+                self.record_service.merge_workout(state.bests, state.rep_maxes, summary)
+            self._workout_templates[workout.id] = tuple(summaries)
+
+    def remove_workout(self, workout_id: str) -> None:
+        with self.lock:
+            for template_id in self._workout_templates.pop(workout_id, ()):
+                state = self._templates.get(template_id)
+                if state is None or state.workouts.pop(workout_id, None) is None:
+                    continue
+                if not state.workouts:
+                    del self._templates[template_id]
+                elif state.holds_record(workout_id):
+                    state.bests = {}
+                    state.rep_maxes = {}
+                    for summary in state.workouts.values():
+                        self.record_service.merge_workout(state.bests, state.rep_maxes, summary)
+
+    def get_records(self, exercise_template_id: str) -> PersonalRecords:
+        """
+        Obtém os recordes pessoais de um modelo de exercício.
+
+        Args:
+            exercise_template_id: ID do modelo de exercício
+
+        Returns:
+            Os recordes do modelo, com a evolução do 1RM estimado por treino
+        """
+        with self.lock:
+            state = self._templates.get(exercise_template_id)
+            if state is None:
+                return PersonalRecords(exercise_template_id=exercise_template_id)
+            return self.record_service.build_records(
+                exercise_template_id, state.bests, state.rep_maxes, list(state.workouts.values())
+            )
@@ -0,0 +1,69 @@
+"""
+Índice colunar com as séries de todo o histórico de treinos.
+"""
+
+from typing import Dict, Optional, Set
+
+from hevyai.domain.entities.set_batch import SetBatch
+from hevyai.domain.entities.workout import Workout
+from hevyai.domain.repositories.set_history_repository import SetHistoryRepository
+from hevyai.infrastructure.indexes.workout_index_hub import WorkoutIndex
+
+
+class SetHistoryIndex(WorkoutIndex, SetHistoryRepository):
+    """
+    Mantém as séries de todos os treinos em um SetBatch.
+
+    Treinos novos são acrescentados ao fim das colunas. Treinos removidos (ou
+    substituídos por uma versão atualizada) são apenas marcados e saem das
+    colunas na próxima leitura, em uma única compactação para todo o lote de
+    alterações. As leituras recebem uma cópia congelada do lote, reaproveitada
+    até a próxima alteração.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._batch = SetBatch()
+        # ID do treino -> posição dele em `workout_ids` do lote
+        self._workout_codes: Dict[str, int] = {}
+        # Posições dos treinos removidos, ainda presentes nas colunas
+        self._removed: Set[int] = set()
+        self._snapshot: Optional[SetBatch] = None
+
+    def clear(self) -> None:
+        with self.lock:
+            self._batch = SetBatch()
+            self._workout_codes = {}
+            self._removed = set()
+            self._snapshot = None
+
+    def add_workout(self, workout: Workout) -> None:
+        with self.lock:
+            self._workout_codes[workout.id] = len(self._batch.workout_ids)
+            self._batch.append_workout(workout)
+            self._snapshot = None
+
+    def remove_workout(self, workout_id: str) -> None:
+        with self.lock:
+            code = self._workout_codes.pop(workout_id, None)
+            if code is not None:
+                self._removed.add(code)
+                self._snapshot = None
+
+    def get_set_batch(self) -> SetBatch:
+        """
+        Obtém as séries de todos os treinos.
+
+        Returns:
+            Cópia congelada do lote, sem os treinos removidos
+        """
+        with self.lock:
+            if self._snapshot is None:
+                if self._removed:
+                    self._batch = self._batch.without_workouts(self._removed)
+                    self._workout_codes = {
+                        workout_id: code for code, workout_id in enumerate(self._batch.workout_ids)
+                    }
+                    self._removed = set()
+                self._snapshot = self._batch.copy()
+            return self._snapshot
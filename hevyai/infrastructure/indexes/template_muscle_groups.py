@@ -0,0 +1,70 @@
+"""
+Consulta, com cache, dos grupos musculares dos modelos de exercícios.
+"""
+
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+from hevyai.domain.repositories.exercise_template_repository import ExerciseTemplateRepository
+
+
+class TemplateMuscleGroups:
+    """
+    Obtém os grupos musculares de cada modelo de exercício, uma vez por modelo.
+
+    Usada pelos índices de treinos para atribuir séries aos grupos musculares;
+    com o catálogo de modelos ativo, as consultas são feitas em memória. Falhas
+    ao consultar um modelo não são guardadas, para que a próxima consulta tente
+    de novo.
+    """
+
+    def __init__(self, repository_factory: Callable[[], ExerciseTemplateRepository]):
+        """
+        Inicializa a consulta.
+
+        Args:
+            repository_factory: Função que cria o repositório de modelos de exercícios
+        """
+        self.repository_factory = repository_factory
+        self._repository: Optional[ExerciseTemplateRepository] = None
+        self._groups: Dict[str, Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    def groups(self, template_id: str) -> Tuple[str, ...]:
+        """
+        Obtém os IDs dos grupos musculares de um modelo, o principal primeiro.
+
+        Args:
+            template_id: ID do modelo de exercício
+
+        Returns:
+            IDs dos grupos musculares em minúsculas (vazio se o modelo não existir)
+        """
+        groups = self._groups.get(template_id)
+        if groups is not None:
+            return groups
+
+        with self._lock:
+            try:
+                if self._repository is None:
+                    self._repository = self.repository_factory()
+                template = self._repository.get_by_id(template_id)
+            except Exception as e:
+                print(f"Erro ao obter os grupos musculares do modelo {template_id}: {e}")
+                return ()
+            groups = tuple((mg.id or mg.name).lower() for mg in template.muscle_groups) if template else ()
+            self._groups[template_id] = groups
+            return groups
+
+    def primary(self, template_id: str) -> Optional[str]:
+        """
+        Obtém o ID do grupo muscular principal (o primeiro) de um modelo.
+
+        Args:
+            template_id: ID do modelo de exercício
+
+        Returns:
+            O ID em minúsculas ou None se o modelo não tiver grupos musculares
+        """
+        groups = self.groups(template_id)
+        return groups[0] if groups else None
@@ -0,0 +1,150 @@
+"""
+Índice invertido de modelos de exercícios para os treinos em que foram feitos.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from hevyai.domain.entities.template_usage import TemplateUsage
+from hevyai.domain.entities.workout import Workout
+from hevyai.domain.repositories.template_usage_repository import TemplateUsageRepository
+from hevyai.domain.timestamps import parse_timestamp
+from hevyai.infrastructure.indexes.workout_index_hub import WorkoutIndex
+
+
+class TemplatePosting(NamedTuple):
+    """Totais de um modelo de exercício em um treino."""
+    start_time: Optional[datetime]
+    sets: int
+    reps: int
+    volume: float
+    duration: int
+    distance: float
+
+
+class TemplateUsageIndex(WorkoutIndex, TemplateUsageRepository):
+    """
+    Índice de modelo de exercício -> treinos, com os totais das séries de cada treino.
+
+    Junto com o índice de grupos musculares do catálogo de modelos, responde
+    "o que treinei para este grupo muscular" consultando apenas as listas dos
+    modelos desse grupo.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # ID do modelo -> ID do treino -> totais
+        self._postings: Dict[str, Dict[str, TemplatePosting]] = {}
+        # ID do treino -> IDs dos modelos feitos nele, para desfazer a contribuição
+        self._workout_templates: Dict[str, Tuple[str, ...]] = {}
+
+    def clear(self) -> None:
+        with self.lock:
+            self._postings = {}
+            self._workout_templates = {}
+
+    def add_workout(self, workout: Workout) -> None:
+        start_time = parse_timestamp(workout.start_time)
+
+        totals: Dict[str, List[float]] = {}
+        for exercise in workout.exercises:
+            if not exercise.exercise_template_id:
+                continue
+            entry = totals.setdefault(exercise.exercise_template_id, [0, 0, 0.0, 0, 0.0])
+            for set_item in exercise.sets:
+                if not set_item.completed:
+                    continue
+                entry[0] += 1
+                entry[1] += set_item.reps or 0
+                entry[2] += (set_item.weight or 0.0) * (set_item.reps or 0)
+                entry[3] += set_item.duration or 0
+                entry[4] += set_item.distance or 0.0
+
+        with self.lock:
+            for template_id, (sets, reps, volume, duration, distance) in totals.items():
+                self._postings.setdefault(template_id, {})[workout.id] = TemplatePosting(
+                    start_time, int(sets), int(reps), volume, int(duration), distance
+                )
+            self._workout_templates[workout.id] = tuple(totals)
+
+    def remove_workout(self, workout_id: str) -> None:
+        with self.lock:
+            for template_id in self._workout_templates.pop(workout_id, ()):
+                postings = self._postings.get(template_id)
+                if postings is None:
+                    continue
+                postings.pop(workout_id, None)
+                if not postings:
+                    del self._postings[template_id]
+
+    def get_usage(
+        self,
+        template_ids: Iterable[str],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Dict[str, TemplateUsage]:
+        """
+        Obtém o uso de cada modelo de exercício em um período.
+
+        Args:
+            template_ids: IDs dos modelos de exercícios
+            start: Início do período, inclusivo (opcional)
+            end: Fim do período, exclusivo (opcional)
+
+        Returns:
+            Dicionário indexado pelo ID do modelo, apenas com os modelos treinados no período
+        """
+        usage: Dict[str, TemplateUsage] = {}
+        with self.lock:
+            for template_id in template_ids:
+                for posting in self._postings.get(template_id, {}).values():
+                    if not _in_range(posting.start_time, start, end):
+                        continue
+                    item = usage.get(template_id)
+                    if item is None:
+                        item = usage[template_id] = TemplateUsage(exercise_template_id=template_id)
+                    item.workouts += 1
+                    item.sets += posting.sets
+                    item.reps += posting.reps
+                    item.volume += posting.volume
+                    item.duration += posting.duration
+                    item.distance += posting.distance
+                    if posting.start_time and (item.last_performed is None or posting.start_time > item.last_performed):
+                        item.last_performed = posting.start_time
+        return usage
+
+    def get_workouts(
+        self,
+        template_ids: Iterable[str],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[Tuple[str, Optional[datetime]]]:
+        """
+        Obtém os treinos em que algum dos modelos de exercícios foi feito.
+
+        Args:
+            template_ids: IDs dos modelos de exercícios
+            start: Início do período, inclusivo (opcional)
+            end: Fim do período, exclusivo (opcional)
+
+        Returns:
+            Lista de tuplas (ID do treino, início do treino), do mais recente para o mais antigo
+        """
+        workouts: Dict[str, Optional[datetime]] = {}
+        with self.lock:
+            for template_id in template_ids:
+                for workout_id, posting in self._postings.get(template_id, {}).items():
+                    if _in_range(posting.start_time, start, end):
+                        workouts[workout_id] = posting.start_time
+        return sorted(
+            workouts.items(),
+            key=lambda item: (item[1] is not None, item[1] or datetime.min, item[0]),
+            reverse=True
+        )
+
+
+def _in_range(value: Optional[datetime], start: Optional[datetime], end: Optional[datetime]) -> bool:
+    """Indica se uma data está em [start, end); sem data, só entra quando não há período."""
+    if value is None:
+        return start is None and end is None
+    return (start is None or value >= start) and (end is None or value < end)
@@ -0,0 +1,109 @@
+"""
+Índice das séries diárias de carga de treino (aguda, crônica e ACWR).
+"""
+
+from datetime import date, timezone, tzinfo
+from typing import Callable, Dict, List, Optional, Tuple
+
+from hevyai.domain.entities.training_load import TrainingLoadSeries
+from hevyai.domain.entities.workout import Workout
+from hevyai.domain.repositories.training_load_repository import TrainingLoadRepository
+from hevyai.domain.services.training_load_service import DailyLoadSeries, TrainingLoadService
+from hevyai.infrastructure.indexes.workout_index_hub import WorkoutIndex
+
+
+class TrainingLoadIndex(WorkoutIndex, TrainingLoadRepository):
+    """
+    Mantém uma série diária de carga por métrica e escopo (todos os treinos e
+    cada grupo muscular principal).
+
+    Cada treino soma a sua carga ao dia em que foi feito e guarda o que somou,
+    para que a remoção subtraia exatamente a mesma carga. As médias de cada
+    série são recalculadas na leitura, só a partir do dia mais antigo alterado;
+    a primeira leitura depois da carga do histórico faz uma passada vetorizada.
+    """
+
+    def __init__(
+        self,
+        primary_muscle_group: Callable[[str], Optional[str]],
+        tz: tzinfo = timezone.utc,
+        load_service: Optional[TrainingLoadService] = None
+    ):
+        """
+        Inicializa o índice.
+
+        Args:
+            primary_muscle_group: Função que obtém o grupo muscular principal de um modelo
+            tz: Fuso horário que define o dia de cada treino (padrão: UTC)
+            load_service: Serviço de carga de treino (padrão: um novo TrainingLoadService)
+        """
+        super().__init__()
+        self.primary_muscle_group = primary_muscle_group
+        self.tz = tz
+        self.load_service = load_service or TrainingLoadService()
+        self._series: Dict[Tuple[str, str], DailyLoadSeries] = {}
+        # ID do treino -> (dia, cargas somadas por métrica e escopo)
+        self._workout_loads: Dict[str, Tuple[date, Dict[Tuple[str, str], float]]] = {}
+
+    def clear(self) -> None:
+        with self.lock:
+            self._series = {}
+            self._workout_loads = {}
+
+    def add_workout(self, workout: Workout) -> None:
+        result = self.load_service.workout_loads(workout, self.primary_muscle_group, self.tz)
+        if result is None:
+            return
+        day, loads = result
+
+        with self.lock:
+            for key, amount in loads.items():
+                series = self._series.get(key)
+                if series is None:
+                    series = self._series[key] = DailyLoadSeries()
+                series.add(day, amount)
+            self._workout_loads[workout.id] = result
+
+    def remove_workout(self, workout_id: str) -> None:
+        with self.lock:
+            day, loads = self._workout_loads.pop(workout_id, (None, {}))
+            for key, amount in loads.items():
+                self._series[key].add(day, -amount)
+
+    def get_scopes(self, metric: str) -> List[str]:
+        """
+        Lista os escopos com carga registrada em uma métrica.
+
+        Args:
+            metric: 'volume' ou 'srpe'
+
+        Returns:
+            Escopos em ordem alfabética
+        """
+        with self.lock:
+            return sorted(scope for series_metric, scope in self._series if series_metric == metric)
+
+    def get_series(self, metric: str, scope: str, start: date, end: date) -> TrainingLoadSeries:
+        """
+        Obtém a série diária de carga de um escopo em um intervalo de dias.
+
+        Args:
+            metric: 'volume' ou 'srpe'
+            scope: 'all' ou o ID de um grupo muscular
+            start: Primeiro dia, inclusivo
+            end: Último dia, inclusivo
+
+        Returns:
+            A série com um item por dia do intervalo
+        """
+        with self.lock:
+            series = self._series.get((metric, scope.lower())) or DailyLoadSeries()
+            return TrainingLoadSeries(
+                metric=metric,
+                scope=scope,
+                acute_days=series.acute_days,
+                chronic_days=series.chronic_days,
+                start=start,
+                end=end,
+                days=series.window(start, end)
+            )
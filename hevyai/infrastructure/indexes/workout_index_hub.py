@@ -0,0 +1,299 @@
+"""
+Índices em memória derivados do histórico de treinos.
+
+O WorkoutIndexHub lê o histórico completo uma vez por processo e, a partir daí,
+aplica apenas as alterações informadas pelo repositório (eventos de treinos da
+API do Hevy ou linhas gravadas na cópia local) a todos os índices registrados.
+Cada índice é atualizado em tempo proporcional ao treino alterado, sem reler o
+histórico.
+"""
+
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+from django.conf import settings
+
+from hevyai.domain.entities.workout import Workout, WorkoutChanges
+from hevyai.domain.repositories.workout_repository import WorkoutRepository
+
+# Margem subtraída do cursor inicial, para cobrir diferenças de relógio com a origem;
+# reaplicar um treino já indexado não altera os índices
+CURSOR_SAFETY_MARGIN = timedelta(minutes=5)
+
+IndexType = TypeVar('IndexType', bound='WorkoutIndex')
+
+
+class WorkoutIndex(ABC):
+    """
+    Índice mantido a partir dos treinos entregues pelo WorkoutIndexHub.
+
+    As implementações guardam, para cada treino, o que ele contribuiu para o
+    índice, de modo que `remove_workout` desfaz exatamente essa contribuição.
+    Leituras e escritas usam `self.lock`, compartilhado com o hub.
+    """
+
+    lock: threading.RLock
+
+    def __init__(self):
+        self.lock = threading.RLock()
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove todo o conteúdo do índice."""
+
+    @abstractmethod
+    def add_workout(self, workout: Workout) -> None:
+        """
+        Inclui a contribuição de um treino no índice.
+
+        Args:
+            workout: Treino a incluir (nunca presente no índice neste momento)
+        """
+
+    @abstractmethod
+    def remove_workout(self, workout_id: str) -> None:
+        """
+        Desfaz a contribuição de um treino; ignora treinos que não estão no índice.
+
+        Args:
+            workout_id: ID do treino
+        """
+
+
+class WorkoutIndexHub:
+    """
+    Mantém um conjunto de índices de treinos em dia com a origem dos dados.
+
+    A primeira chamada a `ensure_current` carrega o histórico completo; as
+    seguintes, no máximo a cada `check_interval` segundos, aplicam as alterações
+    desde o último cursor. Se a origem não fornecer alterações incrementais, o
+    histórico é recarregado.
+
+    As alterações são buscadas na origem fora de `self.lock`, por uma thread de
+    cada vez; o lock só é mantido enquanto elas são aplicadas, então as leituras
+    continuam usando o estado atual durante a busca.
+    """
+
+    def __init__(
+        self,
+        source_factory: Callable[[], WorkoutRepository],
+        indexes: List[WorkoutIndex],
+        check_interval: Optional[float] = None
+    ):
+        """
+        Inicializa o hub com os índices que ele mantém.
+
+        Args:
+            source_factory: Função que cria o repositório de treinos de origem
+            indexes: Índices a manter
+            check_interval: Segundos entre as consultas de alterações
+                            (padrão: settings.HEVY_WORKOUT_INDEX_CHECK_INTERVAL)
+        """
+        self.source_factory = source_factory
+        self.indexes = list(indexes)
+        self.check_interval = (
+            settings.HEVY_WORKOUT_INDEX_CHECK_INTERVAL if check_interval is None else check_interval
+        )
+        self.lock = threading.RLock()
+        for index in self.indexes:
+            index.lock = self.lock
+        # Mantido durante a busca de alterações na origem, sem bloquear as leituras
+        self._update_lock = threading.Lock()
+
+        self.cursor: Optional[str] = None
+        self.workout_count = 0
+        self._workout_ids: set = set()
+        self._last_check = 0.0
+        self._stats = {'full_loads': 0, 'updates': 0, 'workouts_applied': 0, 'deletions_applied': 0}
+        self._last_error: Optional[str] = None
+
+    def get_index(self, index_type: Type[IndexType]) -> IndexType:
+        """
+        Obtém um índice registrado pelo tipo, já em dia com a origem.
+
+        Args:
+            index_type: Classe do índice
+
+        Returns:
+            O índice registrado
+
+        Raises:
+            KeyError: Se nenhum índice desse tipo estiver registrado
+        """
+        self.ensure_current()
+        for index in self.indexes:
+            if isinstance(index, index_type):
+                return index
+        raise KeyError(index_type.__name__)
+
+    def ensure_current(self) -> None:
+        """
+        Carrega o histórico na primeira chamada e depois aplica as alterações pendentes.
+
+        Falhas ao buscar alterações mantêm os índices como estão; a próxima
+        verificação ocorre após `check_interval` segundos.
+        """
+        if self.cursor is None:
+            with self.lock:
+                if self.cursor is None:
+                    self.load()
+            return
+
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return
+        # Se outra thread já está buscando as alterações, usa o estado atual
+        if not self._update_lock.acquire(blocking=False):
+            return
+        try:
+            if now - self._last_check < self.check_interval:
+                return
+            self._last_check = now
+            try:
+                self._update()
+            except Exception as e:
+                self._last_error = str(e)
+                print(f"Erro ao atualizar os índices de treinos: {e}")
+        finally:
+            self._update_lock.release()
+
+    def load(self) -> int:
+        """
+        Recarrega todos os índices a partir do histórico completo.
+
+        O histórico é lido antes de `self.lock` ser obtido; as leituras só esperam
+        a troca do conteúdo dos índices.
+
+        Returns:
+            Quantidade de treinos carregados
+        """
+        started = datetime.now(dt_timezone.utc) - CURSOR_SAFETY_MARGIN
+        workouts = list(self.source_factory().iter_all(prefetch=settings.HEVY_API_MAX_CONCURRENCY))
+        with self.lock:
+            for index in self.indexes:
+                index.clear()
+            self._workout_ids = set()
+            for workout in workouts:
+                self._apply_workout(workout)
+
+            self.cursor = started.isoformat()
+            self.workout_count = len(self._workout_ids)
+            self._last_check = time.monotonic()
+            self._stats['full_loads'] += 1
+            return self.workout_count
+
+    def update(self) -> Tuple[int, int]:
+        """
+        Aplica as alterações da origem desde o último cursor.
+
+        Returns:
+            Tupla (treinos atualizados, treinos excluídos)
+        """
+        with self._update_lock:
+            return self._update()
+
+    def _update(self) -> Tuple[int, int]:
+        """Busca as alterações fora de `self.lock`; exige `self._update_lock`."""
+        try:
+            changes = self.source_factory().get_changes_since(self.cursor)
+        except NotImplementedError:
+            self.load()
+            return self.workout_count, 0
+        self.apply_changes(changes)
+        return len(changes.updated), len(changes.deleted_ids)
+
+    def apply_changes(self, changes: WorkoutChanges) -> None:
+        """
+        Aplica um lote de alterações a todos os índices e avança o cursor.
+
+        Args:
+            changes: Alterações de treinos
+        """
+        with self.lock:
+            for workout_id in changes.deleted_ids:
+                if workout_id in self._workout_ids:
+                    for index in self.indexes:
+                        index.remove_workout(workout_id)
+                    self._workout_ids.discard(workout_id)
+            for workout in changes.updated:
+                self._apply_workout(workout)
+
+            if changes.cursor:
+                self.cursor = changes.cursor
+            self.workout_count = len(self._workout_ids)
+            self._stats['updates'] += 1
+            self._stats['workouts_applied'] += len(changes.updated)
+            self._stats['deletions_applied'] += len(changes.deleted_ids)
+            self._last_error = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtém informações sobre o estado do hub.
+
+        Returns:
+            Dicionário com cursor, quantidade de treinos, índices e contadores de atualização
+        """
+        return {
+            'cursor': self.cursor,
+            'workouts': self.workout_count,
+            'indexes': [type(index).__name__ for index in self.indexes],
+            'last_error': self._last_error,
+            'updating': self._update_lock.locked(),
+            **self._stats,
+        }
+
+    def _apply_workout(self, workout: Workout) -> None:
+        if workout.id in self._workout_ids:
+            for index in self.indexes:
+                index.remove_workout(workout.id)
+        for index in self.indexes:
+            index.add_workout(workout)
+        self._workout_ids.add(workout.id)
+
+
+_hubs: Dict[Tuple[str, ...], WorkoutIndexHub] = {}
+_hubs_lock = threading.Lock()
+_owner_pid = os.getpid()
+
+
+def get_shared_workout_index_hub(
+    key: Tuple[str, ...],
+    source_factory: Callable[[], WorkoutRepository],
+    index_factory: Callable[[], List[WorkoutIndex]]
+) -> WorkoutIndexHub:
+    """
+    Obtém o hub de índices compartilhado do processo para uma origem de dados.
+
+    Assim como o registro de clientes, o registro é recriado em processos filhos
+    criados com fork.
+
+    Args:
+        key: Identificação da origem (ex.: chave de API, URL e origem de dados)
+        source_factory: Função que cria o repositório de treinos de origem
+        index_factory: Função que cria os índices mantidos pelo hub
+
+    Returns:
+        O hub compartilhado, ainda não carregado se for novo
+    """
+    global _owner_pid
+
+    with _hubs_lock:
+        if _owner_pid != os.getpid():
+            _hubs.clear()
+            _owner_pid = os.getpid()
+
+        hub = _hubs.get(key)
+        if hub is None:
+            hub = WorkoutIndexHub(source_factory, index_factory())
+            _hubs[key] = hub
+        return hub
+
+
+def clear_workout_index_hubs() -> None:
+    """Descarta os hubs de índices deste processo."""
+    with _hubs_lock:
+        _hubs.clear()
@@ -0,0 +1,75 @@
+"""
+Implementação assíncrona do repositório de modelos de exercícios usando a API do Hevy.
+"""
+
+from typing import List, Optional
+
+from hevyai.domain.entities.exercise_template import ExerciseTemplate
+from hevyai.infrastructure.api.clients.async_hevy_client import AsyncHevyApiClient
+from hevyai.infrastructure.repositories.hevy_exercise_template_repository import HevyExerciseTemplateRepository
+
+
+class AsyncHevyExerciseTemplateRepository:
+    """
+    Repositório assíncrono de modelos de exercícios usando a API do Hevy.
+
+    Oferece as mesmas operações de leitura do HevyExerciseTemplateRepository, além
+    de `get_all_pages`, que carrega o catálogo completo buscando as páginas em paralelo.
+    """
+
+    # Reutiliza o mapeamento da implementação síncrona
+    _map_template_from_api = HevyExerciseTemplateRepository._map_template_from_api
+
+    def __init__(self, api_client: Optional[AsyncHevyApiClient] = None):
+        """
+        Inicializa o repositório com um cliente assíncrono da API do Hevy.
+
+        Args:
+            api_client: Cliente assíncrono da API do Hevy (opcional). Se não for
+                        fornecido, um novo cliente será criado.
+        """
+        self.api_client = api_client or AsyncHevyApiClient()
+
+    async def get_all(self, page: int = 1, per_page: int = 10) -> List[ExerciseTemplate]:
+        """
+        Obtém uma lista paginada de modelos de exercícios da API do Hevy.
+
+        Args:
+            page: Número da página (padrão: 1)
+            per_page: Quantidade de itens por página (padrão: 10)
+
+        Returns:
+            Uma lista de modelos de exercícios
+        """
+        response = await self.api_client.get_exercise_templates(page, per_page)
+        return [
+            self._map_template_from_api(data)
+            for data in response.get('exercise_templates', [])
+        ]
+
+    async def get_all_pages(self) -> List[ExerciseTemplate]:
+        """
+        Obtém todos os modelos de exercícios, buscando as páginas em paralelo.
+
+        Returns:
+            Uma lista com todos os modelos de exercícios
+        """
+        templates_data = await self.api_client.get_all_exercise_templates()
+        return [self._map_template_from_api(data) for data in templates_data]
+
+    async def get_by_id(self, template_id: str) -> Optional[ExerciseTemplate]:
+        """
+        Obtém um modelo de exercício pelo seu ID da API do Hevy.
+
+        Args:
+            template_id: ID do modelo de exercício
+
+        Returns:
+            O modelo de exercício encontrado ou None se não existir
+        """
+        try:
+            response = await self.api_client.get_exercise_template(template_id)
+            return self._map_template_from_api(response)
+        except Exception as e:
+            print(f"Erro ao buscar modelo de exercício por ID: {e}")
+            return None
@@ -0,0 +1,91 @@
+"""
+Implementação assíncrona do repositório de rotinas usando a API do Hevy.
+"""
+
+from typing import List, Optional
+
+from hevyai.domain.entities.routine import Routine
+from hevyai.infrastructure.api.clients.async_hevy_client import AsyncHevyApiClient
+from hevyai.infrastructure.repositories.hevy_routine_repository import HevyRoutineRepository
+
+
+class AsyncHevyRoutineRepository:
+    """
+    Repositório assíncrono de rotinas usando a API do Hevy.
+
+    Oferece as mesmas operações de leitura do HevyRoutineRepository, além de
+    `get_all_pages`, que carrega todas as rotinas buscando as páginas em paralelo.
+    """
+
+    # Reutiliza o mapeamento da implementação síncrona
+    _map_routine_from_api = HevyRoutineRepository._map_routine_from_api
+    _map_routine_to_api = HevyRoutineRepository._map_routine_to_api
+
+    def __init__(self, api_client: Optional[AsyncHevyApiClient] = None):
+        """
+        Inicializa o repositório com um cliente assíncrono da API do Hevy.
+
+        Args:
+            api_client: Cliente assíncrono da API do Hevy (opcional). Se não for
+                        fornecido, um novo cliente será criado.
+        """
+        self.api_client = api_client or AsyncHevyApiClient()
+
+    async def get_all(self, page: int = 1, per_page: int = 10) -> List[Routine]:
+        """
+        Obtém uma lista paginada de rotinas da API do Hevy.
+
+        Args:
+            page: Número da página (padrão: 1)
+            per_page: Quantidade de itens por página (padrão: 10)
+
+        Returns:
+            Uma lista de rotinas
+        """
+        response = await self.api_client.get_routines(page, per_page)
+        return [self._map_routine_from_api(data) for data in response.get('routines', [])]
+
+    async def get_all_pages(self) -> List[Routine]:
+        """
+        Obtém todas as rotinas da conta, buscando as páginas em paralelo.
+
+        Returns:
+            Uma lista com todas as rotinas
+        """
+        routines_data = await self.api_client.get_all_routines()
+        return [self._map_routine_from_api(data) for data in routines_data]
+
+    async def get_by_id(self, routine_id: str) -> Optional[Routine]:
+        """
+        Obtém uma rotina pelo seu ID da API do Hevy.
+
+        Args:
+            routine_id: ID da rotina
+
+        Returns:
+            A rotina encontrada ou None se não existir
+        """
+        try:
+            response = await self.api_client.get_routine(routine_id)
+            return self._map_routine_from_api(response)
+        except Exception as e:
+            print(f"Erro ao buscar rotina por ID: {e}")
+            return None
+
+    async def save(self, routine: Routine) -> Routine:
+        """
+        Salva uma rotina nova ou atualiza uma existente na API do Hevy.
+
+        Args:
+            routine: Rotina a ser salva
+
+        Returns:
+            A rotina salva
+        """
+        routine_data = self._map_routine_to_api(routine)
+
+        if not routine.id:
+            response = await self.api_client.create_routine(routine_data)
+        else:
+            response = await self.api_client.update_routine(routine.id, routine_data)
+        return self._map_routine_from_api(response)
@@ -0,0 +1,101 @@
+"""
+Implementação assíncrona do repositório de treinos usando a API do Hevy.
+"""
+
+from typing import List, Optional
+
+from hevyai.domain.entities.workout import Workout
+from hevyai.infrastructure.api.clients.async_hevy_client import AsyncHevyApiClient
+from hevyai.infrastructure.repositories.hevy_workout_repository import HevyWorkoutRepository
+
+
+class AsyncHevyWorkoutRepository:
+    """
+    Repositório assíncrono de treinos usando a API do Hevy.
+
+    Oferece as mesmas operações de leitura do HevyWorkoutRepository, além de
+    `get_all_pages`, que carrega todos os treinos buscando as páginas em
+    paralelo. O mapeamento da API para entidades é o mesmo da versão síncrona.
+    """
+
+    # Reutiliza o mapeamento da implementação síncrona
+    _map_workout_from_api = HevyWorkoutRepository._map_workout_from_api
+    _map_workout_to_api = HevyWorkoutRepository._map_workout_to_api
+
+    def __init__(self, api_client: Optional[AsyncHevyApiClient] = None):
+        """
+        Inicializa o repositório com um cliente assíncrono da API do Hevy.
+
+        Args:
+            api_client: Cliente assíncrono da API do Hevy (opcional). Se não for
+                        fornecido, um novo cliente será criado.
+        """
+        self.api_client = api_client or AsyncHevyApiClient()
+
+    async def get_all(self, page: int = 1, per_page: int = 10) -> List[Workout]:
+        """
+        Obtém uma lista paginada de treinos da API do Hevy.
+
+        Args:
+            page: Número da página (padrão: 1)
+            per_page: Quantidade de itens por página (padrão: 10)
+
+        Returns:
+            Uma lista de treinos
+        """
+        response = await self.api_client.get_workouts(page, per_page)
+        return [self._map_workout_from_api(data) for data in response.get('workouts', [])]
+
+    async def get_all_pages(self) -> List[Workout]:
+        """
+        Obtém todos os treinos da conta, buscando as páginas em paralelo.
+
+        Returns:
+            Uma lista com todos os treinos
+        """
+        workouts_data = await self.api_client.get_all_workouts()
+        return [self._map_workout_from_api(data) for data in workouts_data]
+
+    async def get_by_id(self, workout_id: str) -> Optional[Workout]:
+        """
+        Obtém um treino pelo seu ID da API do Hevy.
+
+        Args:
+            workout_id: ID do treino
+
+        Returns:
+            O treino encontrado ou None se não existir
+        """
+        try:
+            response = await self.api_client.get_workout(workout_id)
+            return self._map_workout_from_api(response)
+        except Exception as e:
+            print(f"Erro ao buscar treino por ID: {e}")
+            return None
+
+    async def get_count(self) -> int:
+        """
+        Obtém o número total de treinos da API do Hevy.
+
+        Returns:
+            Número total de treinos
+        """
+        return await self.api_client.get_workout_count()
+
+    async def save(self, workout: Workout) -> Workout:
+        """
+        Salva um treino novo ou atualiza um existente na API do Hevy.
+
+        Args:
+            workout: Treino a ser salvo
+
+        Returns:
+            O treino salvo
+        """
+        workout_data = self._map_workout_to_api(workout)
+
+        if not workout.id:
+            response = await self.api_client.create_workout(workout_data)
+        else:
+            response = await self.api_client.update_workout(workout.id, workout_data)
+        return self._map_workout_from_api(response)
@@ -0,0 +1,151 @@
+"""
+Implementação do repositório de modelos de exercícios usando o catálogo em memória.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from hevyai.domain.entities.exercise_template import ExerciseTemplate
+from hevyai.domain.repositories.exercise_template_repository import ExerciseTemplateRepository
+from hevyai.infrastructure.catalog.exercise_template_catalog import ExerciseTemplateCatalog
+
+
+class CatalogExerciseTemplateRepository(ExerciseTemplateRepository):
+    """
+    Implementação concreta do repositório de modelos de exercícios usando o catálogo.
+
+    Leituras, filtros e paginação são resolvidos em memória pelo
+    ExerciseTemplateCatalog; as gravações são repassadas ao repositório da origem.
+    """
+
+    def __init__(self, catalog: ExerciseTemplateCatalog, source_repository: Optional[ExerciseTemplateRepository] = None):
+        """
+        Inicializa o repositório.
+
+        Args:
+            catalog: Catálogo de modelos de exercícios
+            source_repository: Repositório usado nas gravações (opcional)
+        """
+        self.catalog = catalog
+        self.source_repository = source_repository
+
+    def get_all(self, page: int = 1, per_page: int = 10) -> List[ExerciseTemplate]:
+        """
+        Obtém todos os modelos de exercícios de forma paginada, ordenados por nome.
+
+        Args:
+            page: Número da página (padrão: 1)
+            per_page: Quantidade de itens por página (padrão: 10)
+
+        Returns:
+            Uma lista de modelos de exercícios
+        """
+        return self.find(page=page, per_page=per_page)
+
+    def iter_all(self, prefetch: Optional[int] = None) -> Iterator[ExerciseTemplate]:
+        """
+        Percorre todos os modelos de exercícios do catálogo.
+
+        Args:
+            prefetch: Ignorado no catálogo
+
+        Yields:
+            Cada entidade ExerciseTemplate, ordenada por nome
+        """
+        yield from self.catalog.list()
+
+    def find(
+        self,
+        is_custom: Optional[bool] = None,
+        muscle_group: Optional[str] = None,
+        page: int = 1,
+        per_page: int = 10
+    ) -> List[ExerciseTemplate]:
+        """
+        Obtém uma lista paginada de modelos de exercícios filtrada pelos índices do catálogo.
+
+        Args:
+            is_custom: Se informado, apenas personalizados (True) ou padrão (False)
+            muscle_group: ID ou nome de um grupo muscular (sem diferenciar maiúsculas)
+            page: Número da página (padrão: 1)
+            per_page: Quantidade de itens por página (padrão: 10)
+
+        Returns:
+            Uma lista de modelos de exercícios
+        """
+        start = (page - 1) * per_page
+        return self.catalog.list(is_custom, muscle_group)[start:start + per_page]
+
+    def search(self, query: str, limit: int = 20) -> List[ExerciseTemplate]:
+        """
+        Busca modelos de exercícios no índice de busca do catálogo, ordenados por relevância.
+
+        Args:
+            query: Texto da busca
+            limit: Quantidade máxima de resultados (padrão: 20)
+
+        Returns:
+            Uma lista de modelos de exercícios
+        """
+        return [template for template, _ in self.catalog.search(query, limit)]
+
+    def get_high_water_mark(self) -> Optional[datetime]:
+        """
+        Obtém a data da alteração mais recente entre os modelos de exercícios do catálogo.
+
+        Returns:
+            A marca de atualização do catálogo
+        """
+        return self.catalog.high_water_mark
+
+    def get_by_id(self, template_id: str) -> Optional[ExerciseTemplate]:
+        """
+        Obtém um modelo de exercício pelo seu ID.
+
+        Args:
+            template_id: ID do modelo de exercício
+
+        Returns:
+            O modelo de exercício encontrado ou None se não existir
+        """
+        return self.catalog.get(template_id)
+
+    def get_many(self, template_ids: List[str]) -> Dict[str, ExerciseTemplate]:
+        """
+        Obtém vários modelos de exercícios pelos seus IDs, em memória.
+
+        Args:
+            template_ids: IDs dos modelos de exercícios
+
+        Returns:
+            Dicionário com os modelos encontrados, pelo ID
+        """
+        return self.catalog.get_many(template_ids)
+
+    def save(self, template: ExerciseTemplate) -> ExerciseTemplate:
+        """
+        Salva um modelo de exercício na origem do catálogo.
+
+        Args:
+            template: Modelo de exercício a ser salvo
+
+        Returns:
+            O modelo de exercício salvo
+        """
+        if self.source_repository is None:
+            raise NotImplementedError("O catálogo é somente leitura sem um repositório de origem")
+        return self.source_repository.save(template)
+
+    def delete(self, template_id: str) -> bool:
+        """
+        Exclui um modelo de exercício na origem do catálogo.
+
+        Args:
+            template_id: ID do modelo de exercício a ser excluído
+
+        Returns:
+            True se o modelo foi excluído com sucesso, False caso contrário
+        """
+        if self.source_repository is None:
+            return False
+        return self.source_repository.delete(template_id)
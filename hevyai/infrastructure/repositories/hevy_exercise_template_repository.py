@@ -2,14 +2,20 @@
 Implementação do repositório de modelos de exercícios usando a API do Hevy.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 
 from hevyai.domain.entities.exercise_template import ExerciseTemplate, MuscleGroup
 from hevyai.domain.repositories.exercise_template_repository import ExerciseTemplateRepository
+from hevyai.domain.timestamps import parse_timestamp
+from hevyai.infrastructure.api.clients.client_registry import get_hevy_client
+from hevyai.infrastructure.api.clients.exceptions import HevyApiUnavailableError
 from hevyai.infrastructure.api.clients.hevy_client import HevyApiClient
+from hevyai.infrastructure.api.clients.typed_decoding import get_page_decoder
+from hevyai.infrastructure.repositories.pagination import iter_page_items
+from hevyai.infrastructure.repositories.stale_fallback import StaleFallbackMixin
 
 
-class HevyExerciseTemplateRepository(ExerciseTemplateRepository):
+class HevyExerciseTemplateRepository(StaleFallbackMixin, ExerciseTemplateRepository):
     """
     Implementação concreta do repositório de modelos de exercícios usando a API do Hevy.
     
@@ -23,9 +29,11 @@ class HevyExerciseTemplateRepository(ExerciseTemplateRepository):
         
         Args:
             api_client: Cliente da API do Hevy (opcional). Se não for fornecido,
-                        um novo cliente será criado.
+                        usa o cliente compartilhado do processo.
         """
-        self.api_client = api_client or HevyApiClient()
+        self.api_client = api_client or get_hevy_client()
+        # Decodificador das listagens direto em entidades (None sem o msgspec)
+        self.page_decoder = get_page_decoder('exercise_templates')
     
     def get_all(self, page: int = 1, per_page: int = 10) -> List[ExerciseTemplate]:
         """
@@ -38,7 +46,7 @@ class HevyExerciseTemplateRepository(ExerciseTemplateRepository):
         Returns:
             Uma lista de modelos de exercícios
         """
-        response = self.api_client.get_exercise_templates(page, per_page)
+        response = self._fetch(self.api_client.get_exercise_templates, page, per_page, self.page_decoder)
         templates = []
         
         for template_data in response.get('exercise_templates', []):
@@ -47,6 +55,23 @@ class HevyExerciseTemplateRepository(ExerciseTemplateRepository):
             
         return templates
     
+    def iter_all(self, prefetch: Optional[int] = None) -> Iterator[ExerciseTemplate]:
+        """
+        Percorre todos os modelos de exercícios da API do Hevy.
+        
+        Usa o `page_count` da primeira resposta e busca as próximas páginas em
+        paralelo enquanto a página atual é convertida em entidades.
+        
+        Args:
+            prefetch: Quantidade de páginas a buscar antecipadamente
+                      (padrão: settings.HEVY_API_PREFETCH_PAGES; 0 desativa)
+            
+        Yields:
+            Cada entidade ExerciseTemplate, na ordem retornada pela API
+        """
+        for template_data in iter_page_items(self._fetch_page, 'exercise_templates', prefetch):
+            yield self._map_template_from_api(template_data)
+    
     def get_by_id(self, template_id: str) -> Optional[ExerciseTemplate]:
         """
         Obtém um modelo de exercício pelo seu ID da API do Hevy.
@@ -58,8 +83,10 @@ class HevyExerciseTemplateRepository(ExerciseTemplateRepository):
             O modelo de exercício encontrado ou None se não existir
         """
         try:
-            response = self.api_client.get_exercise_template(template_id)
+            response = self._fetch(self.api_client.get_exercise_template, template_id)
             return self._map_template_from_api(response)
+        except HevyApiUnavailableError:
+            raise
         except Exception as e:
             print(f"Erro ao buscar modelo de exercício por ID: {e}")
             return None
@@ -97,16 +124,23 @@ class HevyExerciseTemplateRepository(ExerciseTemplateRepository):
         # A API do Hevy provavelmente não suporta a exclusão de modelos de exercícios
         return False
     
-    def _map_template_from_api(self, data: Dict[str, Any]) -> ExerciseTemplate:
+    def _fetch_page(self, page: int) -> Dict[str, Any]:
+        """Busca uma página da listagem com o tamanho máximo aceito pela API."""
+        return self._fetch(self.api_client.get_exercise_templates, page, 10, self.page_decoder)
+    
+    def _map_template_from_api(self, data: Any) -> ExerciseTemplate:
         """
         Converte dados de modelo de exercício da API do Hevy para uma entidade ExerciseTemplate.
         
         Args:
-            data: Dados do modelo de exercício da API
+            data: Dados do modelo de exercício da API (ou a entidade já decodificada pelo decodificador tipado)
             
         Returns:
             Entidade ExerciseTemplate
         """
+        if isinstance(data, ExerciseTemplate):
+            return data
+        
         muscle_groups = []
         
         for mg_data in data.get('muscle_groups', []):
@@ -122,6 +156,6 @@ class HevyExerciseTemplateRepository(ExerciseTemplateRepository):
             description=data.get('description'),
             is_custom=data.get('is_custom', False),
             muscle_groups=muscle_groups,
-            created_at=data.get('created_at'),
-            updated_at=data.get('updated_at')
+            created_at=parse_timestamp(data.get('created_at')),
+            updated_at=parse_timestamp(data.get('updated_at'))
         )
\ No newline at end of file
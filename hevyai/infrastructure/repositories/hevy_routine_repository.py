@@ -2,14 +2,20 @@
 Implementação do repositório de rotinas usando a API do Hevy.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 
 from hevyai.domain.entities.routine import Routine, RoutineExercise, RoutineSet
 from hevyai.domain.repositories.routine_repository import RoutineRepository
+from hevyai.domain.timestamps import parse_timestamp
+from hevyai.infrastructure.api.clients.client_registry import get_hevy_client
+from hevyai.infrastructure.api.clients.exceptions import HevyApiUnavailableError
 from hevyai.infrastructure.api.clients.hevy_client import HevyApiClient
+from hevyai.infrastructure.api.clients.typed_decoding import get_page_decoder
+from hevyai.infrastructure.repositories.pagination import iter_page_items
+from hevyai.infrastructure.repositories.stale_fallback import StaleFallbackMixin
 
 
-class HevyRoutineRepository(RoutineRepository):
+class HevyRoutineRepository(StaleFallbackMixin, RoutineRepository):
     """
     Implementação concreta do repositório de rotinas usando a API do Hevy.
     
@@ -23,9 +29,11 @@ class HevyRoutineRepository(RoutineRepository):
         
         Args:
             api_client: Cliente da API do Hevy (opcional). Se não for fornecido,
-                        um novo cliente será criado.
+                        usa o cliente compartilhado do processo.
         """
-        self.api_client = api_client or HevyApiClient()
+        self.api_client = api_client or get_hevy_client()
+        # Decodificador das listagens direto em entidades (None sem o msgspec)
+        self.page_decoder = get_page_decoder('routines')
     
     def get_all(self, page: int = 1, per_page: int = 10) -> List[Routine]:
         """
@@ -38,7 +46,7 @@ class HevyRoutineRepository(RoutineRepository):
         Returns:
             Uma lista de rotinas
         """
-        response = self.api_client.get_routines(page, per_page)
+        response = self._fetch(self.api_client.get_routines, page, per_page, self.page_decoder)
         routines = []
         
         for routine_data in response.get('routines', []):
@@ -47,6 +55,23 @@ class HevyRoutineRepository(RoutineRepository):
             
         return routines
     
+    def iter_all(self, prefetch: Optional[int] = None) -> Iterator[Routine]:
+        """
+        Percorre todas as rotinas da API do Hevy.
+        
+        Usa o `page_count` da primeira resposta e busca as próximas páginas em
+        paralelo enquanto a página atual é convertida em entidades.
+        
+        Args:
+            prefetch: Quantidade de páginas a buscar antecipadamente
+                      (padrão: settings.HEVY_API_PREFETCH_PAGES; 0 desativa)
+            
+        Yields:
+            Cada entidade Routine, na ordem retornada pela API
+        """
+        for routine_data in iter_page_items(self._fetch_page, 'routines', prefetch):
+            yield self._map_routine_from_api(routine_data)
+    
     def get_by_id(self, routine_id: str) -> Optional[Routine]:
         """
         Obtém uma rotina pelo seu ID da API do Hevy.
@@ -58,8 +83,10 @@ class HevyRoutineRepository(RoutineRepository):
             A rotina encontrada ou None se não existir
         """
         try:
-            response = self.api_client.get_routine(routine_id)
+            response = self._fetch(self.api_client.get_routine, routine_id)
             return self._map_routine_from_api(response)
+        except HevyApiUnavailableError:
+            raise
         except Exception as e:
             print(f"Erro ao buscar rotina por ID: {e}")
             return None
@@ -103,16 +130,23 @@ class HevyRoutineRepository(RoutineRepository):
         # Por enquanto, retornamos False
         return False
     
-    def _map_routine_from_api(self, data: Dict[str, Any]) -> Routine:
+    def _fetch_page(self, page: int) -> Dict[str, Any]:
+        """Busca uma página da listagem com o tamanho máximo aceito pela API."""
+        return self._fetch(self.api_client.get_routines, page, 10, self.page_decoder)
+    
+    def _map_routine_from_api(self, data: Any) -> Routine:
         """
         Converte dados de rotina da API do Hevy para uma entidade Routine.
         
         Args:
-            data: Dados da rotina da API
+            data: Dados da rotina da API (ou a entidade já decodificada pelo decodificador tipado)
             
         Returns:
             Entidade Routine
         """
+        if isinstance(data, Routine):
+            return data
+        
         exercises = []
         
         for exercise_data in data.get('exercises', []):
@@ -146,8 +180,8 @@ class HevyRoutineRepository(RoutineRepository):
             notes=data.get('description'),  # API usa 'description' em vez de 'notes'
             folder_id=data.get('folder_id'),
             is_public=data.get('is_public', False),
-            created_at=data.get('created_at'),
-            updated_at=data.get('updated_at')
+            created_at=parse_timestamp(data.get('created_at')),
+            updated_at=parse_timestamp(data.get('updated_at'))
         )
     
     def _map_routine_to_api(self, routine: Routine) -> Dict[str, Any]:
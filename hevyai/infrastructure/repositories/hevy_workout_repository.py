@@ -2,14 +2,20 @@
 Implementação do repositório de treinos usando a API do Hevy.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 
-from hevyai.domain.entities.workout import Workout, Exercise, Set
+from hevyai.domain.entities.workout import Workout, WorkoutChanges, Exercise, Set
 from hevyai.domain.repositories.workout_repository import WorkoutRepository
+from hevyai.domain.timestamps import parse_timestamp
+from hevyai.infrastructure.api.clients.client_registry import get_hevy_client
+from hevyai.infrastructure.api.clients.exceptions import HevyApiUnavailableError
 from hevyai.infrastructure.api.clients.hevy_client import HevyApiClient
+from hevyai.infrastructure.api.clients.typed_decoding import get_page_decoder
+from hevyai.infrastructure.repositories.pagination import iter_page_items, iter_pages
+from hevyai.infrastructure.repositories.stale_fallback import StaleFallbackMixin
 
 
-class HevyWorkoutRepository(WorkoutRepository):
+class HevyWorkoutRepository(StaleFallbackMixin, WorkoutRepository):
     """
     Implementação concreta do repositório de treinos usando a API do Hevy.
     
@@ -23,9 +29,11 @@ class HevyWorkoutRepository(WorkoutRepository):
         
         Args:
             api_client: Cliente da API do Hevy (opcional). Se não for fornecido,
-                        um novo cliente será criado.
+                        usa o cliente compartilhado do processo.
         """
-        self.api_client = api_client or HevyApiClient()
+        self.api_client = api_client or get_hevy_client()
+        # Decodificador das listagens direto em entidades (None sem o msgspec)
+        self.page_decoder = get_page_decoder('workouts')
     
     def get_all(self, page: int = 1, per_page: int = 10) -> List[Workout]:
         """
@@ -38,7 +46,7 @@ class HevyWorkoutRepository(WorkoutRepository):
         Returns:
             Uma lista de treinos
         """
-        response = self.api_client.get_workouts(page, per_page)
+        response = self._fetch(self.api_client.get_workouts, page, per_page, self.page_decoder)
         workouts = []
         
         for workout_data in response.get('workouts', []):
@@ -47,6 +55,23 @@ class HevyWorkoutRepository(WorkoutRepository):
             
         return workouts
     
+    def iter_all(self, prefetch: Optional[int] = None) -> Iterator[Workout]:
+        """
+        Percorre todos os treinos da API do Hevy.
+        
+        Usa o `page_count` da primeira resposta e busca as próximas páginas em
+        paralelo enquanto a página atual é convertida em entidades.
+        
+        Args:
+            prefetch: Quantidade de páginas a buscar antecipadamente
+                      (padrão: settings.HEVY_API_PREFETCH_PAGES; 0 desativa)
+            
+        Yields:
+            Cada entidade Workout, na ordem retornada pela API
+        """
+        for workout_data in iter_page_items(self._fetch_page, 'workouts', prefetch):
+            yield self._map_workout_from_api(workout_data)
+    
     def get_by_id(self, workout_id: str) -> Optional[Workout]:
         """
         Obtém um treino pelo seu ID da API do Hevy.
@@ -58,8 +83,10 @@ class HevyWorkoutRepository(WorkoutRepository):
             O treino encontrado ou None se não existir
         """
         try:
-            response = self.api_client.get_workout(workout_id)
+            response = self._fetch(self.api_client.get_workout, workout_id)
             return self._map_workout_from_api(response)
+        except HevyApiUnavailableError:
+            raise
         except Exception as e:
             print(f"Erro ao buscar treino por ID: {e}")
             return None
@@ -71,7 +98,44 @@ class HevyWorkoutRepository(WorkoutRepository):
         Returns:
             Número total de treinos
         """
-        return self.api_client.get_workout_count()
+        return self._fetch(self.api_client.get_workout_count)
+    
+    def get_changes_since(self, since: str) -> WorkoutChanges:
+        """
+        Obtém os treinos alterados ou excluídos desde uma data pelos eventos da API do Hevy.
+        
+        Quando um treino aparece em mais de um evento, vale o mais recente.
+        
+        Args:
+            since: Data ISO 8601 a partir da qual buscar eventos
+            
+        Returns:
+            As alterações e a data do evento mais recente como próximo cursor
+        """
+        latest: Dict[str, Any] = {}
+        newest = parse_timestamp(since)
+        for _, page_data in iter_pages(lambda page: self.api_client.get_workout_events(since, page)):
+            for event in page_data.get('events', []):
+                workout = event.get('workout') or {}
+                workout_id = event.get('id') or workout.get('id')
+                timestamp = parse_timestamp(
+                    event.get('deleted_at') if event.get('type') == 'deleted' else workout.get('updated_at')
+                )
+                if not workout_id:
+                    continue
+                previous = latest.get(workout_id)
+                if previous is None or (timestamp is not None and (previous[0] is None or timestamp >= previous[0])):
+                    latest[workout_id] = (timestamp, event)
+                if timestamp is not None and (newest is None or timestamp > newest):
+                    newest = timestamp
+        
+        changes = WorkoutChanges(cursor=newest.isoformat() if newest else since)
+        for workout_id, (_, event) in latest.items():
+            if event.get('type') == 'deleted':
+                changes.deleted_ids.append(workout_id)
+            elif event.get('workout'):
+                changes.updated.append(self._map_workout_from_api(event['workout']))
+        return changes
     
     def save(self, workout: Workout) -> Workout:
         """
@@ -112,16 +176,23 @@ class HevyWorkoutRepository(WorkoutRepository):
         # Por enquanto, retornamos False
         return False
     
-    def _map_workout_from_api(self, data: Dict[str, Any]) -> Workout:
+    def _fetch_page(self, page: int) -> Dict[str, Any]:
+        """Busca uma página da listagem com o tamanho máximo aceito pela API."""
+        return self._fetch(self.api_client.get_workouts, page, 10, self.page_decoder)
+    
+    def _map_workout_from_api(self, data: Any) -> Workout:
         """
         Converte dados de treino da API do Hevy para uma entidade Workout.
         
         Args:
-            data: Dados do treino da API
+            data: Dados do treino da API (ou a entidade já decodificada pelo decodificador tipado)
             
         Returns:
             Entidade Workout
         """
+        if isinstance(data, Workout):
+            return data
+        
         exercises = []
         
         for exercise_data in data.get('exercises', []):
@@ -153,10 +224,11 @@ class HevyWorkoutRepository(WorkoutRepository):
             name=data.get('title', ''),  # API usa 'title' em vez de 'name'
             exercises=exercises,
             notes=data.get('description'),  # API usa 'description' em vez de 'notes'
-            start_time=data.get('start_time'),
-            end_time=data.get('end_time'),
-            created_at=data.get('created_at'),
-            updated_at=data.get('updated_at')
+            routine_id=data.get('routine_id'),
+            start_time=parse_timestamp(data.get('start_time')),
+            end_time=parse_timestamp(data.get('end_time')),
+            created_at=parse_timestamp(data.get('created_at')),
+            updated_at=parse_timestamp(data.get('updated_at'))
         )
     
     def _map_workout_to_api(self, workout: Workout) -> Dict[str, Any]:
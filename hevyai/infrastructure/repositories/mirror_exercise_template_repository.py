@@ -0,0 +1,145 @@
+"""
+Implementação do repositório de modelos de exercícios usando a cópia local dos dados do Hevy.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from django.db.models import Max
+
+from hevyai.core.models import HevyExerciseTemplate
+from hevyai.domain.entities.exercise_template import ExerciseTemplate, MuscleGroup
+from hevyai.domain.repositories.exercise_template_repository import ExerciseTemplateRepository
+from hevyai.domain.timestamps import parse_timestamp
+
+
+class MirrorExerciseTemplateRepository(ExerciseTemplateRepository):
+    """
+    Implementação concreta do repositório de modelos de exercícios usando a cópia local.
+
+    As gravações são repassadas ao repositório da API do Hevy e chegam à cópia
+    local pela próxima sincronização.
+    """
+
+    def __init__(self, api_repository: Optional[ExerciseTemplateRepository] = None):
+        """
+        Inicializa o repositório.
+
+        Args:
+            api_repository: Repositório usado nas gravações (opcional)
+        """
+        self.api_repository = api_repository
+
+    def get_all(self, page: int = 1, per_page: int = 10) -> List[ExerciseTemplate]:
+        """
+        Obtém todos os modelos de exercícios de forma paginada.
+
+        Args:
+            page: Número da página (padrão: 1)
+            per_page: Quantidade de itens por página (padrão: 10)
+
+        Returns:
+            Uma lista de modelos de exercícios
+        """
+        start = (page - 1) * per_page
+        records = HevyExerciseTemplate.objects.order_by('title', 'id')[start:start + per_page]
+        return [self._map_template(record) for record in records]
+
+    def iter_all(self, prefetch: Optional[int] = None) -> Iterator[ExerciseTemplate]:
+        """
+        Percorre todos os modelos de exercícios da cópia local.
+
+        Args:
+            prefetch: Ignorado na cópia local
+
+        Yields:
+            Cada entidade ExerciseTemplate
+        """
+        for record in HevyExerciseTemplate.objects.order_by('title', 'id').iterator():
+            yield self._map_template(record)
+
+    def get_by_id(self, template_id: str) -> Optional[ExerciseTemplate]:
+        """
+        Obtém um modelo de exercício pelo seu ID.
+
+        Args:
+            template_id: ID do modelo de exercício
+
+        Returns:
+            O modelo de exercício encontrado ou None se não existir
+        """
+        record = HevyExerciseTemplate.objects.filter(id=template_id).first()
+        return self._map_template(record) if record else None
+
+    def get_many(self, template_ids: List[str]) -> Dict[str, ExerciseTemplate]:
+        """
+        Obtém vários modelos de exercícios pelos seus IDs, em uma única consulta.
+
+        Args:
+            template_ids: IDs dos modelos de exercícios
+
+        Returns:
+            Dicionário com os modelos encontrados, pelo ID
+        """
+        records = HevyExerciseTemplate.objects.filter(id__in=set(template_ids))
+        return {record.id: self._map_template(record) for record in records}
+
+    def get_high_water_mark(self) -> Optional[datetime]:
+        """
+        Obtém a data da alteração mais recente entre os modelos de exercícios da cópia local.
+
+        Returns:
+            A maior data de atualização ou None se a cópia estiver vazia
+        """
+        return HevyExerciseTemplate.objects.aggregate(mark=Max('updated_at'))['mark']
+
+    def save(self, template: ExerciseTemplate) -> ExerciseTemplate:
+        """
+        Salva um modelo de exercício na API do Hevy.
+
+        Args:
+            template: Modelo de exercício a ser salvo
+
+        Returns:
+            O modelo de exercício salvo
+        """
+        if self.api_repository is None:
+            raise NotImplementedError("A cópia local é somente leitura sem um repositório da API")
+        return self.api_repository.save(template)
+
+    def delete(self, template_id: str) -> bool:
+        """
+        Exclui um modelo de exercício na API do Hevy.
+
+        Args:
+            template_id: ID do modelo de exercício a ser excluído
+
+        Returns:
+            True se o modelo foi excluído com sucesso, False caso contrário
+        """
+        if self.api_repository is None:
+            return False
+        return self.api_repository.delete(template_id)
+
+    def _map_template(self, record: HevyExerciseTemplate) -> ExerciseTemplate:
+        """
+        Converte um modelo de exercício da cópia local para uma entidade ExerciseTemplate.
+
+        Args:
+            record: Modelo de exercício da cópia local
+
+        Returns:
+            Entidade ExerciseTemplate
+        """
+        return ExerciseTemplate(
+            id=record.id,
+            name=record.title,
+            description=record.description,
+            is_custom=record.is_custom,
+            muscle_groups=[
+                MuscleGroup(id=group.get('id', ''), name=group.get('name', ''))
+                for group in record.muscle_groups
+            ],
+            created_at=parse_timestamp(record.created_at),
+            updated_at=parse_timestamp(record.updated_at)
+        )
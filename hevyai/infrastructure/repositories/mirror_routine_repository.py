@@ -0,0 +1,146 @@
+"""
+Implementação do repositório de rotinas usando a cópia local dos dados do Hevy.
+"""
+
+from typing import Iterator, List, Optional
+
+from django.db.models import Prefetch
+
+from hevyai.core.models import HevyRoutine, HevyRoutineExercise
+from hevyai.domain.entities.routine import Routine, RoutineExercise, RoutineSet
+from hevyai.domain.repositories.routine_repository import RoutineRepository
+
+
+class MirrorRoutineRepository(RoutineRepository):
+    """
+    Implementação concreta do repositório de rotinas usando a cópia local.
+
+    As gravações são repassadas ao repositório da API do Hevy e chegam à cópia
+    local pela próxima sincronização.
+    """
+
+    def __init__(self, api_repository: Optional[RoutineRepository] = None):
+        """
+        Inicializa o repositório.
+
+        Args:
+            api_repository: Repositório usado nas gravações (opcional)
+        """
+        self.api_repository = api_repository
+
+    def _queryset(self):
+        exercises = HevyRoutineExercise.objects.order_by('position').prefetch_related('sets')
+        return HevyRoutine.objects.order_by('title', 'id').prefetch_related(
+            Prefetch('exercises', queryset=exercises)
+        )
+
+    def get_all(self, page: int = 1, per_page: int = 10) -> List[Routine]:
+        """
+        Obtém todas as rotinas de forma paginada.
+
+        Args:
+            page: Número da página (padrão: 1)
+            per_page: Quantidade de itens por página (padrão: 10)
+
+        Returns:
+            Uma lista de rotinas
+        """
+        start = (page - 1) * per_page
+        return [self._map_routine(record) for record in self._queryset()[start:start + per_page]]
+
+    def iter_all(self, prefetch: Optional[int] = None) -> Iterator[Routine]:
+        """
+        Percorre todas as rotinas da cópia local.
+
+        Args:
+            prefetch: Ignorado na cópia local
+
+        Yields:
+            Cada entidade Routine
+        """
+        for record in self._queryset():
+            yield self._map_routine(record)
+
+    def get_by_id(self, routine_id: str) -> Optional[Routine]:
+        """
+        Obtém uma rotina pelo seu ID.
+
+        Args:
+            routine_id: ID da rotina
+
+        Returns:
+            A rotina encontrada ou None se não existir
+        """
+        record = self._queryset().filter(id=routine_id).first()
+        return self._map_routine(record) if record else None
+
+    def save(self, routine: Routine) -> Routine:
+        """
+        Salva uma rotina na API do Hevy.
+
+        Args:
+            routine: Rotina a ser salva
+
+        Returns:
+            A rotina salva
+        """
+        if self.api_repository is None:
+            raise NotImplementedError("A cópia local é somente leitura sem um repositório da API")
+        return self.api_repository.save(routine)
+
+    def delete(self, routine_id: str) -> bool:
+        """
+        Exclui uma rotina na API do Hevy.
+
+        Args:
+            routine_id: ID da rotina a ser excluída
+
+        Returns:
+            True se a rotina foi excluída com sucesso, False caso contrário
+        """
+        if self.api_repository is None:
+            return False
+        return self.api_repository.delete(routine_id)
+
+    def _map_routine(self, record: HevyRoutine) -> Routine:
+        """
+        Converte uma rotina da cópia local para uma entidade Routine.
+
+        Args:
+            record: Rotina da cópia local, com exercícios e séries pré-carregados
+
+        Returns:
+            Entidade Routine
+        """
+        exercises = []
+        for exercise_record in record.exercises.all():
+            sets = [
+                RoutineSet(
+                    id=set_record.hevy_id,
+                    reps=set_record.reps,
+                    weight=set_record.weight,
+                    duration=set_record.duration,
+                    distance=set_record.distance,
+                    rest_seconds=set_record.rest_seconds
+                )
+                for set_record in exercise_record.sets.all()
+            ]
+            exercises.append(RoutineExercise(
+                id=exercise_record.hevy_id,
+                exercise_template_id=exercise_record.exercise_template_id,
+                name=exercise_record.title,
+                notes=exercise_record.notes,
+                sets=sets,
+                order=exercise_record.position
+            ))
+
+        return Routine(
+            id=record.id,
+            name=record.title,
+            exercises=exercises,
+            notes=record.description,
+            folder_id=record.folder_id,
+            is_public=record.is_public,
+            created_at=record.created_at,
+            updated_at=record.updated_at
+        )
@@ -0,0 +1,190 @@
+"""
+Implementação do repositório de treinos usando a cópia local dos dados do Hevy.
+"""
+
+from typing import Iterator, List, Optional
+
+from django.db.models import Prefetch
+
+from hevyai.core.models import HevyDeletedWorkout, HevyWorkout, HevyWorkoutExercise
+from hevyai.domain.entities.workout import Workout, WorkoutChanges, Exercise, Set
+from hevyai.domain.repositories.workout_repository import WorkoutRepository
+from hevyai.domain.timestamps import parse_timestamp
+
+# Quantidade de treinos carregados por consulta ao percorrer o histórico
+ITER_CHUNK_SIZE = 500
+
+
+class MirrorWorkoutRepository(WorkoutRepository):
+    """
+    Implementação concreta do repositório de treinos usando a cópia local.
+
+    As leituras são consultas indexadas no banco da aplicação, mantido em dia pelo
+    HevySyncService. As gravações são repassadas ao repositório da API do Hevy e
+    chegam à cópia local pela próxima sincronização de eventos.
+    """
+
+    def __init__(self, api_repository: Optional[WorkoutRepository] = None):
+        """
+        Inicializa o repositório.
+
+        Args:
+            api_repository: Repositório usado nas gravações (opcional)
+        """
+        self.api_repository = api_repository
+
+    def _queryset(self):
+        exercises = HevyWorkoutExercise.objects.order_by('position').prefetch_related('sets')
+        return HevyWorkout.objects.order_by('-start_time', 'id').prefetch_related(
+            Prefetch('exercises', queryset=exercises)
+        )
+
+    def get_all(self, page: int = 1, per_page: int = 10) -> List[Workout]:
+        """
+        Obtém todos os treinos de forma paginada, do mais recente para o mais antigo.
+
+        Args:
+            page: Número da página (padrão: 1)
+            per_page: Quantidade de itens por página (padrão: 10)
+
+        Returns:
+            Uma lista de treinos
+        """
+        start = (page - 1) * per_page
+        return [self._map_workout(record) for record in self._queryset()[start:start + per_page]]
+
+    def iter_all(self, prefetch: Optional[int] = None) -> Iterator[Workout]:
+        """
+        Percorre todos os treinos da cópia local.
+
+        Args:
+            prefetch: Ignorado; os treinos são lidos em blocos de ITER_CHUNK_SIZE
+
+        Yields:
+            Cada entidade Workout, do mais recente para o mais antigo
+        """
+        for record in self._queryset().iterator(chunk_size=ITER_CHUNK_SIZE):
+            yield self._map_workout(record)
+
+    def get_by_id(self, workout_id: str) -> Optional[Workout]:
+        """
+        Obtém um treino pelo seu ID.
+
+        Args:
+            workout_id: ID do treino
+
+        Returns:
+            O treino encontrado ou None se não existir
+        """
+        record = self._queryset().filter(id=workout_id).first()
+        return self._map_workout(record) if record else None
+
+    def get_count(self) -> int:
+        """
+        Obtém o número total de treinos.
+
+        Returns:
+            Número total de treinos
+        """
+        return HevyWorkout.objects.count()
+
+    def get_changes_since(self, since: str) -> WorkoutChanges:
+        """
+        Obtém os treinos gravados ou excluídos na cópia local desde uma data.
+
+        Usa a data de sincronização de cada linha, e não a data de alteração no
+        Hevy, para incluir também treinos antigos recebidos agora.
+
+        Args:
+            since: Data ISO 8601 a partir da qual buscar alterações
+
+        Returns:
+            As alterações e a data de sincronização mais recente como próximo cursor
+        """
+        since_time = parse_timestamp(since)
+        newest = since_time
+        changes = WorkoutChanges()
+        for record in self._queryset().filter(synced_at__gt=since_time):
+            changes.updated.append(self._map_workout(record))
+            newest = max(newest, record.synced_at)
+        tombstones = HevyDeletedWorkout.objects.filter(synced_at__gt=since_time).values_list('id', 'synced_at')
+        for workout_id, synced_at in tombstones:
+            changes.deleted_ids.append(workout_id)
+            newest = max(newest, synced_at)
+        # Treinos recriados depois da exclusão continuam na cópia local
+        recreated = set(HevyWorkout.objects.filter(id__in=changes.deleted_ids).values_list('id', flat=True))
+        changes.deleted_ids = [i for i in changes.deleted_ids if i not in recreated]
+        changes.cursor = newest.isoformat()
+        return changes
+
+    def save(self, workout: Workout) -> Workout:
+        """
+        Salva um treino na API do Hevy.
+
+        Args:
+            workout: Treino a ser salvo
+
+        Returns:
+            O treino salvo
+        """
+        if self.api_repository is None:
+            raise NotImplementedError("A cópia local é somente leitura sem um repositório da API")
+        return self.api_repository.save(workout)
+
+    def delete(self, workout_id: str) -> bool:
+        """
+        Exclui um treino na API do Hevy.
+
+        Args:
+            workout_id: ID do treino a ser excluído
+
+        Returns:
+            True se o treino foi excluído com sucesso, False caso contrário
+        """
+        if self.api_repository is None:
+            return False
+        return self.api_repository.delete(workout_id)
+
+    def _map_workout(self, record: HevyWorkout) -> Workout:
+        """
+        Converte um treino da cópia local para uma entidade Workout.
+
+        Args:
+            record: Treino da cópia local, com exercícios e séries pré-carregados
+
+        Returns:
+            Entidade Workout
+        """
+        exercises = []
+        for exercise_record in record.exercises.all():
+            sets = [
+                Set(
+                    id=set_record.hevy_id,
+                    reps=set_record.reps,
+                    weight=set_record.weight,
+                    duration=set_record.duration,
+                    distance=set_record.distance,
+                    rpe=set_record.rpe,
+                    completed=set_record.completed
+                )
+                for set_record in exercise_record.sets.all()
+            ]
+            exercises.append(Exercise(
+                id=exercise_record.hevy_id,
+                exercise_template_id=exercise_record.exercise_template_id,
+                name=exercise_record.title,
+                notes=exercise_record.notes,
+                sets=sets
+            ))
+
+        return Workout(
+            id=record.id,
+            name=record.title,
+            exercises=exercises,
+            notes=record.description,
+            routine_id=record.routine_id,
+            start_time=record.start_time,
+            end_time=record.end_time,
+            created_at=record.created_at,
+            updated_at=record.updated_at
+        )
@@ -0,0 +1,40 @@
+"""
+Implementação do repositório dos totais de treinos por período usando a cópia local.
+"""
+
+from datetime import date
+from typing import List, Optional
+
+from hevyai.core.models import HevyWorkoutRollup
+from hevyai.domain.entities.workout_rollup import WorkoutRollup, period_start
+from hevyai.domain.repositories.workout_rollup_repository import WorkoutRollupRepository
+
+ROLLUP_FIELDS = ('period', 'period_start', 'workouts', 'sets', 'volume', 'duration', 'distinct_exercises')
+
+
+class MirrorWorkoutRollupRepository(WorkoutRollupRepository):
+    """
+    Implementação concreta do repositório de totais por período.
+
+    Lê as linhas de HevyWorkoutRollup, mantidas pelo HevySyncService, com uma
+    única consulta pelo índice (período, início do período).
+    """
+
+    def get_rollups(self, period: str, start: Optional[date] = None, end: Optional[date] = None) -> List[WorkoutRollup]:
+        """
+        Obtém os totais dos períodos que se sobrepõem a um intervalo de dias.
+
+        Args:
+            period: 'day', 'week' ou 'month'
+            start: Primeiro dia, inclusivo (opcional)
+            end: Último dia, inclusivo (opcional)
+
+        Returns:
+            Os totais em ordem cronológica; períodos sem treinos não aparecem
+        """
+        rows = HevyWorkoutRollup.objects.filter(period=period)
+        if start is not None:
+            rows = rows.filter(period_start__gte=period_start(start, period))
+        if end is not None:
+            rows = rows.filter(period_start__lte=end)
+        return [WorkoutRollup(*values) for values in rows.order_by('period_start').values_list(*ROLLUP_FIELDS)]
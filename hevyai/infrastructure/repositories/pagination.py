@@ -0,0 +1,94 @@
+"""
+Utilitários de paginação para os repositórios baseados na API do Hevy.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple
+
+from django.conf import settings
+
+
+def iter_pages(
+    fetch_page: Callable[[int], Dict[str, Any]],
+    start_page: int = 1,
+    prefetch: Optional[int] = None
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Percorre as páginas de um endpoint paginado da API do Hevy.
+
+    A página inicial é buscada de forma síncrona para obter o `page_count`.
+    Enquanto o consumidor processa a página atual, as próximas `prefetch`
+    páginas já são buscadas em um pool de threads, de modo que no máximo
+    `prefetch + 1` páginas ficam em memória ao mesmo tempo. Com `prefetch=0`
+    as páginas são buscadas uma de cada vez, em ordem, sem threads.
+
+    Args:
+        fetch_page: Função que busca uma página pelo número
+        start_page: Primeira página a ser buscada (padrão: 1), usada para retomar
+                    uma leitura interrompida
+        prefetch: Quantidade de páginas buscadas antecipadamente
+                  (padrão: settings.HEVY_API_PREFETCH_PAGES; 0 desativa)
+
+    Yields:
+        Tuplas (número da página, resposta da página), em ordem
+    """
+    prefetch = settings.HEVY_API_PREFETCH_PAGES if prefetch is None else prefetch
+    first_page = fetch_page(start_page)
+    page_count = first_page.get('page_count', 1) or 1
+
+    if page_count <= start_page:
+        if start_page <= page_count:
+            yield start_page, first_page
+        return
+
+    if prefetch <= 0:
+        yield start_page, first_page
+        for page_number in range(start_page + 1, page_count + 1):
+            yield page_number, fetch_page(page_number)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix='hevy-prefetch')
+    pending: Deque = deque()
+    next_page = start_page + 1
+    try:
+        while next_page <= page_count and len(pending) < prefetch:
+            pending.append((next_page, executor.submit(fetch_page, next_page)))
+            next_page += 1
+
+        yield start_page, first_page
+
+        while pending:
+            page_number, future = pending.popleft()
+            page_data = future.result()
+            if next_page <= page_count:
+                pending.append((next_page, executor.submit(fetch_page, next_page)))
+                next_page += 1
+            yield page_number, page_data
+    finally:
+        # Se o consumidor parar no meio, as páginas pendentes são descartadas
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_page_items(
+    fetch_page: Callable[[int], Dict[str, Any]],
+    items_key: str,
+    prefetch: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Percorre todos os itens de um endpoint paginado da API do Hevy.
+
+    As páginas são lidas por `iter_pages`, com as próximas `prefetch` páginas
+    buscadas antecipadamente.
+
+    Args:
+        fetch_page: Função que busca uma página pelo número
+        items_key: Chave da lista de itens na resposta (ex.: 'workouts')
+        prefetch: Quantidade de páginas buscadas antecipadamente
+                  (padrão: settings.HEVY_API_PREFETCH_PAGES; 0 desativa)
+
+    Yields:
+        Os dados de cada item, na ordem das páginas
+    """
+    for _, page_data in iter_pages(fetch_page, prefetch=prefetch):
+        yield from page_data.get(items_key, [])
@@ -0,0 +1,95 @@
+"""
+Seleção das implementações de repositório conforme a origem de dados configurada.
+"""
+
+from django.conf import settings
+
+from hevyai.domain.repositories.exercise_template_repository import ExerciseTemplateRepository
+from hevyai.domain.repositories.routine_repository import RoutineRepository
+from hevyai.domain.repositories.workout_repository import WorkoutRepository
+from hevyai.domain.repositories.workout_rollup_repository import WorkoutRollupRepository
+from hevyai.infrastructure.api.clients.client_registry import get_hevy_client
+from hevyai.infrastructure.catalog.exercise_template_catalog import get_exercise_template_catalog
+from hevyai.infrastructure.repositories.catalog_exercise_template_repository import CatalogExerciseTemplateRepository
+from hevyai.infrastructure.repositories.hevy_exercise_template_repository import HevyExerciseTemplateRepository
+from hevyai.infrastructure.repositories.hevy_routine_repository import HevyRoutineRepository
+from hevyai.infrastructure.repositories.hevy_workout_repository import HevyWorkoutRepository
+from hevyai.infrastructure.repositories.mirror_exercise_template_repository import MirrorExerciseTemplateRepository
+from hevyai.infrastructure.repositories.mirror_routine_repository import MirrorRoutineRepository
+from hevyai.infrastructure.repositories.mirror_workout_repository import MirrorWorkoutRepository
+from hevyai.infrastructure.repositories.mirror_workout_rollup_repository import MirrorWorkoutRollupRepository
+
+
+def use_mirror() -> bool:
+    """
+    Indica se as leituras devem usar a cópia local dos dados do Hevy.
+
+    Returns:
+        True se settings.HEVY_DATA_SOURCE for 'mirror'
+    """
+    return settings.HEVY_DATA_SOURCE == 'mirror'
+
+
+def get_workout_repository() -> WorkoutRepository:
+    """
+    Obtém o repositório de treinos da origem de dados configurada.
+
+    Returns:
+        O repositório de treinos
+    """
+    api_repository = HevyWorkoutRepository(get_hevy_client())
+    return MirrorWorkoutRepository(api_repository) if use_mirror() else api_repository
+
+
+def get_routine_repository() -> RoutineRepository:
+    """
+    Obtém o repositório de rotinas da origem de dados configurada.
+
+    Returns:
+        O repositório de rotinas
+    """
+    api_repository = HevyRoutineRepository(get_hevy_client())
+    return MirrorRoutineRepository(api_repository) if use_mirror() else api_repository
+
+
+def get_workout_rollup_repository() -> WorkoutRollupRepository:
+    """
+    Obtém o repositório dos totais de treinos por período.
+
+    Os totais só existem na cópia local e são mantidos pela sincronização
+    (sync_hevy), qualquer que seja a origem de dados das demais leituras.
+
+    Returns:
+        O repositório dos totais por período
+    """
+    return MirrorWorkoutRollupRepository()
+
+
+def get_exercise_template_source() -> ExerciseTemplateRepository:
+    """
+    Obtém o repositório de modelos de exercícios da origem de dados configurada, sem o catálogo.
+
+    Returns:
+        O repositório de modelos de exercícios da API ou da cópia local
+    """
+    api_repository = HevyExerciseTemplateRepository(get_hevy_client())
+    return MirrorExerciseTemplateRepository(api_repository) if use_mirror() else api_repository
+
+
+def get_exercise_template_repository() -> ExerciseTemplateRepository:
+    """
+    Obtém o repositório de modelos de exercícios da origem de dados configurada.
+
+    Com settings.HEVY_TEMPLATE_CATALOG ativo, as leituras são servidas pelo
+    catálogo em memória do processo, carregado a partir da origem configurada.
+
+    Returns:
+        O repositório de modelos de exercícios
+    """
+    source_repository = get_exercise_template_source()
+    if not settings.HEVY_TEMPLATE_CATALOG:
+        return source_repository
+
+    key = (settings.HEVY_API_KEY or '', settings.HEVY_API_URL, settings.HEVY_DATA_SOURCE)
+    catalog = get_exercise_template_catalog(key, get_exercise_template_source)
+    return CatalogExerciseTemplateRepository(catalog, source_repository)
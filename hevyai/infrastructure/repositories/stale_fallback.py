@@ -0,0 +1,42 @@
+"""
+Suporte a dados desatualizados nos repositórios baseados na API do Hevy.
+"""
+
+from typing import Any, Callable
+
+from hevyai.infrastructure.api.clients.exceptions import HevyApiUnavailableError
+
+
+class StaleFallbackMixin:
+    """
+    Permite que um repositório sirva a última resposta conhecida da API do Hevy.
+
+    Quando a API está indisponível (ou o circuito do endpoint está aberto) e o
+    cliente tem uma resposta anterior bem-sucedida, ela é usada no lugar da nova e
+    o repositório passa a indicar `is_stale = True`. Sem resposta anterior, a
+    exceção é propagada.
+    """
+
+    is_stale = False
+
+    def _fetch(self, call: Callable[..., Any], *args: Any) -> Any:
+        """
+        Executa uma chamada ao cliente com fallback para dados desatualizados.
+
+        Args:
+            call: Método do cliente da API
+            *args: Argumentos da chamada
+
+        Returns:
+            A resposta da API ou, se ela estiver indisponível, a última resposta conhecida
+
+        Raises:
+            HevyApiUnavailableError: Se a API estiver indisponível e não houver resposta anterior
+        """
+        try:
+            return call(*args)
+        except HevyApiUnavailableError as e:
+            if e.stale_data is None:
+                raise
+            self.is_stale = True
+            return e.stale_data
@@ -0,0 +1,611 @@
+"""
+Sincronização da cópia local (espelho) dos dados do Hevy.
+Faz a carga completa de cada recurso e, depois dela, aplica apenas os eventos de
+treinos (atualizações e exclusões) ocorridos desde o último cursor salvo.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+
+from hevyai.core.models import (
+    HevyDeletedWorkout,
+    HevyExerciseTemplate,
+    HevyRoutine,
+    HevyRoutineExercise,
+    HevyRoutineFolder,
+    HevyRoutineSet,
+    HevySyncState,
+    HevyWorkout,
+    HevyWorkoutExercise,
+    HevyWorkoutSet,
+)
+from hevyai.domain.timestamps import parse_timestamp
+from hevyai.infrastructure.api.clients.client_registry import get_hevy_client
+from hevyai.infrastructure.api.clients.hevy_client import HevyApiClient
+from hevyai.infrastructure.repositories.pagination import iter_pages
+from hevyai.infrastructure.sync.workout_rollups import WorkoutRollupService
+
+# Recursos sincronizados, na ordem em que a carga completa é feita
+RESOURCES = ('exercise_templates', 'routine_folders', 'routines', 'workouts')
+
+# Cursor usado quando ainda não há eventos aplicados
+EPOCH = '1970-01-01T00:00:00Z'
+
+WORKOUT_FIELDS = ['title', 'description', 'routine_id', 'start_time', 'end_time', 'created_at', 'updated_at']
+ROUTINE_FIELDS = ['title', 'description', 'folder_id', 'is_public', 'created_at', 'updated_at']
+TEMPLATE_FIELDS = [
+    'title', 'description', 'exercise_type', 'primary_muscle_group', 'muscle_groups', 'is_custom',
+    'created_at', 'updated_at'
+]
+FOLDER_FIELDS = ['title', 'index', 'created_at', 'updated_at']
+
+
+@dataclass
+class SyncPhaseResult:
+    """
+    Resultado de uma fase da sincronização.
+
+    Attributes:
+        phase: Nome da fase (ex.: 'backfill:workouts', 'events:workouts')
+        items: Itens (ou eventos) recebidos da API
+        pages: Páginas lidas
+        rows: Linhas gravadas, incluindo exercícios e séries
+        removed: Itens removidos da cópia local
+        seconds: Duração da fase
+        resumed_from_page: Página do ponto de controle retomado (0 se não houve retomada)
+    """
+    phase: str
+    items: int = 0
+    pages: int = 0
+    rows: int = 0
+    removed: int = 0
+    seconds: float = 0.0
+    resumed_from_page: int = 0
+
+    @property
+    def items_per_second(self) -> float:
+        """Vazão da fase em itens por segundo."""
+        return self.items / self.seconds if self.seconds else 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Vazão da fase em linhas gravadas por segundo."""
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class HevySyncService:
+    """
+    Mantém a cópia local dos dados do Hevy em dia.
+
+    Treinos são sincronizados de forma incremental pelos eventos de treinos, com o
+    cursor persistido em `HevySyncState`. Rotinas, modelos de exercícios e pastas
+    não têm eventos na API e são recarregados por completo a cada sincronização.
+    Todas as gravações usam inserções em lote com upsert. Cada lote de treinos
+    gravados ou excluídos recalcula os totais por período (HevyWorkoutRollup)
+    dos dias, semanas e meses que ele alterou.
+    """
+
+    def __init__(
+        self,
+        api_client: Optional[HevyApiClient] = None,
+        batch_size: int = 1000,
+        rollups: Optional[WorkoutRollupService] = None
+    ):
+        """
+        Inicializa o serviço.
+
+        Args:
+            api_client: Cliente da API do Hevy (opcional, padrão: cliente compartilhado)
+            batch_size: Quantidade máxima de linhas por comando de inserção
+            rollups: Serviço dos totais por período (padrão: um novo WorkoutRollupService)
+        """
+        self.api_client = api_client or get_hevy_client()
+        self.batch_size = batch_size
+        self.rollups = rollups or WorkoutRollupService(batch_size=batch_size)
+
+    def sync(
+        self,
+        full: bool = False,
+        restart: bool = False,
+        on_phase: Optional[Callable[[SyncPhaseResult], None]] = None,
+        resources: Optional[Iterable[str]] = None
+    ) -> List[SyncPhaseResult]:
+        """
+        Sincroniza todos os recursos.
+
+        Rotinas, modelos de exercícios e pastas são recarregados por completo.
+        Treinos passam pela carga completa apenas na primeira sincronização (ou com
+        `full`); depois disso só os eventos desde o cursor são aplicados. Execuções
+        interrompidas são retomadas do último ponto de controle.
+
+        Args:
+            full: Se True, faz a carga completa também dos treinos
+            restart: Se True, descarta pontos de controle de execuções interrompidas
+            on_phase: Função chamada ao fim de cada fase, com o seu resultado
+            resources: Recursos a sincronizar (padrão: todos)
+
+        Returns:
+            Resultado de cada fase, na ordem em que foram executadas
+        """
+        results = []
+        selected = set(resources or RESOURCES)
+        for resource in RESOURCES:
+            if resource not in selected:
+                continue
+            state = self._state(resource)
+            if resource == 'workouts' and not full and state.backfilled_at and state.run_kind != 'backfill':
+                result = self.sync_workout_events(restart=restart)
+            else:
+                result = self.backfill(resource, restart=restart)
+            results.append(result)
+            if on_phase is not None:
+                on_phase(result)
+        return results
+
+    def is_backfilled(self, resource: str) -> bool:
+        """
+        Indica se a carga completa de um recurso já foi concluída.
+
+        Args:
+            resource: Nome do recurso
+
+        Returns:
+            True se o recurso já foi carregado por completo
+        """
+        return HevySyncState.objects.filter(resource=resource, backfilled_at__isnull=False).exists()
+
+    def backfill_all(self, restart: bool = False) -> List[SyncPhaseResult]:
+        """
+        Faz a carga completa de todos os recursos.
+
+        Args:
+            restart: Se True, descarta pontos de controle de execuções interrompidas
+
+        Returns:
+            Resultado da carga de cada recurso
+        """
+        return [self.backfill(resource, restart=restart) for resource in RESOURCES]
+
+    def backfill(self, resource: str, restart: bool = False) -> SyncPhaseResult:
+        """
+        Faz a carga completa de um recurso, removendo da cópia local os itens que
+        não existem mais no Hevy.
+
+        Os itens são gravados em lotes de `batch_size`, e após cada lote a última
+        página gravada é salva como ponto de controle. Uma carga interrompida é
+        retomada a partir dessa página (lida de novo, como margem para itens que
+        mudaram de página). Itens não regravados desde o início da carga são
+        considerados removidos no Hevy. Para treinos, o cursor de eventos passa a
+        ser o início da carga, de modo que alterações feitas durante ela são
+        reaplicadas pela próxima sincronização.
+
+        Args:
+            resource: Nome do recurso ('workouts', 'routines', 'exercise_templates' ou 'routine_folders')
+            restart: Se True, ignora o ponto de controle de uma carga interrompida
+
+        Returns:
+            O resultado da carga
+        """
+        fetch_page = {
+            'workouts': self.api_client.get_workouts,
+            'routines': self.api_client.get_routines,
+            'exercise_templates': self.api_client.get_exercise_templates,
+            'routine_folders': self.api_client.get_routine_folders,
+        }[resource]
+        upsert = self._upserts()[resource]
+        state = self._state(resource)
+        result = SyncPhaseResult(phase=f'backfill:{resource}')
+        started = time.perf_counter()
+
+        if state.run_kind == 'backfill' and not restart:
+            result.resumed_from_page = state.run_page
+        else:
+            self._begin_run(state, 'backfill')
+
+        batch: List[Dict[str, Any]] = []
+        for page_number, page_data in iter_pages(fetch_page, start_page=max(1, state.run_page)):
+            items = page_data.get(resource, [])
+            batch.extend(items)
+            result.pages += 1
+            result.items += len(items)
+            if len(batch) >= self.batch_size:
+                result.rows += upsert(batch)
+                batch = []
+                self._checkpoint(state, page_number)
+        if batch:
+            result.rows += upsert(batch)
+
+        result.removed = self._remove_missing(resource, state.run_started_at)
+        if resource == 'workouts':
+            state.cursor = state.run_started_at.isoformat()
+        state.backfilled_at = timezone.now()
+        self._end_run(state)
+        result.seconds = time.perf_counter() - started
+        return result
+
+    def sync_workout_events(self, restart: bool = False) -> SyncPhaseResult:
+        """
+        Aplica os eventos de treinos ocorridos desde o cursor salvo.
+
+        Cada página de eventos é aplicada em uma transação e salva como ponto de
+        controle, junto com a data do evento mais recente já visto. O cursor só
+        avança quando todas as páginas foram aplicadas; uma leitura interrompida é
+        retomada da última página concluída com o mesmo cursor.
+
+        Args:
+            restart: Se True, ignora o ponto de controle de uma leitura interrompida
+
+        Returns:
+            O resultado da leitura de eventos
+        """
+        state = self._state('workouts')
+        since = state.cursor or EPOCH
+        result = SyncPhaseResult(phase='events:workouts')
+        started = time.perf_counter()
+
+        if state.run_kind == 'events' and not restart:
+            result.resumed_from_page = state.run_page
+        else:
+            self._begin_run(state, 'events')
+
+        newest = parse_timestamp(state.run_cursor)
+        pages = iter_pages(lambda page: self.api_client.get_workout_events(since, page), start_page=max(1, state.run_page))
+        for page_number, page_data in pages:
+            events = page_data.get('events', [])
+            counts = self.apply_workout_events(events)
+            result.pages += 1
+            result.items += len(events)
+            result.rows += counts['rows']
+            result.removed += counts['deleted']
+            for event in events:
+                timestamp = parse_timestamp(_event_timestamp(event))
+                if timestamp is not None and (newest is None or timestamp > newest):
+                    newest = timestamp
+            state.run_cursor = newest.isoformat() if newest else None
+            self._checkpoint(state, page_number)
+
+        if state.run_cursor:
+            state.cursor = state.run_cursor
+        self._end_run(state)
+        result.seconds = time.perf_counter() - started
+        return result
+
+    def apply_workout_events(self, events: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Aplica uma lista de eventos de treinos à cópia local.
+
+        Quando um mesmo treino aparece em mais de um evento, vale o mais recente.
+        Eventos mais antigos que o estado já gravado (treino atualizado depois, ou
+        excluído depois) são ignorados, o que torna a aplicação idempotente e
+        independente da ordem das páginas.
+
+        Args:
+            events: Eventos no formato da API ('updated' com o treino ou 'deleted' com o ID)
+
+        Returns:
+            Dicionário com a quantidade de treinos atualizados, excluídos e ignorados
+            e de linhas gravadas
+        """
+        latest: Dict[str, Tuple[Optional[datetime], Dict[str, Any]]] = {}
+        for event in events:
+            workout_id = event.get('id') or (event.get('workout') or {}).get('id')
+            if not workout_id:
+                continue
+            timestamp = parse_timestamp(_event_timestamp(event))
+            previous = latest.get(workout_id)
+            if previous is None or _is_newer(timestamp, previous[0]):
+                latest[workout_id] = (timestamp, event)
+
+        ids = list(latest)
+        stored = dict(HevyWorkout.objects.filter(id__in=ids).values_list('id', 'updated_at'))
+        tombstones = dict(HevyDeletedWorkout.objects.filter(id__in=ids).values_list('id', 'deleted_at'))
+
+        updated, deleted, skipped = [], [], 0
+        for workout_id, (timestamp, event) in latest.items():
+            if event.get('type') == 'deleted':
+                if _is_newer(stored.get(workout_id), timestamp):
+                    skipped += 1
+                else:
+                    deleted.append(event)
+            elif event.get('workout'):
+                if _is_newer(stored.get(workout_id), timestamp) or _is_newer(tombstones.get(workout_id), timestamp):
+                    skipped += 1
+                else:
+                    updated.append(event['workout'])
+
+        rows = self.upsert_workouts(updated) if updated else 0
+        if deleted:
+            self.delete_workouts(deleted)
+        return {'updated': len(updated), 'deleted': len(deleted), 'skipped': skipped, 'rows': rows}
+
+    def upsert_workouts(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Grava treinos, substituindo seus exercícios e séries.
+
+        Args:
+            items: Treinos no formato da API
+
+        Returns:
+            Quantidade de linhas gravadas (treinos, exercícios e séries)
+        """
+        workouts, exercises, sets = [], [], []
+        for data in items:
+            workouts.append(HevyWorkout(
+                id=data['id'],
+                title=data.get('title') or '',
+                description=data.get('description'),
+                routine_id=data.get('routine_id'),
+                start_time=parse_timestamp(data.get('start_time')),
+                end_time=parse_timestamp(data.get('end_time')),
+                created_at=parse_timestamp(data.get('created_at')),
+                updated_at=parse_timestamp(data.get('updated_at')),
+            ))
+            for position, exercise_data in enumerate(data.get('exercises', [])):
+                exercise_id = f"{data['id']}:{position}"
+                exercises.append(HevyWorkoutExercise(
+                    id=exercise_id,
+                    workout_id=data['id'],
+                    position=position,
+                    hevy_id=exercise_data.get('id') or '',
+                    exercise_template_id=exercise_data.get('exercise_template_id') or '',
+                    title=exercise_data.get('title') or '',
+                    notes=exercise_data.get('notes'),
+                    superset_id=exercise_data.get('superset_id'),
+                ))
+                for set_position, set_data in enumerate(exercise_data.get('sets', [])):
+                    sets.append(HevyWorkoutSet(
+                        id=f"{exercise_id}:{set_position}",
+                        exercise_id=exercise_id,
+                        position=set_position,
+                        hevy_id=set_data.get('id') or '',
+                        set_type=set_data.get('type'),
+                        reps=set_data.get('reps'),
+                        weight=set_data.get('weight', set_data.get('weight_kg')),
+                        duration=set_data.get('duration', set_data.get('duration_seconds')),
+                        distance=set_data.get('distance', set_data.get('distance_meters')),
+                        rpe=set_data.get('rpe'),
+                        completed=set_data.get('completed', True),
+                    ))
+
+        ids = [workout.id for workout in workouts]
+        with transaction.atomic():
+            # Os períodos de antes e de depois da alteração têm os totais recalculados
+            touched = self._start_times(ids) + [workout.start_time for workout in workouts]
+            self._clear_workout_children(ids)
+            HevyWorkout.objects.bulk_create(
+                workouts, batch_size=self.batch_size,
+                update_conflicts=True, unique_fields=['id'], update_fields=WORKOUT_FIELDS + ['synced_at']
+            )
+            HevyWorkoutExercise.objects.bulk_create(exercises, batch_size=self.batch_size)
+            HevyWorkoutSet.objects.bulk_create(sets, batch_size=self.batch_size)
+            HevyDeletedWorkout.objects.filter(id__in=ids).delete()
+            self.rollups.refresh(touched)
+        return len(workouts) + len(exercises) + len(sets)
+
+    def delete_workouts(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Remove treinos excluídos no Hevy e registra as exclusões.
+
+        Args:
+            events: Eventos de exclusão ({'type': 'deleted', 'id', 'deleted_at'})
+        """
+        ids = [event['id'] for event in events]
+        with transaction.atomic():
+            touched = self._start_times(ids)
+            self._clear_workout_children(ids)
+            HevyWorkout.objects.filter(id__in=ids).delete()
+            HevyDeletedWorkout.objects.bulk_create(
+                [HevyDeletedWorkout(id=e['id'], deleted_at=parse_timestamp(e.get('deleted_at'))) for e in events],
+                batch_size=self.batch_size,
+                update_conflicts=True, unique_fields=['id'], update_fields=['deleted_at', 'synced_at']
+            )
+            self.rollups.refresh(touched)
+
+    def upsert_routines(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Grava rotinas, substituindo seus exercícios e séries.
+
+        Args:
+            items: Rotinas no formato da API
+
+        Returns:
+            Quantidade de linhas gravadas (rotinas, exercícios e séries)
+        """
+        routines, exercises, sets = [], [], []
+        for data in items:
+            routine_id = str(data['id'])
+            folder_id = data.get('folder_id')
+            routines.append(HevyRoutine(
+                id=routine_id,
+                title=data.get('title') or '',
+                description=data.get('description') or data.get('notes'),
+                folder_id=str(folder_id) if folder_id is not None else None,
+                is_public=data.get('is_public', False),
+                created_at=parse_timestamp(data.get('created_at')),
+                updated_at=parse_timestamp(data.get('updated_at')),
+            ))
+            for position, exercise_data in enumerate(data.get('exercises', [])):
+                exercise_id = f"{routine_id}:{position}"
+                exercises.append(HevyRoutineExercise(
+                    id=exercise_id,
+                    routine_id=routine_id,
+                    position=exercise_data.get('index', position),
+                    hevy_id=exercise_data.get('id') or '',
+                    exercise_template_id=exercise_data.get('exercise_template_id') or '',
+                    title=exercise_data.get('title') or '',
+                    notes=exercise_data.get('notes'),
+                ))
+                for set_position, set_data in enumerate(exercise_data.get('sets', [])):
+                    sets.append(HevyRoutineSet(
+                        id=f"{exercise_id}:{set_position}",
+                        exercise_id=exercise_id,
+                        position=set_position,
+                        hevy_id=set_data.get('id') or '',
+                        set_type=set_data.get('type'),
+                        reps=set_data.get('reps'),
+                        weight=set_data.get('weight', set_data.get('weight_kg')),
+                        duration=set_data.get('duration', set_data.get('duration_seconds')),
+                        distance=set_data.get('distance', set_data.get('distance_meters')),
+                        rest_seconds=set_data.get('rest_seconds', exercise_data.get('rest_seconds')),
+                    ))
+
+        ids = [routine.id for routine in routines]
+        with transaction.atomic():
+            HevyRoutineSet.objects.filter(exercise__routine_id__in=ids).delete()
+            HevyRoutineExercise.objects.filter(routine_id__in=ids).delete()
+            HevyRoutine.objects.bulk_create(
+                routines, batch_size=self.batch_size,
+                update_conflicts=True, unique_fields=['id'], update_fields=ROUTINE_FIELDS + ['synced_at']
+            )
+            HevyRoutineExercise.objects.bulk_create(exercises, batch_size=self.batch_size)
+            HevyRoutineSet.objects.bulk_create(sets, batch_size=self.batch_size)
+        return len(routines) + len(exercises) + len(sets)
+
+    def upsert_exercise_templates(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Grava modelos de exercícios.
+
+        Args:
+            items: Modelos de exercícios no formato da API
+
+        Returns:
+            Quantidade de modelos gravados
+        """
+        templates = []
+        for data in items:
+            primary = data.get('primary_muscle_group')
+            muscle_groups = data.get('muscle_groups')
+            if muscle_groups is None:
+                groups = ([primary] if primary else []) + list(data.get('secondary_muscle_groups') or [])
+                muscle_groups = [{'id': group, 'name': group} for group in groups]
+            templates.append(HevyExerciseTemplate(
+                id=str(data['id']),
+                title=data.get('title') or data.get('name') or '',
+                description=data.get('description'),
+                exercise_type=data.get('type'),
+                primary_muscle_group=primary or (muscle_groups[0]['name'] if muscle_groups else None),
+                muscle_groups=muscle_groups,
+                is_custom=data.get('is_custom', False),
+                created_at=parse_timestamp(data.get('created_at')),
+                updated_at=parse_timestamp(data.get('updated_at')),
+            ))
+        HevyExerciseTemplate.objects.bulk_create(
+            templates, batch_size=self.batch_size,
+            update_conflicts=True, unique_fields=['id'], update_fields=TEMPLATE_FIELDS + ['synced_at']
+        )
+        return len(templates)
+
+    def upsert_routine_folders(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Grava pastas de rotinas.
+
+        Args:
+            items: Pastas de rotinas no formato da API
+
+        Returns:
+            Quantidade de pastas gravadas
+        """
+        folders = [
+            HevyRoutineFolder(
+                id=str(data['id']),
+                title=data.get('title') or '',
+                index=data.get('index') or 0,
+                created_at=parse_timestamp(data.get('created_at')),
+                updated_at=parse_timestamp(data.get('updated_at')),
+            )
+            for data in items
+        ]
+        HevyRoutineFolder.objects.bulk_create(
+            folders, batch_size=self.batch_size,
+            update_conflicts=True, unique_fields=['id'], update_fields=FOLDER_FIELDS + ['synced_at']
+        )
+        return len(folders)
+
+    def _upserts(self) -> Dict[str, Callable[[List[Dict[str, Any]]], int]]:
+        """Associa cada recurso ao método que grava seus itens."""
+        return {
+            'workouts': self.upsert_workouts,
+            'routines': self.upsert_routines,
+            'exercise_templates': self.upsert_exercise_templates,
+            'routine_folders': self.upsert_routine_folders,
+        }
+
+    def _remove_missing(self, resource: str, since: datetime) -> int:
+        """
+        Remove da cópia local os itens de um recurso não regravados desde uma data.
+
+        Args:
+            resource: Nome do recurso
+            since: Início da carga completa
+
+        Returns:
+            Quantidade de itens removidos
+        """
+        model = {
+            'workouts': HevyWorkout,
+            'routines': HevyRoutine,
+            'exercise_templates': HevyExerciseTemplate,
+            'routine_folders': HevyRoutineFolder,
+        }[resource]
+        missing = list(model.objects.filter(synced_at__lt=since).values_list('id', flat=True))
+        if not missing:
+            return 0
+        with transaction.atomic():
+            touched = self._start_times(missing) if resource == 'workouts' else []
+            if resource == 'workouts':
+                self._clear_workout_children(missing)
+            model.objects.filter(id__in=missing).delete()
+            self.rollups.refresh(touched)
+        return len(missing)
+
+    def _state(self, resource: str) -> HevySyncState:
+        """Obtém (ou cria) o estado de sincronização de um recurso."""
+        state, _ = HevySyncState.objects.get_or_create(resource=resource)
+        return state
+
+    def _begin_run(self, state: HevySyncState, kind: str) -> None:
+        """Registra o início de uma execução, descartando pontos de controle anteriores."""
+        state.run_kind = kind
+        state.run_started_at = timezone.now()
+        state.run_page = 0
+        state.run_cursor = None
+        state.save()
+
+    def _checkpoint(self, state: HevySyncState, page: int) -> None:
+        """Salva a última página concluída da execução em andamento."""
+        state.run_page = page
+        state.save(update_fields=['run_page', 'run_cursor', 'updated_at'])
+
+    def _end_run(self, state: HevySyncState) -> None:
+        """Conclui a execução em andamento, limpando o ponto de controle."""
+        state.run_kind = None
+        state.run_started_at = None
+        state.run_page = 0
+        state.run_cursor = None
+        state.save()
+
+    def _start_times(self, workout_ids: List[str]) -> List[Optional[datetime]]:
+        """Obtém os inícios gravados de treinos, antes de alterá-los ou excluí-los."""
+        return list(HevyWorkout.objects.filter(id__in=workout_ids).values_list('start_time', flat=True))
+
+    def _clear_workout_children(self, workout_ids: List[str]) -> None:
+        """Remove os exercícios e as séries de treinos, começando pelas séries."""
+        HevyWorkoutSet.objects.filter(exercise__workout_id__in=workout_ids).delete()
+        HevyWorkoutExercise.objects.filter(workout_id__in=workout_ids).delete()
+
+
+def _is_newer(value: Optional[datetime], other: Optional[datetime]) -> bool:
+    """Indica se uma data é posterior a outra (datas ausentes nunca são posteriores)."""
+    return value is not None and (other is None or value > other)
+
+
+def _event_timestamp(event: Dict[str, Any]) -> Optional[str]:
+    """Obtém a data de um evento de treino (exclusão ou última atualização)."""
+    if event.get('type') == 'deleted':
+        return event.get('deleted_at')
+    return (event.get('workout') or {}).get('updated_at')
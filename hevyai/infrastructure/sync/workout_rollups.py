@@ -0,0 +1,153 @@
+"""
+Manutenção dos totais de treinos por período na cópia local.
+Recalcula apenas os períodos (dia, semana e mês) dos treinos alterados.
+"""
+
+from datetime import date, datetime, time, tzinfo
+from typing import Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count, DateField, DurationField, ExpressionWrapper, F, FloatField, Q, Sum
+from django.db.models.functions import Trunc
+from django.utils import timezone
+
+from hevyai.core.models import HevyWorkout, HevyWorkoutExercise, HevyWorkoutRollup, HevyWorkoutSet
+from hevyai.domain.entities.workout_rollup import ROLLUP_PERIODS, next_period_start, period_start
+
+# Intervalos de datas por consulta de agregação
+RANGES_PER_QUERY = 100
+
+
+class WorkoutRollupService:
+    """
+    Recalcula os totais (HevyWorkoutRollup) dos períodos que contêm treinos alterados.
+
+    Cada período recalculado é lido do zero da cópia local, por consultas de
+    agregação restritas aos intervalos de datas dos períodos (usando o índice de
+    início dos treinos), e a sua linha é substituída. Por isso o recálculo pode
+    ser repetido e não depende da ordem das alterações; basta que os instantes
+    de início de antes e de depois de cada alteração sejam informados.
+    """
+
+    def __init__(self, tz: Optional[tzinfo] = None, batch_size: int = 1000):
+        """
+        Inicializa o serviço.
+
+        Args:
+            tz: Fuso horário dos períodos (padrão: o fuso da aplicação)
+            batch_size: Quantidade máxima de linhas por comando de inserção ou exclusão
+        """
+        self.tz = tz or timezone.get_default_timezone()
+        self.batch_size = batch_size
+
+    def refresh(self, start_times: Iterable[Optional[datetime]]) -> int:
+        """
+        Recalcula os períodos que contêm os instantes informados.
+
+        Args:
+            start_times: Inícios de treinos gravados ou excluídos (None é ignorado)
+
+        Returns:
+            Quantidade de linhas de totais gravadas
+        """
+        days = {timezone.localtime(moment, self.tz).date() for moment in start_times if moment is not None}
+        if not days:
+            return 0
+
+        keys: List[str] = []
+        rollups: List[HevyWorkoutRollup] = []
+        for period in ROLLUP_PERIODS:
+            starts = sorted({period_start(day, period) for day in days})
+            keys.extend(_rollup_id(period, start) for start in starts)
+            ranges = self._ranges(starts, period)
+            for offset in range(0, len(ranges), RANGES_PER_QUERY):
+                rollups.extend(self._compute(period, ranges[offset:offset + RANGES_PER_QUERY]))
+
+        with transaction.atomic():
+            for offset in range(0, len(keys), self.batch_size):
+                HevyWorkoutRollup.objects.filter(id__in=keys[offset:offset + self.batch_size]).delete()
+            HevyWorkoutRollup.objects.bulk_create(rollups, batch_size=self.batch_size)
+        return len(rollups)
+
+    def rebuild(self) -> int:
+        """
+        Recalcula os totais de todos os períodos a partir da cópia local.
+
+        Returns:
+            Quantidade de linhas de totais gravadas
+        """
+        with transaction.atomic():
+            HevyWorkoutRollup.objects.all().delete()
+            start_times = HevyWorkout.objects.exclude(start_time=None).values_list('start_time', flat=True)
+            return self.refresh(start_times.iterator())
+
+    def _ranges(self, starts: List[date], period: str) -> List[Tuple[datetime, datetime]]:
+        """Converte períodos ordenados em intervalos de instantes, unindo períodos seguidos."""
+        ranges: List[Tuple[date, date]] = []
+        for start in starts:
+            end = next_period_start(start, period)
+            if ranges and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], end)
+            else:
+                ranges.append((start, end))
+        return [(self._midnight(start), self._midnight(end)) for start, end in ranges]
+
+    def _midnight(self, day: date) -> datetime:
+        return timezone.make_aware(datetime.combine(day, time.min), self.tz)
+
+    def _compute(self, period: str, ranges: List[Tuple[datetime, datetime]]) -> List[HevyWorkoutRollup]:
+        """Agrega os treinos, as séries e os exercícios dos intervalos por período."""
+        workouts = (
+            HevyWorkout.objects.filter(self._within(ranges, ''))
+            .annotate(period_start=self._trunc('start_time', period))
+            .order_by().values('period_start')
+            .annotate(
+                workouts=Count('id'),
+                duration=Sum(ExpressionWrapper(F('end_time') - F('start_time'), output_field=DurationField()))
+            )
+        )
+        sets = {
+            row['period_start']: row
+            for row in HevyWorkoutSet.objects.filter(self._within(ranges, 'exercise__workout__'), completed=True)
+            .annotate(period_start=self._trunc('exercise__workout__start_time', period))
+            .order_by().values('period_start')
+            .annotate(sets=Count('id'), volume=Sum(F('weight') * F('reps'), output_field=FloatField()))
+        }
+        exercises = dict(
+            HevyWorkoutExercise.objects.filter(self._within(ranges, 'workout__'))
+            .exclude(exercise_template_id='')
+            .annotate(period_start=self._trunc('workout__start_time', period))
+            .order_by().values('period_start')
+            .annotate(distinct_exercises=Count('exercise_template_id', distinct=True))
+            .values_list('period_start', 'distinct_exercises')
+        )
+
+        rollups = []
+        for row in workouts:
+            start = row['period_start']
+            set_totals = sets.get(start, {})
+            duration = row['duration']
+            rollups.append(HevyWorkoutRollup(
+                id=_rollup_id(period, start),
+                period=period,
+                period_start=start,
+                workouts=row['workouts'],
+                sets=set_totals.get('sets', 0),
+                volume=set_totals.get('volume') or 0.0,
+                duration=max(int(duration.total_seconds()), 0) if duration else 0,
+                distinct_exercises=exercises.get(start, 0),
+            ))
+        return rollups
+
+    def _within(self, ranges: List[Tuple[datetime, datetime]], prefix: str) -> Q:
+        condition = Q()
+        for start, end in ranges:
+            condition |= Q(**{f'{prefix}start_time__gte': start, f'{prefix}start_time__lt': end})
+        return condition
+
+    def _trunc(self, field: str, period: str) -> Trunc:
+        return Trunc(field, period, output_field=DateField(), tzinfo=self.tz)
+
+
+def _rollup_id(period: str, start: date) -> str:
+    return f'{period}:{start.isoformat()}'
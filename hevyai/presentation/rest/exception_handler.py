@@ -0,0 +1,30 @@
+"""
+Tratamento de exceções da API REST.
+"""
+
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import exception_handler
+
+from hevyai.infrastructure.api.clients.exceptions import HevyApiUnavailableError
+
+
+def hevy_exception_handler(exc, context):
+    """
+    Converte a indisponibilidade da API do Hevy em uma resposta 503.
+
+    As demais exceções seguem o tratamento padrão do Django REST Framework.
+
+    Args:
+        exc: Exceção levantada pela view
+        context: Contexto da view
+
+    Returns:
+        A resposta de erro ou None se a exceção não for tratada
+    """
+    if isinstance(exc, HevyApiUnavailableError):
+        return Response(
+            {"message": "API do Hevy indisponível no momento", "endpoint": exc.endpoint},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+    return exception_handler(exc, context)
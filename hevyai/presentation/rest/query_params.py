@@ -0,0 +1,54 @@
+"""
+Leitura dos parâmetros de consulta comuns aos endpoints da API REST.
+"""
+
+from datetime import datetime, time, timedelta
+from typing import Optional, Tuple
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+
+def parse_period(request, start_param: str = 'from', end_param: str = 'to') -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Lê um período dos parâmetros de consulta.
+
+    Aceita datas (AAAA-MM-DD) ou datas e horas ISO 8601. Uma data final sem hora
+    inclui o dia inteiro. Datas sem fuso usam o fuso horário da aplicação.
+
+    Args:
+        request: Requisição do DRF
+        start_param: Nome do parâmetro de início (padrão: 'from')
+        end_param: Nome do parâmetro de fim (padrão: 'to')
+
+    Returns:
+        Tupla (início inclusivo, fim exclusivo), com None nos limites não informados
+
+    Raises:
+        ValidationError: Se uma data for inválida ou o início for posterior ao fim
+    """
+    start = _parse_bound(request.query_params.get(start_param), start_param, end_of_day=False)
+    end = _parse_bound(request.query_params.get(end_param), end_param, end_of_day=True)
+    if start and end and start >= end:
+        raise ValidationError({end_param: "A data final deve ser posterior à data inicial"})
+    return start, end
+
+
+def _parse_bound(value: Optional[str], name: str, end_of_day: bool) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        # Datas sem hora primeiro: parse_datetime também as aceita, como meia-noite
+        day = parse_date(value)
+        if day is not None:
+            parsed = datetime.combine(day + timedelta(days=1) if end_of_day else day, time.min)
+        else:
+            parsed = parse_datetime(value)
+            if parsed is None:
+                raise ValueError(value)
+    except ValueError:
+        raise ValidationError({name: f"Data inválida: '{value}' (use AAAA-MM-DD ou ISO 8601)"})
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
@@ -0,0 +1,72 @@
+"""
+Serializadores para as análises do histórico de treinos.
+Converte os resumos de volume, tonelagem e intensidade, as séries de carga de
+treino e os totais por período para JSON.
+"""
+
+from rest_framework import serializers
+
+
+class TrainingTotalsSerializer(serializers.Serializer):
+    """Serializador para os totais de um treino, exercício ou período."""
+    key = serializers.CharField()
+    name = serializers.CharField(allow_null=True)
+    workouts = serializers.IntegerField()
+    sets = serializers.IntegerField()
+    reps = serializers.IntegerField()
+    volume = serializers.FloatField()
+    tonnage = serializers.FloatField()
+    duration = serializers.IntegerField()
+    distance = serializers.FloatField()
+    average_intensity = serializers.FloatField(allow_null=True)
+    average_rpe = serializers.FloatField(allow_null=True)
+    first_performed = serializers.DateTimeField(allow_null=True)
+    last_performed = serializers.DateTimeField(allow_null=True)
+
+
+class TrainingSummarySerializer(serializers.Serializer):
+    """Serializador para o resumo do histórico de treinos em um período."""
+    group_by = serializers.CharField()
+    start = serializers.DateTimeField(allow_null=True)
+    end = serializers.DateTimeField(allow_null=True)
+    totals = TrainingTotalsSerializer()
+    groups = TrainingTotalsSerializer(many=True)
+
+
+class TrainingLoadDaySerializer(serializers.Serializer):
+    """Serializador para a carga de treino de um dia."""
+    day = serializers.DateField()
+    load = serializers.FloatField()
+    acute = serializers.FloatField()
+    chronic = serializers.FloatField()
+    ratio = serializers.FloatField(allow_null=True)
+
+
+class TrainingLoadSeriesSerializer(serializers.Serializer):
+    """Serializador para a série diária de carga de treino de um escopo."""
+    metric = serializers.CharField()
+    scope = serializers.CharField()
+    acute_days = serializers.IntegerField()
+    chronic_days = serializers.IntegerField()
+    start = serializers.DateField()
+    end = serializers.DateField()
+    scopes = serializers.ListField(child=serializers.CharField())
+    days = TrainingLoadDaySerializer(many=True)
+
+
+class WorkoutRollupSerializer(serializers.Serializer):
+    """Serializador para os totais dos treinos de um período."""
+    period_start = serializers.DateField()
+    workouts = serializers.IntegerField()
+    sets = serializers.IntegerField()
+    volume = serializers.FloatField()
+    duration = serializers.IntegerField()
+    distinct_exercises = serializers.IntegerField()
+
+
+class WorkoutRollupsSerializer(serializers.Serializer):
+    """Serializador para os totais por período de um intervalo."""
+    period = serializers.CharField()
+    start = serializers.DateField(allow_null=True)
+    end = serializers.DateField(allow_null=True)
+    rollups = WorkoutRollupSerializer(many=True)
@@ -0,0 +1,27 @@
+"""
+Serializadores para a evolução de um modelo de exercício.
+Converte as séries temporais de um modelo de exercício para JSON.
+"""
+
+from rest_framework import serializers
+
+
+class HistoryPointSerializer(serializers.Serializer):
+    """Serializador para um ponto de uma série temporal (um treino)."""
+    performed_at = serializers.DateTimeField()
+    workout_id = serializers.CharField()
+    value = serializers.FloatField()
+    reps = serializers.IntegerField(allow_null=True)
+
+
+class ExerciseHistorySerializer(serializers.Serializer):
+    """Serializador para a evolução de um modelo de exercício em um período."""
+    exercise_template_id = serializers.CharField()
+    start = serializers.DateTimeField(allow_null=True)
+    end = serializers.DateTimeField(allow_null=True)
+    points = serializers.IntegerField()
+    sessions = serializers.IntegerField()
+    downsampled = serializers.BooleanField()
+    top_set = HistoryPointSerializer(many=True)
+    e1rm = HistoryPointSerializer(many=True)
+    volume = HistoryPointSerializer(many=True)
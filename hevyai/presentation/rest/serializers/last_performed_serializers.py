@@ -0,0 +1,33 @@
+"""
+Serializadores para os valores anteriores dos exercícios de uma rotina.
+Converte a última execução de cada exercício para JSON.
+"""
+
+from rest_framework import serializers
+
+
+class PreviousSetSerializer(serializers.Serializer):
+    """Serializador para uma série da última execução de um exercício."""
+    weight = serializers.FloatField(allow_null=True)
+    reps = serializers.IntegerField(allow_null=True)
+    duration = serializers.IntegerField(allow_null=True)
+    distance = serializers.FloatField(allow_null=True)
+    rpe = serializers.FloatField(allow_null=True)
+
+
+class RoutineExercisePreviousSerializer(serializers.Serializer):
+    """Serializador para os valores anteriores de um exercício da rotina."""
+    id = serializers.CharField()
+    exercise_template_id = serializers.CharField()
+    name = serializers.CharField()
+    order = serializers.IntegerField()
+    workout_id = serializers.CharField(allow_null=True)
+    performed_at = serializers.DateTimeField(allow_null=True)
+    sets = PreviousSetSerializer(many=True)
+
+
+class RoutinePreviousValuesSerializer(serializers.Serializer):
+    """Serializador para os valores anteriores de todos os exercícios de uma rotina."""
+    routine_id = serializers.CharField()
+    routine_name = serializers.CharField()
+    exercises = RoutineExercisePreviousSerializer(many=True)
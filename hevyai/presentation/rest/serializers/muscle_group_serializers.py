@@ -0,0 +1,57 @@
+"""
+Serializadores para grupos musculares.
+Converte os dados de grupos musculares e do volume treinado para JSON.
+"""
+
+from rest_framework import serializers
+
+from hevyai.presentation.rest.serializers.exercise_template_serializers import MuscleGroupSerializer
+
+
+class MuscleGroupSummarySerializer(serializers.Serializer):
+    """Serializador para um grupo muscular e a quantidade de modelos de exercícios dele."""
+    id = serializers.CharField(read_only=True)
+    name = serializers.CharField()
+    template_count = serializers.IntegerField()
+
+
+class MuscleGroupTemplateVolumeSerializer(serializers.Serializer):
+    """Serializador para o volume de um modelo de exercício dentro de um grupo muscular."""
+    exercise_template_id = serializers.CharField()
+    name = serializers.CharField()
+    is_primary = serializers.BooleanField()
+    workouts = serializers.IntegerField()
+    sets = serializers.IntegerField()
+    reps = serializers.IntegerField()
+    volume = serializers.FloatField()
+    duration = serializers.IntegerField()
+    distance = serializers.FloatField()
+    last_performed = serializers.DateTimeField(allow_null=True)
+
+
+class MuscleGroupVolumeSerializer(serializers.Serializer):
+    """Serializador para o volume treinado de um grupo muscular em um período."""
+    muscle_group = serializers.CharField()
+    start = serializers.DateTimeField(allow_null=True)
+    end = serializers.DateTimeField(allow_null=True)
+    workouts = serializers.IntegerField()
+    sets = serializers.IntegerField()
+    reps = serializers.IntegerField()
+    volume = serializers.FloatField()
+    duration = serializers.IntegerField()
+    distance = serializers.FloatField()
+    last_performed = serializers.DateTimeField(allow_null=True)
+    templates = MuscleGroupTemplateVolumeSerializer(many=True)
+    recent_workout_ids = serializers.ListField(child=serializers.CharField())
+
+
+class MuscleGroupWeeksSerializer(serializers.Serializer):
+    """Serializador para as séries e o volume por semana e grupo muscular."""
+    secondary_weight = serializers.FloatField()
+    start = serializers.DateTimeField(allow_null=True)
+    end = serializers.DateTimeField(allow_null=True)
+    weeks = serializers.ListField(child=serializers.DateField())
+    muscle_groups = MuscleGroupSerializer(many=True)
+    sets = serializers.ListField(child=serializers.ListField(child=serializers.FloatField()))
+    volume = serializers.ListField(child=serializers.ListField(child=serializers.FloatField()))
+    unassigned_sets = serializers.ListField(child=serializers.IntegerField())
@@ -0,0 +1,36 @@
+"""
+Serializadores para recordes pessoais.
+Converte os recordes de um modelo de exercício para JSON.
+"""
+
+from rest_framework import serializers
+
+
+class RecordSetSerializer(serializers.Serializer):
+    """Serializador para a série que detém um recorde."""
+    value = serializers.FloatField()
+    weight = serializers.FloatField()
+    reps = serializers.IntegerField()
+    workout_id = serializers.CharField()
+    performed_at = serializers.DateTimeField(allow_null=True)
+
+
+class OneRepMaxPointSerializer(serializers.Serializer):
+    """Serializador para o melhor 1RM estimado de um treino."""
+    workout_id = serializers.CharField()
+    performed_at = serializers.DateTimeField(allow_null=True)
+    epley = serializers.FloatField()
+    brzycki = serializers.FloatField(allow_null=True)
+    is_record = serializers.BooleanField()
+
+
+class PersonalRecordsSerializer(serializers.Serializer):
+    """Serializador para os recordes pessoais de um modelo de exercício."""
+    exercise_template_id = serializers.CharField()
+    workouts = serializers.IntegerField()
+    best_weight = RecordSetSerializer(allow_null=True)
+    best_e1rm_epley = RecordSetSerializer(allow_null=True)
+    best_e1rm_brzycki = RecordSetSerializer(allow_null=True)
+    best_volume_set = RecordSetSerializer(allow_null=True)
+    rep_maxes = RecordSetSerializer(many=True)
+    e1rm_history = OneRepMaxPointSerializer(many=True)
@@ -0,0 +1,60 @@
+"""
+Serializadores para a aderência dos treinos às rotinas.
+Converte a comparação entre o planejado e o executado para JSON.
+"""
+
+from rest_framework import serializers
+
+
+class ExerciseAdherenceSerializer(serializers.Serializer):
+    """Serializador para a comparação de um exercício planejado com o executado."""
+    exercise_template_id = serializers.CharField()
+    name = serializers.CharField()
+    planned_sets = serializers.IntegerField()
+    performed_sets = serializers.IntegerField()
+    missed_sets = serializers.IntegerField()
+    extra_sets = serializers.IntegerField()
+    skipped = serializers.BooleanField()
+    reps_delta = serializers.FloatField(allow_null=True)
+    weight_delta = serializers.FloatField(allow_null=True)
+
+
+class WorkoutAdherenceSerializer(serializers.Serializer):
+    """Serializador para a aderência de um treino à sua rotina."""
+    workout_id = serializers.CharField()
+    workout_name = serializers.CharField()
+    routine_id = serializers.CharField()
+    routine_name = serializers.CharField()
+    matched_by = serializers.CharField()
+    similarity = serializers.FloatField()
+    score = serializers.FloatField()
+    start_time = serializers.DateTimeField(allow_null=True)
+    planned_exercises = serializers.IntegerField()
+    skipped_exercises = serializers.IntegerField()
+    extra_exercises = serializers.IntegerField()
+    planned_sets = serializers.IntegerField()
+    missed_sets = serializers.IntegerField()
+    extra_sets = serializers.IntegerField()
+    reps_delta = serializers.FloatField(allow_null=True)
+    weight_delta = serializers.FloatField(allow_null=True)
+    exercises = ExerciseAdherenceSerializer(many=True)
+
+
+class RoutineAdherenceSummarySerializer(serializers.Serializer):
+    """Serializador para a aderência média dos treinos de uma rotina."""
+    routine_id = serializers.CharField()
+    routine_name = serializers.CharField()
+    workouts = serializers.IntegerField()
+    average_score = serializers.FloatField()
+    skipped_exercises = serializers.IntegerField()
+    missed_sets = serializers.IntegerField()
+    last_performed = serializers.DateTimeField(allow_null=True)
+
+
+class RoutineAdherenceReportSerializer(serializers.Serializer):
+    """Serializador para a aderência às rotinas dos treinos de um período."""
+    start = serializers.DateTimeField(allow_null=True)
+    end = serializers.DateTimeField(allow_null=True)
+    unmatched_workouts = serializers.IntegerField()
+    routines = RoutineAdherenceSummarySerializer(many=True)
+    workouts = WorkoutAdherenceSerializer(many=True)
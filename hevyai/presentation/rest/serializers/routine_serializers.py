@@ -3,9 +3,17 @@ Serializadores para rotinas.
 Converte objetos de rotina para JSON e vice-versa.
 """
 
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Optional
+
 from rest_framework import serializers
 
 
+def _optional(convert: Callable[[Any], Any], value: Any) -> Optional[Any]:
+    """Aplica a conversão do campo do DRF, mantendo None como None."""
+    return None if value is None else convert(value)
+
+
 class RoutineSetSerializer(serializers.Serializer):
     """Serializador para um conjunto de exercícios em uma rotina."""
     id = serializers.CharField(read_only=True)
@@ -15,6 +23,19 @@ class RoutineSetSerializer(serializers.Serializer):
     distance = serializers.FloatField(allow_null=True, required=False)
     rest_seconds = serializers.IntegerField(allow_null=True, required=False)
 
+    def to_representation(self, instance: Any) -> Dict[str, Any]:
+        """Converte uma série diretamente, com as mesmas conversões dos campos."""
+        if isinstance(instance, Mapping):
+            return super().to_representation(instance)
+        return {
+            'id': _optional(str, instance.id),
+            'reps': _optional(int, instance.reps),
+            'weight': _optional(float, instance.weight),
+            'duration': _optional(int, instance.duration),
+            'distance': _optional(float, instance.distance),
+            'rest_seconds': _optional(int, instance.rest_seconds),
+        }
+
 
 class RoutineExerciseSerializer(serializers.Serializer):
     """Serializador para um exercício em uma rotina."""
@@ -25,6 +46,20 @@ class RoutineExerciseSerializer(serializers.Serializer):
     sets = RoutineSetSerializer(many=True)
     order = serializers.IntegerField(default=0)
 
+    def to_representation(self, instance: Any) -> Dict[str, Any]:
+        """Converte um exercício e as suas séries diretamente (ver RoutineSetSerializer)."""
+        if isinstance(instance, Mapping):
+            return super().to_representation(instance)
+        represent_set = self.fields['sets'].child.to_representation
+        return {
+            'id': _optional(str, instance.id),
+            'exercise_template_id': _optional(str, instance.exercise_template_id),
+            'name': _optional(str, instance.name),
+            'notes': _optional(str, instance.notes),
+            'sets': [represent_set(set_item) for set_item in instance.sets],
+            'order': _optional(int, instance.order),
+        }
+
 
 class RoutineSerializer(serializers.Serializer):
     """Serializador para uma rotina completa."""
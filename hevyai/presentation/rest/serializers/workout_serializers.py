@@ -3,9 +3,17 @@ Serializadores para treinos.
 Converte objetos de treino para JSON e vice-versa.
 """
 
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Optional
+
 from rest_framework import serializers
 
 
+def _optional(convert: Callable[[Any], Any], value: Any) -> Optional[Any]:
+    """Aplica a conversão do campo do DRF, mantendo None como None."""
+    return None if value is None else convert(value)
+
+
 class SetSerializer(serializers.Serializer):
     """Serializador para um conjunto de exercícios em um treino."""
     id = serializers.CharField(read_only=True)
@@ -16,6 +24,25 @@ class SetSerializer(serializers.Serializer):
     rpe = serializers.FloatField(allow_null=True, required=False)
     completed = serializers.BooleanField(default=True)
 
+    def to_representation(self, instance: Any) -> Dict[str, Any]:
+        """
+        Converte uma série diretamente, com as mesmas conversões dos campos.
+
+        As séries são a maior parte de um histórico de treinos; montar o
+        dicionário aqui evita percorrer os campos do DRF um a um para cada série.
+        """
+        if isinstance(instance, Mapping):
+            return super().to_representation(instance)
+        return {
+            'id': _optional(str, instance.id),
+            'reps': _optional(int, instance.reps),
+            'weight': _optional(float, instance.weight),
+            'duration': _optional(int, instance.duration),
+            'distance': _optional(float, instance.distance),
+            'rpe': _optional(float, instance.rpe),
+            'completed': _optional(bool, instance.completed),
+        }
+
 
 class ExerciseSerializer(serializers.Serializer):
     """Serializador para um exercício em um treino."""
@@ -25,6 +52,19 @@ class ExerciseSerializer(serializers.Serializer):
     notes = serializers.CharField(allow_null=True, required=False)
     sets = SetSerializer(many=True)
 
+    def to_representation(self, instance: Any) -> Dict[str, Any]:
+        """Converte um exercício e as suas séries diretamente (ver SetSerializer)."""
+        if isinstance(instance, Mapping):
+            return super().to_representation(instance)
+        represent_set = self.fields['sets'].child.to_representation
+        return {
+            'id': _optional(str, instance.id),
+            'exercise_template_id': _optional(str, instance.exercise_template_id),
+            'name': _optional(str, instance.name),
+            'notes': _optional(str, instance.notes),
+            'sets': [represent_set(set_item) for set_item in instance.sets],
+        }
+
 
 class WorkoutSerializer(serializers.Serializer):
     """Serializador para um treino completo."""
@@ -32,6 +72,7 @@ class WorkoutSerializer(serializers.Serializer):
     name = serializers.CharField()
     exercises = ExerciseSerializer(many=True)
     notes = serializers.CharField(allow_null=True, required=False)
+    routine_id = serializers.CharField(allow_null=True, read_only=True)
     start_time = serializers.DateTimeField(allow_null=True, required=False)
     end_time = serializers.DateTimeField(allow_null=True, required=False)
     created_at = serializers.DateTimeField(read_only=True)
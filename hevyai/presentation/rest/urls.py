@@ -8,12 +8,18 @@ from rest_framework.routers import DefaultRouter
 from hevyai.presentation.rest.viewsets.workout_viewsets import WorkoutViewSet
 from hevyai.presentation.rest.viewsets.routine_viewsets import RoutineViewSet
 from hevyai.presentation.rest.viewsets.exercise_template_viewsets import ExerciseTemplateViewSet
+from hevyai.presentation.rest.viewsets.muscle_group_viewsets import MuscleGroupViewSet
+from hevyai.presentation.rest.viewsets.upstream_viewsets import UpstreamViewSet
+from hevyai.presentation.rest.viewsets.analytics_viewsets import AnalyticsViewSet
 
 # Criar um router e registrar os viewsets
 router = DefaultRouter()
 router.register(r'workouts', WorkoutViewSet, basename='workout')
 router.register(r'routines', RoutineViewSet, basename='routine')
 router.register(r'exercise-templates', ExerciseTemplateViewSet, basename='exercise-template')
+router.register(r'muscle-groups', MuscleGroupViewSet, basename='muscle-group')
+router.register(r'upstream', UpstreamViewSet, basename='upstream')
+router.register(r'analytics', AnalyticsViewSet, basename='analytics')
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -0,0 +1,120 @@
+"""
+Viewsets para os endpoints de análise do histórico de treinos.
+"""
+
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from hevyai.application.use_cases.analytics_use_cases import (
+    GetTrainingLoadUseCase,
+    GetTrainingSummaryUseCase,
+    GetWorkoutRollupsUseCase,
+)
+from hevyai.domain.entities.workout_rollup import ROLLUP_PERIODS
+from hevyai.domain.services.training_load_service import METRIC_VOLUME, METRICS, SCOPE_ALL
+from hevyai.domain.services.workout_analysis_service import GROUP_BY_OPTIONS
+from hevyai.infrastructure.indexes.index_factory import get_set_history_repository, get_training_load_repository
+from hevyai.infrastructure.repositories.repository_factory import get_workout_rollup_repository
+from hevyai.presentation.rest.query_params import parse_period
+from hevyai.presentation.rest.serializers.analytics_serializers import (
+    TrainingLoadSeriesSerializer,
+    TrainingSummarySerializer,
+    WorkoutRollupsSerializer,
+)
+
+
+class AnalyticsViewSet(viewsets.ViewSet):
+    """
+    Viewset para as análises do histórico de treinos.
+
+    As análises são calculadas sobre o índice colunar de séries mantido pelo
+    hub de índices de treinos, sem reler o histórico a cada requisição.
+    """
+
+    @action(detail=False, methods=['get'])
+    def summary(self, request):
+        """
+        Resume volume, tonelagem, séries, duração, intensidade e RPE do período.
+
+        GET /api/analytics/summary/
+
+        Parâmetros de consulta:
+        - from: Data inicial (AAAA-MM-DD ou ISO 8601, opcional)
+        - to: Data final, inclusiva quando informada sem hora (opcional)
+        - group_by: workout, exercise, day, week, month ou year (padrão: week)
+        """
+        start, end = parse_period(request)
+        group_by = request.query_params.get('group_by', 'week')
+        if group_by not in GROUP_BY_OPTIONS:
+            raise ValidationError({'group_by': f"Use um destes valores: {', '.join(GROUP_BY_OPTIONS)}"})
+
+        use_case = GetTrainingSummaryUseCase(get_set_history_repository())
+        summary = use_case.execute(start, end, group_by, timezone.get_current_timezone())
+        serializer = TrainingSummarySerializer(summary)
+        return Response(serializer.data)
+
+    @action(detail=False, methods=['get'], url_path='training-load')
+    def training_load(self, request):
+        """
+        Carga diária com as médias móveis exponenciais aguda (7 dias) e crônica
+        (28 dias) e a razão entre elas (ACWR).
+
+        GET /api/analytics/training-load/
+
+        Parâmetros de consulta:
+        - metric: volume (peso x repetições) ou srpe (RPE médio x minutos) (padrão: volume)
+        - muscle_group: ID do grupo muscular principal, ou all (padrão: all)
+        - from: Data inicial (padrão: 90 dias antes da data final)
+        - to: Data final, inclusiva (padrão: hoje)
+        """
+        metric = request.query_params.get('metric', METRIC_VOLUME)
+        if metric not in METRICS:
+            raise ValidationError({'metric': f"Use um destes valores: {', '.join(METRICS)}"})
+        scope = request.query_params.get('muscle_group') or SCOPE_ALL
+
+        start_day, end_day = _local_days(request)
+        use_case = GetTrainingLoadUseCase(get_training_load_repository())
+        try:
+            series = use_case.execute(metric, scope, timezone.localdate(), start_day, end_day)
+        except ValueError as e:
+            raise ValidationError({'from': str(e)})
+        serializer = TrainingLoadSeriesSerializer(series)
+        return Response(serializer.data)
+
+    @action(detail=False, methods=['get'])
+    def rollups(self, request):
+        """
+        Totais de treinos, séries, volume, duração e exercícios distintos por período.
+
+        GET /api/analytics/rollups/
+
+        Os totais são mantidos pela sincronização da cópia local (sync_hevy) e
+        lidos sem agregar as séries.
+
+        Parâmetros de consulta:
+        - period: day, week ou month (padrão: week)
+        - from: Data inicial (opcional)
+        - to: Data final, inclusiva (opcional)
+        """
+        period = request.query_params.get('period', 'week')
+        if period not in ROLLUP_PERIODS:
+            raise ValidationError({'period': f"Use um destes valores: {', '.join(ROLLUP_PERIODS)}"})
+        start_day, end_day = _local_days(request)
+
+        use_case = GetWorkoutRollupsUseCase(get_workout_rollup_repository())
+        rollups = use_case.execute(period, start_day, end_day)
+        serializer = WorkoutRollupsSerializer(rollups)
+        return Response(serializer.data)
+
+
+def _local_days(request):
+    """Lê o período da consulta como dias locais inclusivos (o fim de parse_period é exclusivo)."""
+    start, end = parse_period(request)
+    start_day = timezone.localdate(start) if start else None
+    end_day = timezone.localdate(end - timedelta(microseconds=1)) if end else None
+    return start_day, end_day
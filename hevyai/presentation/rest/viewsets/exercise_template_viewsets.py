@@ -3,17 +3,31 @@ Viewsets para os endpoints relacionados a modelos de exercícios.
 """
 
 from rest_framework import viewsets, status
+from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from hevyai.application.use_cases.exercise_template_use_cases import (
     GetExerciseTemplatesUseCase, 
-    GetExerciseTemplateByIdUseCase
+    GetExerciseTemplateByIdUseCase,
+    GetExerciseTemplateHistoryUseCase,
+    GetExerciseTemplateRecordsUseCase,
+    SearchExerciseTemplatesUseCase
 )
-from hevyai.infrastructure.repositories.hevy_exercise_template_repository import HevyExerciseTemplateRepository
+from hevyai.domain.services.exercise_history_service import MIN_POINTS
+from hevyai.infrastructure.indexes.index_factory import get_exercise_history_repository, get_personal_record_repository
+from hevyai.infrastructure.repositories.repository_factory import get_exercise_template_repository
+from hevyai.presentation.rest.query_params import parse_period
+from hevyai.presentation.rest.viewsets.mixins import StaleResponseMixin
+from hevyai.presentation.rest.serializers.exercise_history_serializers import ExerciseHistorySerializer
 from hevyai.presentation.rest.serializers.exercise_template_serializers import ExerciseTemplateSerializer
+from hevyai.presentation.rest.serializers.personal_record_serializers import PersonalRecordsSerializer
 
+# Pontos por série na evolução de um modelo de exercício
+DEFAULT_HISTORY_POINTS = 300
+MAX_HISTORY_POINTS = 5000
 
-class ExerciseTemplateViewSet(viewsets.ViewSet):
+
+class ExerciseTemplateViewSet(StaleResponseMixin, viewsets.ViewSet):
     """
     Viewset para gerenciar modelos de exercícios.
     
@@ -25,9 +39,10 @@ class ExerciseTemplateViewSet(viewsets.ViewSet):
         Inicializa o viewset com os casos de uso necessários.
         """
         super().__init__(**kwargs)
-        self.template_repository = HevyExerciseTemplateRepository()
+        self.template_repository = get_exercise_template_repository()
         self.get_templates_use_case = GetExerciseTemplatesUseCase(self.template_repository)
         self.get_template_by_id_use_case = GetExerciseTemplateByIdUseCase(self.template_repository)
+        self.search_templates_use_case = SearchExerciseTemplatesUseCase(self.template_repository)
 
     def list(self, request):
         """
@@ -38,11 +53,17 @@ class ExerciseTemplateViewSet(viewsets.ViewSet):
         Parâmetros de consulta:
         - page: Número da página (padrão: 1)
         - per_page: Itens por página (padrão: 10)
+        - is_custom: 'true' para apenas personalizados, 'false' para apenas os padrão
+        - muscle_group: ID ou nome de um grupo muscular
         """
         page = int(request.query_params.get('page', 1))
         per_page = int(request.query_params.get('per_page', 10))
+        is_custom = request.query_params.get('is_custom')
+        if is_custom is not None:
+            is_custom = is_custom.lower() in ('1', 'true', 'yes')
+        muscle_group = request.query_params.get('muscle_group')
         
-        templates = self.get_templates_use_case.execute(page, per_page)
+        templates = self.get_templates_use_case.execute(page, per_page, is_custom, muscle_group)
         serializer = ExerciseTemplateSerializer(templates, many=True)
         
         return Response(serializer.data)
@@ -62,4 +83,88 @@ class ExerciseTemplateViewSet(viewsets.ViewSet):
             )
             
         serializer = ExerciseTemplateSerializer(template)
-        return Response(serializer.data)
\ No newline at end of file
+        return Response(serializer.data)
+
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """
+        Busca modelos de exercícios por nome e descrição.
+        
+        GET /api/exercise-templates/search/?q=
+        
+        Aceita palavras parciais ("inclin"), sem acentos, com erros de digitação
+        e abreviações ("db", "supino"). Os resultados vêm ordenados por relevância.
+        
+        Parâmetros de consulta:
+        - q: Texto da busca
+        - limit: Quantidade máxima de resultados (padrão: 20, máximo: 100)
+        """
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response(
+                {"message": "Informe o texto da busca no parâmetro 'q'"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            limit = min(max(int(request.query_params.get('limit', 20)), 1), 100)
+        except ValueError:
+            return Response(
+                {"message": "O parâmetro 'limit' deve ser um número inteiro"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        templates = self.search_templates_use_case.execute(query, limit)
+        serializer = ExerciseTemplateSerializer(templates, many=True)
+        
+        return Response(serializer.data)
+
+    @action(detail=True, methods=['get'])
+    def records(self, request, pk=None):
+        """
+        Obtém os recordes pessoais de um modelo de exercício.
+        
+        GET /api/exercise-templates/{id}/records/
+        
+        Retorna o maior peso, o máximo de repetições por peso, o maior 1RM
+        estimado (Epley e Brzycki), a série de maior volume e a evolução do 1RM
+        estimado por treino, com os treinos que bateram recorde. Os recordes vêm
+        do índice mantido a partir do histórico de treinos.
+        """
+        use_case = GetExerciseTemplateRecordsUseCase(get_personal_record_repository())
+        
+        records = use_case.execute(pk)
+        serializer = PersonalRecordsSerializer(records)
+        return Response(serializer.data)
+
+    @action(detail=True, methods=['get'])
+    def history(self, request, pk=None):
+        """
+        Obtém a evolução de um modelo de exercício: série principal, 1RM estimado
+        e volume de cada treino.
+        
+        GET /api/exercise-templates/{id}/history/
+        
+        As séries vêm do índice das sessões de cada modelo, ordenado pelo início
+        do treino. Quando o período tem mais treinos que o pedido, cada série é
+        reduzida no servidor (LTTB), mantendo picos, vales e as pontas.
+        
+        Parâmetros de consulta:
+        - from: Data inicial (AAAA-MM-DD ou ISO 8601, opcional)
+        - to: Data final, inclusiva quando informada sem hora (opcional)
+        - points: Quantidade máxima de pontos por série (padrão: 300, de 3 a 5000)
+        """
+        start, end = parse_period(request)
+        try:
+            points = int(request.query_params.get('points', DEFAULT_HISTORY_POINTS))
+        except ValueError:
+            points = 0
+        if not MIN_POINTS <= points <= MAX_HISTORY_POINTS:
+            return Response(
+                {"message": f"O parâmetro 'points' deve ser um inteiro de {MIN_POINTS} a {MAX_HISTORY_POINTS}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        use_case = GetExerciseTemplateHistoryUseCase(get_exercise_history_repository())
+        history = use_case.execute(pk, points, start, end)
+        serializer = ExerciseHistorySerializer(history)
+        return Response(serializer.data)
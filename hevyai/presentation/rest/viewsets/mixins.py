@@ -0,0 +1,24 @@
+"""
+Mixins compartilhados pelos viewsets.
+"""
+
+from hevyai.infrastructure.repositories.stale_fallback import StaleFallbackMixin
+
+
+class StaleResponseMixin:
+    """
+    Marca respostas montadas com dados desatualizados da API do Hevy.
+
+    Se algum repositório do viewset serviu a última resposta conhecida porque a
+    API estava indisponível, a resposta recebe o cabeçalho
+    `Warning: 110 - "Response is Stale"`.
+    """
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if any(
+            isinstance(value, StaleFallbackMixin) and value.is_stale
+            for value in vars(self).values()
+        ):
+            response['Warning'] = '110 - "Response is Stale"'
+        return response
@@ -0,0 +1,116 @@
+"""
+Viewsets para os endpoints relacionados a grupos musculares.
+"""
+
+from django.utils import timezone
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from hevyai.application.use_cases.muscle_group_use_cases import (
+    ListMuscleGroupsUseCase,
+    GetMuscleGroupTemplatesUseCase,
+    GetMuscleGroupVolumeUseCase,
+    GetMuscleGroupWeeksUseCase
+)
+from hevyai.infrastructure.indexes.index_factory import get_set_history_repository, get_template_usage_repository
+from hevyai.infrastructure.repositories.repository_factory import get_exercise_template_repository
+from hevyai.presentation.rest.query_params import parse_period
+from hevyai.presentation.rest.serializers.exercise_template_serializers import ExerciseTemplateSerializer
+from hevyai.presentation.rest.serializers.muscle_group_serializers import (
+    MuscleGroupSummarySerializer,
+    MuscleGroupVolumeSerializer,
+    MuscleGroupWeeksSerializer
+)
+from hevyai.presentation.rest.viewsets.mixins import StaleResponseMixin
+
+
+class MuscleGroupViewSet(StaleResponseMixin, viewsets.ViewSet):
+    """
+    Viewset para consultar grupos musculares.
+    
+    Os modelos de exercícios de um grupo vêm do índice de grupos musculares do
+    catálogo, e o volume treinado do índice de uso de modelos de exercícios,
+    mantido a partir do histórico de treinos.
+    """
+    
+    def __init__(self, **kwargs):
+        """
+        Inicializa o viewset com os casos de uso necessários.
+        """
+        super().__init__(**kwargs)
+        self.template_repository = get_exercise_template_repository()
+        self.list_groups_use_case = ListMuscleGroupsUseCase(self.template_repository)
+        self.get_group_templates_use_case = GetMuscleGroupTemplatesUseCase(self.template_repository)
+
+    def list(self, request):
+        """
+        Lista os grupos musculares dos modelos de exercícios.
+        
+        GET /api/muscle-groups/
+        """
+        groups = self.list_groups_use_case.execute()
+        serializer = MuscleGroupSummarySerializer(groups, many=True)
+        return Response(serializer.data)
+
+    @action(detail=True, methods=['get'])
+    def templates(self, request, pk=None):
+        """
+        Lista os modelos de exercícios de um grupo muscular, ordenados por nome.
+        
+        GET /api/muscle-groups/{id}/templates/
+        
+        Parâmetros de consulta:
+        - page: Número da página (padrão: 1)
+        - per_page: Itens por página (padrão: 10)
+        """
+        page = int(request.query_params.get('page', 1))
+        per_page = int(request.query_params.get('per_page', 10))
+        
+        templates = self.get_group_templates_use_case.execute(pk, page, per_page)
+        serializer = ExerciseTemplateSerializer(templates, many=True)
+        return Response(serializer.data)
+
+    @action(detail=True, methods=['get'])
+    def volume(self, request, pk=None):
+        """
+        Obtém o volume treinado de um grupo muscular, no total e por modelo de exercício.
+        
+        GET /api/muscle-groups/{id}/volume/
+        
+        Parâmetros de consulta:
+        - from: Data inicial (AAAA-MM-DD ou ISO 8601, opcional)
+        - to: Data final, inclusiva quando informada sem hora (opcional)
+        """
+        start, end = parse_period(request)
+        use_case = GetMuscleGroupVolumeUseCase(self.template_repository, get_template_usage_repository())
+        
+        volume = use_case.execute(pk, start, end)
+        serializer = MuscleGroupVolumeSerializer(volume)
+        return Response(serializer.data)
+
+    @action(detail=False, methods=['get'], url_path='weekly-volume')
+    def weekly_volume(self, request):
+        """
+        Obtém as séries e o volume de todos os grupos musculares por semana.
+        
+        GET /api/muscle-groups/weekly-volume/
+        
+        Parâmetros de consulta:
+        - from: Data inicial (AAAA-MM-DD ou ISO 8601, opcional)
+        - to: Data final, inclusiva quando informada sem hora (opcional)
+        - secondary_weight: Peso, entre 0 e 1, das séries nos grupos secundários (padrão: 0)
+        """
+        start, end = parse_period(request)
+        try:
+            secondary_weight = float(request.query_params.get('secondary_weight', 0))
+        except ValueError:
+            secondary_weight = -1.0
+        if not 0 <= secondary_weight <= 1:
+            raise ValidationError({'secondary_weight': "Use um número entre 0 e 1"})
+
+        use_case = GetMuscleGroupWeeksUseCase(self.template_repository, get_set_history_repository())
+        weeks = use_case.execute(start, end, timezone.get_current_timezone(), secondary_weight)
+        serializer = MuscleGroupWeeksSerializer(weeks)
+        return Response(serializer.data)
@@ -4,13 +4,24 @@ Viewsets para os endpoints relacionados a rotinas.
 
 from rest_framework import viewsets, status
 from rest_framework.response import Response
+from rest_framework.decorators import action
 
-from hevyai.application.use_cases.routine_use_cases import GetRoutinesUseCase, GetRoutineByIdUseCase
-from hevyai.infrastructure.repositories.hevy_routine_repository import HevyRoutineRepository
+from hevyai.application.use_cases.routine_use_cases import (
+    GetRoutineAdherenceUseCase,
+    GetRoutineByIdUseCase,
+    GetRoutinePreviousValuesUseCase,
+    GetRoutinesUseCase,
+)
+from hevyai.infrastructure.indexes.index_factory import get_last_performed_repository, get_performed_workout_repository
+from hevyai.infrastructure.repositories.repository_factory import get_routine_repository
+from hevyai.presentation.rest.query_params import parse_period
+from hevyai.presentation.rest.viewsets.mixins import StaleResponseMixin
+from hevyai.presentation.rest.serializers.last_performed_serializers import RoutinePreviousValuesSerializer
+from hevyai.presentation.rest.serializers.routine_adherence_serializers import RoutineAdherenceReportSerializer
 from hevyai.presentation.rest.serializers.routine_serializers import RoutineSerializer
 
 
-class RoutineViewSet(viewsets.ViewSet):
+class RoutineViewSet(StaleResponseMixin, viewsets.ViewSet):
     """
     Viewset para gerenciar rotinas.
     
@@ -22,7 +33,7 @@ class RoutineViewSet(viewsets.ViewSet):
         Inicializa o viewset com os casos de uso necessários.
         """
         super().__init__(**kwargs)
-        self.routine_repository = HevyRoutineRepository()
+        self.routine_repository = get_routine_repository()
         self.get_routines_use_case = GetRoutinesUseCase(self.routine_repository)
         self.get_routine_by_id_use_case = GetRoutineByIdUseCase(self.routine_repository)
 
@@ -59,4 +70,49 @@ class RoutineViewSet(viewsets.ViewSet):
             )
             
         serializer = RoutineSerializer(routine)
-        return Response(serializer.data)
\ No newline at end of file
+        return Response(serializer.data)
+
+    @action(detail=False, methods=['get'])
+    def adherence(self, request):
+        """
+        Compara os treinos do período com as rotinas das quais eles vieram.
+
+        GET /api/routines/adherence/
+
+        Cada treino é associado à rotina que ele informa ou, sem ela, à rotina
+        com os modelos de exercícios mais parecidos; o score é a fração das
+        séries planejadas que foram feitas.
+
+        Parâmetros de consulta:
+        - from: Data inicial (AAAA-MM-DD ou ISO 8601, opcional)
+        - to: Data final, inclusiva quando informada sem hora (opcional)
+        - routine_id: Mostra apenas os treinos desta rotina (opcional)
+        """
+        start, end = parse_period(request)
+        use_case = GetRoutineAdherenceUseCase(get_performed_workout_repository(), self.routine_repository)
+        report = use_case.execute(start, end, request.query_params.get('routine_id') or None)
+        serializer = RoutineAdherenceReportSerializer(report)
+        return Response(serializer.data)
+
+    @action(detail=True, methods=['get'], url_path='previous-values')
+    def previous_values(self, request, pk=None):
+        """
+        Obtém os valores da última vez em que cada exercício da rotina foi feito.
+
+        GET /api/routines/{id}/previous-values/
+
+        Para cada exercício da rotina, retorna as séries concluídas do treino mais
+        recente com o mesmo modelo de exercício, lidas do índice mantido a partir
+        do histórico de treinos, em uma única chamada.
+        """
+        use_case = GetRoutinePreviousValuesUseCase(self.routine_repository, get_last_performed_repository())
+        previous = use_case.execute(pk)
+
+        if not previous:
+            return Response(
+                {"message": "Rotina não encontrada"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        serializer = RoutinePreviousValuesSerializer(previous)
+        return Response(serializer.data)
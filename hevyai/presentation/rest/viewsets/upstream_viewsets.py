@@ -0,0 +1,29 @@
+"""
+Viewsets para os endpoints de observabilidade da integração com a API do Hevy.
+"""
+
+from rest_framework import viewsets
+from rest_framework.response import Response
+
+from hevyai.infrastructure.api.clients.client_registry import get_all_client_stats
+from hevyai.infrastructure.api.clients.request_scheduler import get_all_scheduler_stats
+
+
+class UpstreamViewSet(viewsets.ViewSet):
+    """
+    Viewset para consultar o estado da integração com a API do Hevy.
+    
+    Expõe as estatísticas do limitador de taxa, das novas tentativas e do cache de
+    respostas deste processo, úteis para dimensionar os workers em relação à cota do Hevy.
+    """
+
+    def list(self, request):
+        """
+        Obtém as estatísticas das requisições feitas à API do Hevy por este processo.
+        
+        GET /api/upstream/
+        """
+        return Response({
+            "schedulers": get_all_scheduler_stats(),
+            "clients": get_all_client_stats()
+        })
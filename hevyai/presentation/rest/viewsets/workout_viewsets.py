@@ -6,12 +6,15 @@ from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 
+from hevyai.application.use_cases.routine_use_cases import GetWorkoutAdherenceUseCase
 from hevyai.application.use_cases.workout_use_cases import GetWorkoutsUseCase, GetWorkoutByIdUseCase
-from hevyai.infrastructure.repositories.hevy_workout_repository import HevyWorkoutRepository
+from hevyai.infrastructure.repositories.repository_factory import get_routine_repository, get_workout_repository
+from hevyai.presentation.rest.viewsets.mixins import StaleResponseMixin
+from hevyai.presentation.rest.serializers.routine_adherence_serializers import WorkoutAdherenceSerializer
 from hevyai.presentation.rest.serializers.workout_serializers import WorkoutSerializer
 
 
-class WorkoutViewSet(viewsets.ViewSet):
+class WorkoutViewSet(StaleResponseMixin, viewsets.ViewSet):
     """
     Viewset para gerenciar treinos.
     
@@ -23,7 +26,7 @@ class WorkoutViewSet(viewsets.ViewSet):
         Inicializa o viewset com os casos de uso necessários.
         """
         super().__init__(**kwargs)
-        self.workout_repository = HevyWorkoutRepository()
+        self.workout_repository = get_workout_repository()
         self.get_workouts_use_case = GetWorkoutsUseCase(self.workout_repository)
         self.get_workout_by_id_use_case = GetWorkoutByIdUseCase(self.workout_repository)
 
@@ -61,6 +64,25 @@ class WorkoutViewSet(viewsets.ViewSet):
             
         serializer = WorkoutSerializer(workout)
         return Response(serializer.data)
+
+    @action(detail=True, methods=['get'])
+    def adherence(self, request, pk=None):
+        """
+        Compara um treino com a rotina da qual ele veio, exercício por exercício.
+
+        GET /api/workouts/{id}/adherence/
+        """
+        use_case = GetWorkoutAdherenceUseCase(self.workout_repository, get_routine_repository())
+        adherence = use_case.execute(pk)
+
+        if not adherence:
+            return Response(
+                {"message": "Treino não encontrado ou sem rotina associada"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        serializer = WorkoutAdherenceSerializer(adherence)
+        return Response(serializer.data)
     
     @action(detail=False, methods=['get'])
     def count(self, request):
@@ -133,6 +133,7 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
+    'EXCEPTION_HANDLER': 'hevyai.presentation.rest.exception_handler.hevy_exception_handler',
 }
 
 # Configurações de CORS
@@ -143,4 +144,42 @@ CORS_ALLOWED_ORIGINS = [
 
 # Configurações da API do Hevy
 HEVY_API_URL = os.environ.get('HEVY_API_URL', 'https://api.hevyapp.com')
-HEVY_API_KEY = os.environ.get('HEVY_API_KEY')
\ No newline at end of file
+HEVY_API_KEY = os.environ.get('HEVY_API_KEY')
+# Máximo de requisições simultâneas do cliente assíncrono ao buscar várias páginas
+HEVY_API_MAX_CONCURRENCY = int(os.environ.get('HEVY_API_MAX_CONCURRENCY', '8'))
+# Páginas buscadas antecipadamente pelos iteradores de histórico completo (iter_all)
+HEVY_API_PREFETCH_PAGES = int(os.environ.get('HEVY_API_PREFETCH_PAGES', '4'))
+# Limite de taxa compartilhado por chave de API (requisições por segundo e rajada)
+HEVY_API_RATE_LIMIT = float(os.environ.get('HEVY_API_RATE_LIMIT', '5'))
+HEVY_API_RATE_BURST = float(os.environ.get('HEVY_API_RATE_BURST', '10'))
+# Novas tentativas de requisições GET que falham com 429, 5xx ou erro de conexão
+HEVY_API_MAX_RETRIES = int(os.environ.get('HEVY_API_MAX_RETRIES', '3'))
+HEVY_API_BACKOFF_BASE = float(os.environ.get('HEVY_API_BACKOFF_BASE', '0.5'))
+HEVY_API_BACKOFF_MAX = float(os.environ.get('HEVY_API_BACKOFF_MAX', '30'))
+# Pool de conexões keep-alive do cliente compartilhado (por processo)
+HEVY_API_POOL_SIZE = int(os.environ.get('HEVY_API_POOL_SIZE', '10'))
+# Se verdadeiro, threads esperam por uma conexão livre em vez de abrir conexões extras
+HEVY_API_POOL_BLOCK = os.environ.get('HEVY_API_POOL_BLOCK', '1') == '1'
+# Cache de respostas de detalhe: respostas sem ETag/Last-Modified valem por HEVY_API_CACHE_TTL segundos
+HEVY_API_CACHE_TTL = float(os.environ.get('HEVY_API_CACHE_TTL', '60'))
+HEVY_API_CACHE_MAX_ENTRIES = int(os.environ.get('HEVY_API_CACHE_MAX_ENTRIES', '2048'))
+# Prazos (em segundos) para estabelecer a conexão e para ler a resposta
+HEVY_API_CONNECT_TIMEOUT = float(os.environ.get('HEVY_API_CONNECT_TIMEOUT', '3.05'))
+HEVY_API_READ_TIMEOUT = float(os.environ.get('HEVY_API_READ_TIMEOUT', '10'))
+# Circuit breaker por endpoint: falhas consecutivas para abrir e tempo até a chamada de teste
+HEVY_API_CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get('HEVY_API_CIRCUIT_FAILURE_THRESHOLD', '5'))
+HEVY_API_CIRCUIT_RESET_TIMEOUT = float(os.environ.get('HEVY_API_CIRCUIT_RESET_TIMEOUT', '30'))
+# Respostas guardadas para servir dados desatualizados quando a API estiver indisponível
+HEVY_API_STALE_MAX_ENTRIES = int(os.environ.get('HEVY_API_STALE_MAX_ENTRIES', '1024'))
+# Decodifica as listagens direto em entidades com o msgspec, quando ele estiver instalado
+HEVY_API_TYPED_DECODING = os.environ.get('HEVY_API_TYPED_DECODING', '1') == '1'
+# Origem das leituras dos viewsets: 'api' (API do Hevy) ou 'mirror' (cópia local sincronizada)
+HEVY_DATA_SOURCE = os.environ.get('HEVY_DATA_SOURCE', 'api')
+# Catálogo em memória de modelos de exercícios: TTL, intervalo entre verificações de
+# alterações na origem e diretório da cópia em disco (vazio desativa a cópia)
+HEVY_TEMPLATE_CATALOG = os.environ.get('HEVY_TEMPLATE_CATALOG', '1') == '1'
+HEVY_TEMPLATE_CATALOG_TTL = float(os.environ.get('HEVY_TEMPLATE_CATALOG_TTL', '3600'))
+HEVY_TEMPLATE_CATALOG_CHECK_INTERVAL = float(os.environ.get('HEVY_TEMPLATE_CATALOG_CHECK_INTERVAL', '30'))
+HEVY_TEMPLATE_CATALOG_DIR = os.environ.get('HEVY_TEMPLATE_CATALOG_DIR', str(BASE_DIR / 'var' / 'catalog'))
+# Índices de treinos em memória: segundos entre as consultas de alterações na origem
+HEVY_WORKOUT_INDEX_CHECK_INTERVAL = float(os.environ.get('HEVY_WORKOUT_INDEX_CHECK_INTERVAL', '30'))
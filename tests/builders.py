@@ -0,0 +1,54 @@
+"""
+Construção de entidades de domínio para os testes.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence
+
+from hevyai.domain.entities.workout import Exercise, Set, Workout
+
+BASE_TIME = datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+
+def make_workout(
+    workout_id: str,
+    day: int = 0,
+    exercises: Optional[Dict[str, Sequence[tuple]]] = None,
+    start_time: Optional[datetime] = None
+) -> Workout:
+    """
+    Cria um treino com os exercícios e séries informados.
+
+    Args:
+        workout_id: ID do treino
+        day: Dias a partir de BASE_TIME, usado quando start_time não é informado
+        exercises: ID do modelo de exercício -> séries como (peso, repetições[, concluída])
+        start_time: Início do treino (opcional)
+
+    Returns:
+        Entidade Workout
+    """
+    start = start_time or BASE_TIME + timedelta(days=day)
+    built: List[Exercise] = []
+    for position, (template_id, sets) in enumerate((exercises or {}).items()):
+        built.append(Exercise(
+            id=f'{workout_id}-{position}',
+            exercise_template_id=template_id,
+            name=template_id,
+            sets=[
+                Set(
+                    id=f'{workout_id}-{position}-{index}',
+                    weight=spec[0],
+                    reps=spec[1],
+                    completed=spec[2] if len(spec) > 2 else True
+                )
+                for index, spec in enumerate(sets)
+            ]
+        ))
+    return Workout(
+        id=workout_id,
+        name=workout_id,
+        exercises=built,
+        start_time=start,
+        end_time=start + timedelta(hours=1)
+    )
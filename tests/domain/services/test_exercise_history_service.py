@@ -0,0 +1,78 @@
+"""
+Testes da redução das séries de evolução pelo algoritmo Largest-Triangle-Three-Buckets.
+"""
+
+import math
+
+import pytest
+
+from hevyai.domain.services.exercise_history_service import (
+    MIN_POINTS,
+    ExerciseHistoryService,
+    largest_triangle_three_buckets,
+)
+from tests.builders import make_workout
+
+
+def _series(size: int):
+    xs = [float(x) for x in range(size)]
+    ys = [math.sin(x / 7) * 100 + (x % 5) for x in range(size)]
+    return xs, ys
+
+
+@pytest.mark.parametrize('size, threshold', [(0, 10), (1, 10), (10, 10), (10, 50)])
+def test_threshold_at_least_the_size_keeps_every_point(size, threshold):
+    xs, ys = _series(size)
+
+    assert largest_triangle_three_buckets(xs, ys, threshold) == list(range(size))
+
+
+@pytest.mark.parametrize('threshold', [0, 1, MIN_POINTS - 1])
+def test_threshold_below_the_minimum_keeps_every_point(threshold):
+    xs, ys = _series(100)
+
+    assert largest_triangle_three_buckets(xs, ys, threshold) == list(range(100))
+
+
+@pytest.mark.parametrize('size, threshold', [(11, 10), (100, 3), (100, 4), (1000, 300), (1001, 37), (5000, 5000 - 1)])
+def test_output_has_threshold_points_keeping_the_endpoints(size, threshold):
+    xs, ys = _series(size)
+
+    selected = largest_triangle_three_buckets(xs, ys, threshold)
+
+    assert len(selected) == threshold
+    assert selected[0] == 0
+    assert selected[-1] == size - 1
+    assert selected == sorted(set(selected))
+
+
+def test_keeps_isolated_peaks_and_valleys():
+    xs = [float(x) for x in range(1000)]
+    ys = [0.0] * 1000
+    ys[317] = 50.0
+    ys[800] = -30.0
+
+    selected = largest_triangle_three_buckets(xs, ys, 20)
+
+    assert 317 in selected
+    assert 800 in selected
+
+
+def test_build_history_downsamples_each_series_only_above_max_points():
+    service = ExerciseHistoryService()
+    sessions = [
+        service.summarize_workout(make_workout(f'w{day}', day, {'bench': [(60.0 + day % 9, 5), (50.0, 15)]}))['bench']
+        for day in range(40)
+    ]
+
+    full = service.build_history('bench', sessions, max_points=40)
+    reduced = service.build_history('bench', sessions, max_points=10)
+
+    assert not full.downsampled
+    assert len(full.top_set) == len(full.e1rm) == len(full.volume) == 40
+    assert reduced.downsampled
+    assert reduced.sessions == 40
+    assert len(reduced.top_set) == len(reduced.e1rm) == len(reduced.volume) == 10
+    assert reduced.top_set[0].workout_id == 'w0'
+    assert reduced.top_set[-1].workout_id == 'w39'
+    assert (reduced.top_set[0].value, reduced.top_set[0].reps) == (60.0, 5)
@@ -0,0 +1,80 @@
+"""
+Testes das fórmulas de 1RM estimado e da comparação entre séries candidatas a recorde.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from hevyai.domain.entities.personal_record import RecordSet
+from hevyai.domain.services.personal_record_service import (
+    BEST_E1RM_EPLEY,
+    BEST_WEIGHT,
+    MAX_E1RM_REPS,
+    PersonalRecordService,
+    brzycki_one_rep_max,
+    epley_one_rep_max,
+    is_better,
+)
+from tests.builders import BASE_TIME, make_workout
+
+
+def test_one_rep_max_formulas_return_the_weight_for_a_single_rep():
+    assert epley_one_rep_max(100.0, 1) == 100.0
+    assert brzycki_one_rep_max(100.0, 1) == 100.0
+
+
+@pytest.mark.parametrize('weight, reps, epley, brzycki', [
+    (100.0, 5, 116.667, 112.5),
+    (100.0, 10, 133.333, 133.333),
+    (60.0, 12, 84.0, 86.4),
+])
+def test_one_rep_max_formulas(weight, reps, epley, brzycki):
+    assert epley_one_rep_max(weight, reps) == pytest.approx(epley, abs=1e-3)
+    assert brzycki_one_rep_max(weight, reps) == pytest.approx(brzycki, abs=1e-3)
+
+
+def _record(value, reps=5, day=0):
+    return RecordSet(value, value, reps, f'w{day}', BASE_TIME + timedelta(days=day))
+
+
+def test_is_better_without_current_record():
+    assert is_better(_record(50.0), None)
+
+
+def test_is_better_prefers_the_higher_value():
+    assert is_better(_record(101.0), _record(100.0))
+    assert not is_better(_record(99.0), _record(100.0))
+
+
+def test_is_better_breaks_ties_by_reps():
+    assert is_better(_record(100.0, reps=6), _record(100.0, reps=5))
+    assert not is_better(_record(100.0, reps=4), _record(100.0, reps=5))
+
+
+def test_is_better_breaks_remaining_ties_by_the_earlier_set():
+    earlier, later = _record(100.0, day=1), _record(100.0, day=2)
+    assert is_better(earlier, later)
+    assert not is_better(later, earlier)
+    assert not is_better(_record(100.0, day=1), earlier)
+
+
+def test_summarize_workout_ignores_incomplete_and_unweighted_sets():
+    workout = make_workout('w1', exercises={
+        'bench': [(100.0, 5), (120.0, 3, False), (None, 10), (80.0, 0)],
+        'plank': [(None, None)],
+    })
+
+    summaries = PersonalRecordService().summarize_workout(workout)
+
+    assert list(summaries) == ['bench']
+    assert summaries['bench'].bests[BEST_WEIGHT].value == 100.0
+
+
+def test_summarize_workout_skips_e1rm_above_the_rep_limit():
+    workout = make_workout('w1', exercises={'curl': [(20.0, MAX_E1RM_REPS + 1)]})
+
+    summary = PersonalRecordService().summarize_workout(workout)['curl']
+
+    assert summary.bests[BEST_WEIGHT].value == 20.0
+    assert BEST_E1RM_EPLEY not in summary.bests
@@ -0,0 +1,131 @@
+"""
+Testes das médias móveis exponenciais da carga de treino: a fórmula vetorizada em
+blocos e o recálculo incremental da série diária.
+"""
+
+import random
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pytest
+
+from hevyai.domain.services.training_load_service import (
+    ACUTE_DAYS,
+    CHRONIC_DAYS,
+    EWMA_BLOCK_DAYS,
+    DailyLoadSeries,
+    ewma_alpha,
+    exponential_average,
+)
+
+START = date(2024, 1, 1)
+
+
+def _naive_average(values, alpha: float, initial: float = 0.0) -> List[float]:
+    averages = []
+    previous = initial
+    for value in values:
+        previous = alpha * value + (1 - alpha) * previous
+        averages.append(previous)
+    return averages
+
+
+def _naive_window(loads: Dict[date, float], start: date, end: date) -> List[Tuple[float, float, float]]:
+    """(carga, aguda, crônica) de cada dia, calculadas dia a dia desde o primeiro dia com carga."""
+    first = min(loads, default=start)
+    acute = chronic = 0.0
+    days = {}
+    day = min(first, start)
+    while day <= end:
+        load = loads.get(day, 0.0)
+        if day >= first:
+            acute = ewma_alpha(ACUTE_DAYS) * load + (1 - ewma_alpha(ACUTE_DAYS)) * acute
+            chronic = ewma_alpha(CHRONIC_DAYS) * load + (1 - ewma_alpha(CHRONIC_DAYS)) * chronic
+        days[day] = (load, acute, chronic)
+        day += timedelta(days=1)
+    return [days[start + timedelta(days=offset)] for offset in range((end - start).days + 1)]
+
+
+def _assert_window_matches(series: DailyLoadSeries, loads: Dict[date, float], start: date, end: date) -> None:
+    actual = series.window(start, end)
+    expected = _naive_window(loads, start, end)
+    assert [item.day for item in actual] == [start + timedelta(days=k) for k in range(len(expected))]
+    for item, (load, acute, chronic) in zip(actual, expected):
+        assert item.load == pytest.approx(load, abs=1e-9)
+        assert item.acute == pytest.approx(acute, rel=1e-9, abs=1e-9)
+        assert item.chronic == pytest.approx(chronic, rel=1e-9, abs=1e-9)
+        if chronic > 1e-9:
+            assert item.ratio == pytest.approx(acute / chronic, rel=1e-6)
+        else:
+            assert item.ratio is None
+
+
+@pytest.mark.parametrize('size', [1, EWMA_BLOCK_DAYS - 1, EWMA_BLOCK_DAYS, 5 * EWMA_BLOCK_DAYS + 17])
+@pytest.mark.parametrize('days', [ACUTE_DAYS, CHRONIC_DAYS])
+def test_exponential_average_matches_day_by_day_recurrence(size, days):
+    rng = np.random.default_rng(size + days)
+    values = rng.uniform(0, 10000, size) * (rng.random(size) < 0.4)
+    alpha = ewma_alpha(days)
+
+    actual = exponential_average(values, alpha, initial=1234.5)
+
+    assert actual.tolist() == pytest.approx(_naive_average(values, alpha, 1234.5), rel=1e-9)
+
+
+def test_window_of_an_empty_series_is_all_zeros():
+    days = DailyLoadSeries().window(START, START + timedelta(days=2))
+
+    assert [(d.load, d.acute, d.chronic, d.ratio) for d in days] == [(0.0, 0.0, 0.0, None)] * 3
+
+
+def test_window_before_the_first_load_and_after_the_last_decays():
+    series = DailyLoadSeries()
+    loads = {START + timedelta(days=10): 1000.0, START + timedelta(days=12): 500.0}
+    for day, amount in loads.items():
+        series.add(day, amount)
+
+    _assert_window_matches(series, loads, START, START + timedelta(days=200))
+
+
+def test_window_matches_naive_average_after_out_of_order_adds_and_removals():
+    rng = random.Random(7)
+    series = DailyLoadSeries()
+    # Cargas inteiras: somar e subtrair não deixa resíduo de ponto flutuante
+    contributions: List[Tuple[date, float]] = []
+    loads: Dict[date, float] = {}
+
+    def apply(day: date, amount: float) -> None:
+        series.add(day, amount)
+        loads[day] = loads.get(day, 0.0) + amount
+
+    for step in range(600):
+        if contributions and rng.random() < 0.3:
+            day, amount = contributions.pop(rng.randrange(len(contributions)))
+            apply(day, -amount)
+        else:
+            # Dias fora de ordem, inclusive antes do início atual da série
+            day = START + timedelta(days=rng.randrange(-60, 400))
+            amount = float(rng.randrange(1, 5000))
+            contributions.append((day, amount))
+            apply(day, amount)
+
+        if step % 37 == 0:
+            # Leituras intermediárias deixam o recálculo incremental partir do dia alterado
+            window_start = START + timedelta(days=rng.randrange(-90, 420))
+            _assert_window_matches(series, loads, window_start, window_start + timedelta(days=rng.randrange(0, 120)))
+
+    _assert_window_matches(series, loads, START - timedelta(days=90), START + timedelta(days=500))
+
+
+def test_removing_every_load_returns_to_zero():
+    series = DailyLoadSeries()
+    series.add(START, 300.0)
+    series.add(START + timedelta(days=3), 200.0)
+    series.window(START, START + timedelta(days=5))
+
+    series.add(START, -300.0)
+    series.add(START + timedelta(days=3), -200.0)
+    days = series.window(START, START + timedelta(days=5))
+
+    assert all(d.load == 0.0 and d.acute == 0.0 and d.chronic == 0.0 and d.ratio is None for d in days)
@@ -0,0 +1,55 @@
+"""
+Testes dos totais do serviço de análise de treinos.
+"""
+
+from datetime import timedelta
+
+from hevyai.domain.entities.set_batch import SetBatch
+from hevyai.domain.services.workout_analysis_service import WorkoutAnalysisService
+from tests.builders import make_workout
+
+
+def _workout(workout_id, day, exercises, minutes):
+    workout = make_workout(workout_id, day, exercises)
+    workout.end_time = workout.start_time + timedelta(minutes=minutes) if minutes is not None else None
+    return workout
+
+
+def _summary(workouts, group_by):
+    return WorkoutAnalysisService().summarize(SetBatch.from_workouts(workouts), group_by=group_by)
+
+
+WORKOUTS = [
+    _workout('w1', 0, {'bench': [(100.0, 5), (100.0, 5)], 'squat': [(140.0, 3)]}, 60),
+    _workout('w2', 1, {'bench': [(105.0, 3)]}, 45),
+    _workout('w3', 8, {'squat': [(150.0, 2)]}, 30),
+]
+
+
+def test_duration_is_the_time_between_start_and_end_of_each_workout():
+    summary = _summary(WORKOUTS, 'workout')
+
+    assert summary.totals.duration == 135 * 60
+    assert {group.key: group.duration for group in summary.groups} == {'w1': 3600, 'w2': 2700, 'w3': 1800}
+
+
+def test_period_and_exercise_durations_count_each_workout_once():
+    weeks = _summary(WORKOUTS, 'week')
+    exercises = _summary(WORKOUTS, 'exercise')
+
+    assert [group.duration for group in weeks.groups] == [105 * 60, 30 * 60]
+    assert {group.key: group.duration for group in exercises.groups} == {'bench': 105 * 60, 'squat': 90 * 60}
+
+
+def test_workouts_without_a_valid_end_time_have_no_duration():
+    workouts = [
+        _workout('w1', 0, {'bench': [(100.0, 5)]}, None),
+        _workout('w2', 1, {'bench': [(100.0, 5)]}, -10),
+        _workout('w3', 2, {'bench': [(100.0, 5)]}, 20),
+        _workout('w4', 3, {'bench': [(100.0, 5, False)]}, 50),
+    ]
+
+    summary = _summary(workouts, 'workout')
+
+    assert summary.totals.duration == 20 * 60
+    assert summary.totals.workouts == 3
@@ -0,0 +1,197 @@
+"""
+Testes do circuit breaker por endpoint e da sua integração com o cliente da API do Hevy.
+"""
+
+import pytest
+import requests
+
+from hevyai.infrastructure.api.clients import circuit_breaker as circuit_breaker_module
+from hevyai.infrastructure.api.clients.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from hevyai.infrastructure.api.clients.exceptions import CircuitOpenError
+from hevyai.infrastructure.api.clients.hevy_client import HevyApiClient
+
+
+class FakeClock:
+    """Relógio monotônico controlado pelo teste."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSession:
+    """Sessão HTTP que devolve (ou levanta) os resultados configurados, em ordem."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        result = self.results.pop(0)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
+def _response(status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b'{}'
+    return response
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker_module.time, 'monotonic', fake)
+    return fake
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.before_call()
+        breaker.record_failure()
+
+
+def test_opens_after_threshold_and_rejects_until_reset_timeout(clock):
+    breaker = CircuitBreaker('/v1/workouts', failure_threshold=3, reset_timeout=30)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.get_stats()['state'] == CLOSED
+
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.get_stats()['state'] == OPEN
+
+    clock.now += 29
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.get_stats()['rejected'] == 1
+
+
+def test_success_resets_consecutive_failures(clock):
+    breaker = CircuitBreaker('/v1/workouts', failure_threshold=2, reset_timeout=30)
+    breaker.before_call()
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_success()
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.get_stats()['state'] == CLOSED
+
+
+def test_half_open_allows_a_single_probe(clock):
+    breaker = CircuitBreaker('/v1/workouts', failure_threshold=1, reset_timeout=30)
+    _open(breaker)
+    clock.now += 30
+
+    breaker.before_call()
+    assert breaker.get_stats()['state'] == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_successful_probe_closes_the_circuit(clock):
+    breaker = CircuitBreaker('/v1/workouts', failure_threshold=1, reset_timeout=30)
+    _open(breaker)
+    clock.now += 30
+
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.get_stats()['state'] == CLOSED
+    breaker.before_call()
+    breaker.before_call()
+
+
+def test_failed_probe_reopens_the_circuit(clock):
+    breaker = CircuitBreaker('/v1/workouts', failure_threshold=1, reset_timeout=30)
+    _open(breaker)
+    clock.now += 30
+
+    breaker.before_call()
+    breaker.record_failure()
+    stats = breaker.get_stats()
+    assert stats['state'] == OPEN
+    assert stats['transitions'] == {'closed->open': 1, 'open->half_open': 1, 'half_open->open': 1}
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_released_probe_frees_the_slot_without_counting_a_failure(clock):
+    breaker = CircuitBreaker('/v1/workouts', failure_threshold=1, reset_timeout=30)
+    _open(breaker)
+    clock.now += 30
+
+    breaker.before_call()
+    breaker.release_probe()
+    stats = breaker.get_stats()
+    assert stats['state'] == HALF_OPEN
+    assert stats['consecutive_failures'] == 1
+    breaker.before_call()
+
+
+def _client(name: str, error: BaseException, *results) -> HevyApiClient:
+    # Chave própria por teste: o limite de taxa é compartilhado por chave de API
+    session = FakeSession(error, *results)
+    return HevyApiClient(api_key=f'test-{name}', api_url='http://hevy.test', session=session)
+
+
+@pytest.fixture
+def breaker_settings(settings):
+    settings.HEVY_API_CIRCUIT_FAILURE_THRESHOLD = 1
+    settings.HEVY_API_CIRCUIT_RESET_TIMEOUT = 30
+    return settings
+
+
+@pytest.mark.parametrize('error', [
+    requests.exceptions.ChunkedEncodingError('conexão encerrada no meio do corpo'),
+    requests.exceptions.TooManyRedirects('redirecionamentos demais'),
+    requests.exceptions.ContentDecodingError('gzip inválido'),
+])
+def test_client_probe_failing_with_a_request_error_reopens_the_circuit(clock, breaker_settings, error):
+    client = _client(f'reopen-{type(error).__name__}', error, _response(200))
+    breaker = client.breakers.get('/v1/workouts')
+    _open(breaker)
+    clock.now += 30
+
+    with pytest.raises(type(error)):
+        client._request('GET', '/v1/workouts')
+    assert breaker.get_stats()['state'] == OPEN
+
+    clock.now += 30
+    response = client._request('GET', '/v1/workouts')
+    assert response.status_code == 200
+    assert breaker.get_stats()['state'] == CLOSED
+    assert client.session.calls == 2
+
+
+@pytest.mark.parametrize('error', [RuntimeError('falha inesperada'), KeyboardInterrupt()])
+def test_client_probe_failing_with_a_local_error_releases_the_probe(clock, breaker_settings, error):
+    client = _client(f'release-{type(error).__name__}', error, _response(200))
+    breaker = client.breakers.get('/v1/workouts')
+    _open(breaker)
+    clock.now += 30
+
+    with pytest.raises(type(error)):
+        client._request('GET', '/v1/workouts')
+    assert breaker.get_stats()['state'] == HALF_OPEN
+
+    response = client._request('GET', '/v1/workouts')
+    assert response.status_code == 200
+    assert breaker.get_stats()['state'] == CLOSED
+    assert client.session.calls == 2
+
+
+def test_client_local_errors_do_not_open_the_circuit(clock, breaker_settings):
+    client = _client('local-error', RuntimeError('falha inesperada'), _response(200))
+
+    with pytest.raises(RuntimeError):
+        client._request('GET', '/v1/workouts')
+    stats = client.breakers.get('/v1/workouts').get_stats()
+    assert stats['state'] == CLOSED
+    assert stats['consecutive_failures'] == 0
+    assert client._request('GET', '/v1/workouts').status_code == 200
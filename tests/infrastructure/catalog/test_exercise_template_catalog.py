@@ -0,0 +1,73 @@
+"""
+Testes do catálogo em memória dos modelos de exercícios.
+"""
+
+import threading
+from datetime import datetime, timezone
+
+from hevyai.domain.entities.exercise_template import ExerciseTemplate
+from hevyai.infrastructure.catalog.exercise_template_catalog import ExerciseTemplateCatalog
+
+
+def _template(template_id: str, name: str, updated_at: datetime) -> ExerciseTemplate:
+    return ExerciseTemplate(id=template_id, name=name, created_at=updated_at, updated_at=updated_at)
+
+
+class FakeSource:
+    """Origem cuja consulta à marca de atualização espera o teste liberá-la."""
+
+    def __init__(self, templates):
+        self.templates = templates
+        self.mark = max(t.updated_at for t in templates)
+        self.mark_threads = []
+        self.release = threading.Event()
+
+    def iter_all(self, prefetch=None):
+        return iter(list(self.templates))
+
+    def get_high_water_mark(self):
+        self.mark_threads.append(threading.current_thread())
+        assert self.release.wait(5)
+        return self.mark
+
+
+def test_high_water_mark_is_checked_off_the_request_thread():
+    first = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    source = FakeSource([_template('t1', 'Supino', first)])
+    catalog = ExerciseTemplateCatalog(lambda: source, ttl=3600, check_interval=0)
+    assert catalog.get('t1').name == 'Supino'
+
+    # A origem ainda não respondeu, mas a leitura é servida da memória
+    source.templates = [_template('t1', 'Supino reto', datetime(2024, 2, 1, tzinfo=timezone.utc))]
+    source.mark = source.templates[0].updated_at
+    assert catalog.get('t1').name == 'Supino'
+
+    refresh_thread = catalog._refresh_thread
+    source.release.set()
+    refresh_thread.join(5)
+    assert source.mark_threads == [refresh_thread]
+    assert catalog.get('t1').name == 'Supino reto'
+
+
+def test_unchanged_high_water_mark_keeps_the_catalog():
+    source = FakeSource([_template('t1', 'Supino', datetime(2024, 1, 1, tzinfo=timezone.utc))])
+    source.release.set()
+    catalog = ExerciseTemplateCatalog(lambda: source, ttl=3600, check_interval=0)
+
+    for _ in range(2):
+        catalog.get('t1')
+        catalog._refresh_thread.join(5)
+
+    assert source.mark_threads
+    assert threading.main_thread() not in source.mark_threads
+    assert catalog.get_stats()['refreshes'] == 1
+
+
+def test_loading_does_not_modify_the_source_entities():
+    template = ExerciseTemplate(id='t1', name='Supino', created_at=None, updated_at='2024-01-01T00:00:00Z')
+    source = FakeSource([template])
+    catalog = ExerciseTemplateCatalog(lambda: source, ttl=3600, check_interval=3600)
+
+    assert catalog.get('t1') is template
+    assert template.updated_at == '2024-01-01T00:00:00Z'
+    assert template.created_at is None
@@ -0,0 +1,128 @@
+"""
+Testes do índice incremental de recordes pessoais: inclusão, exclusão e edição de treinos.
+"""
+
+from hevyai.infrastructure.indexes.personal_record_index import PersonalRecordIndex
+from tests.builders import make_workout
+
+
+def _index(*workouts) -> PersonalRecordIndex:
+    index = PersonalRecordIndex()
+    for workout in workouts:
+        index.add_workout(workout)
+    return index
+
+
+def test_add_keeps_the_best_sets_of_all_workouts():
+    index = _index(
+        make_workout('w1', 0, {'bench': [(100.0, 5), (90.0, 8)]}),
+        make_workout('w2', 1, {'bench': [(105.0, 2)]}),
+    )
+
+    records = index.get_records('bench')
+
+    assert records.workouts == 2
+    assert (records.best_weight.value, records.best_weight.workout_id) == (105.0, 'w2')
+    assert (records.best_volume_set.value, records.best_volume_set.workout_id) == (720.0, 'w1')
+    assert records.best_e1rm_epley.workout_id == 'w1'
+    assert [(r.value, r.reps) for r in records.rep_maxes] == [(105.0, 2), (100.0, 5), (90.0, 8)]
+    assert [(p.workout_id, p.is_record) for p in records.e1rm_history] == [('w1', True), ('w2', False)]
+
+
+def test_tie_keeps_the_workout_that_reached_the_mark_first():
+    index = _index(
+        make_workout('w2', 1, {'bench': [(100.0, 5)]}),
+        make_workout('w1', 0, {'bench': [(100.0, 5)]}),
+    )
+
+    assert index.get_records('bench').best_weight.workout_id == 'w1'
+
+
+def test_removing_a_record_holder_recomputes_from_the_remaining_workouts():
+    index = _index(
+        make_workout('w1', 0, {'bench': [(100.0, 5)]}),
+        make_workout('w2', 1, {'bench': [(110.0, 3)]}),
+        make_workout('w3', 2, {'bench': [(95.0, 5)]}),
+    )
+
+    index.remove_workout('w2')
+    records = index.get_records('bench')
+
+    assert records.workouts == 2
+    assert (records.best_weight.value, records.best_weight.workout_id) == (100.0, 'w1')
+    assert 110.0 not in [r.value for r in records.rep_maxes]
+    assert [p.workout_id for p in records.e1rm_history] == ['w1', 'w3']
+
+
+def test_removing_a_non_holder_keeps_the_records():
+    index = _index(
+        make_workout('w1', 0, {'bench': [(100.0, 5)], 'squat': [(140.0, 5)]}),
+        make_workout('w2', 1, {'bench': [(80.0, 5)]}),
+    )
+    before = index.get_records('bench')
+
+    index.remove_workout('w2')
+    after = index.get_records('bench')
+
+    assert after.workouts == 1
+    assert after.best_weight == before.best_weight
+    assert after.best_e1rm_epley == before.best_e1rm_epley
+    assert index.get_records('squat').best_weight.value == 140.0
+
+
+def test_removing_the_last_workout_leaves_empty_records():
+    index = _index(make_workout('w1', 0, {'bench': [(100.0, 5)]}))
+
+    index.remove_workout('w1')
+    records = index.get_records('bench')
+
+    assert records.workouts == 0
+    assert records.best_weight is None
+    assert records.e1rm_history == []
+
+
+def test_removing_an_unknown_workout_is_ignored():
+    index = _index(make_workout('w1', 0, {'bench': [(100.0, 5)]}))
+
+    index.remove_workout('missing')
+
+    assert index.get_records('bench').best_weight.value == 100.0
+
+
+def test_edit_replaces_the_previous_contribution():
+    index = _index(
+        make_workout('w1', 0, {'bench': [(100.0, 5)]}),
+        make_workout('w2', 1, {'bench': [(120.0, 1)]}),
+    )
+
+    # O hub aplica a edição como remoção seguida de inclusão
+    index.remove_workout('w2')
+    index.add_workout(make_workout('w2', 1, {'bench': [(90.0, 5)], 'row': [(70.0, 8)]}))
+
+    bench = index.get_records('bench')
+    assert (bench.best_weight.value, bench.best_weight.workout_id) == (100.0, 'w1')
+    assert 120.0 not in [r.value for r in bench.rep_maxes]
+    assert index.get_records('row').best_weight.workout_id == 'w2'
+
+
+def test_matches_rebuilding_from_scratch_after_mixed_changes():
+    workouts = [
+        make_workout(f'w{day}', day, {'bench': [(60.0 + (day * 7) % 45, 1 + day % 10)]})
+        for day in range(30)
+    ]
+    index = _index(*workouts)
+    for day in range(0, 30, 3):
+        index.remove_workout(f'w{day}')
+    for day in range(0, 30, 6):
+        index.add_workout(workouts[day])
+
+    remaining = [w for day, w in enumerate(workouts) if day % 3 or day % 6 == 0]
+    expected = _index(*remaining).get_records('bench')
+    actual = index.get_records('bench')
+
+    assert actual.workouts == expected.workouts
+    assert actual.best_weight == expected.best_weight
+    assert actual.best_e1rm_epley == expected.best_e1rm_epley
+    assert actual.best_volume_set == expected.best_volume_set
+    assert actual.rep_maxes == expected.rep_maxes
+    assert actual.e1rm_history == expected.e1rm_history
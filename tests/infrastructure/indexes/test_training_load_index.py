@@ -0,0 +1,69 @@
+"""
+Testes do índice de carga de treino: remover ou editar um treino desfaz a sua carga.
+"""
+
+from datetime import date, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from hevyai.domain.services.training_load_service import METRIC_VOLUME, SCOPE_ALL
+from hevyai.infrastructure.indexes.training_load_index import TrainingLoadIndex
+from tests.builders import BASE_TIME, make_workout
+
+GROUPS = {'bench': 'chest', 'squat': 'quadriceps'}
+START = BASE_TIME.date()
+END = START + timedelta(days=60)
+
+
+def _index(*workouts) -> TrainingLoadIndex:
+    index = TrainingLoadIndex(GROUPS.get)
+    for workout in workouts:
+        index.add_workout(workout)
+    return index
+
+
+def _days(index, scope=SCOPE_ALL):
+    return [
+        value
+        for d in index.get_series(METRIC_VOLUME, scope, START, END).days
+        for value in (d.load, d.acute, d.chronic)
+    ]
+
+
+def test_workout_volume_is_added_to_its_day_and_scopes():
+    index = _index(make_workout('w1', 2, {'bench': [(100.0, 5)], 'squat': [(140.0, 5), (150.0, 3, False)]}))
+
+    days = index.get_series(METRIC_VOLUME, SCOPE_ALL, START, END).days
+
+    assert days[2].day == START + timedelta(days=2)
+    assert days[2].load == 1200.0
+    assert index.get_series(METRIC_VOLUME, 'chest', START, END).days[2].load == 500.0
+    assert index.get_scopes(METRIC_VOLUME) == ['all', 'chest', 'quadriceps']
+
+
+def test_removal_and_edit_match_an_index_built_from_scratch():
+    workouts = [make_workout(f'w{day}', day, {'bench': [(80.0 + day, 5)]}) for day in range(0, 40, 2)]
+    index = _index(*workouts)
+    index.get_series(METRIC_VOLUME, SCOPE_ALL, START, END)
+
+    index.remove_workout('w10')
+    index.remove_workout('w4')
+    edited = make_workout('w20', 21, {'squat': [(200.0, 2)]})
+    index.remove_workout('w20')
+    index.add_workout(edited)
+
+    remaining = [w for w in workouts if w.id not in ('w10', 'w4', 'w20')] + [edited]
+    expected = _index(*remaining)
+    # O recálculo incremental parte de outro bloco: diferenças só no último dígito
+    for scope in (SCOPE_ALL, 'chest', 'quadriceps'):
+        assert _days(index, scope) == pytest.approx(_days(expected, scope), rel=1e-12, abs=1e-9)
+
+
+def test_days_are_local_to_the_index_timezone():
+    index = TrainingLoadIndex(GROUPS.get, ZoneInfo('America/Sao_Paulo'))
+    index.add_workout(make_workout('w1', exercises={'bench': [(100.0, 1)]}, start_time=BASE_TIME.replace(hour=1)))
+
+    days = index.get_series(METRIC_VOLUME, SCOPE_ALL, date(2023, 12, 31), date(2024, 1, 1)).days
+
+    assert [d.load for d in days] == [100.0, 0.0]
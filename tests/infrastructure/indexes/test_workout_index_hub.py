@@ -0,0 +1,59 @@
+"""
+Testes do WorkoutIndexHub: carga inicial e busca de alterações sem bloquear as leituras.
+"""
+
+import threading
+
+from hevyai.domain.entities.workout import WorkoutChanges
+from hevyai.infrastructure.indexes.personal_record_index import PersonalRecordIndex
+from hevyai.infrastructure.indexes.workout_index_hub import WorkoutIndexHub
+from tests.builders import make_workout
+
+
+class SlowSource:
+    """Origem cujas consultas de alterações esperam o teste liberá-las."""
+
+    def __init__(self, workouts, changes):
+        self.workouts = workouts
+        self.changes = changes
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def iter_all(self, prefetch=None):
+        return iter(self.workouts)
+
+    def get_changes_since(self, cursor):
+        self.calls += 1
+        self.started.set()
+        assert self.release.wait(5)
+        return self.changes
+
+
+def test_changes_are_fetched_without_holding_the_read_lock():
+    source = SlowSource(
+        [make_workout('w1', 0, {'bench': [(100.0, 5)]})],
+        WorkoutChanges(updated=[make_workout('w2', 1, {'bench': [(110.0, 3)]})], cursor='2024-01-02T00:00:00+00:00')
+    )
+    index = PersonalRecordIndex()
+    hub = WorkoutIndexHub(lambda: source, [index], check_interval=0)
+    hub.ensure_current()
+
+    updater = threading.Thread(target=hub.ensure_current)
+    updater.start()
+    try:
+        assert source.started.wait(5)
+        # Durante a busca, as leituras usam o estado atual e outras threads não esperam
+        assert hub.lock.acquire(timeout=1)
+        hub.lock.release()
+        assert index.get_records('bench').best_weight.workout_id == 'w1'
+        assert hub.get_stats()['updating']
+        hub.ensure_current()
+        assert source.calls == 1
+    finally:
+        source.release.set()
+        updater.join(5)
+
+    assert index.get_records('bench').best_weight.workout_id == 'w2'
+    assert hub.cursor == '2024-01-02T00:00:00+00:00'
+    assert not hub.get_stats()['updating']
@@ -0,0 +1,51 @@
+"""
+Testes da leitura de endpoints paginados, com e sem busca antecipada de páginas.
+"""
+
+import threading
+
+from hevyai.infrastructure.repositories.pagination import iter_page_items, iter_pages
+
+
+class FakeEndpoint:
+    """Endpoint paginado que registra as páginas pedidas e a thread de cada pedido."""
+
+    def __init__(self, page_count: int):
+        self.page_count = page_count
+        self.calls = []
+
+    def __call__(self, page: int):
+        self.calls.append((page, threading.current_thread()))
+        return {'page': page, 'page_count': self.page_count, 'items': [f'item-{page}']}
+
+    @property
+    def pages(self):
+        return [page for page, _ in self.calls]
+
+
+def test_without_prefetch_pages_are_fetched_one_at_a_time():
+    endpoint = FakeEndpoint(page_count=3)
+    pages = iter_pages(endpoint, prefetch=0)
+
+    for expected in (1, 2, 3):
+        page_number, page_data = next(pages)
+        assert page_number == page_data['page'] == expected
+        assert endpoint.pages == list(range(1, expected + 1))
+
+    assert next(pages, None) is None
+    assert all(thread is threading.current_thread() for _, thread in endpoint.calls)
+
+
+def test_prefetch_keeps_the_page_order(settings):
+    settings.HEVY_API_PREFETCH_PAGES = 2
+    endpoint = FakeEndpoint(page_count=5)
+
+    assert [page for page, _ in iter_pages(endpoint)] == [1, 2, 3, 4, 5]
+    assert list(iter_page_items(endpoint, 'items', prefetch=3)) == [f'item-{page}' for page in range(1, 6)]
+
+
+def test_start_page_resumes_an_interrupted_read():
+    endpoint = FakeEndpoint(page_count=4)
+
+    assert [page for page, _ in iter_pages(endpoint, start_page=3, prefetch=0)] == [3, 4]
+    assert endpoint.pages == [3, 4]
@@ -0,0 +1,29 @@
+"""
+Testes da validação dos parâmetros de consulta dos endpoints de modelos de exercícios.
+"""
+
+import pytest
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+
+
+@pytest.fixture
+def client():
+    api_client = APIClient()
+    api_client.force_authenticate(User(username='tester'))
+    return api_client
+
+
+def test_search_with_a_non_integer_limit_is_a_bad_request(client):
+    response = client.get('/api/exercise-templates/search/', {'q': 'supino', 'limit': 'abc'})
+
+    assert response.status_code == 400
+    assert 'limit' in response.json()['message']
+
+
+@pytest.mark.parametrize('points', ['abc', '2', '5001'])
+def test_history_with_invalid_points_is_a_bad_request(client, points):
+    response = client.get('/api/exercise-templates/bench/history/', {'points': points})
+
+    assert response.status_code == 400
+    assert 'points' in response.json()['message']